@@ -0,0 +1,69 @@
+"""
+Massa de dados realista para os benchmarks (src.db.synthetic_data).
+
+Escala padrão (BENCH_SCALE=1): 1 paróquia, 20 mil fiéis, 50 jogos e
+200 mil cartelas. BENCH_SCALE=0.05 gera uma versão reduzida para rodar
+rápido na máquina de desenvolvimento.
+
+Jogos gerados:
+- 1 jogo com vendas abertas (alvo de criar/pagar/listar cartelas)
+- CLOSE_GAMES jogos com fim de vendas vencido e ainda AGENDADOS
+  (cada rodada do benchmark de encerramento consome um)
+- o restante FINALIZADO
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+
+from src.db.synthetic_data import SYNTHETIC_PASSWORD, SyntheticDataResult, SyntheticSpec, generate_synthetic_data
+from src.models.models import RoleParoquia, RoleParoquiaCodigo, UsuarioParoquia
+from src.utils.auth import create_access_token, hash_password
+from src.utils.time_manager import get_fortaleza_time
+
+BENCH_PASSWORD = SYNTHETIC_PASSWORD
+PARISH_ID = "PAR-BENCH"
+ADMIN_ID = "ADM-BENCH"
+CLOSE_GAMES = 8
+
+
+def seed_benchmark_dataset(engine: Engine, scale: float = 1.0, seed: int = 42) -> SyntheticDataResult:
+    """Popula um banco vazio (tabelas já criadas) e devolve os ids usados nos cenários."""
+    spec = SyntheticSpec(
+        fieis=max(50, int(20_000 * scale)),
+        games=50,
+        cards=max(1000, int(200_000 * scale)),
+        seed=seed,
+        paroquia_id=PARISH_ID,
+        password=BENCH_PASSWORD,
+        open_games=1,
+        closing_games=CLOSE_GAMES,
+    )
+    dataset = generate_synthetic_data(engine, spec, on_progress=None)
+
+    # Admin-Paróquia ativo libera o acesso público (login de fiéis)
+    now = get_fortaleza_time()
+    with engine.begin() as conn:
+        conn.execute(
+            insert(RoleParoquia.__table__),
+            [{"id": "ROL-BENCH", "codigo": RoleParoquiaCodigo.ADMIN.value, "nome": "Administrador", "ativo": True, "criado_em": now, "atualizado_em": now}],  # noqa: E501
+        )
+        conn.execute(
+            insert(UsuarioParoquia.__table__),
+            [{"id": ADMIN_ID, "nome": "Admin Bench", "login": "admin_bench", "senha_hash": hash_password(BENCH_PASSWORD), "email": "admin.bench@example.com", "paroquia_id": PARISH_ID, "role_id": "ROL-BENCH", "ativo": True, "criado_em": now, "atualizado_em": now}],  # noqa: E501
+        )
+    return dataset
+
+
+def fiel_headers(fiel_id: str) -> dict[str, str]:
+    token = create_access_token({"sub": fiel_id, "tipo": "usuario_comum"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def admin_headers(admin_id: str = ADMIN_ID) -> dict[str, str]:
+    token = create_access_token({"sub": admin_id, "tipo": "usuario_paroquia"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+__all__ = ["BENCH_PASSWORD", "seed_benchmark_dataset", "fiel_headers", "admin_headers"]
@@ -0,0 +1,222 @@
+"""
+Benchmarks dos endpoints centrais, em processo (ASGI, sem rede).
+
+Não rodam na suíte normal. Para executar (a partir de backend/):
+
+    RUN_BENCHMARKS=1 python -m pytest benchmarks -q -s
+    RUN_BENCHMARKS=1 BENCH_SCALE=0.05 python -m pytest benchmarks -q -s   # massa reduzida
+
+Variáveis:
+- BENCH_SCALE            fração da massa padrão (20k fiéis / 200k cartelas)
+- BENCH_BASELINE         arquivo de baseline (padrão benchmarks/baseline.json)
+- BENCH_MAX_REGRESSION   aumento tolerado da mediana sobre o baseline (padrão 0.25)
+- BENCH_UPDATE_BASELINE  =1 grava os resultados desta execução como baseline
+
+Os resultados de cada execução ficam em benchmarks/results/latest.json.
+O baseline depende da máquina: gere-o no mesmo ambiente em que compara.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bench_dataset import seed_benchmark_dataset
+from src.db.base import Base, get_db, get_read_db
+from src.main import app
+from src.utils.response_cache import response_cache
+
+BENCH_DIR = Path(__file__).resolve().parent
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS", "").lower() in {"1", "true", "yes"}
+BENCH_SCALE = float(os.getenv("BENCH_SCALE", "1.0"))
+BASELINE_PATH = Path(os.getenv("BENCH_BASELINE", str(BENCH_DIR / "baseline.json")))
+RESULTS_PATH = BENCH_DIR / "results" / "latest.json"
+MAX_REGRESSION = float(os.getenv("BENCH_MAX_REGRESSION", "0.25"))
+UPDATE_BASELINE = os.getenv("BENCH_UPDATE_BASELINE", "").lower() in {"1", "true", "yes"}
+
+_results: dict[str, dict[str, Any]] = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+    skip = pytest.mark.skip(reason="benchmarks desativados (defina RUN_BENCHMARKS=1)")
+    for item in items:
+        if BENCH_DIR in Path(str(item.fspath)).parents:
+            item.add_marker(skip)
+
+
+def _load_baseline() -> dict[str, Any]:
+    if not BASELINE_PATH.exists():
+        return {}
+    stored = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    # Baseline de outra escala de massa não é comparável
+    if stored.get("scale") != BENCH_SCALE:
+        return {}
+    return stored.get("benchmarks", {})
+
+
+def _write_json(path: Path, benchmarks: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "scale": BENCH_SCALE,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": benchmarks,
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _results:
+        return
+    _write_json(RESULTS_PATH, _results)
+    if UPDATE_BASELINE:
+        merged = {**_load_baseline(), **_results}
+        _write_json(BASELINE_PATH, merged)
+
+
+# ============================================================================
+# MASSA DE DADOS E CLIENTE
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def bench_engine(tmp_path_factory):
+    engine = create_engine(
+        f"sqlite:///{tmp_path_factory.mktemp('bench') / 'bench.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def bench_data(bench_engine):
+    started = time.perf_counter()
+    dataset = seed_benchmark_dataset(bench_engine, scale=BENCH_SCALE)
+    print(
+        f"\n🌱 Massa: {dataset.fieis} fiéis, {dataset.games} jogos, {dataset.cards} cartelas "
+        f"em {time.perf_counter() - started:.1f}s"
+    )
+    return dataset
+
+
+@pytest.fixture
+def bench_app(bench_engine, bench_data):
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=bench_engine)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    response_cache.clear()
+    try:
+        yield app
+    finally:
+        app.dependency_overrides.clear()
+        response_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def bench_client(bench_app):
+    async with AsyncClient(app=bench_app, base_url="http://bench") as client:
+        yield client
+
+
+# ============================================================================
+# MEDIÇÃO
+# ============================================================================
+
+
+class AsyncBenchmark:
+    """
+    Mede uma corrotina em várias rodadas (estilo pytest-benchmark).
+
+    `setup` (opcional) roda antes de cada rodada, fora da medição, e devolve
+    os kwargs da rodada. Ao final compara a mediana com o baseline e falha se
+    a regressão passar de BENCH_MAX_REGRESSION.
+    """
+
+    def __init__(self, name: str, baseline: Optional[dict[str, Any]]):
+        self.name = name
+        self.baseline = baseline
+        self.stats: Optional[dict[str, Any]] = None
+
+    async def __call__(
+        self,
+        target: Callable[..., Awaitable[Any]],
+        *,
+        rounds: int,
+        warmup: int = 2,
+        setup: Optional[Callable[[], Awaitable[dict[str, Any]]]] = None,
+    ) -> dict[str, Any]:
+        for _ in range(warmup):
+            kwargs = await setup() if setup else {}
+            await target(**kwargs)
+
+        samples = []
+        for _ in range(rounds):
+            kwargs = await setup() if setup else {}
+            started = time.perf_counter()
+            await target(**kwargs)
+            samples.append((time.perf_counter() - started) * 1000)
+
+        samples.sort()
+        self.stats = {
+            "rounds": rounds,
+            "min_ms": round(samples[0], 3),
+            "median_ms": round(statistics.median(samples), 3),
+            "mean_ms": round(statistics.fmean(samples), 3),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            "max_ms": round(samples[-1], 3),
+            "stddev_ms": round(statistics.pstdev(samples), 3),
+            "ops": round(1000 / statistics.fmean(samples), 2),
+        }
+        _results[self.name] = self.stats
+        self._check_regression()
+        return self.stats
+
+    def _check_regression(self) -> None:
+        stats = self.stats
+        line = f"⏱️  {self.name}: mediana {stats['median_ms']}ms | p95 {stats['p95_ms']}ms | {stats['ops']} ops/s"
+        if not self.baseline or UPDATE_BASELINE:
+            print(f"\n{line} (sem baseline)")
+            return
+        base = self.baseline["median_ms"]
+        change = (stats["median_ms"] - base) / base if base else 0.0
+        print(f"\n{line} | baseline {base}ms ({change:+.0%})")
+        if change > MAX_REGRESSION:
+            pytest.fail(
+                f"Regressão de desempenho em {self.name}: mediana {stats['median_ms']}ms "
+                f"vs baseline {base}ms ({change:+.0%}, limite +{MAX_REGRESSION:.0%})"
+            )
+
+
+@pytest.fixture(scope="session")
+def bench_baseline():
+    return _load_baseline()
+
+
+@pytest.fixture
+def benchmark(request, bench_baseline):
+    name = request.node.name.removeprefix("test_")
+    return AsyncBenchmark(name, bench_baseline.get(name))
@@ -0,0 +1,99 @@
+import itertools
+
+import pytest
+
+from bench_dataset import BENCH_PASSWORD, admin_headers, fiel_headers
+
+
+@pytest.mark.asyncio
+async def test_create_card(bench_client, bench_data, benchmark):
+    fieis = itertools.cycle(bench_data.fiel_ids)
+
+    async def _setup():
+        return {"headers": fiel_headers(next(fieis))}
+
+    async def _create(headers):
+        response = await bench_client.post(
+            f"/games/{bench_data.open_game_ids[0]}/cards", json={"modo": "aleatoria"}, headers=headers
+        )
+        assert response.status_code == 201, response.text
+
+    await benchmark(_create, rounds=200, setup=_setup)
+
+
+@pytest.mark.asyncio
+async def test_pay_card(bench_client, bench_data, benchmark):
+    fieis = itertools.cycle(reversed(bench_data.fiel_ids))
+
+    async def _setup():
+        headers = fiel_headers(next(fieis))
+        created = await bench_client.post(
+            f"/games/{bench_data.open_game_ids[0]}/cards", json={"modo": "aleatoria"}, headers=headers
+        )
+        assert created.status_code == 201, created.text
+        return {"card_id": created.json()["id"], "headers": headers}
+
+    async def _pay(card_id, headers):
+        response = await bench_client.post(
+            f"/games/{bench_data.open_game_ids[0]}/cards/{card_id}/pay", headers=headers
+        )
+        assert response.status_code == 200, response.text
+
+    await benchmark(_pay, rounds=200, setup=_setup)
+
+
+@pytest.mark.asyncio
+async def test_list_game_cards(bench_client, bench_data, benchmark):
+    headers = admin_headers()
+
+    async def _list():
+        response = await bench_client.get(f"/games/{bench_data.open_game_ids[0]}/cards", headers=headers)
+        assert response.status_code == 200, response.text
+
+    await benchmark(_list, rounds=30)
+
+
+@pytest.mark.asyncio
+async def test_list_my_cards(bench_client, bench_data, benchmark):
+    fieis = itertools.cycle(bench_data.fiel_ids)
+
+    async def _setup():
+        return {"headers": fiel_headers(next(fieis))}
+
+    async def _list(headers):
+        response = await bench_client.get("/users/me/cards", headers=headers)
+        assert response.status_code == 200, response.text
+
+    await benchmark(_list, rounds=200, setup=_setup)
+
+
+@pytest.mark.asyncio
+async def test_login(bench_client, bench_data, benchmark):
+    cpfs = itertools.cycle(bench_data.fiel_cpfs)
+
+    async def _setup():
+        return {"cpf": next(cpfs)}
+
+    async def _login(cpf):
+        response = await bench_client.post("/auth/login", json={"cpf": cpf, "senha": BENCH_PASSWORD})
+        assert response.status_code == 200, response.text
+
+    await benchmark(_login, rounds=20, warmup=1, setup=_setup)
+
+
+@pytest.mark.asyncio
+async def test_close_sales_for_game(bench_client, bench_data, benchmark):
+    # Cada rodada encerra um jogo diferente (encerrar é irreversível)
+    games = iter(bench_data.closing_game_ids)
+    headers = admin_headers()
+
+    async def _setup():
+        return {"game_id": next(games)}
+
+    async def _close(game_id):
+        response = await bench_client.post(
+            f"/games/{game_id}/close-sales", json={"iniciar_sorteio": True}, headers=headers
+        )
+        assert response.status_code == 200, response.text
+
+    await benchmark(_close, rounds=len(bench_data.closing_game_ids) - 1, warmup=1, setup=_setup)
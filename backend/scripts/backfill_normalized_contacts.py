@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Backfill das colunas normalizadas (nome_norm, email_norm, telefone_norm, cpf_norm).
+
+Adiciona colunas/índices ausentes e preenche os registros em lotes. O init_db
+já faz isso automaticamente na primeira subida após a migração; use este script
+para rodar antes do deploy em bases grandes ou para recalcular tudo (--all).
+
+Uso:
+python3 backend/scripts/backfill_normalized_contacts.py
+python3 backend/scripts/backfill_normalized_contacts.py --all --chunk-size 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from src.db.base import engine
+from src.db.normalized_contacts import (
+    normalized_contact_models,
+    backfill_normalized_contacts,
+    ensure_normalized_contact_columns,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill de nome_norm/email_norm/telefone_norm/cpf_norm")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--all", action="store_true", help="Recalcula também linhas já preenchidas")
+    args = parser.parse_args()
+
+    migrated = ensure_normalized_contact_columns(engine, chunk_size=args.chunk_size)
+    for table_name, filled in migrated.items():
+        print(f"✅ Colunas criadas em {table_name} ({filled} registros preenchidos)")
+
+    for model in normalized_contact_models():
+        filled = backfill_normalized_contacts(
+            engine, model, chunk_size=args.chunk_size, only_missing=not args.all
+        )
+        print(f"✅ {model.__tablename__}: {filled} registros atualizados")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
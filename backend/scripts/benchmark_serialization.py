@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark da serialização das listagens de jogos e cartelas.
+
+Compara o caminho antigo e o novo para N cartelas e M jogos:
+1) antes  -> dict com isoformat()/float() por campo + jsonable_encoder + json.dumps
+             (o que o JSONResponse padrão do FastAPI fazia)
+2) depois -> dict com tipos finais + orjson.dumps direto (ORJSONResponse sem
+             passar pelo jsonable_encoder)
+
+Uso:
+python3 backend/scripts/benchmark_serialization.py --cards 10000 --games 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from src.models.models import Sorteio, StatusCartela, StatusSorteio
+from src.routers.games_routes import STATUS_TO_PUBLIC, _to_game_response
+from src.utils.time_manager import get_fortaleza_time
+
+
+def _stdlib_render(content) -> bytes:
+    # Mesmo render do starlette.responses.JSONResponse
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _legacy_game_response(game: Sorteio) -> dict:
+    return {
+        "id": game.id,
+        "title": game.titulo,
+        "description": game.descricao or "",
+        "scheduled_date": game.horario_sorteio.isoformat() if game.horario_sorteio else None,
+        "data_inicio_vendas": game.inicio_vendas.isoformat() if game.inicio_vendas else None,
+        "data_sorteio": game.horario_sorteio.isoformat() if game.horario_sorteio else None,
+        "status": STATUS_TO_PUBLIC.get(game.status.value, "scheduled"),
+        "card_price": float(game.valor_cartela or 0),
+        "total_prize": float(game.total_premio or 0),
+        "cards_sold": int(game.total_cartelas_vendidas or 0),
+        "max_cards": int(game.max_cards) if game.max_cards else None,
+        "prize_percent": float(game.rateio_premio or 0),
+        "parish_percent": float(game.rateio_paroquia or 0),
+        "operation_percent": float(game.rateio_operacao or 0),
+        "evolution_percent": float(game.rateio_evolucao or 0),
+        "created_at": game.criado_em.isoformat() if game.criado_em else None,
+    }
+
+
+def _build_games(count: int) -> list[Sorteio]:
+    now = get_fortaleza_time()
+    return [
+        Sorteio(
+            id=f"SOR_{idx:06d}",
+            paroquia_id="PAR_1",
+            titulo=f"Bingo {idx}",
+            descricao="Bingo beneficente",
+            valor_cartela=10.0,
+            rateio_premio=50.0,
+            rateio_paroquia=30.0,
+            rateio_operacao=15.0,
+            rateio_evolucao=5.0,
+            total_arrecadado=1500.0,
+            total_premio=750.0,
+            total_cartelas_vendidas=150,
+            max_cards=500,
+            inicio_vendas=now - timedelta(days=1),
+            fim_vendas=now + timedelta(hours=1),
+            horario_sorteio=now + timedelta(hours=1, minutes=1),
+            status=StatusSorteio.AGENDADO,
+            criado_em=now,
+            atualizado_em=now,
+        )
+        for idx in range(count)
+    ]
+
+
+def _build_card_rows(count: int) -> list[tuple]:
+    """Linhas como as do select de colunas de GET /games/{id}/cards."""
+    now = get_fortaleza_time()
+    numbers = tuple(f"{n:02d}" for n in range(1, 25))
+    return [
+        (f"CAR_{idx:08d}", StatusCartela.PAGA, now, f"USR_{idx % 500}", f"Fiel {idx % 500}")
+        + numbers
+        for idx in range(count)
+    ]
+
+
+def _legacy_cards(rows: list[tuple]) -> list[dict]:
+    return [
+        {
+            "id": row[0],
+            "numbers": [str(n) for n in row[5:]],
+            "status": row[1].value if hasattr(row[1], "value") else str(row[1]),
+            "purchase_date": row[2].isoformat() if row[2] else None,
+            "owner_name": row[4] or "Usuário",
+            "owner_id": row[3],
+        }
+        for row in rows
+    ]
+
+
+def _fast_cards(rows: list[tuple]) -> list[dict]:
+    return [
+        {
+            "id": row[0],
+            "numbers": list(row[5:]),
+            "status": row[1].value,
+            "purchase_date": row[2],
+            "owner_name": row[4] or "Usuário",
+            "owner_id": row[3],
+        }
+        for row in rows
+    ]
+
+
+def _measure(label: str, items: int, render, repeat: int) -> dict:
+    body = render()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - started)
+    return {
+        "caso": label,
+        "itens": items,
+        "bytes": len(body),
+        "melhor_ms": round(best * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark de serialização JSON")
+    parser.add_argument("--cards", type=int, default=10000)
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+    args = parser.parse_args()
+
+    games = _build_games(args.games)
+    card_rows = _build_card_rows(args.cards)
+
+    results = [
+        _measure(
+            "jogos antes",
+            args.games,
+            lambda: _stdlib_render(jsonable_encoder([_legacy_game_response(g) for g in games])),
+            args.repeat,
+        ),
+        _measure(
+            "jogos depois",
+            args.games,
+            lambda: orjson.dumps([_to_game_response(g) for g in games]),
+            args.repeat,
+        ),
+        _measure(
+            "cartelas antes",
+            args.cards,
+            lambda: _stdlib_render(jsonable_encoder(_legacy_cards(card_rows))),
+            args.repeat,
+        ),
+        _measure(
+            "cartelas depois",
+            args.cards,
+            lambda: orjson.dumps(_fast_cards(card_rows)),
+            args.repeat,
+        ),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'caso':<18} {'itens':>8} {'bytes':>10} {'melhor(ms)':>12}")
+    for item in results:
+        print(f"{item['caso']:<18} {item['itens']:>8} {item['bytes']:>10} {item['melhor_ms']:>12}")
+
+
+if __name__ == "__main__":
+    main()
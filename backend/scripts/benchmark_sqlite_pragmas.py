@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark do perfil de PRAGMAs do SQLite (antes x depois).
+
+Simula o checkout concorrente (pay_card): várias threads escrevem cartelas e
+atualizam os totais do mesmo Sorteio enquanto outras threads leem a listagem
+de cartelas. Roda duas vezes sobre arquivos temporários:
+
+1) padrão   -> engine sem PRAGMAs (journal DELETE, sem busy_timeout)
+2) tunado   -> engine com SQLITE_PRAGMAS + retry_on_sqlite_busy
+
+Uso:
+python3 backend/scripts/benchmark_sqlite_pragmas.py --writers 8 --readers 4 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from random import sample
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base, configure_sqlite_engine, is_sqlite_busy_error, retry_on_sqlite_busy
+from src.models.models import Cartela, Paroquia, Sorteio, StatusCartela, StatusSorteio, UsuarioComum
+from src.utils.time_manager import get_fortaleza_time
+
+
+GAME_ID = "SOR_BENCH"
+
+
+def _seed(session_factory):
+    now = get_fortaleza_time()
+    db = session_factory()
+    try:
+        db.add(
+            Paroquia(
+                id="PAR_BENCH",
+                nome="Paróquia Benchmark",
+                email="bench@example.com",
+                chave_pix="bench@example.com",
+            )
+        )
+        for idx in range(32):
+            db.add(
+                UsuarioComum(
+                    id=f"USR_BENCH_{idx}",
+                    nome=f"Fiel {idx}",
+                    cpf=f"{idx:011d}",
+                    email=f"fiel{idx}@example.com",
+                    telefone="85999990000",
+                    whatsapp="85999990000",
+                    senha_hash="x",
+                )
+            )
+        db.add(
+            Sorteio(
+                id=GAME_ID,
+                paroquia_id="PAR_BENCH",
+                titulo="Bingo Benchmark",
+                valor_cartela=10.0,
+                inicio_vendas=now - timedelta(hours=1),
+                fim_vendas=now + timedelta(hours=1),
+                horario_sorteio=now + timedelta(hours=2),
+                status=StatusSorteio.AGENDADO,
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _pay_card(db, writer_id: int, seq: int):
+    now = get_fortaleza_time()
+    numbers = [f"{n:02d}" for n in sample(range(1, 76), 24)]
+    db.add(
+        Cartela(
+            id=f"CAR_{writer_id}_{seq}",
+            sorteio_id=GAME_ID,
+            usuario_id=f"USR_BENCH_{writer_id % 32}",
+            status=StatusCartela.PAGA,
+            numeros_marcados=[],
+            criado_em=now,
+            atualizado_em=now,
+            **{f"n{idx}": numbers[idx - 1] for idx in range(1, 25)},
+        )
+    )
+    game = db.query(Sorteio).filter(Sorteio.id == GAME_ID).first()
+    game.total_cartelas_vendidas = int(game.total_cartelas_vendidas or 0) + 1
+    game.total_arrecadado = float(game.total_arrecadado or 0) + 10.0
+    db.commit()
+
+
+def run_scenario(label: str, tuned: bool, writers: int, readers: int, seconds: float) -> dict:
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_sqlite_"))
+    db_path = tmp_dir / "bench.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        future=True,
+    )
+    if tuned:
+        configure_sqlite_engine(engine)
+
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    _seed(session_factory)
+
+    pay = retry_on_sqlite_busy(_pay_card) if tuned else _pay_card
+    stop_at = time.perf_counter() + seconds
+    lock = threading.Lock()
+    stats = {"writes_ok": 0, "writes_locked": 0, "reads_ok": 0, "reads_locked": 0}
+
+    def writer(writer_id: int):
+        seq = 0
+        while time.perf_counter() < stop_at:
+            seq += 1
+            db = session_factory()
+            try:
+                pay(db=db, writer_id=writer_id, seq=seq)
+                key = "writes_ok"
+            except OperationalError as exc:
+                db.rollback()
+                if not is_sqlite_busy_error(exc):
+                    raise
+                key = "writes_locked"
+            finally:
+                db.close()
+            with lock:
+                stats[key] += 1
+
+    def reader():
+        while time.perf_counter() < stop_at:
+            db = session_factory()
+            try:
+                db.query(Cartela).filter(Cartela.sorteio_id == GAME_ID).order_by(
+                    Cartela.criado_em.desc()
+                ).limit(200).all()
+                key = "reads_ok"
+            except OperationalError as exc:
+                if not is_sqlite_busy_error(exc):
+                    raise
+                key = "reads_locked"
+            finally:
+                db.close()
+            with lock:
+                stats[key] += 1
+
+    threads = [threading.Thread(target=writer, args=(idx,)) for idx in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    engine.dispose()
+
+    return {
+        "scenario": label,
+        "elapsed_s": round(elapsed, 3),
+        **stats,
+        "writes_per_s": round(stats["writes_ok"] / elapsed, 1),
+        "reads_per_s": round(stats["reads_ok"] / elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de PRAGMAs do SQLite")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+    args = parser.parse_args()
+
+    results = [
+        run_scenario("padrao", False, args.writers, args.readers, args.seconds),
+        run_scenario("tunado", True, args.writers, args.readers, args.seconds),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'cenário':<10} {'escritas/s':>11} {'leituras/s':>11} {'locked(w)':>10} {'locked(r)':>10}")
+    for item in results:
+        print(
+            f"{item['scenario']:<10} {item['writes_per_s']:>11} {item['reads_per_s']:>11} "
+            f"{item['writes_locked']:>10} {item['reads_locked']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark dos geradores de ID temporal.
+
+Compara, em IDs/segundo:
+1) generate_temporal_id_with_microseconds -> strftime + pytz a cada chamada
+2) generate_unique_temporal_id            -> nó + sequência, data formatada 1x por segundo
+3) generate_many                          -> lote com uma única aquisição do lock
+
+Uso:
+python3 backend/scripts/benchmark_temporal_ids.py --count 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from src.utils.time_manager import (
+    generate_many,
+    generate_temporal_id_with_microseconds,
+    generate_unique_temporal_id,
+)
+
+
+def _measure(label: str, produce, count: int) -> dict:
+    started = time.perf_counter()
+    ids = produce(count)
+    elapsed = time.perf_counter() - started
+    return {
+        "gerador": label,
+        "ids": count,
+        "unicos": len(set(ids)),
+        "elapsed_s": round(elapsed, 4),
+        "ids_por_s": round(count / elapsed) if elapsed else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark de IDs temporais")
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+    args = parser.parse_args()
+
+    results = [
+        _measure(
+            "microseconds (atual)",
+            lambda n: [generate_temporal_id_with_microseconds("CAR") for _ in range(n)],
+            args.count,
+        ),
+        _measure(
+            "unique (nó+sequência)",
+            lambda n: [generate_unique_temporal_id("CAR") for _ in range(n)],
+            args.count,
+        ),
+        _measure("generate_many (lote)", lambda n: generate_many("CAR", n), args.count),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'gerador':<24} {'ids/s':>12} {'únicos':>10} {'tempo(s)':>10}")
+    for item in results:
+        print(
+            f"{item['gerador']:<24} {item['ids_por_s']:>12} {item['unicos']:>10} {item['elapsed_s']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Verificação de índices das consultas quentes (EXPLAIN).
+
+Executa EXPLAIN QUERY PLAN (SQLite) ou EXPLAIN (PostgreSQL) para cada consulta
+frequente dos endpoints de Jogos/Cartelas e falha se alguma fizer varredura
+completa da tabela. Use após rodar migrate_jogos_cartelas_schema.py.
+
+Uso:
+python3 backend/scripts/check_query_indexes.py
+python3 backend/scripts/check_query_indexes.py --verbose
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from src.db.base import engine
+from src.db.query_plan import check_hot_query_indexes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Verifica uso de índices nas consultas quentes")
+    parser.add_argument("--verbose", action="store_true", help="Exibe o plano completo de cada consulta")
+    args = parser.parse_args()
+
+    print(f"🔎 Verificando planos de execução ({engine.dialect.name})...")
+    results = check_hot_query_indexes(engine)
+
+    failures = 0
+    for item in results:
+        marker = "✅" if item["uses_index"] else "❌"
+        print(f"{marker} {item['endpoint']} [{item['table']}]")
+        if args.verbose or not item["uses_index"]:
+            for line in item["plan"]:
+                print(f"     {line}")
+        if not item["uses_index"]:
+            failures += 1
+
+    if failures:
+        print(f"❌ {failures} consulta(s) sem índice. Rode migrate_jogos_cartelas_schema.py.")
+        return 1
+
+    print("✅ Todas as consultas quentes usam índice")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Importação em lote de fiéis a partir de CSV (linha de comando).
+
+Mesmo pipeline do endpoint POST /admin/usuarios/importar-fieis: validação
+por lote, deduplicação contra o banco e hash de senhas em pool de processos.
+
+Uso:
+python3 backend/scripts/import_fieis_csv.py cadastro.csv
+python3 backend/scripts/import_fieis_csv.py cadastro.csv --paroquia-id PAR_... --report erros.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from src.db.base import SessionLocal
+from src.utils.fiel_import import FIEL_IMPORT_BATCH_SIZE, FIEL_IMPORT_HASH_WORKERS, import_fieis_csv
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Importa fiéis de um arquivo CSV")
+    parser.add_argument("csv_path", help="Arquivo CSV (nome, cpf, email, telefone, ...)")
+    parser.add_argument("--paroquia-id", default=None, help="Paróquia associada aos fiéis")
+    parser.add_argument("--batch-size", type=int, default=FIEL_IMPORT_BATCH_SIZE)
+    parser.add_argument("--hash-workers", type=int, default=FIEL_IMPORT_HASH_WORKERS, help="Processos para bcrypt")
+    parser.add_argument("--report", default=None, help="Salva o relatório completo em JSON")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        with open(args.csv_path, encoding="utf-8-sig", newline="") as stream:
+            report = import_fieis_csv(
+                db,
+                stream,
+                paroquia_id=args.paroquia_id,
+                batch_size=args.batch_size,
+                hash_workers=args.hash_workers,
+                use_processes=True,
+            )
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        return 1
+    finally:
+        db.close()
+
+    print(f"📥 Linhas lidas: {report['total_linhas']}")
+    print(f"✅ Importados: {report['importados']}")
+    print(f"⚠️ Com erro: {report['com_erro']}")
+    for item in report["erros"][:20]:
+        print(f"   linha {item['linha']}: {'; '.join(item['erros'])}")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"📝 Relatório salvo em {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Perfil do tempo de import na inicialização (python -X importtime).
+
+Importa o módulo alvo (padrão: src.main) em processo novo, mostra o tempo
+total, os pacotes e módulos mais caros e se alguma dependência pesada que
+deveria ser carregada sob demanda (SMTP, Fernet, JWT, passlib) entrou no
+caminho de inicialização.
+
+Uso:
+python3 backend/scripts/import_time_report.py
+python3 backend/scripts/import_time_report.py --runs 5 --top 30 --sort cumulative
+python3 backend/scripts/import_time_report.py --budget-ms 2500 --json import_time.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from src.utils.import_profile import best_of
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Perfil de tempo de import (-X importtime)")
+    parser.add_argument("--module", default="src.main", help="Módulo importado (padrão: src.main)")
+    parser.add_argument("--runs", type=int, default=3, help="Medições; vale a mais rápida")
+    parser.add_argument("--top", type=int, default=20, help="Quantidade de módulos listados")
+    parser.add_argument("--sort", choices=["self", "cumulative"], default="self")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Falha (exit 1) acima deste total")
+    parser.add_argument("--json", default=None, help="Grava o relatório em JSON")
+    args = parser.parse_args()
+
+    try:
+        profile = best_of(args.runs, args.module)
+    except RuntimeError as exc:
+        print(f"❌ {exc}")
+        return 1
+
+    print(f"📦 import {profile.target}: {profile.total_ms:.0f} ms ({len(profile.records)} módulos, melhor de {args.runs})")
+
+    print("\n🧱 Por pacote (tempo próprio):")
+    for name, us in list(profile.by_package().items())[: args.top]:
+        print(f"   {us / 1000:8.1f} ms  {name}")
+
+    label = "próprio" if args.sort == "self" else "acumulado"
+    print(f"\n🐢 Módulos mais caros ({label}):")
+    for record in profile.top(args.top, args.sort):
+        value = record.self_us if args.sort == "self" else record.cumulative_us
+        print(f"   {value / 1000:8.1f} ms  {record.module}")
+
+    violations = profile.lazy_violations()
+    if violations:
+        print(f"\n⚠️  Dependências pesadas importadas na inicialização: {', '.join(violations)}")
+    else:
+        print("\n✅ Dependências pesadas ficam para o primeiro uso")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(profile.to_dict(args.top), indent=2, ensure_ascii=False))
+        print(f"💾 Relatório salvo em {args.json}")
+
+    if args.budget_ms is not None and profile.total_ms > args.budget_ms:
+        print(f"❌ Orçamento estourado: {profile.total_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        return 1
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,13 @@ Rotina de manutenção para encerramento de jogos/cartelas.
 Fluxo sugerido:
 1) lock         -> bloqueia novas escritas por alguns minutos
 2) snapshot     -> gera foto rápida dos resultados do jogo
-3) backup       -> executa backup completo consistente
+3) backup       -> executa backup consistente (online e incremental)
 4) unlock       -> libera escritas
+
+Backups (src/db/backup.py) vão para um repositório endereçado por conteúdo
+(padrão backend/data/backups): cada execução grava um manifesto JSON e só
+os blocos/tabelas alterados desde o backup anterior. O SQLite é copiado com a
+API de backup em passos curtos, sem travar a aplicação.
 """
 
 from __future__ import annotations
@@ -28,9 +33,21 @@ BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
+from sqlalchemy import inspect
 from sqlalchemy.engine import make_url
 
-from src.db.base import DATABASE_URL, SessionLocal
+from src.db.backup import (
+    DEFAULT_CHUNK_PAGES,
+    DEFAULT_PAGES_PER_STEP,
+    DEFAULT_STEP_SLEEP_SECONDS,
+    backup_postgresql,
+    backup_sqlite,
+    is_manifest,
+    restore_postgresql_sql,
+    restore_sqlite,
+)
+from src.db.base import DATABASE_URL, SessionLocal, engine
+from src.utils.game_snapshot import snapshot_path_for_game, verify_game_snapshot, write_game_snapshot
 from src.models.models import (
     Cartela,
     CategoriaConfiguracao,
@@ -45,6 +62,15 @@ from src.utils.time_manager import get_fortaleza_time
 CARD_COLS = [f"n{i}" for i in range(1, 25)]
 
 
+def _manifest_arg(value: str) -> str:
+    """--backup-file/--output-file: o backup é um manifesto JSON, não mais um .db/.sql"""
+    if not is_manifest(Path(value)):
+        raise argparse.ArgumentTypeError(
+            f"use um caminho .json para o manifesto do backup (recebido: {value})"
+        )
+    return value
+
+
 def get_or_create_config(db, chave: str, valor_padrao: str, descricao: str) -> Configuracao:
     row = db.query(Configuracao).filter(Configuracao.chave == chave).first()
     if row:
@@ -113,9 +139,22 @@ def emit_alert(message: str) -> Path:
     return path
 
 
-def snapshot_game(game_id: str, output_dir: str | None = None) -> Path:
+def snapshot_game(game_id: str, output_dir: str | None = None, full: bool = False) -> Path:
     db = SessionLocal()
     try:
+        if full:
+            # NDJSON.gz com todas as cartelas pagas, em lotes, + hash_integridade
+            base_dir = Path(output_dir) if output_dir else Path("backend/data/snapshots")
+            try:
+                result = write_game_snapshot(db, game_id, snapshot_path_for_game(game_id, base_dir))
+            except LookupError as exc:
+                raise RuntimeError(str(exc)) from exc
+            print(
+                f"✅ Snapshot completo gerado: {result.path} "
+                f"({result.cards} cartelas, sha256={result.sha256})"
+            )
+            return result.path
+
         jogo = db.query(Sorteio).filter(Sorteio.id == game_id).first()
         if not jogo:
             raise RuntimeError(f"Jogo não encontrado: {game_id}")
@@ -165,46 +204,76 @@ def snapshot_game(game_id: str, output_dir: str | None = None) -> Path:
         db.close()
 
 
-def backup_database(output_file: str | None = None) -> Path:
-    now = get_fortaleza_time().strftime("%Y%m%d_%H%M%S")
+def _sqlite_database_path() -> Path:
+    database = make_url(DATABASE_URL).database
+    for candidate in (database, "backend/data/bingo.db", "data/bingo.db"):
+        if candidate and Path(candidate).exists():
+            return Path(candidate)
+    raise RuntimeError("Arquivo SQLite não encontrado")
 
-    if DATABASE_URL.startswith("sqlite"):
-        sqlite_path = Path("backend/data/bingo.db")
-        if not sqlite_path.exists():
-            sqlite_path = Path("data/bingo.db")
-        if not sqlite_path.exists():
-            raise RuntimeError("Arquivo SQLite não encontrado")
-
-        out = Path(output_file) if output_file else Path(f"backend/data/backup_bingo_{now}.db")
-        out.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(sqlite_path, out)
-        print(f"✅ Backup SQLite criado: {out}")
-        return out
-
-    # PostgreSQL via pg_dump
-    out = Path(output_file) if output_file else Path(f"backend/data/backup_bingo_{now}.sql")
-    out.parent.mkdir(parents=True, exist_ok=True)
 
-    url = make_url(DATABASE_URL)
-    env = os.environ.copy()
-    if url.password:
-        env["PGPASSWORD"] = url.password
+def verify_snapshot(snapshot_file: str) -> dict:
+    db = SessionLocal()
+    try:
+        result = verify_game_snapshot(db, Path(snapshot_file))
+    finally:
+        db.close()
 
-    cmd = [
-        "pg_dump",
-        "-h", url.host or "localhost",
-        "-p", str(url.port or 5432),
-        "-U", url.username or "postgres",
-        "-d", url.database or "postgres",
-        "-f", str(out),
-    ]
+    icon = "✅" if result["valid"] else "❌"
+    print(
+        f"{icon} Snapshot {snapshot_file}: arquivo íntegro={result['file_intact']} | "
+        f"igual ao banco={result['matches_database']} | "
+        f"hash_integridade={result['matches_stored_hash']} | cartelas={result['cards']}"
+    )
+    if result["first_mismatch"]:
+        print(f"   Primeira divergência: {result['first_mismatch']}")
+    return result
+
+
+def backup_database(
+    output_file: str | None = None,
+    store_dir: str | None = None,
+    pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+    step_sleep_ms: float = DEFAULT_STEP_SLEEP_SECONDS * 1000,
+    chunk_pages: int = DEFAULT_CHUNK_PAGES,
+) -> Path:
+    """
+    Backup online e incremental. Retorna o caminho do manifesto (.json).
 
-    completed = subprocess.run(cmd, env=env, check=False, capture_output=True, text=True)
-    if completed.returncode != 0:
-        raise RuntimeError(f"Falha no pg_dump: {completed.stderr.strip()}")
+    - SQLite: API de backup em passos de `pages_per_step` páginas, com pausa
+      de `step_sleep_ms` entre eles; blocos de páginas inalterados são reaproveitados
+    - PostgreSQL: pg_dump por seção/tabela, comprimido em streaming; tabelas
+      inalteradas são reaproveitadas
+    """
+    now = get_fortaleza_time().strftime("%Y%m%d_%H%M%S")
+    store = Path(store_dir) if store_dir else Path("backend/data/backups")
+    manifest = Path(output_file) if output_file else store / f"backup_bingo_{now}.json"
+    if not is_manifest(manifest):
+        raise ValueError(f"O backup agora é um manifesto .json (recebido: {manifest})")
 
-    print(f"✅ Backup PostgreSQL criado: {out}")
-    return out
+    if DATABASE_URL.startswith("sqlite"):
+        result = backup_sqlite(
+            _sqlite_database_path(),
+            store,
+            manifest,
+            pages_per_step=pages_per_step,
+            step_sleep_seconds=step_sleep_ms / 1000,
+            chunk_pages=chunk_pages,
+        )
+        label = "SQLite"
+    else:
+        result = backup_postgresql(
+            make_url(DATABASE_URL), inspect(engine).get_table_names(), store, manifest
+        )
+        label = "PostgreSQL"
+
+    print(f"✅ Backup {label} criado: {result.manifest_path}")
+    print(
+        f"   {result.objects_written} objetos novos, {result.objects_reused} reaproveitados | "
+        f"{result.bytes_total / 1024 / 1024:.1f} MiB lógicos, "
+        f"{result.bytes_written / 1024 / 1024:.1f} MiB gravados | {result.elapsed_seconds:.2f}s"
+    )
+    return result.manifest_path
 
 
 def _sqlite_has_unique_index_on_cards(conn: sqlite3.Connection) -> bool:
@@ -223,14 +292,17 @@ def _sqlite_has_unique_index_on_cards(conn: sqlite3.Connection) -> bool:
 def validate_restore_consistency(backup_path: Path) -> dict[str, str]:
     """
     Valida consistência do backup com restauração em base temporária.
-    - SQLite: restaura via cópia para temp e valida schema.
-    - PostgreSQL: restaura dump em DB temporário e valida schema.
+    - SQLite: remonta o manifesto (ou copia o .db legado) para temp e valida schema.
+    - PostgreSQL: restaura dump (manifesto remontado em .sql) em DB temporário e valida schema.
     """
     if DATABASE_URL.startswith("sqlite"):
         tmp_dir = Path("backend/data/restore-check")
         tmp_dir.mkdir(parents=True, exist_ok=True)
         restored_db = tmp_dir / f"restore_check_{get_fortaleza_time().strftime('%Y%m%d_%H%M%S')}.db"
-        shutil.copy2(backup_path, restored_db)
+        if is_manifest(backup_path):
+            restore_sqlite(backup_path, restored_db)
+        else:
+            shutil.copy2(backup_path, restored_db)
 
         conn = sqlite3.connect(str(restored_db))
         try:
@@ -283,6 +355,12 @@ def validate_restore_consistency(backup_path: Path) -> dict[str, str]:
     ]
     dropdb_cmd = ["dropdb", "-h", host, "-p", port, "-U", user, temp_db]
 
+    restore_sql: Path | None = None
+    if is_manifest(backup_path):
+        restore_sql = Path(backup_path).with_name(f"restore_check_{stamp}.sql")
+        restore_postgresql_sql(backup_path, restore_sql)
+        restore_cmd[-1] = str(restore_sql)
+
     try:
         created = subprocess.run(createdb_cmd, env=env, check=False, capture_output=True, text=True)
         if created.returncode != 0:
@@ -315,6 +393,8 @@ def validate_restore_consistency(backup_path: Path) -> dict[str, str]:
         }
     finally:
         subprocess.run(dropdb_cmd, env=env, check=False, capture_output=True, text=True)
+        if restore_sql is not None:
+            restore_sql.unlink(missing_ok=True)
 
 
 def simulate_insert_during_lock(base_url: str, game_id: str, faithful_token: str) -> dict[str, str]:
@@ -449,23 +529,39 @@ def main():
     p_snapshot = sub.add_parser("snapshot", help="Gera snapshot de um jogo")
     p_snapshot.add_argument("--game-id", required=True)
     p_snapshot.add_argument("--output-dir", default=None)
+    p_snapshot.add_argument(
+        "--full", action="store_true", help="Todas as cartelas pagas em NDJSON.gz + hash_integridade"
+    )
+
+    p_verify = sub.add_parser("verify-snapshot", help="Confere snapshot completo contra o banco")
+    p_verify.add_argument("--file", required=True)
 
-    p_backup = sub.add_parser("backup", help="Gera backup completo do banco")
-    p_backup.add_argument("--output-file", default=None)
+    p_backup = sub.add_parser("backup", help="Gera backup online/incremental do banco")
+    p_backup.add_argument(
+        "--output-file", type=_manifest_arg, default=None, help="Caminho do manifesto (.json)"
+    )
+    p_backup.add_argument("--store-dir", default=None, help="Repositório de objetos (padrão backend/data/backups)")
+    p_backup.add_argument("--pages-per-step", type=int, default=DEFAULT_PAGES_PER_STEP)
+    p_backup.add_argument("--step-sleep-ms", type=float, default=DEFAULT_STEP_SLEEP_SECONDS * 1000)
+    p_backup.add_argument("--chunk-pages", type=int, default=DEFAULT_CHUNK_PAGES)
 
     p_cycle = sub.add_parser("close-cycle", help="Executa lock + snapshot + backup + unlock")
     p_cycle.add_argument("--game-id", required=True)
     p_cycle.add_argument("--minutes", type=int, default=5)
     p_cycle.add_argument("--reason", type=str, default="Sistema em manutenção para processamento de resultados")
     p_cycle.add_argument("--snapshot-dir", default=None)
-    p_cycle.add_argument("--backup-file", default=None)
+    p_cycle.add_argument(
+        "--backup-file", type=_manifest_arg, default=None, help="Caminho do manifesto (.json)"
+    )
 
     p_drill = sub.add_parser("drill", help="Simulação operacional validando 4 pontos críticos")
     p_drill.add_argument("--game-id", required=True)
     p_drill.add_argument("--minutes", type=int, default=5)
     p_drill.add_argument("--reason", type=str, default="Simulação operacional de encerramento")
     p_drill.add_argument("--snapshot-dir", default=None)
-    p_drill.add_argument("--backup-file", default=None)
+    p_drill.add_argument(
+        "--backup-file", type=_manifest_arg, default=None, help="Caminho do manifesto (.json)"
+    )
     p_drill.add_argument("--base-url", type=str, default="http://localhost:8000")
     p_drill.add_argument("--faithful-token", required=True, help="Token JWT de usuário comum para testar compra durante lock")
 
@@ -476,9 +572,18 @@ def main():
     elif args.command == "unlock":
         unset_lock()
     elif args.command == "snapshot":
-        snapshot_game(game_id=args.game_id, output_dir=args.output_dir)
+        snapshot_game(game_id=args.game_id, output_dir=args.output_dir, full=args.full)
+    elif args.command == "verify-snapshot":
+        if not verify_snapshot(args.file)["valid"]:
+            sys.exit(1)
     elif args.command == "backup":
-        backup_database(output_file=args.output_file)
+        backup_database(
+            output_file=args.output_file,
+            store_dir=args.store_dir,
+            pages_per_step=args.pages_per_step,
+            step_sleep_ms=args.step_sleep_ms,
+            chunk_pages=args.chunk_pages,
+        )
     elif args.command == "close-cycle":
         run_cycle(
             game_id=args.game_id,
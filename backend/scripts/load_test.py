@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""
+Gerador de carga assíncrono (asyncio + httpx) para a API de Jogos/Cartelas.
+
+Substitui a carga em threads do stress_integrity_test.py por um gerador de
+malha aberta: as requisições saem na taxa configurada (constante ou Poisson)
+independentemente de as anteriores terem terminado, como numa corrida real de
+vendas. A latência é medida a partir do instante planejado de envio (corrige a
+"omissão coordenada" quando o servidor enfileira).
+
+Cenários (--scenario nome:taxa_por_segundo, repetível):
+- cards      -> POST /games/{id}/cards (cartela aleatória)
+- checkout   -> POST /games/{id}/cards + POST /games/{id}/cards/{card}/pay
+- listing    -> mistura de GET /games, /games/{id}, /games/{id}/cards, /users/me/cards
+- draw_watch -> tempestade de conexões: --watchers clientes abrem conexão ao
+                mesmo tempo e acompanham GET /games/{id} e /auth/public-status
+                a cada --watch-interval segundos (a API não tem push; o
+                frontend acompanha o sorteio por polling)
+
+Relatório: percentis de latência (histograma log-linear estilo HDR, 2 dígitos
+significativos), vazão atingida e classificação de erros (409 conflito,
+423 manutenção, 5xx, timeout, conexão). --report grava JSON; --compare
+imprime a diferença contra um relatório anterior.
+
+Uso:
+python3 backend/scripts/load_test.py --base-url http://localhost:8000 \\
+  --game-id SOR_20260223190000 --token "$JWT_FIEL" \\
+  --scenario cards:50 --scenario listing:200 --duration 30 --report carga.json
+
+# Sobe um uvicorn local (SQLite ou, com USE_SQLITE=false, o PostgreSQL do .env)
+python3 backend/scripts/load_test.py --spawn-server --port 8765 ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import httpx
+
+
+SCENARIOS = ("cards", "checkout", "listing", "draw_watch")
+
+# Pesos da mistura de leituras do cenário listing
+LISTING_MIX = (
+    ("GET", "/games", 4),
+    ("GET", "/games/{game_id}", 3),
+    ("GET", "/games/{game_id}/cards", 1),
+    ("GET", "/users/me/cards", 2),
+)
+
+
+# ============================================================================
+# HISTOGRAMA DE LATÊNCIA
+# ============================================================================
+
+
+class LatencyHistogram:
+    """
+    Histograma log-linear (estilo HDR) em microssegundos.
+
+    Cada valor é arredondado para baixo com `significant_digits` dígitos
+    significativos: memória limitada (~90 baldes por década) e erro relativo
+    máximo de 1% para 2 dígitos, em qualquer escala.
+    """
+
+    def __init__(self, significant_digits: int = 2):
+        self.significant_digits = significant_digits
+        self.counts: Counter = Counter()
+        self.total = 0
+        self.sum_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def _bucket(self, value_us: int) -> int:
+        if value_us < 10 ** self.significant_digits:
+            return value_us
+        scale = 10 ** (int(math.log10(value_us)) + 1 - self.significant_digits)
+        return (value_us // scale) * scale
+
+    def record(self, seconds: float) -> None:
+        value_us = max(0, int(seconds * 1_000_000))
+        self.counts[self._bucket(value_us)] += 1
+        self.total += 1
+        self.sum_us += value_us
+        self.max_us = max(self.max_us, value_us)
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+
+    def percentile(self, pct: float) -> float:
+        """Percentil em milissegundos (limite inferior do balde)."""
+        if not self.total:
+            return 0.0
+        rank = max(1, math.ceil(self.total * pct / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(bucket, self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "count": self.total,
+            "min_ms": round((self.min_us or 0) / 1000, 3),
+            "mean_ms": round(self.sum_us / self.total / 1000, 3) if self.total else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p90_ms": round(self.percentile(90), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "p999_ms": round(self.percentile(99.9), 3),
+            "max_ms": round(self.max_us / 1000, 3),
+        }
+
+
+def classify(status_code: Optional[int], error: Optional[BaseException] = None) -> str:
+    """Classe de resultado usada no relatório."""
+    if error is not None:
+        if isinstance(error, httpx.TimeoutException):
+            return "timeout"
+        if isinstance(error, httpx.TransportError):
+            return "conexao"
+        return "excecao"
+    if status_code is None:
+        return "excecao"
+    if 200 <= status_code < 300:
+        return "ok"
+    if status_code == 409:
+        return "409_conflito"
+    if status_code == 423:
+        return "423_manutencao"
+    if status_code >= 500:
+        return "5xx"
+    return f"{status_code}"
+
+
+@dataclass
+class ScenarioStats:
+    name: str
+    target_rate: float
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    outcomes: Counter = field(default_factory=Counter)
+    started: int = 0
+
+    def record(self, latency_s: float, outcome: str) -> None:
+        self.latency.record(latency_s)
+        self.outcomes[outcome] += 1
+
+    def report(self, elapsed_s: float) -> dict[str, Any]:
+        done = sum(self.outcomes.values())
+        errors = {k: v for k, v in self.outcomes.items() if k != "ok"}
+        return {
+            "target_rate": self.target_rate,
+            "achieved_rate": round(done / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+            "requests": done,
+            "ok": self.outcomes.get("ok", 0),
+            "error_rate": round(sum(errors.values()) / done, 4) if done else 0.0,
+            "errors": dict(sorted(errors.items())),
+            "latency": self.latency.summary(),
+        }
+
+
+# ============================================================================
+# CENÁRIOS
+# ============================================================================
+
+
+@dataclass
+class LoadPlan:
+    game_id: str
+    tokens: list[str]
+    rates: dict[str, float]
+    duration_s: float = 10.0
+    arrival: str = "poisson"
+    watchers: int = 0
+    watch_interval_s: float = 2.0
+    timeout_s: float = 10.0
+    seed: Optional[int] = None
+
+
+ClientFactory = Callable[[], httpx.AsyncClient]
+
+
+async def _timed(
+    stats: ScenarioStats,
+    planned_at: float,
+    call: Callable[[], Awaitable[httpx.Response]],
+) -> Optional[httpx.Response]:
+    stats.started += 1
+    try:
+        response = await call()
+    except Exception as exc:  # noqa: BLE001 - toda falha entra no relatório
+        stats.record(time.perf_counter() - planned_at, classify(None, exc))
+        return None
+    stats.record(time.perf_counter() - planned_at, classify(response.status_code))
+    return response
+
+
+def _auth(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+async def _cards_once(client, plan: LoadPlan, token: str, stats: ScenarioStats, planned_at: float):
+    await _timed(
+        stats,
+        planned_at,
+        lambda: client.post(f"/games/{plan.game_id}/cards", json={"modo": "aleatoria"}, headers=_auth(token)),
+    )
+
+
+async def _checkout_once(client, plan: LoadPlan, token: str, stats: ScenarioStats, planned_at: float):
+    # Latência do checkout = criação + pagamento, a partir do instante planejado
+    try:
+        created = await client.post(
+            f"/games/{plan.game_id}/cards", json={"modo": "aleatoria"}, headers=_auth(token)
+        )
+    except Exception as exc:  # noqa: BLE001
+        stats.started += 1
+        stats.record(time.perf_counter() - planned_at, classify(None, exc))
+        return
+    if created.status_code != 201:
+        stats.started += 1
+        stats.record(time.perf_counter() - planned_at, classify(created.status_code))
+        return
+    card_id = created.json().get("id")
+    await _timed(
+        stats,
+        planned_at,
+        lambda: client.post(f"/games/{plan.game_id}/cards/{card_id}/pay", headers=_auth(token)),
+    )
+
+
+def _listing_picker(rng: random.Random) -> Callable[[], tuple[str, str]]:
+    population = [(method, path) for method, path, weight in LISTING_MIX for _ in range(weight)]
+    return lambda: rng.choice(population)
+
+
+async def _open_loop(
+    client: httpx.AsyncClient,
+    plan: LoadPlan,
+    name: str,
+    stats: ScenarioStats,
+    rng: random.Random,
+) -> None:
+    """Dispara requisições na taxa alvo sem esperar as anteriores (malha aberta)."""
+    rate = plan.rates[name]
+    if rate <= 0:
+        return
+    pick_listing = _listing_picker(rng)
+    tasks: set[asyncio.Task] = set()
+    start = time.perf_counter()
+    next_at = start
+    sent = 0
+
+    while True:
+        gap = rng.expovariate(rate) if plan.arrival == "poisson" else 1.0 / rate
+        next_at += gap
+        if next_at - start >= plan.duration_s:
+            break
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        token = plan.tokens[sent % len(plan.tokens)] if plan.tokens else ""
+        sent += 1
+
+        if name == "cards":
+            coro = _cards_once(client, plan, token, stats, next_at)
+        elif name == "checkout":
+            coro = _checkout_once(client, plan, token, stats, next_at)
+        else:
+            method, path = pick_listing()
+            url = path.format(game_id=plan.game_id)
+            coro = _timed(
+                stats,
+                next_at,
+                lambda url=url, method=method, token=token: client.request(
+                    method, url, headers=_auth(token)
+                ),
+            )
+        task = asyncio.create_task(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
+async def _draw_watch(
+    client_factory: ClientFactory, plan: LoadPlan, stats: ScenarioStats
+) -> None:
+    """Todos os espectadores conectam de uma vez e acompanham o jogo por polling."""
+
+    async def _watcher(index: int) -> None:
+        token = plan.tokens[index % len(plan.tokens)] if plan.tokens else ""
+        async with client_factory() as client:
+            deadline = time.perf_counter() + plan.duration_s
+            while True:
+                planned_at = time.perf_counter()
+                if planned_at >= deadline:
+                    return
+                await _timed(
+                    stats, planned_at, lambda: client.get(f"/games/{plan.game_id}", headers=_auth(token))
+                )
+                await _timed(stats, time.perf_counter(), lambda: client.get("/auth/public-status"))
+                await asyncio.sleep(plan.watch_interval_s)
+
+    await asyncio.gather(*(_watcher(idx) for idx in range(plan.watchers)))
+
+
+async def run_load(client_factory: ClientFactory, plan: LoadPlan) -> dict[str, Any]:
+    """
+    Executa os cenários em paralelo e devolve o relatório.
+
+    Args:
+        client_factory: Cria um httpx.AsyncClient já apontado para a API
+        plan: Jogo, tokens, taxas por cenário, duração e chegada
+
+    Returns:
+        dict: Relatório por cenário e total (serializável em JSON)
+    """
+    rng = random.Random(plan.seed)
+    stats = {
+        name: ScenarioStats(name, plan.rates.get(name, 0.0))
+        for name in SCENARIOS
+        if plan.rates.get(name, 0.0) > 0 or (name == "draw_watch" and plan.watchers > 0)
+    }
+    if "draw_watch" in stats:
+        stats["draw_watch"].target_rate = (
+            round(plan.watchers * 2 / plan.watch_interval_s, 2) if plan.watch_interval_s > 0 else 0.0
+        )
+
+    started_wall = time.time()
+    started = time.perf_counter()
+    async with client_factory() as shared:
+        jobs = [
+            _open_loop(shared, plan, name, stats[name], random.Random(rng.random()))
+            for name in stats
+            if name != "draw_watch"
+        ]
+        if "draw_watch" in stats:
+            jobs.append(_draw_watch(client_factory, plan, stats["draw_watch"]))
+        await asyncio.gather(*jobs)
+    elapsed = time.perf_counter() - started
+
+    total = LatencyHistogram()
+    outcomes: Counter = Counter()
+    for item in stats.values():
+        total.merge(item.latency)
+        outcomes.update(item.outcomes)
+    total_stats = ScenarioStats("total", sum(s.target_rate for s in stats.values()), total, outcomes)
+
+    return {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started_wall)),
+        "elapsed_s": round(elapsed, 3),
+        "config": {
+            "game_id": plan.game_id,
+            "rates": plan.rates,
+            "duration_s": plan.duration_s,
+            "arrival": plan.arrival,
+            "watchers": plan.watchers,
+            "watch_interval_s": plan.watch_interval_s,
+            "tokens": len(plan.tokens),
+        },
+        "scenarios": {name: item.report(elapsed) for name, item in stats.items()},
+        "total": total_stats.report(elapsed),
+    }
+
+
+# ============================================================================
+# RELATÓRIO / COMPARAÇÃO
+# ============================================================================
+
+
+def print_report(report: dict[str, Any]) -> None:
+    header = f"{'cenário':<12} {'req':>7} {'req/s':>8} {'erro%':>7} {'p50':>9} {'p90':>9} {'p99':>9} {'p99.9':>9} {'max':>9}"  # noqa: E501
+    print(header)
+    for name, item in [*report["scenarios"].items(), ("total", report["total"])]:
+        lat = item["latency"]
+        print(
+            f"{name:<12} {item['requests']:>7} {item['achieved_rate']:>8.1f} "
+            f"{item['error_rate'] * 100:>6.2f}% {lat['p50_ms']:>8.1f}ms {lat['p90_ms']:>7.1f}ms "
+            f"{lat['p99_ms']:>7.1f}ms {lat['p999_ms']:>7.1f}ms {lat['max_ms']:>7.1f}ms"
+        )
+        if item["errors"]:
+            print(f"{'':<12} erros: {item['errors']}")
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Linhas com a variação de p50/p99/erro por cenário em relação ao baseline."""
+    lines = []
+    for name, item in [*current["scenarios"].items(), ("total", current["total"])]:
+        base = baseline["total"] if name == "total" else baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        parts = []
+        for key in ("p50_ms", "p99_ms"):
+            before, after = base["latency"][key], item["latency"][key]
+            change = ((after - before) / before * 100) if before else 0.0
+            parts.append(f"{key[:-3]} {before:.1f}→{after:.1f}ms ({change:+.0f}%)")
+        parts.append(f"erro {base['error_rate'] * 100:.2f}%→{item['error_rate'] * 100:.2f}%")
+        lines.append(f"{name:<12} " + " | ".join(parts))
+    return lines
+
+
+# ============================================================================
+# SERVIDOR LOCAL
+# ============================================================================
+
+
+def spawn_server(port: int, workers: int) -> subprocess.Popen:
+    """Sobe uvicorn com o ambiente atual (USE_SQLITE decide SQLite x PostgreSQL)."""
+    cmd = [
+        sys.executable, "-m", "uvicorn", "src.main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    process = subprocess.Popen(cmd, cwd=str(BACKEND_DIR), env=os.environ.copy())
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn terminou durante a inicialização")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/ping", timeout=1).status_code == 200:
+                return process
+        except httpx.TransportError:
+            pass
+        time.sleep(0.3)
+    process.terminate()
+    raise RuntimeError("uvicorn não respondeu em 30s")
+
+
+def _parse_scenario(value: str) -> tuple[str, float]:
+    name, _, rate = value.partition(":")
+    if name not in SCENARIOS or name == "draw_watch":
+        raise argparse.ArgumentTypeError(
+            f"cenário inválido: {name} (use cards, checkout ou listing; draw_watch via --watchers)"
+        )
+    try:
+        return name, float(rate or "10")
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"taxa inválida em {value}") from exc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gerador de carga assíncrono (malha aberta)")
+    parser.add_argument("--base-url", default=None, help="Ex: http://localhost:8000")
+    parser.add_argument("--game-id", required=True)
+    parser.add_argument("--token", action="append", default=[], help="JWT de fiel (repetível)")
+    parser.add_argument("--scenario", action="append", type=_parse_scenario, default=[], help="nome:req_por_s")
+    parser.add_argument("--duration", type=float, default=30.0, help="Segundos de carga")
+    parser.add_argument("--arrival", choices=("poisson", "constant"), default="poisson")
+    parser.add_argument("--watchers", type=int, default=0, help="Conexões do cenário draw_watch")
+    parser.add_argument("--watch-interval", type=float, default=2.0)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--report", default=None, help="Grava o relatório JSON neste caminho")
+    parser.add_argument("--compare", default=None, help="Relatório JSON anterior para comparar")
+    parser.add_argument("--spawn-server", action="store_true", help="Sobe uvicorn local para o teste")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--server-workers", type=int, default=1)
+    args = parser.parse_args()
+
+    if not args.scenario and args.watchers <= 0:
+        parser.error("informe ao menos um --scenario ou --watchers")
+
+    server = None
+    base_url = args.base_url
+    if args.spawn_server:
+        server = spawn_server(args.port, args.server_workers)
+        base_url = f"http://127.0.0.1:{args.port}"
+        print(f"🚀 uvicorn local em {base_url}")
+    if not base_url:
+        parser.error("informe --base-url ou --spawn-server")
+
+    plan = LoadPlan(
+        game_id=args.game_id,
+        tokens=args.token,
+        rates=dict(args.scenario),
+        duration_s=args.duration,
+        arrival=args.arrival,
+        watchers=args.watchers,
+        watch_interval_s=args.watch_interval,
+        timeout_s=args.timeout,
+        seed=args.seed,
+    )
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+
+    def client_factory() -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=base_url, timeout=plan.timeout_s, limits=limits)
+
+    try:
+        print(f"⏳ Carga por {plan.duration_s:.0f}s: {plan.rates or ''} watchers={plan.watchers}")
+        report = asyncio.run(run_load(client_factory, plan))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print_report(report)
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"✅ Relatório salvo em {args.report}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n📊 Comparação com", args.compare)
+        for line in compare_reports(baseline, report):
+            print(line)
+
+    return 1 if report["total"]["errors"].get("5xx") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
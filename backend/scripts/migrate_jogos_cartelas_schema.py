@@ -7,14 +7,25 @@ Objetivos:
 - Adicionar n1..n24 em cartelas
 - Migrar dados legados de cartelas.numeros (JSON) para n1..n24
 - Criar índice único composto (sorteio_id + n1..n24)
+- Criar índices compostos das consultas quentes (Cartela/Sorteio)
 - Normalizar status legado de cartelas para o novo fluxo
+
+As etapas de dados rodam em lotes por faixa de id (src/db/chunked_migration):
+um commit por lote, checkpoint para retomar após interrupção e progresso com
+vazão. Nenhuma transação segura a tabela de cartelas por minutos.
+
+Uso:
+python3 backend/scripts/migrate_jogos_cartelas_schema.py
+python3 backend/scripts/migrate_jogos_cartelas_schema.py --chunk-size 5000
+python3 backend/scripts/migrate_jogos_cartelas_schema.py --restart   # ignora checkpoints
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import sys
-from typing import Any
+from typing import Any, Sequence
 from pathlib import Path
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
@@ -24,10 +35,13 @@ if str(BACKEND_DIR) not in sys.path:
 from sqlalchemy import inspect, text
 
 from src.db.base import engine
+from src.db.chunked_migration import run_chunked_migration
+from src.models.models import Cartela, Sorteio
 
 
 CARD_COLS = [f"n{i}" for i in range(1, 25)]
 UNIQUE_INDEX_NAME = "uq_cartela_sorteio_n1_n24"
+DEFAULT_CHUNK_SIZE = 2000
 
 
 def get_columns(table: str) -> set[str]:
@@ -44,66 +58,102 @@ def add_column_if_missing(table: str, column_ddl: str, column_name: str):
     print(f"✅ Coluna adicionada: {table}.{column_name}")
 
 
-def migrate_legacy_numbers():
+def parse_legacy_numbers(raw: Any) -> list[str] | None:
+    """Converte cartelas.numeros (JSON, lista plana ou 5x5) para os 24 números n1..n24."""
+    if raw is None:
+        return None
+
+    parsed: Any = raw
+    if isinstance(raw, str):
+        try:
+            parsed = json.loads(raw)
+        except Exception:
+            parsed = None
+
+    numbers: list[str] = []
+    if isinstance(parsed, list):
+        for item in parsed:
+            if isinstance(item, list):
+                for sub in item:
+                    numbers.append(str(sub).zfill(2))
+            else:
+                numbers.append(str(item).zfill(2))
+
+    return numbers if len(numbers) == 24 else None
+
+
+def _legacy_number_params(rows: Sequence[Any]) -> list[dict[str, Any]]:
+    params = []
+    for row in rows:
+        if all(getattr(row, c) for c in CARD_COLS):
+            continue
+        numbers = parse_legacy_numbers(row.numeros)
+        if numbers is None:
+            continue
+        item = {c: numbers[idx] for idx, c in enumerate(CARD_COLS)}
+        item["id"] = row.id
+        params.append(item)
+    return params
+
+
+def migrate_legacy_numbers(chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True):
     cols = get_columns("cartelas")
     if "numeros" not in cols:
         print("ℹ️ Coluna legada cartelas.numeros não existe; nada para migrar")
         return
 
-    select_cols = "id, numeros, " + ", ".join(CARD_COLS)
-    with engine.begin() as conn:
-        rows = conn.execute(text(f"SELECT {select_cols} FROM cartelas")).mappings().all()
-
-        migrated = 0
-        for row in rows:
-            existing = [row.get(c) for c in CARD_COLS]
-            if all(existing):
-                continue
-
-            raw = row.get("numeros")
-            if raw is None:
-                continue
-
-            parsed: Any = raw
-            if isinstance(raw, str):
-                try:
-                    parsed = json.loads(raw)
-                except Exception:
-                    parsed = None
-
-            numbers: list[str] = []
-            if isinstance(parsed, list):
-                for item in parsed:
-                    if isinstance(item, list):
-                        for sub in item:
-                            numbers.append(str(sub).zfill(2))
-                    else:
-                        numbers.append(str(item).zfill(2))
-
-            if len(numbers) != 24:
-                continue
-
-            set_clause = ", ".join([f"{c} = :{c}" for c in CARD_COLS])
-            params = {c: numbers[idx] for idx, c in enumerate(CARD_COLS)}
-            params["id"] = row["id"]
-            conn.execute(text(f"UPDATE cartelas SET {set_clause} WHERE id = :id"), params)
-            migrated += 1
-
-    print(f"✅ Cartelas legadas migradas para n1..n24: {migrated}")
+    set_clause = ", ".join([f"{c} = :{c}" for c in CARD_COLS])
+    result = run_chunked_migration(
+        engine,
+        name="cartelas_numeros_n1_n24",
+        table="cartelas",
+        columns=["numeros", *CARD_COLS],
+        transform=_legacy_number_params,
+        update_sql=f"UPDATE cartelas SET {set_clause} WHERE id = :id",
+        # Só linhas ainda incompletas: reexecuções e retomadas leem pouco
+        where=" OR ".join([f"{c} IS NULL" for c in CARD_COLS]),
+        chunk_size=chunk_size,
+        resume=resume,
+    )
+
+    if result.resumed_from:
+        print(f"ℹ️ Retomado após a cartela {result.resumed_from}")
+    print(
+        f"✅ Cartelas legadas migradas para n1..n24: {result.updated} "
+        f"({result.scanned} lidas, {result.rows_per_second:,.0f} linhas/s)"
+    )
 
 
 def check_duplicates_before_unique_index() -> None:
-    group_cols = ", ".join(["sorteio_id", *CARD_COLS])
-    query = f"""
-        SELECT {group_cols}, COUNT(*) AS c
+    """
+    Procura cartelas repetidas jogo a jogo.
+
+    O GROUP BY de 25 colunas roda por sorteio_id (índice de cartelas.sorteio_id),
+    em consultas curtas, em vez de agrupar a tabela inteira de uma vez.
+    """
+    group_cols = ", ".join(CARD_COLS)
+    query = text(f"""
+        SELECT sorteio_id, {group_cols}, COUNT(*) AS c
         FROM cartelas
-        GROUP BY {group_cols}
+        WHERE sorteio_id = :sorteio_id
+        GROUP BY sorteio_id, {group_cols}
         HAVING COUNT(*) > 1
-        LIMIT 5
-    """
+        LIMIT :limite
+    """)
 
     with engine.connect() as conn:
-        dups = conn.execute(text(query)).fetchall()
+        game_ids = conn.execute(
+            text("SELECT DISTINCT sorteio_id FROM cartelas ORDER BY sorteio_id")
+        ).scalars().all()
+
+    dups: list[Any] = []
+    for game_id in game_ids:
+        with engine.connect() as conn:
+            dups.extend(
+                conn.execute(query, {"sorteio_id": game_id, "limite": 5 - len(dups)}).fetchall()
+            )
+        if len(dups) >= 5:
+            break
 
     if dups:
         print("❌ Duplicatas detectadas. Resolva antes de criar índice único.")
@@ -121,21 +171,59 @@ def create_unique_index_if_missing():
     print(f"✅ Índice único criado/verificado: {UNIQUE_INDEX_NAME}")
 
 
-def normalize_legacy_statuses():
+def create_hot_query_indexes_if_missing():
+    """
+    Cria os índices declarados nos modelos Sorteio/Cartela que ainda não existem.
+    create_all() só cria índices junto com tabelas novas; bancos já existentes
+    dependem desta etapa. Idempotente (checkfirst) em SQLite e PostgreSQL.
+    """
+    existing = {
+        table: {idx["name"] for idx in inspect(engine).get_indexes(table)}
+        for table in ("sorteios", "cartelas")
+    }
+
+    created = 0
+    for model in (Sorteio, Cartela):
+        for index in sorted(model.__table__.indexes, key=lambda idx: idx.name):
+            if index.name in existing[model.__tablename__]:
+                continue
+            index.create(bind=engine, checkfirst=True)
+            created += 1
+            print(f"✅ Índice criado: {index.name}")
+
+    print(f"✅ Índices das consultas quentes verificados (novos: {created})")
+
+
+def normalize_legacy_statuses(chunk_size: int = DEFAULT_CHUNK_SIZE, resume: bool = True):
     """
     Regras de normalização:
     - ativa -> paga (cartela historicamente válida para sorteio)
     - vencedora/perdedora permanecem inalteradas
     - demais valores permanecem para análise manual
     """
-    with engine.begin() as conn:
-        updated = conn.execute(text(
-            "UPDATE cartelas SET status = 'paga' WHERE status = 'ativa'"
-        )).rowcount or 0
-    print(f"✅ Status legados normalizados (ativa -> paga): {updated}")
+    result = run_chunked_migration(
+        engine,
+        name="cartelas_status_ativa_paga",
+        table="cartelas",
+        columns=["status"],
+        transform=lambda rows: [{"id": row.id} for row in rows],
+        update_sql="UPDATE cartelas SET status = 'paga' WHERE id = :id AND status = 'ativa'",
+        where="status = 'ativa'",
+        chunk_size=chunk_size,
+        resume=resume,
+    )
+    print(f"✅ Status legados normalizados (ativa -> paga): {result.updated}")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Migração de schema Jogos/Cartelas")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignora checkpoints e recomeça as etapas de dados"
+    )
+    args = parser.parse_args()
+    resume = not args.restart
+
     print("🚀 Iniciando migração Jogos/Cartelas...")
 
     add_column_if_missing("sorteios", "max_cards INTEGER", "max_cards")
@@ -143,7 +231,7 @@ def main():
     for card_col in CARD_COLS:
         add_column_if_missing("cartelas", f"{card_col} CHAR(2)", card_col)
 
-    migrate_legacy_numbers()
+    migrate_legacy_numbers(args.chunk_size, resume)
 
     # Garantir que não existem nulls nas colunas novas para criar índice confiável
     with engine.connect() as conn:
@@ -154,10 +242,11 @@ def main():
     if int(null_check) > 0:
         print(f"⚠️ Existem {null_check} cartelas com n1..n24 incompletos. O índice único será criado mesmo assim, mas revise esses registros.")
 
-    normalize_legacy_statuses()
+    normalize_legacy_statuses(args.chunk_size, resume)
 
     check_duplicates_before_unique_index()
     create_unique_index_if_missing()
+    create_hot_query_indexes_if_missing()
 
     print("✅ Migração concluída")
 
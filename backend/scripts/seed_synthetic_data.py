@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Carga sintética determinística para testes de desempenho (linha de comando).
+
+Insere N fiéis, M jogos e K cartelas no banco configurado (USE_SQLITE /
+variáveis do PostgreSQL), ou em --database-url. Mesma --seed e mesma
+--reference-date reproduzem exatamente os mesmos dados.
+
+Uso:
+python3 backend/scripts/seed_synthetic_data.py --fieis 20000 --games 50 --cards 1000000
+python3 backend/scripts/seed_synthetic_data.py --database-url sqlite:////tmp/perf.db --create-tables \\
+  --cards 200000 --seed 7 --reference-date 2026-01-01T19:00:00
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from sqlalchemy import create_engine, event
+
+from src.db.synthetic_data import DEFAULT_BATCH_SIZE, SYNTHETIC_PASSWORD, SyntheticSpec, generate_synthetic_data
+from src.utils.time_manager import FORTALEZA_TZ
+
+
+def _engine(database_url: str | None):
+    if not database_url:
+        from src.db.base import engine
+
+        return engine
+
+    from src.db.base import apply_sqlite_pragmas
+
+    if database_url.startswith("sqlite"):
+        custom = create_engine(database_url, connect_args={"check_same_thread": False})
+        event.listen(custom, "connect", lambda dbapi_conn, _record: apply_sqlite_pragmas(dbapi_conn))
+        return custom
+    return create_engine(database_url)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Gera massa sintética (fiéis, jogos e cartelas)")
+    parser.add_argument("--fieis", type=int, default=20000)
+    parser.add_argument("--games", type=int, default=50)
+    parser.add_argument("--cards", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--open-games", type=int, default=1, help="Jogos com vendas abertas")
+    parser.add_argument("--closing-games", type=int, default=0, help="Jogos com vendas vencidas a encerrar")
+    parser.add_argument("--paroquia-id", default="PAR_SYN")
+    parser.add_argument("--password", default=SYNTHETIC_PASSWORD, help="Senha de todos os fiéis")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--reference-date",
+        default=None,
+        help="Data base ISO (horário de Fortaleza) para datas reprodutíveis; padrão: agora",
+    )
+    parser.add_argument("--database-url", default=None, help="Padrão: banco configurado da aplicação")
+    parser.add_argument("--create-tables", action="store_true", help="Cria as tabelas antes da carga")
+    parser.add_argument("--keep-indexes", action="store_true", help="Não adia os índices em tabela vazia")
+    args = parser.parse_args()
+
+    reference_time = None
+    if args.reference_date:
+        reference_time = datetime.fromisoformat(args.reference_date)
+        if reference_time.tzinfo is None:
+            reference_time = FORTALEZA_TZ.localize(reference_time)
+
+    engine = _engine(args.database_url)
+    if args.create_tables:
+        from src.db.base import Base
+
+        Base.metadata.create_all(bind=engine)
+
+    spec = SyntheticSpec(
+        fieis=args.fieis,
+        games=args.games,
+        cards=args.cards,
+        seed=args.seed,
+        paroquia_id=args.paroquia_id,
+        password=args.password,
+        open_games=args.open_games,
+        closing_games=args.closing_games,
+        batch_size=args.batch_size,
+        reference_time=reference_time,
+        defer_indexes=not args.keep_indexes,
+    )
+    print(f"🌱 Gerando {spec.fieis:,} fiéis, {spec.games} jogos e {spec.cards:,} cartelas (seed={spec.seed})")
+    try:
+        result = generate_synthetic_data(engine, spec)
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        return 1
+
+    print(
+        f"✅ Concluído em {result.elapsed_seconds:.1f}s ({result.rows_per_second:,.0f} linhas/s) | "
+        f"jogos abertos: {', '.join(result.open_game_ids) or '-'}"
+    )
+    print(f"🔑 Login de teste: CPF {result.fiel_cpfs[0]} / senha {spec.password}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,8 @@ Teste de Stress e Integridade - Jogos/Cartelas
 
 Fluxo automatizado:
 1) (Opcional) Executa migração para validar sintaxe/compatibilidade local
-2) Simula carga: cria N cartelas rapidamente via API
+2) Simula carga: cria N cartelas simultâneas via API (asyncio/httpx)
+   Para carga sustentada com taxa de chegada, use scripts/load_test.py
 3) Ativa lock de manutenção
 4) Tenta criar +1 cartela durante lock e valida barreira (423/503)
 5) Executa snapshot e backup completo
@@ -22,6 +23,7 @@ python3 backend/scripts/stress_integrity_test.py \
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import random
 import subprocess
@@ -29,10 +31,15 @@ import sys
 import time
 import urllib.error
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import httpx
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "backend" / "scripts"))
+
+from load_test import LatencyHistogram, classify  # noqa: E402
+
 MAINTENANCE_SCRIPT = REPO_ROOT / "backend" / "scripts" / "jogos_cartelas_maintenance.py"
 MIGRATION_SCRIPT = REPO_ROOT / "backend" / "scripts" / "migrate_jogos_cartelas_schema.py"
 
@@ -118,6 +125,31 @@ def create_card(base_url: str, game_id: str, faithful_token: str, mode: str = "a
     )
 
 
+async def create_cards_burst(base_url: str, game_id: str, faithful_token: str, count: int):
+    """Dispara `count` criações de cartela simultâneas (asyncio + httpx)."""
+    latency = LatencyHistogram()
+    headers = {"Authorization": f"Bearer {faithful_token}"}
+
+    async with httpx.AsyncClient(base_url=base_url.rstrip("/"), timeout=30) as client:
+
+        async def _one():
+            t0 = now_s()
+            try:
+                response = await client.post(f"/games/{game_id}/cards", json={"modo": "aleatoria"}, headers=headers)
+            except httpx.HTTPError as exc:
+                latency.record(now_s() - t0)
+                return classify(None, exc), str(exc)
+            latency.record(now_s() - t0)
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = response.text
+            return response.status_code, payload
+
+        results = await asyncio.gather(*(_one() for _ in range(count)))
+    return results, latency
+
+
 def main():
     parser = argparse.ArgumentParser(description="Teste de stress e integridade para lock/snapshot/backup/cartelas")
     parser.add_argument("--base-url", required=True, help="Ex: http://localhost:8000")
@@ -163,17 +195,17 @@ def main():
     success_responses: list[dict] = []
     failures: list[tuple[int, dict | str]] = []
 
-    with ThreadPoolExecutor(max_workers=min(args.load, 10)) as executor:
-        futures = [executor.submit(create_card, base_url, game_id, args.faithful_token, "aleatoria", None) for _ in range(args.load)]
-        for fut in as_completed(futures):
-            code, payload = fut.result()
-            if code == 201 and isinstance(payload, dict):
-                success_responses.append(payload)
-            else:
-                failures.append((code, payload))
+    results, load_latency = asyncio.run(create_cards_burst(base_url, game_id, args.faithful_token, args.load))
+    for code, payload in results:
+        if code == 201 and isinstance(payload, dict):
+            success_responses.append(payload)
+        else:
+            failures.append((code, payload))
 
     load_elapsed = now_s() - load_t0
     print(f"Carga concluída em {load_elapsed:.3f}s | sucesso={len(success_responses)} | falhas={len(failures)}")
+    lat = load_latency.summary()
+    print(f"Latência: p50={lat['p50_ms']}ms p99={lat['p99_ms']}ms max={lat['max_ms']}ms")
 
     if failures:
         print("Falhas de carga:")
@@ -0,0 +1,483 @@
+"""
+Backup - Backups Online, Incrementais e Endereçados por Conteúdo
+================================================================
+Módulo responsável por:
+- SQLite: cópia consistente com a API de backup do sqlite3 (Connection.backup),
+  em passos de N páginas com pausa entre eles, para a aplicação continuar
+  lendo e gravando durante o backup
+- PostgreSQL: pg_dump por seção (pre-data / dados de cada tabela / post-data),
+  lido em streaming do stdout; todas as partes usam o mesmo snapshot
+  exportado (pg_export_snapshot), então o backup é consistente entre tabelas
+- Guardar o conteúdo em um repositório de objetos endereçados por SHA-256 e
+  comprimidos em gzip (objects/ab/abcd....gz): blocos de páginas (SQLite) ou
+  tabelas (PostgreSQL) que não mudaram desde o backup anterior não são
+  gravados de novo, apenas referenciados no manifesto
+- Remontar o banco (ou o SQL) a partir do manifesto, conferindo cada hash
+
+Manifesto (JSON): engine, data, tamanho do bloco e a lista ordenada de
+objetos que compõem o backup.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Sequence
+
+from src.utils.time_manager import get_fortaleza_time
+
+
+MANIFEST_VERSION = 1
+
+# Páginas copiadas por passo da API de backup (4 KiB cada no padrão do SQLite)
+DEFAULT_PAGES_PER_STEP = 256
+
+# Pausa entre passos: libera o banco para as escritas da aplicação
+DEFAULT_STEP_SLEEP_SECONDS = 0.005
+
+# Páginas por objeto no repositório (granularidade do incremental)
+DEFAULT_CHUNK_PAGES = 256
+
+_STREAM_BUFFER = 1024 * 1024
+
+
+@dataclass
+class BackupResult:
+    manifest_path: Path
+    objects_total: int
+    objects_written: int
+    objects_reused: int
+    bytes_total: int
+    bytes_written: int
+    elapsed_seconds: float
+
+
+# ============================================================================
+# REPOSITÓRIO DE OBJETOS
+# ============================================================================
+
+
+class ContentStore:
+    """Objetos gzip endereçados pelo SHA-256 do conteúdo descomprimido."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.gz"
+
+    def has(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def _publish(self, tmp_path: Path, digest: str) -> bool:
+        target = self.path_for(digest)
+        if target.exists():
+            tmp_path.unlink(missing_ok=True)
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, target)
+        return True
+
+    def _tmp_file(self) -> Path:
+        fd, name = tempfile.mkstemp(prefix=".tmp-", suffix=".gz", dir=self.objects_dir)
+        os.close(fd)
+        return Path(name)
+
+    def put_bytes(self, data: bytes) -> tuple[str, bool]:
+        """Guarda um bloco. Retorna (sha256, gravado?) — False se já existia."""
+        digest = hashlib.sha256(data).hexdigest()
+        if self.has(digest):
+            return digest, False
+        tmp_path = self._tmp_file()
+        with gzip.open(tmp_path, "wb", compresslevel=6) as fh:
+            fh.write(data)
+        return digest, self._publish(tmp_path, digest)
+
+    def put_stream(self, stream: IO[bytes]) -> tuple[str, int, bool]:
+        """
+        Comprime um fluxo direto para o repositório, calculando o hash no caminho.
+
+        Returns:
+            tuple: (sha256, bytes descomprimidos, gravado?)
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        tmp_path = self._tmp_file()
+        try:
+            with gzip.open(tmp_path, "wb", compresslevel=6) as fh:
+                while True:
+                    block = stream.read(_STREAM_BUFFER)
+                    if not block:
+                        break
+                    hasher.update(block)
+                    size += len(block)
+                    fh.write(block)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        digest = hasher.hexdigest()
+        return digest, size, self._publish(tmp_path, digest)
+
+    def iter_object(self, digest: str) -> Iterable[bytes]:
+        """Conteúdo descomprimido do objeto, conferindo o SHA-256 ao final."""
+        hasher = hashlib.sha256()
+        with gzip.open(self.path_for(digest), "rb") as fh:
+            while True:
+                block = fh.read(_STREAM_BUFFER)
+                if not block:
+                    break
+                hasher.update(block)
+                yield block
+        if hasher.hexdigest() != digest:
+            raise RuntimeError(f"Objeto de backup corrompido: {digest}")
+
+    def stored_size(self, digest: str) -> int:
+        return self.path_for(digest).stat().st_size
+
+
+def _write_manifest(path: Path, manifest: dict[str, Any]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_manifest(path: Path) -> dict[str, Any]:
+    manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise RuntimeError(f"Versão de manifesto não suportada: {manifest.get('version')}")
+    return manifest
+
+
+def is_manifest(path: Path) -> bool:
+    return Path(path).suffix == ".json"
+
+
+def _manifest_store(
+    manifest_path: Path, manifest: dict[str, Any], store_dir: Optional[Path]
+) -> ContentStore:
+    """
+    Repositório dos objetos: o informado, o gravado no manifesto ou, se este
+    não existir mais (repositório movido junto), a pasta do manifesto.
+    """
+    if store_dir is not None:
+        return ContentStore(store_dir)
+    recorded = manifest.get("store")
+    if recorded and (Path(recorded) / "objects").is_dir():
+        return ContentStore(Path(recorded))
+    return ContentStore(Path(manifest_path).parent)
+
+
+# ============================================================================
+# SQLITE
+# ============================================================================
+
+
+def sqlite_online_copy(
+    source_path: Path,
+    target_path: Path,
+    pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+    step_sleep_seconds: float = DEFAULT_STEP_SLEEP_SECONDS,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """
+    Cópia consistente de um SQLite em uso via sqlite3.Connection.backup.
+
+    Cada passo copia `pages_per_step` páginas, com pausa de `step_sleep_seconds`
+    entre passos. Em WAL (modo da aplicação) a origem fixa um snapshot de
+    leitura antes do primeiro passo: as escritas da aplicação seguem no WAL e
+    não reiniciam a cópia. Fora do WAL, uma escrita concorrente faz o SQLite
+    reiniciar os passos (o resultado continua consistente).
+    """
+    source = sqlite3.connect(f"file:{Path(source_path)}?mode=ro", uri=True, isolation_level=None)
+    target = sqlite3.connect(str(target_path))
+
+    def _throttle(status, remaining, total):
+        if progress is not None:
+            progress(total - remaining, total)
+        if remaining and step_sleep_seconds > 0:
+            time.sleep(step_sleep_seconds)
+
+    try:
+        if source.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal":
+            source.execute("BEGIN")
+            source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        source.backup(target, pages=pages_per_step, progress=_throttle)
+    finally:
+        target.close()
+        source.close()
+
+
+def backup_sqlite(
+    source_path: Path,
+    store_dir: Path,
+    manifest_path: Path,
+    pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+    step_sleep_seconds: float = DEFAULT_STEP_SLEEP_SECONDS,
+    chunk_pages: int = DEFAULT_CHUNK_PAGES,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> BackupResult:
+    """
+    Backup online e incremental de um banco SQLite.
+
+    A cópia consistente vai para um arquivo temporário no repositório e é
+    quebrada em blocos de `chunk_pages` páginas; só blocos inéditos são
+    comprimidos e gravados. O temporário é removido ao final.
+    """
+    started = time.perf_counter()
+    store = ContentStore(store_dir)
+    fd, tmp_name = tempfile.mkstemp(prefix=".snapshot-", suffix=".db", dir=store.root)
+    os.close(fd)
+    snapshot = Path(tmp_name)
+
+    try:
+        sqlite_online_copy(source_path, snapshot, pages_per_step, step_sleep_seconds, progress)
+
+        conn = sqlite3.connect(str(snapshot))
+        try:
+            page_size = int(conn.execute("PRAGMA page_size").fetchone()[0])
+            # Cópia sai em modo rollback journal: o arquivo sozinho é o banco completo
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
+
+        chunk_bytes = page_size * max(1, chunk_pages)
+        objects: list[dict[str, Any]] = []
+        written = bytes_written = bytes_total = 0
+        with open(snapshot, "rb") as fh:
+            while True:
+                data = fh.read(chunk_bytes)
+                if not data:
+                    break
+                digest, created = store.put_bytes(data)
+                objects.append({"sha256": digest, "size": len(data)})
+                bytes_total += len(data)
+                if created:
+                    written += 1
+                    bytes_written += store.stored_size(digest)
+    finally:
+        snapshot.unlink(missing_ok=True)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "engine": "sqlite",
+        "created_at": get_fortaleza_time().isoformat(),
+        "store": str(store.root.resolve()),
+        "source": str(source_path),
+        "page_size": page_size,
+        "chunk_pages": chunk_pages,
+        "size": bytes_total,
+        "objects": objects,
+    }
+    _write_manifest(manifest_path, manifest)
+    return BackupResult(
+        manifest_path=Path(manifest_path),
+        objects_total=len(objects),
+        objects_written=written,
+        objects_reused=len(objects) - written,
+        bytes_total=bytes_total,
+        bytes_written=bytes_written,
+        elapsed_seconds=time.perf_counter() - started,
+    )
+
+
+def restore_sqlite(
+    manifest_path: Path, target_path: Path, store_dir: Optional[Path] = None
+) -> Path:
+    """Remonta o arquivo SQLite do manifesto (store padrão: o gravado no manifesto)."""
+    manifest = load_manifest(manifest_path)
+    if manifest["engine"] != "sqlite":
+        raise RuntimeError("Manifesto não é de um backup SQLite")
+
+    store = _manifest_store(manifest_path, manifest, store_dir)
+    target_path = Path(target_path)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target_path.with_suffix(target_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as out:
+        for item in manifest["objects"]:
+            for block in store.iter_object(item["sha256"]):
+                out.write(block)
+    if tmp_path.stat().st_size != manifest["size"]:
+        tmp_path.unlink(missing_ok=True)
+        raise RuntimeError("Backup SQLite incompleto: tamanho restaurado diverge do manifesto")
+    os.replace(tmp_path, target_path)
+    return target_path
+
+
+# ============================================================================
+# POSTGRESQL
+# ============================================================================
+
+
+def _pg_dump_into_store(
+    store: ContentStore, base_cmd: Sequence[str], extra_args: Sequence[str], env: dict[str, str]
+) -> tuple[str, int, bool]:
+    process = subprocess.Popen(
+        [*base_cmd, *extra_args], env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    try:
+        digest, size, created = store.put_stream(process.stdout)
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read().decode("utf-8", errors="ignore")
+        process.stderr.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError(f"Falha no pg_dump {' '.join(extra_args)}: {stderr.strip()}")
+    return digest, size, created
+
+
+@contextmanager
+def exported_snapshot(url: Any) -> Iterator[Optional[str]]:
+    """
+    Mantém aberta uma transação REPEATABLE READ e exporta o seu snapshot.
+
+    Enquanto o bloco estiver ativo, cada `pg_dump --snapshot=<id>` enxerga
+    exatamente os mesmos dados. Produz None se não for possível exportar
+    (sem conexão, permissão, servidor antigo), para o chamador cair no dump
+    único.
+    """
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.pool import NullPool
+
+    engine = conn = None
+    snapshot_id: Optional[str] = None
+    try:
+        engine = create_engine(url, poolclass=NullPool)
+        conn = engine.connect().execution_options(isolation_level="REPEATABLE READ")
+        conn.begin()
+        snapshot_id = conn.execute(text("SELECT pg_export_snapshot()")).scalar()
+    except Exception:
+        snapshot_id = None
+
+    try:
+        yield snapshot_id
+    finally:
+        if conn is not None:
+            conn.close()
+        if engine is not None:
+            engine.dispose()
+
+
+def backup_postgresql(
+    url: Any,
+    tables: Sequence[str],
+    store_dir: Path,
+    manifest_path: Path,
+) -> BackupResult:
+    """
+    Backup incremental por tabela com pg_dump em texto, comprimido em streaming.
+
+    Partes: schema (pre-data), dados de cada tabela e post-data (índices e
+    constraints). Tabelas cujo dump é idêntico ao do backup anterior geram o
+    mesmo hash e não são regravadas.
+
+    Cada pg_dump roda com --snapshot do mesmo snapshot exportado, que fica
+    aberto até a última parte. Sem snapshot exportado, faz um único pg_dump
+    (consistente, mas sem reaproveitamento por tabela).
+    """
+    started = time.perf_counter()
+    store = ContentStore(store_dir)
+    env = os.environ.copy()
+    if url.password:
+        env["PGPASSWORD"] = url.password
+    base_cmd = [
+        "pg_dump",
+        "-h",
+        url.host or "localhost",
+        "-p",
+        str(url.port or 5432),
+        "-U",
+        url.username or "postgres",
+        "-d",
+        url.database or "postgres",
+        "--no-owner",
+    ]
+
+    objects: list[dict[str, Any]] = []
+    written = bytes_written = bytes_total = 0
+    with exported_snapshot(url) as snapshot_id:
+        if snapshot_id:
+            snapshot = [f"--snapshot={snapshot_id}"]
+            parts: list[tuple[str, list[str]]] = [("pre-data", ["--section=pre-data", *snapshot])]
+            parts += [
+                (f"data:{table}", ["--data-only", "--table", table, *snapshot])
+                for table in sorted(tables)
+            ]
+            parts.append(("post-data", ["--section=post-data", *snapshot]))
+        else:
+            parts = [("full", [])]
+
+        for name, args in parts:
+            digest, size, created = _pg_dump_into_store(store, base_cmd, args, env)
+            objects.append({"name": name, "sha256": digest, "size": size})
+            bytes_total += size
+            if created:
+                written += 1
+                bytes_written += store.stored_size(digest)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "engine": "postgresql",
+        "created_at": get_fortaleza_time().isoformat(),
+        "store": str(store.root.resolve()),
+        "source": url.database,
+        "snapshot": bool(snapshot_id),
+        "size": bytes_total,
+        "objects": objects,
+    }
+    _write_manifest(manifest_path, manifest)
+    return BackupResult(
+        manifest_path=Path(manifest_path),
+        objects_total=len(objects),
+        objects_written=written,
+        objects_reused=len(objects) - written,
+        bytes_total=bytes_total,
+        bytes_written=bytes_written,
+        elapsed_seconds=time.perf_counter() - started,
+    )
+
+
+def restore_postgresql_sql(
+    manifest_path: Path, target_sql: Path, store_dir: Optional[Path] = None
+) -> Path:
+    """Concatena as partes do manifesto em um .sql aplicável com psql -f."""
+    manifest = load_manifest(manifest_path)
+    if manifest["engine"] != "postgresql":
+        raise RuntimeError("Manifesto não é de um backup PostgreSQL")
+
+    store = _manifest_store(manifest_path, manifest, store_dir)
+    with open(target_sql, "wb") as out:
+        for item in manifest["objects"]:
+            for block in store.iter_object(item["sha256"]):
+                out.write(block)
+            out.write(b"\n")
+    return Path(target_sql)
+
+
+__all__ = [
+    "DEFAULT_PAGES_PER_STEP",
+    "DEFAULT_STEP_SLEEP_SECONDS",
+    "DEFAULT_CHUNK_PAGES",
+    "BackupResult",
+    "ContentStore",
+    "load_manifest",
+    "is_manifest",
+    "sqlite_online_copy",
+    "backup_sqlite",
+    "restore_sqlite",
+    "exported_snapshot",
+    "backup_postgresql",
+    "restore_postgresql_sql",
+]
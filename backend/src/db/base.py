@@ -3,17 +3,35 @@ Database Base Configuration - Configuração Base do Banco de Dados
 ================================================================
 Módulo responsável por:
 - Configurar o engine SQLAlchemy com PostgreSQL
+- Instrumentar o pool de conexões (espera, uso e overflow)
 - Definir a sessão de banco de dados
+- Opcionalmente, rotear leituras pesadas para uma réplica (DB_READ_HOST / DB_READ_URL)
 - Forçar timezone de Fortaleza em todas as conexões
+- Aplicar perfil de PRAGMAs de produção no SQLite (WAL, busy_timeout, cache)
 - Fornecer a classe Base para todos os modelos
 """
 
-from typing import Generator
+from typing import Callable, Generator, TypeVar
 from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from starlette.requests import Request
+import functools
+import inspect as pyinspect
 import os
+import time
+
+from src.db.pool_metrics import InstrumentedQueuePool, PoolTelemetry, attach_pool_telemetry
+from src.db.replica import ReadWriteSessions, ReplicaStickiness
+from src.db.schema_version import (
+    SchemaState,
+    read_schema_state,
+    schema_fingerprint,
+    schema_sync_forced,
+    write_schema_state,
+)
 
 
 # ============================================================================
@@ -53,29 +71,41 @@ else:
 # ENGINE CONFIGURATION
 # ============================================================================
 
+# Parâmetros do pool do PostgreSQL (configuráveis por ambiente)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+
 # Configuração do engine (diferente para SQLite vs PostgreSQL)
 if USE_SQLITE:
     # SQLite: Mais simples, sem pool de conexões
     engine = create_engine(
         DATABASE_URL,
+        poolclass=InstrumentedQueuePool,  # QueuePool padrão do SQLite + telemetria de espera
         connect_args={"check_same_thread": False},  # Necessário para SQLite com FastAPI
         echo=False,  # Não logar SQL (ative para debug)
         future=True,  # Usar SQLAlchemy 2.0 style
     )
 else:
-    # PostgreSQL: Com pool de conexões
+    # PostgreSQL: Com pool de conexões (dimensionável por ambiente).
+    # Regra prática: pool_size + max_overflow >= threads do threadpool por worker,
+    # e (workers * (pool_size + max_overflow)) < max_connections do PostgreSQL.
     engine = create_engine(
         DATABASE_URL,
-        poolclass=QueuePool,
-        pool_size=10,  # Número de conexões mantidas no pool
-        max_overflow=20,  # Conexões extras permitidas além do pool_size
-        pool_timeout=30,  # Timeout para obter conexão do pool (segundos)
-        pool_recycle=3600,  # Reciclar conexões a cada 1 hora
+        poolclass=InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,  # Número de conexões mantidas no pool
+        max_overflow=DB_MAX_OVERFLOW,  # Conexões extras permitidas além do pool_size
+        pool_timeout=DB_POOL_TIMEOUT,  # Timeout para obter conexão do pool (segundos)
+        pool_recycle=DB_POOL_RECYCLE,  # Reciclar conexões (segundos)
         pool_pre_ping=True,  # Testar conexão antes de usar
         echo=False,  # Não logar SQL (ative para debug)
         future=True,  # Usar SQLAlchemy 2.0 style
     )
 
+# Telemetria do pool (exposta em /admin/metrics/db-pool)
+pool_telemetry = attach_pool_telemetry(engine, PoolTelemetry())
+
 
 # ============================================================================
 # FORÇAR TIMEZONE DE FORTALEZA EM TODAS AS CONEXÕES
@@ -105,6 +135,158 @@ else:
     print("   ℹ️  SQLite: Timezone gerenciado pelo Python (pytz)")
 
 
+# ============================================================================
+# PERFIL DE PRAGMAS DO SQLITE (PRODUÇÃO EM PARÓQUIAS PEQUENAS)
+# ============================================================================
+
+# WAL: leitores não bloqueiam escritor (e vice-versa)
+# synchronous=NORMAL: seguro em WAL, fsync apenas no checkpoint
+# busy_timeout: espera o lock em vez de falhar com "database is locked"
+# cache_size negativo = tamanho em KiB
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE_BYTES", str(256 * 1024 * 1024))),
+    "temp_store": "MEMORY",
+}
+
+# Retentativas de transações de escrita quando o busy_timeout não basta
+SQLITE_WRITE_RETRY_ATTEMPTS = int(os.getenv("SQLITE_WRITE_RETRY_ATTEMPTS", "5"))
+SQLITE_WRITE_RETRY_BASE_DELAY = float(os.getenv("SQLITE_WRITE_RETRY_BASE_DELAY", "0.05"))
+
+
+def apply_sqlite_pragmas(dbapi_conn, pragmas: dict | None = None) -> None:
+    """
+    Aplica o perfil de PRAGMAs em uma conexão DBAPI do SQLite.
+
+    Args:
+        dbapi_conn: Conexão sqlite3
+        pragmas: Perfil alternativo (padrão: SQLITE_PRAGMAS)
+    """
+    cursor = dbapi_conn.cursor()
+    try:
+        for name, value in (pragmas or SQLITE_PRAGMAS).items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def configure_sqlite_engine(target_engine: Engine, pragmas: dict | None = None) -> None:
+    """
+    Registra o listener "connect" que aplica os PRAGMAs em toda nova conexão.
+
+    Exposto para que scripts e benchmarks apliquem o mesmo perfil a outros engines.
+    """
+
+    @event.listens_for(target_engine, "connect")
+    def set_sqlite_pragmas(dbapi_conn, connection_record):
+        apply_sqlite_pragmas(dbapi_conn, pragmas)
+
+
+if USE_SQLITE:
+    configure_sqlite_engine(engine)
+    print(
+        f"   ℹ️  SQLite: journal_mode={SQLITE_PRAGMAS['journal_mode']}, "
+        f"busy_timeout={SQLITE_PRAGMAS['busy_timeout']}ms"
+    )
+
+
+def is_sqlite_busy_error(exc: Exception) -> bool:
+    """Indica se o erro é de lock/ocupado do SQLite."""
+    message = str(getattr(exc, "orig", None) or exc).lower()
+    return "database is locked" in message or "database is busy" in message
+
+
+F = TypeVar("F", bound=Callable)
+
+
+def retry_on_sqlite_busy(func: F) -> F:
+    """
+    Decorator para endpoints de escrita: refaz a unidade de trabalho inteira
+    quando o SQLite devolve "database is locked" mesmo após o busy_timeout.
+
+    A sessão (kwarg "db") recebe rollback antes de cada nova tentativa, então a
+    função decorada deve reconsultar o estado a cada execução (como os endpoints
+    FastAPI já fazem). Em PostgreSQL o erro nunca casa e nada muda.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except OperationalError as exc:
+                if not is_sqlite_busy_error(exc) or attempt >= SQLITE_WRITE_RETRY_ATTEMPTS:
+                    raise
+                db = kwargs.get("db")
+                if db is not None:
+                    db.rollback()
+                time.sleep(SQLITE_WRITE_RETRY_BASE_DELAY * (2 ** (attempt - 1)))
+                attempt += 1
+
+    # FastAPI resolve anotações em string com os globals do wrapper (deste módulo);
+    # a assinatura já avaliada preserva módulos com "from __future__ import annotations".
+    wrapper.__signature__ = pyinspect.signature(func, eval_str=True)  # type: ignore[attr-defined]
+    return wrapper  # type: ignore[return-value]
+
+
+# ============================================================================
+# RÉPLICA DE LEITURA (OPCIONAL)
+# ============================================================================
+
+# DB_READ_URL tem precedência (ex.: sqlite:///./data/replica.db em testes locais);
+# DB_READ_HOST reaproveita usuário/senha/banco do primário em outro host.
+DATABASE_READ_URL = os.getenv("DB_READ_URL", "").strip() or None
+if DATABASE_READ_URL is None and not USE_SQLITE and os.getenv("DB_READ_HOST"):
+    DATABASE_READ_URL = (
+        f"postgresql://{DB_USER}:{DB_PASSWORD}@{os.getenv('DB_READ_HOST')}:"
+        f"{os.getenv('DB_READ_PORT', DB_PORT)}/{DB_NAME}"
+    )
+
+# Segundos em que um cliente lê do primário após escrever (read-your-writes)
+DB_READ_STICKY_SECONDS = float(os.getenv("DB_READ_STICKY_SECONDS", "5"))
+
+
+def create_read_engine(url: str) -> Engine:
+    """
+    Engine somente leitura para a réplica.
+
+    PostgreSQL: transações read-only por padrão e timezone de Fortaleza.
+    SQLite: mesmo perfil de PRAGMAs do primário + query_only.
+    """
+    if url.startswith("sqlite"):
+        read_engine_ = create_engine(
+            url,
+            poolclass=InstrumentedQueuePool,
+            connect_args={"check_same_thread": False},
+            future=True,
+        )
+        configure_sqlite_engine(read_engine_, {**SQLITE_PRAGMAS, "query_only": "ON"})
+        return read_engine_
+
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        connect_args={
+            "options": "-c default_transaction_read_only=on -c timezone=America/Fortaleza"
+        },
+        future=True,
+    )
+
+
+read_engine = create_read_engine(DATABASE_READ_URL) if DATABASE_READ_URL else None
+if read_engine is not None:
+    print(f"✓ Réplica de leitura ativa: {read_engine.url.render_as_string(hide_password=True)}")
+
+
 # ============================================================================
 # SESSION CONFIGURATION
 # ============================================================================
@@ -117,6 +299,18 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,  # Não expirar objetos após commit (útil para retornar objetos da API)
 )
 
+# Sessões da réplica (None sem réplica configurada)
+ReadSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=read_engine, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
+# Roteamento primário/réplica com aderência pós-escrita por cliente
+db_sessions = ReadWriteSessions(
+    SessionLocal, ReadSessionLocal, ReplicaStickiness(DB_READ_STICKY_SECONDS)
+)
+
 
 # ============================================================================
 # BASE CLASS PARA MODELOS
@@ -131,12 +325,13 @@ Base = declarative_base()
 # ============================================================================
 
 
-def get_db() -> Generator[Session, None, None]:
+def get_db(request: Request = None) -> Generator[Session, None, None]:
     """
     Dependency injection para FastAPI.
 
-    Cria uma sessão de banco de dados para cada request,
-    garante que seja fechada após o uso, e faz rollback em caso de erro.
+    Cria uma sessão de banco de dados (primário) para cada request e
+    garante que seja fechada após o uso. Commits com escrita fazem o
+    cliente ler do primário por DB_READ_STICKY_SECONDS em get_read_db.
 
     Yields:
         Session: Sessão do SQLAlchemy
@@ -146,11 +341,20 @@ def get_db() -> Generator[Session, None, None]:
         def read_users(db: Session = Depends(get_db)):
             return db.query(User).all()
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    yield from db_sessions.session(request)
+
+
+def get_read_db(request: Request = None) -> Generator[Session, None, None]:
+    """
+    Dependency para endpoints somente leitura (listagens pesadas).
+
+    Usa a réplica quando configurada, exceto logo após uma escrita do mesmo
+    cliente (read-your-writes). Nunca grave com esta sessão.
+
+    Yields:
+        Session: Sessão da réplica ou do primário
+    """
+    yield from db_sessions.read_session(request)
 
 
 # ============================================================================
@@ -158,13 +362,22 @@ def get_db() -> Generator[Session, None, None]:
 # ============================================================================
 
 
-def init_db() -> None:
+def init_db(target_engine: Engine | None = None) -> SchemaState:
     """
     Inicializa o banco de dados criando todas as tabelas.
 
     Esta função deve ser chamada apenas uma vez, no início da aplicação.
     Em produção, use Alembic para migrations.
+
+    Se o hash gravado em schema_versao bate com os modelos atuais, pula
+    create_all, a reflexão e as migrações automáticas (uma consulta só).
+    SCHEMA_SYNC_FORCE=true força a sincronização completa.
+
+    Returns:
+        SchemaState: Versão do schema/seed registrada após a inicialização
     """
+    bind = target_engine or engine
+
     # Import de todos os modelos para garantir que estejam registrados
     from src.models import models  # noqa: F401
 
@@ -172,16 +385,24 @@ def init_db() -> None:
     managed_tables = [
         table for table in Base.metadata.sorted_tables if table.info.get("managed", True)
     ]
-    Base.metadata.create_all(bind=engine, tables=managed_tables)
+    fingerprint = schema_fingerprint(managed_tables)
+
+    if not schema_sync_forced():
+        state = read_schema_state(bind)
+        if state is not None and state.schema_hash == fingerprint:
+            print(f"✓ Schema atual ({fingerprint[:12]}) - reflexão e DDL ignoradas")
+            return state
+
+    Base.metadata.create_all(bind=bind, tables=managed_tables)
 
     # Compatibilidade com bancos legados sem migrations completas
-    inspector = inspect(engine)
+    inspector = inspect(bind)
     table_names = set(inspector.get_table_names())
 
     if "sorteios" in table_names:
         sorteios_cols = {col["name"] for col in inspector.get_columns("sorteios")}
         if "max_cards" not in sorteios_cols:
-            with engine.begin() as conn:
+            with bind.begin() as conn:
                 conn.execute(text("ALTER TABLE sorteios ADD COLUMN max_cards INTEGER"))
             print("✓ Migração automática aplicada: coluna sorteios.max_cards")
 
@@ -189,14 +410,35 @@ def init_db() -> None:
         cartelas_cols = {col["name"] for col in inspector.get_columns("cartelas")}
         missing_card_cols = [f"n{i}" for i in range(1, 25) if f"n{i}" not in cartelas_cols]
         if missing_card_cols:
-            with engine.begin() as conn:
+            with bind.begin() as conn:
                 for col in missing_card_cols:
                     conn.execute(text(f"ALTER TABLE cartelas ADD COLUMN {col} CHAR(2)"))
             print(
                 f"✓ Migração automática aplicada: colunas cartelas ({', '.join(missing_card_cols)})"
             )
 
-    print("✓ Banco de dados inicializado com sucesso")
+    from src.db.normalized_contacts import ensure_normalized_contact_columns
+
+    for table_name, filled in ensure_normalized_contact_columns(bind).items():
+        print(
+            f"✓ Migração automática aplicada: {table_name}.*_norm "
+            f"({filled} registros preenchidos)"
+        )
+
+    # create_all não cria índices novos em tabelas que já existiam
+    inspector = inspect(bind)
+    for table in managed_tables:
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.info.get("dialect", bind.dialect.name) != bind.dialect.name:
+                continue
+            if index.name not in existing_indexes:
+                index.create(bind=bind)
+                print(f"✓ Migração automática aplicada: índice {index.name}")
+
+    state = write_schema_state(bind, schema_hash=fingerprint)
+    print(f"✓ Banco de dados inicializado com sucesso (schema {fingerprint[:12]})")
+    return state
 
 
 def drop_all_tables() -> None:
@@ -233,8 +475,18 @@ __all__ = [
     "SessionLocal",
     "Base",
     "get_db",
+    "get_read_db",
+    "db_sessions",
+    "read_engine",
+    "create_read_engine",
     "init_db",
     "drop_all_tables",
     "verify_connection",
     "DATABASE_URL",
+    "pool_telemetry",
+    "SQLITE_PRAGMAS",
+    "apply_sqlite_pragmas",
+    "configure_sqlite_engine",
+    "is_sqlite_busy_error",
+    "retry_on_sqlite_busy",
 ]
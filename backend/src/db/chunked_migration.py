@@ -0,0 +1,251 @@
+"""
+Chunked Migration - Migrações de Dados em Lotes Retomáveis
+==========================================================
+Módulo responsável por:
+- Percorrer uma tabela por faixas de chave primária (keyset: WHERE pk > :ultima
+  ORDER BY pk LIMIT :lote), sem carregar a tabela inteira em memória
+- Aplicar as alterações de cada lote com um único executemany
+- Fazer commit por lote junto com o checkpoint (tabela migration_checkpoints),
+  permitindo retomar do ponto em que uma execução interrompida parou
+- Informar progresso e vazão (linhas/s) a cada lote
+
+Cada transação dura um lote: nenhuma trava é mantida por minutos em tabelas
+grandes de cartelas.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine, Row
+
+
+CHECKPOINT_TABLE = "migration_checkpoints"
+
+_CHECKPOINT_DDL = (
+    f"CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} ("
+    "nome VARCHAR(100) PRIMARY KEY, "
+    "ultima_chave VARCHAR(255) NOT NULL, "
+    "linhas_lidas INTEGER NOT NULL DEFAULT 0, "
+    "linhas_alteradas INTEGER NOT NULL DEFAULT 0, "
+    "atualizado_em VARCHAR(32) NOT NULL)"
+)
+
+
+@dataclass
+class ChunkProgress:
+    """Situação após cada lote (repassada ao callback de progresso)."""
+
+    name: str
+    chunks: int
+    scanned: int
+    updated: int
+    last_key: Any
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class ChunkedMigrationResult:
+    name: str
+    chunks: int
+    scanned: int
+    updated: int
+    elapsed_seconds: float
+    resumed_from: Optional[str]
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def print_progress(progress: ChunkProgress) -> None:
+    """Callback padrão: uma linha por lote."""
+    print(
+        f"  ⏳ {progress.name}: lote {progress.chunks} | {progress.scanned} lidas | "
+        f"{progress.updated} alteradas | {progress.rows_per_second:,.0f} linhas/s"
+    )
+
+
+# ============================================================================
+# CHECKPOINTS
+# ============================================================================
+
+
+def ensure_checkpoint_table(target_engine: Engine) -> None:
+    with target_engine.begin() as conn:
+        conn.execute(text(_CHECKPOINT_DDL))
+
+
+def load_checkpoint(target_engine: Engine, name: str) -> Optional[str]:
+    """Última chave concluída de uma migração interrompida (None = começar do início)."""
+    ensure_checkpoint_table(target_engine)
+    with target_engine.connect() as conn:
+        return conn.execute(
+            text(f"SELECT ultima_chave FROM {CHECKPOINT_TABLE} WHERE nome = :nome"),
+            {"nome": name},
+        ).scalar()
+
+
+def clear_checkpoint(target_engine: Engine, name: str) -> None:
+    ensure_checkpoint_table(target_engine)
+    with target_engine.begin() as conn:
+        conn.execute(text(f"DELETE FROM {CHECKPOINT_TABLE} WHERE nome = :nome"), {"nome": name})
+
+
+def _save_checkpoint(
+    conn: Connection, name: str, last_key: Any, scanned: int, updated: int
+) -> None:
+    params = {
+        "nome": name,
+        "ultima_chave": str(last_key),
+        "linhas_lidas": scanned,
+        "linhas_alteradas": updated,
+        "atualizado_em": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    # UPDATE e, se não existir, INSERT: portátil entre SQLite e PostgreSQL
+    result = conn.execute(
+        text(
+            f"UPDATE {CHECKPOINT_TABLE} SET ultima_chave = :ultima_chave, "
+            "linhas_lidas = :linhas_lidas, linhas_alteradas = :linhas_alteradas, "
+            "atualizado_em = :atualizado_em WHERE nome = :nome"
+        ),
+        params,
+    )
+    if not result.rowcount:
+        conn.execute(
+            text(
+                f"INSERT INTO {CHECKPOINT_TABLE} "
+                "(nome, ultima_chave, linhas_lidas, linhas_alteradas, atualizado_em) "
+                "VALUES (:nome, :ultima_chave, :linhas_lidas, :linhas_alteradas, :atualizado_em)"
+            ),
+            params,
+        )
+
+
+# ============================================================================
+# EXECUÇÃO
+# ============================================================================
+
+
+def run_chunked_migration(
+    target_engine: Engine,
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    transform: Callable[[Sequence[Row]], list[dict[str, Any]]],
+    update_sql: str,
+    key_column: str = "id",
+    key_type: Callable[[str], Any] = str,
+    where: Optional[str] = None,
+    chunk_size: int = 1000,
+    resume: bool = True,
+    on_progress: Optional[Callable[[ChunkProgress], None]] = print_progress,
+) -> ChunkedMigrationResult:
+    """
+    Executa uma migração de dados em lotes por faixa de chave primária.
+
+    Args:
+        target_engine: Engine do banco
+        name: Identificador da migração (chave do checkpoint)
+        table: Tabela percorrida
+        columns: Colunas lidas além da chave
+        transform: Recebe as linhas do lote e devolve os parâmetros do UPDATE
+                   (lista vazia = nada a alterar neste lote)
+        update_sql: Comando com parâmetros nomeados, executado via executemany
+        key_column: Chave primária (ordenável) usada nas faixas
+        key_type: Conversão da chave salva no checkpoint (texto) de volta ao tipo da coluna
+        where: Filtro SQL adicional (ex.: "status = 'ativa'")
+        chunk_size: Linhas por lote / transação
+        resume: Se True, continua do checkpoint de uma execução interrompida
+        on_progress: Callback chamado após cada lote (None = silencioso)
+
+    Returns:
+        ChunkedMigrationResult: Totais da execução (somente desta execução)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser >= 1")
+
+    resumed_from = load_checkpoint(target_engine, name) if resume else None
+    if not resume:
+        clear_checkpoint(target_engine, name)
+
+    select_cols = ", ".join([key_column, *[col for col in columns if col != key_column]])
+    filters = [f"{key_column} > :ultima_chave"]
+    if where:
+        filters.append(f"({where})")
+    page_sql = text(
+        f"SELECT {select_cols} FROM {table} WHERE {' AND '.join(filters)} "
+        f"ORDER BY {key_column} LIMIT :lote"
+    )
+    first_page_sql = text(
+        f"SELECT {select_cols} FROM {table}"
+        + (f" WHERE ({where})" if where else "")
+        + f" ORDER BY {key_column} LIMIT :lote"
+    )
+    update_stmt = text(update_sql)
+
+    started = time.perf_counter()
+    last_key: Any = key_type(resumed_from) if resumed_from is not None else None
+    chunks = scanned = updated = 0
+
+    while True:
+        with target_engine.begin() as conn:
+            if last_key is None:
+                rows = conn.execute(first_page_sql, {"lote": chunk_size}).all()
+            else:
+                rows = conn.execute(page_sql, {"ultima_chave": last_key, "lote": chunk_size}).all()
+            if not rows:
+                break
+
+            params = transform(rows)
+            if params:
+                conn.execute(update_stmt, params)
+
+            last_key = getattr(rows[-1], key_column)
+            chunks += 1
+            scanned += len(rows)
+            updated += len(params)
+            _save_checkpoint(conn, name, last_key, scanned, updated)
+
+        if on_progress is not None:
+            on_progress(
+                ChunkProgress(
+                    name=name,
+                    chunks=chunks,
+                    scanned=scanned,
+                    updated=updated,
+                    last_key=last_key,
+                    elapsed_seconds=time.perf_counter() - started,
+                )
+            )
+
+        if len(rows) < chunk_size:
+            break
+
+    # Concluída: a próxima execução recomeça do início (migrações são idempotentes)
+    clear_checkpoint(target_engine, name)
+    return ChunkedMigrationResult(
+        name=name,
+        chunks=chunks,
+        scanned=scanned,
+        updated=updated,
+        elapsed_seconds=time.perf_counter() - started,
+        resumed_from=resumed_from,
+    )
+
+
+__all__ = [
+    "CHECKPOINT_TABLE",
+    "ChunkProgress",
+    "ChunkedMigrationResult",
+    "run_chunked_migration",
+    "load_checkpoint",
+    "clear_checkpoint",
+    "ensure_checkpoint_table",
+    "print_progress",
+]
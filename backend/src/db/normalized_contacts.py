@@ -0,0 +1,142 @@
+"""
+Normalized Contacts - Migração das Colunas *_norm
+=================================================
+Módulo responsável por:
+- Adicionar nome_norm / email_norm / telefone_norm / cpf_norm em bancos já existentes
+- Criar os índices dessas colunas
+- Preencher (backfill) as colunas em lotes, paginando pela PK
+
+Novas gravações já preenchem as colunas via NormalizedContactMixin; este
+módulo cobre apenas os registros anteriores à migração.
+"""
+
+from typing import Any
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.engine import Engine
+
+from src.utils.normalization import normalize_cpf, normalize_email, normalize_nome, normalize_phone
+
+
+NORMALIZED_COLUMNS = {
+    "nome_norm": "VARCHAR(200)",
+    "email_norm": "VARCHAR(200)",
+    "telefone_norm": "VARCHAR(20)",
+    "cpf_norm": "VARCHAR(11)",
+}
+
+
+def normalized_contact_models() -> list[Any]:
+    from src.models.models import AdminSiteUser, UsuarioComum, UsuarioParoquia
+
+    return [AdminSiteUser, UsuarioParoquia, UsuarioComum]
+
+
+def backfill_normalized_contacts(
+    target_engine: Engine, model: Any, chunk_size: int = 1000, only_missing: bool = True
+) -> int:
+    """
+    Preenche as colunas *_norm de uma tabela em lotes de `chunk_size`.
+
+    Args:
+        target_engine: Engine do banco
+        model: Modelo com NormalizedContactMixin
+        chunk_size: Linhas por transação
+        only_missing: Se True, ignora linhas que já têm alguma coluna *_norm
+
+    Returns:
+        int: Quantidade de linhas atualizadas
+    """
+    table = model.__table__
+    # SQL explícito: não dispara o onupdate de atualizado_em (backfill não é edição)
+    stmt = text(
+        f"UPDATE {table.name} SET nome_norm = :nome_norm, email_norm = :email_norm, "
+        "telefone_norm = :telefone_norm, cpf_norm = :cpf_norm WHERE id = :id"
+    )
+
+    updated = 0
+    last_id = ""
+    while True:
+        query = (
+            select(table.c.id, table.c.nome, table.c.email, table.c.telefone, table.c.cpf)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(chunk_size)
+        )
+        if only_missing:
+            query = query.where(
+                table.c.nome_norm.is_(None),
+                table.c.email_norm.is_(None),
+                table.c.telefone_norm.is_(None),
+                table.c.cpf_norm.is_(None),
+            )
+
+        with target_engine.begin() as conn:
+            rows = conn.execute(query).all()
+            if not rows:
+                break
+            params = [
+                {
+                    "id": row.id,
+                    "nome_norm": normalize_nome(row.nome) or None,
+                    "email_norm": normalize_email(row.email) or None,
+                    "telefone_norm": normalize_phone(row.telefone) or None,
+                    "cpf_norm": normalize_cpf(row.cpf) or None,
+                }
+                for row in rows
+            ]
+            conn.execute(stmt, params)
+
+        updated += len(rows)
+        last_id = rows[-1].id
+
+    return updated
+
+
+def ensure_normalized_contact_columns(
+    target_engine: Engine, chunk_size: int = 1000
+) -> dict[str, int]:
+    """
+    Garante colunas e índices *_norm e faz o backfill das tabelas migradas agora.
+
+    Returns:
+        dict[str, int]: Linhas preenchidas por tabela (somente tabelas migradas)
+    """
+    inspector = inspect(target_engine)
+    table_names = set(inspector.get_table_names())
+    result: dict[str, int] = {}
+
+    for model in normalized_contact_models():
+        table = model.__table__
+        if table.name not in table_names:
+            continue
+
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+        missing = [name for name in NORMALIZED_COLUMNS if name not in existing]
+        if not missing:
+            continue
+
+        with target_engine.begin() as conn:
+            for name in missing:
+                conn.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {name} {NORMALIZED_COLUMNS[name]}")
+                )
+
+        for index in table.indexes:
+            if {col.name for col in index.columns} & set(NORMALIZED_COLUMNS):
+                index.create(bind=target_engine, checkfirst=True)
+
+        # Recalcula todas as linhas: tabelas já migradas podem ganhar só uma coluna nova
+        result[table.name] = backfill_normalized_contacts(
+            target_engine, model, chunk_size, only_missing=False
+        )
+
+    return result
+
+
+__all__ = [
+    "NORMALIZED_COLUMNS",
+    "normalized_contact_models",
+    "backfill_normalized_contacts",
+    "ensure_normalized_contact_columns",
+]
@@ -0,0 +1,229 @@
+"""
+Pool Metrics - Telemetria do Pool de Conexões
+=============================================
+Módulo responsável por:
+- Medir o tempo de espera para obter conexão do pool (histograma)
+- Contar conexões em uso, overflow e novas conexões físicas
+- Expor um snapshot para o endpoint administrativo de métricas
+
+Os contadores vêm dos eventos "connect", "checkout" e "checkin" do pool.
+O tempo de espera é medido por InstrumentedQueuePool, porque o SQLAlchemy não
+emite evento antes da espera pela conexão (apenas depois de obtê-la).
+"""
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+# Limites superiores (ms) dos buckets do histograma de espera
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolTelemetry:
+    """Acumulador thread-safe das métricas de um pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects_total = 0
+            self.checkouts_total = 0
+            self.checkins_total = 0
+            self.checked_out = 0
+            self.checked_out_peak = 0
+            self.overflow_peak = 0
+            self.checkout_timeouts_total = 0
+            self.wait_count = 0
+            self.wait_sum_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects_total += 1
+
+    def record_checkout(self, overflow: int) -> None:
+        with self._lock:
+            self.checkouts_total += 1
+            self.checked_out += 1
+            self.checked_out_peak = max(self.checked_out_peak, self.checked_out)
+            self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins_total += 1
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_sum_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+            for idx, upper in enumerate(WAIT_BUCKETS_MS):
+                if elapsed_ms <= upper:
+                    self.wait_buckets[idx] += 1
+                    break
+            else:
+                self.wait_buckets[-1] += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.checkout_timeouts_total += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            cumulative = 0
+            buckets = []
+            for upper, count in zip([*WAIT_BUCKETS_MS, "+Inf"], self.wait_buckets):
+                cumulative += count
+                buckets.append({"le_ms": upper, "count": cumulative})
+
+            return {
+                "connects_total": self.connects_total,
+                "checkouts_total": self.checkouts_total,
+                "checkins_total": self.checkins_total,
+                "checked_out": self.checked_out,
+                "checked_out_peak": self.checked_out_peak,
+                "overflow_peak": self.overflow_peak,
+                "checkout_timeouts_total": self.checkout_timeouts_total,
+                "wait": {
+                    "count": self.wait_count,
+                    "sum_ms": round(self.wait_sum_ms, 3),
+                    "avg_ms": (
+                        round(self.wait_sum_ms / self.wait_count, 3) if self.wait_count else 0.0
+                    ),
+                    "max_ms": round(self.wait_max_ms, 3),
+                    "buckets": buckets,
+                },
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool que registra o tempo de espera de cada checkout."""
+
+    telemetry: PoolTelemetry | None = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            if self.telemetry is not None:
+                self.telemetry.record_timeout()
+            raise
+        if self.telemetry is not None:
+            self.telemetry.record_wait((time.perf_counter() - started) * 1000.0)
+        return conn
+
+
+def attach_pool_telemetry(target_engine: Engine, telemetry: PoolTelemetry) -> PoolTelemetry:
+    """
+    Conecta a telemetria aos eventos do pool do engine.
+
+    Args:
+        target_engine: Engine cujo pool será observado
+        telemetry: Acumulador que receberá as métricas
+
+    Returns:
+        PoolTelemetry: O mesmo acumulador (para encadeamento)
+    """
+    pool = target_engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        pool.telemetry = telemetry
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_conn, connection_record):
+        telemetry.record_connect()
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_conn, connection_record, connection_proxy):
+        overflow = pool.overflow() if hasattr(pool, "overflow") else 0
+        telemetry.record_checkout(max(0, overflow))
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_conn, connection_record):
+        telemetry.record_checkin()
+
+    return telemetry
+
+
+def pool_status(target_engine: Engine, telemetry: PoolTelemetry) -> dict[str, Any]:
+    """
+    Snapshot das métricas acumuladas + estado instantâneo do pool.
+
+    Returns:
+        dict: Configuração, estado atual e métricas acumuladas do pool
+    """
+    pool = target_engine.pool
+    config: dict[str, Any] = {"pool_class": type(pool).__name__}
+    current: dict[str, Any] = {}
+
+    if isinstance(pool, QueuePool):
+        config.update(
+            {
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "pool_timeout_s": pool._timeout,
+            }
+        )
+        current.update(
+            {
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(0, pool.overflow()),
+            }
+        )
+
+    return {"config": config, "current": current, "metrics": telemetry.snapshot()}
+
+
+def render_pool_prometheus(status: dict[str, Any]) -> str:
+    """
+    Converte o resultado de pool_status() para o formato texto do Prometheus.
+
+    Returns:
+        str: Linhas de métricas do pool (gauges, counters e histograma de espera)
+    """
+    current = status.get("current", {})
+    metrics = status["metrics"]
+    lines = [
+        "# HELP db_pool_checked_out Conexões do pool em uso.",
+        "# TYPE db_pool_checked_out gauge",
+        f"db_pool_checked_out {current.get('checked_out', metrics['checked_out'])}",
+        "# HELP db_pool_overflow Conexões de overflow abertas.",
+        "# TYPE db_pool_overflow gauge",
+        f"db_pool_overflow {current.get('overflow', 0)}",
+        "# HELP db_pool_checkouts_total Checkouts de conexão realizados.",
+        "# TYPE db_pool_checkouts_total counter",
+        f"db_pool_checkouts_total {metrics['checkouts_total']}",
+        "# HELP db_pool_checkout_timeouts_total Checkouts que estouraram pool_timeout.",
+        "# TYPE db_pool_checkout_timeouts_total counter",
+        f"db_pool_checkout_timeouts_total {metrics['checkout_timeouts_total']}",
+        "# HELP db_pool_wait_seconds Tempo de espera por conexão do pool.",
+        "# TYPE db_pool_wait_seconds histogram",
+    ]
+    for bucket in metrics["wait"]["buckets"]:
+        upper = bucket["le_ms"]
+        le = upper if upper == "+Inf" else repr(upper / 1000.0)
+        lines.append(f'db_pool_wait_seconds_bucket{{le="{le}"}} {bucket["count"]}')
+    lines.append(f"db_pool_wait_seconds_sum {metrics['wait']['sum_ms'] / 1000.0!r}")
+    lines.append(f"db_pool_wait_seconds_count {metrics['wait']['count']}")
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "WAIT_BUCKETS_MS",
+    "PoolTelemetry",
+    "InstrumentedQueuePool",
+    "attach_pool_telemetry",
+    "pool_status",
+    "render_pool_prometheus",
+]
@@ -0,0 +1,164 @@
+"""
+Query Plan Checker - Verificação de Índices nas Consultas Quentes
+=================================================================
+Módulo responsável por:
+- Reproduzir o formato das consultas mais frequentes de Jogos/Cartelas
+- Executar EXPLAIN (PostgreSQL) / EXPLAIN QUERY PLAN (SQLite) em cada uma
+- Indicar se o plano usa índice ou faz varredura completa da tabela
+
+Os formatos abaixo espelham as consultas de src/routers/games_routes.py.
+Ao alterar um filtro/ordenação nos endpoints, atualize a consulta correspondente.
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql import Select
+
+from src.models.models import Cartela, Sorteio, StatusCartela, StatusSorteio
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """Consulta quente associada ao endpoint que a executa."""
+
+    endpoint: str
+    table: str
+    build: Callable[[], Select]
+
+
+HOT_QUERIES: list[HotQuery] = [
+    HotQuery(
+        endpoint="GET /games/{game_id}/cards",
+        table="cartelas",
+        build=lambda: select(Cartela.id)
+        .where(Cartela.sorteio_id == "SOR_X")
+        .order_by(Cartela.criado_em.desc()),
+    ),
+    HotQuery(
+        endpoint="POST /games/{game_id}/close-sales (carrinhos)",
+        table="cartelas",
+        build=lambda: select(Cartela.id).where(
+            Cartela.sorteio_id == "SOR_X",
+            Cartela.status == StatusCartela.NO_CARRINHO,
+        ),
+    ),
+    HotQuery(
+        endpoint="POST /games/{game_id}/close-sales (pagas)",
+        table="cartelas",
+        build=lambda: select(Cartela.id).where(
+            Cartela.sorteio_id == "SOR_X",
+            Cartela.status.in_([StatusCartela.PAGA, StatusCartela.ATIVA]),
+        ),
+    ),
+    HotQuery(
+        endpoint="GET /users/me/cards",
+        table="cartelas",
+        build=lambda: select(Cartela.id)
+        .where(Cartela.usuario_id == "USR_X")
+        .order_by(Cartela.criado_em.desc()),
+    ),
+    HotQuery(
+        endpoint="POST /games/{game_id}/cards/{card_id}/pay",
+        table="cartelas",
+        build=lambda: select(Cartela.id).where(
+            Cartela.id == "CAR_X",
+            Cartela.sorteio_id == "SOR_X",
+        ),
+    ),
+    HotQuery(
+        endpoint="GET /games",
+        table="sorteios",
+        build=lambda: select(Sorteio.id).order_by(Sorteio.horario_sorteio.desc()),
+    ),
+    HotQuery(
+        endpoint="POST /games/{game_id}/reschedule (jogos futuros)",
+        table="sorteios",
+        build=lambda: select(Sorteio.id)
+        .where(
+            Sorteio.status.in_([StatusSorteio.AGENDADO, StatusSorteio.EM_ANDAMENTO]),
+            Sorteio.horario_sorteio > "2000-01-01 00:00:00",
+        )
+        .order_by(Sorteio.horario_sorteio.asc()),
+    ),
+]
+
+
+def _compile_literal(conn: Connection, statement: Select) -> str:
+    return str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+
+
+def explain_query(conn: Connection, statement: Select) -> list[str]:
+    """
+    Executa o EXPLAIN adequado ao dialeto e retorna as linhas do plano.
+
+    No PostgreSQL, varredura sequencial é desabilitada apenas nesta transação:
+    tabelas pequenas levariam o planner a preferir Seq Scan mesmo com índice
+    disponível, e o objetivo aqui é saber se o índice é *utilizável*.
+    """
+    sql = _compile_literal(conn, statement)
+
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        return [str(row[-1]) for row in rows]
+
+    if conn.dialect.name == "postgresql":
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        rows = conn.exec_driver_sql(f"EXPLAIN {sql}").fetchall()
+        return [str(row[0]) for row in rows]
+
+    raise RuntimeError(f"Dialeto não suportado para verificação de plano: {conn.dialect.name}")
+
+
+def plan_uses_index(dialect_name: str, table: str, plan_lines: list[str]) -> bool:
+    """
+    Indica se o plano acessa a tabela via índice.
+
+    SQLite: "SCAN <tabela>" sem "USING ... INDEX" é varredura completa.
+    PostgreSQL: "Seq Scan on <tabela>" é varredura completa.
+    """
+    if dialect_name == "sqlite":
+        for line in plan_lines:
+            upper = line.upper()
+            if upper.startswith("SCAN") and table.upper() in upper and "INDEX" not in upper:
+                return False
+        return any("INDEX" in line.upper() for line in plan_lines)
+
+    for line in plan_lines:
+        if "Seq Scan" in line and table in line:
+            return False
+    return any("Index" in line for line in plan_lines)
+
+
+def check_hot_query_indexes(engine: Engine) -> list[dict]:
+    """
+    Executa EXPLAIN em todas as consultas quentes.
+
+    Returns:
+        list[dict]: Um item por consulta com endpoint, plano e flag uses_index
+    """
+    results = []
+    with engine.connect() as conn:
+        for hot_query in HOT_QUERIES:
+            with conn.begin():
+                plan = explain_query(conn, hot_query.build())
+            results.append(
+                {
+                    "endpoint": hot_query.endpoint,
+                    "table": hot_query.table,
+                    "plan": plan,
+                    "uses_index": plan_uses_index(conn.dialect.name, hot_query.table, plan),
+                }
+            )
+    return results
+
+
+__all__ = [
+    "HotQuery",
+    "HOT_QUERIES",
+    "explain_query",
+    "plan_uses_index",
+    "check_hot_query_indexes",
+]
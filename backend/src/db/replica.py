@@ -0,0 +1,152 @@
+"""
+Replica - Roteamento de Leituras para Réplica com Aderência Pós-Escrita
+=======================================================================
+Módulo responsável por:
+- Entregar sessões do primário (get_db) ou da réplica de leitura (get_read_db)
+- Garantir "read-your-writes": após um commit com escrita, as leituras do
+  mesmo cliente vão ao primário por alguns segundos (aderência / stickiness),
+  cobrindo o atraso de replicação
+- Identificar o cliente pelo token Bearer (hash) ou, sem token, pelo IP
+
+Sem réplica configurada, get_read_db devolve sessões do primário.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Callable, Generator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.requests import Request
+
+
+# Chaves em Session.info
+STICKY_KEY_INFO = "replica_sticky_key"
+PENDING_WRITE_INFO = "replica_pending_write"
+ROLE_INFO = "db_role"
+
+
+class ReplicaStickiness:
+    """Janela, por cliente, em que as leituras devem ir ao primário."""
+
+    def __init__(self, ttl_seconds: float = 5.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, key: Optional[str]) -> None:
+        """Registra uma escrita do cliente (reinicia a janela)."""
+        if not key or self.ttl_seconds <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            self._until[key] = now + self.ttl_seconds
+            if len(self._until) > 10000:
+                self._until = {k: v for k, v in self._until.items() if v > now}
+
+    def is_sticky(self, key: Optional[str]) -> bool:
+        if not key:
+            return False
+        until = self._until.get(key)
+        return until is not None and until > self._clock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._until.clear()
+
+
+def sticky_key_from_request(request: Optional[Request]) -> Optional[str]:
+    """Identificador estável do cliente: hash do token Bearer ou IP de origem."""
+    if request is None:
+        return None
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return "tok:" + hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:24]
+    if request.client is not None:
+        return f"ip:{request.client.host}"
+    return None
+
+
+class ReadWriteSessions:
+    """
+    Fábrica de sessões por papel (primário/réplica) com aderência pós-escrita.
+
+    Args:
+        primary_factory: sessionmaker do primário
+        replica_factory: sessionmaker da réplica (None = sem réplica)
+        stickiness: Janela de aderência compartilhada
+    """
+
+    def __init__(
+        self,
+        primary_factory: sessionmaker,
+        replica_factory: Optional[sessionmaker] = None,
+        stickiness: Optional[ReplicaStickiness] = None,
+    ):
+        self.primary_factory = primary_factory
+        self.replica_factory = replica_factory
+        self.stickiness = stickiness or ReplicaStickiness()
+        self._install_write_tracking(primary_factory)
+
+    @property
+    def has_replica(self) -> bool:
+        return self.replica_factory is not None
+
+    def _install_write_tracking(self, factory: sessionmaker) -> None:
+        stickiness = self.stickiness
+
+        @event.listens_for(factory, "after_flush")
+        def _flag_flush(session, flush_context):
+            session.info[PENDING_WRITE_INFO] = True
+
+        @event.listens_for(factory, "do_orm_execute")
+        def _flag_bulk(orm_execute_state):
+            if orm_execute_state.is_update or orm_execute_state.is_delete:
+                orm_execute_state.session.info[PENDING_WRITE_INFO] = True
+
+        @event.listens_for(factory, "after_commit")
+        def _stick_after_commit(session):
+            # Marca no commit (e não ao fim da requisição): a próxima leitura do
+            # cliente pode chegar antes do teardown das dependências
+            if session.info.pop(PENDING_WRITE_INFO, False):
+                stickiness.mark(session.info.get(STICKY_KEY_INFO))
+
+        @event.listens_for(factory, "after_soft_rollback")
+        def _discard_on_rollback(session, previous_transaction):
+            session.info.pop(PENDING_WRITE_INFO, None)
+
+    def _open(self, factory: sessionmaker, role: str, key: Optional[str]) -> Session:
+        session = factory()
+        session.info[ROLE_INFO] = role
+        session.info[STICKY_KEY_INFO] = key
+        return session
+
+    def session(self, request: Optional[Request] = None) -> Generator[Session, None, None]:
+        """Sessão do primário (leituras e escritas)."""
+        db = self._open(self.primary_factory, "primary", sticky_key_from_request(request))
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def read_session(self, request: Optional[Request] = None) -> Generator[Session, None, None]:
+        """Sessão da réplica; do primário sem réplica ou se o cliente escreveu há pouco."""
+        key = sticky_key_from_request(request)
+        if not self.has_replica or self.stickiness.is_sticky(key):
+            db = self._open(self.primary_factory, "primary", key)
+        else:
+            db = self._open(self.replica_factory, "replica", key)
+        try:
+            yield db
+        finally:
+            db.close()
+
+
+__all__ = [
+    "ReplicaStickiness",
+    "ReadWriteSessions",
+    "sticky_key_from_request",
+    "ROLE_INFO",
+]
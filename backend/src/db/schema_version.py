@@ -0,0 +1,150 @@
+"""
+Schema Version - Versão do Schema e do Seed Aplicados
+=====================================================
+Módulo responsável por:
+- Calcular a impressão digital (hash) das tabelas gerenciadas pelos modelos
+- Ler/gravar o registro único da tabela schema_versao
+- Decidir se a inicialização precisa de reflexão/DDL e de seed
+
+Com o schema atual, o boot faz uma única consulta (uma linha) em vez de
+create_all + inspect + get_columns/get_indexes por tabela. Para forçar a
+sincronização completa (ex.: banco alterado manualmente), use
+SCHEMA_SYNC_FORCE=true.
+"""
+
+from dataclasses import dataclass
+import hashlib
+import os
+from typing import Iterable, Optional
+
+from sqlalchemy import Table, UniqueConstraint, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+from src.utils.time_manager import get_fortaleza_time
+
+
+# Incrementar ao mudar a lógica de migração automática do init_db
+# (mudanças nos modelos já alteram o hash sozinhas)
+SCHEMA_REVISION = 1
+
+SCHEMA_ROW_ID = "SCHEMA"
+
+
+@dataclass(frozen=True)
+class SchemaState:
+    """Conteúdo do registro de schema_versao."""
+
+    schema_hash: str
+    seed_versao: int
+
+
+def schema_sync_forced() -> bool:
+    return os.getenv("SCHEMA_SYNC_FORCE", "false").lower() == "true"
+
+
+def schema_fingerprint(tables: Iterable[Table]) -> str:
+    """
+    Hash estável das tabelas: colunas (tipo, nulidade, PK), índices e restrições únicas.
+
+    Calculado só a partir dos metadados em memória, sem consultar o banco.
+    """
+    digest = hashlib.sha256(f"revision={SCHEMA_REVISION}".encode())
+    for table in sorted(tables, key=lambda item: item.name):
+        digest.update(f"\ntable {table.name}".encode())
+        for column in table.columns:
+            digest.update(
+                f"\n col {column.name} {column.type!r} "
+                f"null={column.nullable} pk={column.primary_key}".encode()
+            )
+        for index in sorted(table.indexes, key=lambda item: item.name or ""):
+            columns = ",".join(column.name for column in index.columns)
+            digest.update(f"\n index {index.name} {columns} unique={index.unique}".encode())
+        unique_constraints = sorted(
+            (constraint.name or "", ",".join(column.name for column in constraint.columns))
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        )
+        for name, columns in unique_constraints:
+            digest.update(f"\n unique {name} {columns}".encode())
+    return digest.hexdigest()
+
+
+def _schema_table() -> Table:
+    from src.models.models import SchemaVersao
+
+    return SchemaVersao.__table__
+
+
+def read_schema_state(target_engine: Engine) -> Optional[SchemaState]:
+    """
+    Lê o registro de versão (uma consulta).
+
+    Returns:
+        SchemaState, ou None se a tabela/registro ainda não existe
+    """
+    table = _schema_table()
+    try:
+        with target_engine.connect() as conn:
+            row = conn.execute(
+                select(table.c.schema_hash, table.c.seed_versao).where(table.c.id == SCHEMA_ROW_ID)
+            ).first()
+    except (OperationalError, ProgrammingError):
+        # Primeiro boot ou banco legado: tabela schema_versao ainda não criada
+        return None
+    if row is None:
+        return None
+    return SchemaState(schema_hash=row.schema_hash, seed_versao=row.seed_versao)
+
+
+def write_schema_state(
+    target_engine: Engine, schema_hash: Optional[str] = None, seed_versao: Optional[int] = None
+) -> SchemaState:
+    """
+    Grava (upsert) o hash do schema e/ou a versão do seed, preservando o outro campo.
+
+    Returns:
+        SchemaState: Estado após a gravação
+    """
+    table = _schema_table()
+    with target_engine.begin() as conn:
+        row = conn.execute(
+            select(table.c.schema_hash, table.c.seed_versao).where(table.c.id == SCHEMA_ROW_ID)
+        ).first()
+        state = SchemaState(
+            schema_hash=(
+                schema_hash if schema_hash is not None else (row.schema_hash if row else "")
+            ),
+            seed_versao=seed_versao if seed_versao is not None else (row.seed_versao if row else 0),
+        )
+        values = {
+            "schema_hash": state.schema_hash,
+            "seed_versao": state.seed_versao,
+            "atualizado_em": get_fortaleza_time(),
+        }
+        if row is None:
+            conn.execute(table.insert().values(id=SCHEMA_ROW_ID, **values))
+        else:
+            conn.execute(table.update().where(table.c.id == SCHEMA_ROW_ID).values(**values))
+    return state
+
+
+def seed_pending(state: Optional[SchemaState], seed_version: int) -> bool:
+    """Seed roda no primeiro boot, quando SEED_VERSION sobe ou com SCHEMA_SYNC_FORCE."""
+    return schema_sync_forced() or state is None or state.seed_versao < seed_version
+
+
+def mark_seed_applied(target_engine: Engine, seed_version: int) -> SchemaState:
+    return write_schema_state(target_engine, seed_versao=seed_version)
+
+
+__all__ = [
+    "SCHEMA_REVISION",
+    "SchemaState",
+    "schema_sync_forced",
+    "schema_fingerprint",
+    "read_schema_state",
+    "write_schema_state",
+    "seed_pending",
+    "mark_seed_applied",
+]
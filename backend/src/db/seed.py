@@ -15,7 +15,6 @@ do primeiro SUPER_ADMIN.
 import os
 import logging
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 
 from src.models.models import (
     AdminSiteUser,
@@ -27,12 +26,14 @@ from src.models.models import (
     CategoriaConfiguracao,
     SistemaAuditoria,
 )
-from src.utils.time_manager import generate_temporal_id_with_microseconds, get_fortaleza_time
+from src.utils.auth import get_pwd_context
+from src.utils.time_manager import generate_unique_temporal_id, get_fortaleza_time
 
 logger = logging.getLogger(__name__)
 
-# Contexto para hash de senhas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Incrementar ao mudar os dados de bootstrap (roles, admin, configurações):
+# o startup só roda seed_database quando schema_versao.seed_versao < SEED_VERSION
+SEED_VERSION = 1
 
 
 def hash_password(password: str) -> str:
@@ -44,7 +45,7 @@ def hash_password(password: str) -> str:
     # Garantir que senha não ultrapasse 72 bytes
     if isinstance(password, str):
         password = password.encode("utf-8")[:72].decode("utf-8", errors="ignore")
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def check_seed_needed(db: Session) -> bool:
@@ -72,7 +73,7 @@ def ensure_roles_paroquia_defaults(db: Session) -> None:
         if not existente:
             db.add(
                 RoleParoquia(
-                    id=generate_temporal_id_with_microseconds("ROL"),
+                    id=generate_unique_temporal_id("ROL"),
                     codigo=codigo,
                     nome=nome,
                     descricao=descricao,
@@ -151,7 +152,7 @@ def seed_database(db: Session) -> bool:
         # ====================================================================
         # Primeiro admin que gerenciará paroquias criadas depois
         bootstrap_admin = AdminSiteUser(
-            id=generate_temporal_id_with_microseconds("ADM"),
+            id=generate_unique_temporal_id("ADM"),
             nome="Admin",
             login="Admin",
             senha_hash=hash_password("admin123"),
@@ -392,4 +393,4 @@ def seed_database(db: Session) -> bool:
 
 
 # Exportações
-__all__ = ["seed_database", "check_seed_needed", "hash_password"]
+__all__ = ["SEED_VERSION", "seed_database", "check_seed_needed", "hash_password"]
@@ -0,0 +1,589 @@
+"""
+Synthetic Data - Massa Sintética Determinística para Testes de Desempenho
+=========================================================================
+Módulo responsável por:
+- Gerar N fiéis (CPFs válidos), M jogos e K cartelas a partir de uma semente:
+  mesma semente + mesma data de referência = mesmos dados
+- Garantir assinatura única por jogo (conjunto dos 24 números, a mesma regra
+  da trava de checkout), sem consultar o banco, e gravar em configuracoes a
+  trava `paid_card_unique::<jogo>::<números>` de cada cartela paga, como o
+  checkout faz
+- Inserir em lotes direto no driver: VALUES multi-linha por página no
+  PostgreSQL (execute_values) e executemany no SQLite, com os valores já
+  convertidos pelos tipos das colunas; outros dialetos usam insert() do Core
+- Reaproveitar um único hash bcrypt para todas as senhas (gerar um hash por
+  fiel levaria horas em 1M de registros)
+- Em tabelas vazias, recriar os índices secundários só depois da carga
+
+Não apaga nada: os ids levam o prefixo SYN<semente> e não colidem com ids
+reais nem com os de outra carga de semente diferente.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import Table, bindparam, insert, literal, select, update
+from sqlalchemy.engine import Connection, Engine
+
+from src.models.models import (
+    CategoriaConfiguracao,
+    Cartela,
+    Configuracao,
+    Paroquia,
+    Sorteio,
+    StatusCartela,
+    StatusSorteio,
+    TipoConfiguracao,
+    UsuarioComum,
+)
+from src.utils.auth import hash_password
+from src.utils.normalization import normalize_email, normalize_nome, normalize_phone
+from src.utils.time_manager import get_fortaleza_time
+
+
+SYNTHETIC_PASSWORD = "Senha@123"
+
+# Linhas por executemany (o driver ainda pagina internamente no PostgreSQL)
+DEFAULT_BATCH_SIZE = 5000
+
+# Fração de cartelas pagas nos jogos com vendas abertas
+OPEN_GAME_PAID_RATIO = 0.7
+
+_NUMBER_STRINGS = tuple(f"{n:02d}" for n in range(1, 76))
+_NUMBER_BITS = tuple(1 << n for n in range(75))
+# Bytes aleatórios -> posições 0..74 sem viés (bytes >= 225 são descartados)
+_BYTE_TO_POSITION = bytes(value % 75 for value in range(256))
+_BYTE_REJECT = bytes(range(225, 256))
+# Sorteios por cartela: 40 valores têm ~31 distintos em média (precisamos de 24)
+_DRAWS_PER_CARD = 40
+_CARD_NUMBER_KEYS = tuple(f"n{i}" for i in range(1, 25))
+
+
+@dataclass
+class SyntheticSpec:
+    """Volume e parâmetros da carga sintética."""
+
+    fieis: int
+    games: int
+    cards: int
+    seed: int = 42
+    paroquia_id: str = "PAR_SYN"
+    password: str = SYNTHETIC_PASSWORD
+    open_games: int = 1
+    closing_games: int = 0
+    batch_size: int = DEFAULT_BATCH_SIZE
+    reference_time: Optional[datetime] = None
+    # Em tabela vazia: remove os índices secundários e recria ao final
+    defer_indexes: bool = True
+
+    @property
+    def id_prefix(self) -> str:
+        return f"SYN{self.seed}"
+
+
+@dataclass
+class SyntheticProgress:
+    table: str
+    inserted: int
+    total: int
+    elapsed_seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.inserted / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass
+class SyntheticDataResult:
+    fieis: int
+    games: int
+    cards: int
+    elapsed_seconds: float
+    fiel_ids: list[str] = field(default_factory=list)
+    fiel_cpfs: list[str] = field(default_factory=list)
+    open_game_ids: list[str] = field(default_factory=list)
+    closing_game_ids: list[str] = field(default_factory=list)
+    game_ids: list[str] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        total = self.fieis + self.games + self.cards
+        return total / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def print_progress(progress: SyntheticProgress) -> None:
+    """Callback padrão: uma linha por lote."""
+    print(
+        f"  ⏳ {progress.table}: {progress.inserted:,}/{progress.total:,} | "
+        f"{progress.rows_per_second:,.0f} linhas/s"
+    )
+
+
+def synthetic_cpf(index: int, seed: int = 0) -> str:
+    """CPF válido (dígitos verificadores Módulo 11), único por (semente, índice)."""
+    base = (seed * 7_919_993 + index) % 900_000_000 + 100_000_000
+    digits = [int(ch) for ch in str(base)]
+    for length in (9, 10):
+        resto = sum(d * (length + 1 - i) for i, d in enumerate(digits)) % 11
+        digits.append(0 if resto < 2 else 11 - resto)
+    return "".join(map(str, digits))
+
+
+def _fiel_rows(spec: SyntheticSpec, senha_hash: str, now: datetime, result: SyntheticDataResult):
+    prefix = spec.id_prefix
+    for idx in range(spec.fieis):
+        fiel_id = f"USR_{prefix}_{idx:08d}"
+        cpf = synthetic_cpf(idx, spec.seed)
+        result.fiel_ids.append(fiel_id)
+        result.fiel_cpfs.append(cpf)
+        phone = f"85{9_0000_0000 + (idx % 1_0000_0000):09d}"
+        nome = f"Fiel Sintético {idx}"
+        email = f"fiel{idx}.{prefix.lower()}@synthetic.example.com"
+        # Core não dispara o NormalizedContactMixin: *_norm preenchidas aqui
+        yield (
+            fiel_id,
+            nome,
+            cpf,
+            email,
+            phone,
+            phone,
+            senha_hash,
+            "fiel",
+            0,
+            True,
+            False,
+            spec.paroquia_id,
+            normalize_nome(nome),
+            normalize_email(email),
+            normalize_phone(phone),
+            cpf,
+            now,
+            now,
+        )
+
+
+def _game_rows(spec: SyntheticSpec, now: datetime, result: SyntheticDataResult) -> list[dict]:
+    rows = []
+    for idx in range(spec.games):
+        game_id = f"SOR_{spec.id_prefix}_{idx:05d}"
+        if idx < spec.open_games:
+            game_status = StatusSorteio.AGENDADO
+            inicio = now - timedelta(days=2)
+            fim = now + timedelta(days=5)
+            result.open_game_ids.append(game_id)
+        elif idx < spec.open_games + spec.closing_games:
+            # Vendas vencidas há pouco, aguardando o encerramento
+            game_status = StatusSorteio.AGENDADO
+            inicio = now - timedelta(days=3)
+            fim = now - timedelta(minutes=5)
+            result.closing_game_ids.append(game_id)
+        else:
+            # Histórico semanal: o jogo idx aconteceu idx semanas atrás
+            game_status = StatusSorteio.FINALIZADO
+            inicio = now - timedelta(weeks=idx, days=3)
+            fim = inicio + timedelta(days=2)
+        result.game_ids.append(game_id)
+        rows.append(
+            {
+                "id": game_id,
+                "paroquia_id": spec.paroquia_id,
+                "titulo": f"Bingo Sintético {idx}",
+                "valor_cartela": 10.0,
+                "rateio_premio": 50.0,
+                "rateio_paroquia": 30.0,
+                "rateio_operacao": 15.0,
+                "rateio_evolucao": 5.0,
+                "total_arrecadado": 0.0,
+                "total_premio": 0.0,
+                "total_cartelas_vendidas": 0,
+                "inicio_vendas": inicio,
+                "fim_vendas": fim,
+                "horario_sorteio": fim + timedelta(hours=1),
+                "status": game_status,
+                "pedras_sorteadas": [],
+                "vencedores_ids": [],
+                "criado_em": inicio,
+                "atualizado_em": inicio,
+            }
+        )
+    return rows
+
+
+_CARD_COLUMNS = (
+    "id",
+    "sorteio_id",
+    "usuario_id",
+    *_CARD_NUMBER_KEYS,
+    "status",
+    "numeros_marcados",
+    "criado_em",
+    "atualizado_em",
+)
+
+# Trava de unicidade gravada pelo checkout (games_routes) para cada cartela paga
+_LOCK_COLUMNS = ("chave", "valor", "tipo", "categoria", "descricao", "alterado_em")
+_LOCK_DESCRIPTION = "Trava de unicidade de cartela no checkout (primeiro pagamento vence)"
+
+_FIEL_COLUMNS = (
+    "id",
+    "nome",
+    "cpf",
+    "email",
+    "telefone",
+    "whatsapp",
+    "senha_hash",
+    "tipo",
+    "tentativas_login",
+    "ativo",
+    "banido",
+    "paroquia_id",
+    "nome_norm",
+    "email_norm",
+    "telefone_norm",
+    "cpf_norm",
+    "criado_em",
+    "atualizado_em",
+)
+
+
+def _card_rows(
+    game: dict,
+    count: int,
+    rng: random.Random,
+    fiel_ids: list[str],
+    now: datetime,
+    paid: list[int],
+    locks: list[tuple],
+):
+    """
+    Cartelas de um jogo como tuplas em _CARD_COLUMNS; `paid[0]` acumula as
+    pagas e `locks` recebe a trava de checkout (_LOCK_COLUMNS) de cada uma.
+    """
+    finished = game["status"] == StatusSorteio.FINALIZADO
+    seen: set[int] = set()
+    # Compras entre o início das vendas e o fim delas (ou agora, se ainda abertas)
+    window = max(1, int((min(game["fim_vendas"], now) - game["inicio_vendas"]).total_seconds()))
+    randbytes, randrange, rand = rng.randbytes, rng.randrange, rng.random
+    inicio = game["inicio_vendas"]
+    game_id = game["id"]
+    prefix = f"CAR_{game_id[4:]}_"
+    lock_prefix = f"paid_card_unique::{game_id}::"
+    total_fieis = len(fiel_ids)
+    number_of = _NUMBER_STRINGS.__getitem__
+    bit_of = _NUMBER_BITS.__getitem__
+    no_marks: list = []
+
+    stream = b""
+    pos = 0
+    produced = 0
+    while produced < count:
+        # Os 24 primeiros valores distintos de um fluxo uniforme formam uma
+        # amostra uniforme (equivale a random.sample, mas tudo em C)
+        picked: list[int] = []
+        while len(picked) < 24:
+            if pos + _DRAWS_PER_CARD > len(stream):
+                stream = stream[pos:] + randbytes(65536).translate(_BYTE_TO_POSITION, _BYTE_REJECT)
+                pos = 0
+            end = pos + _DRAWS_PER_CARD
+            picked = list(dict.fromkeys([*picked, *stream[pos:end]]))
+            pos = end
+        del picked[24:]
+
+        # Assinatura = conjunto dos números (bitmask), como na trava de checkout
+        signature = sum(map(bit_of, picked))
+        if signature in seen:
+            continue
+        seen.add(signature)
+
+        if finished:
+            card_status = StatusCartela.PERDEDORA
+        elif rand() < OPEN_GAME_PAID_RATIO:
+            card_status = StatusCartela.PAGA
+        else:
+            card_status = StatusCartela.NO_CARRINHO
+        bought = inicio + timedelta(seconds=randrange(window))
+        card_id = f"{prefix}{produced:08d}"
+        if card_status is not StatusCartela.NO_CARRINHO:
+            paid[0] += 1
+            # Mesma chave de _build_paid_card_lock_key (números "01".."75" ordenados)
+            picked_sorted = sorted(picked)
+            locks.append(
+                (
+                    lock_prefix + "|".join(map(number_of, picked_sorted)),
+                    card_id,
+                    TipoConfiguracao.STRING,
+                    CategoriaConfiguracao.CARRINHO,
+                    _LOCK_DESCRIPTION,
+                    bought,
+                )
+            )
+        yield (
+            card_id,
+            game_id,
+            fiel_ids[randrange(total_fieis)],
+            *map(number_of, picked),
+            card_status,
+            no_marks,
+            bought,
+            bought,
+        )
+        produced += 1
+
+
+def _driver_executemany(
+    conn: Connection, table: Table, columns: tuple[str, ...], rows: list[tuple]
+) -> bool:
+    """
+    Caminho rápido: executemany direto no driver com valores já convertidos
+    pelos próprios tipos das colunas (bind_processor), sem o processamento
+    por linha do SQLAlchemy. Retorna False se o dialeto não tiver caminho rápido.
+    """
+    dialect = conn.dialect
+    is_psycopg2 = dialect.name == "postgresql" and dialect.driver == "psycopg2"
+    if not is_psycopg2 and dialect.paramstyle != "qmark":
+        return False
+
+    processors = [
+        (idx, processor)
+        for idx, name in enumerate(columns)
+        if (processor := table.c[name].type.bind_processor(dialect)) is not None
+    ]
+    if processors:
+        # Valores repetidos em sequência (status, [] de marcados) convertidos uma vez
+        last_in: list = [object()] * len(processors)
+        last_out: list = [None] * len(processors)
+        converted = []
+        for row in rows:
+            values = list(row)
+            for slot, (idx, processor) in enumerate(processors):
+                value = values[idx]
+                if value is not last_in[slot]:
+                    last_in[slot] = value
+                    last_out[slot] = processor(value)
+                values[idx] = last_out[slot]
+            converted.append(values)
+        rows = converted
+
+    quote = dialect.identifier_preparer.quote
+    column_list = ", ".join(quote(name) for name in columns)
+    cursor = conn.connection.cursor()
+    try:
+        if is_psycopg2:
+            from psycopg2.extras import execute_values
+
+            # VALUES multi-linha em páginas de 1000 linhas
+            execute_values(
+                cursor,
+                f"INSERT INTO {quote(table.name)} ({column_list}) VALUES %s",
+                rows,
+                page_size=1000,
+            )
+        else:
+            placeholders = ", ".join("?" * len(columns))
+            cursor.executemany(
+                f"INSERT INTO {quote(table.name)} ({column_list}) VALUES ({placeholders})", rows
+            )
+    finally:
+        cursor.close()
+    return True
+
+
+@contextmanager
+def _deferred_indexes(engine: Engine, table: Table, enabled: bool):
+    """
+    Carga em tabela vazia: remove os índices secundários antes e os recria no
+    fim (um CREATE INDEX ordenado custa bem menos que manter 7-11 índices
+    linha a linha). Tabela com dados mantém os índices: nada é removido em
+    banco em uso. PK, UNIQUE e índices únicos ficam sempre ativos.
+    """
+    with engine.connect() as conn:
+        empty = conn.execute(select(literal(1)).select_from(table).limit(1)).first() is None
+    # Índices únicos (ex.: cpf/email dos fiéis) continuam valendo durante a carga
+    secondary = [index for index in table.indexes if not index.unique]
+    indexes = sorted(secondary, key=lambda index: index.name) if enabled and empty else []
+
+    with engine.begin() as conn:
+        for index in indexes:
+            index.drop(conn, checkfirst=True)
+    try:
+        yield
+    finally:
+        with engine.begin() as conn:
+            for index in indexes:
+                index.create(conn, checkfirst=True)
+
+
+def _insert_batches(
+    engine: Engine,
+    table: Table,
+    columns: tuple[str, ...],
+    rows: Iterator[tuple],
+    total: int,
+    batch_size: int,
+    started: float,
+    inserted_before: int,
+    on_progress: Optional[Callable[[SyntheticProgress], None]],
+    side_rows: Optional[tuple[Table, tuple[str, ...], list[tuple]]] = None,
+) -> int:
+    """
+    Insere em lotes de `batch_size` linhas, numa transação por chamada.
+    `side_rows` (tabela, colunas, lista) é esvaziada a cada lote na mesma
+    transação: linhas dependentes que o gerador acumula enquanto produz o lote.
+    """
+    inserted = inserted_before
+    batch: list[tuple] = []
+
+    def _execute(
+        conn: Connection, target: Table, target_columns: tuple[str, ...], target_rows: list[tuple]
+    ):
+        if not _driver_executemany(conn, target, target_columns, target_rows):
+            conn.execute(insert(target), [dict(zip(target_columns, row)) for row in target_rows])
+
+    with engine.begin() as conn:
+
+        def _flush():
+            nonlocal inserted
+            _execute(conn, table, columns, batch)
+            if side_rows and side_rows[2]:
+                _execute(conn, *side_rows)
+                side_rows[2].clear()
+            inserted += len(batch)
+            batch.clear()
+            if on_progress:
+                on_progress(
+                    SyntheticProgress(table.name, inserted, total, time.perf_counter() - started)
+                )
+
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                _flush()
+        if batch:
+            _flush()
+    return inserted
+
+
+def generate_synthetic_data(
+    engine: Engine,
+    spec: SyntheticSpec,
+    on_progress: Optional[Callable[[SyntheticProgress], None]] = print_progress,
+) -> SyntheticDataResult:
+    """
+    Insere a carga sintética descrita em `spec` (tabelas já devem existir).
+
+    Returns:
+        SyntheticDataResult: Contagens, tempo e ids gerados (fiéis, CPFs, jogos)
+    """
+    if spec.fieis <= 0 or spec.games <= 0 or spec.cards < 0:
+        raise ValueError("fieis e games devem ser positivos; cards não pode ser negativo")
+    if spec.cards and spec.cards // spec.games > 1_000_000:
+        raise ValueError("Mais de 1M de cartelas por jogo: aumente a quantidade de jogos")
+
+    started = time.perf_counter()
+    rng = random.Random(spec.seed)
+    now = spec.reference_time or get_fortaleza_time()
+    result = SyntheticDataResult(
+        fieis=spec.fieis, games=spec.games, cards=spec.cards, elapsed_seconds=0.0
+    )
+
+    # Um hash para todos: bcrypt custa ~0,3s por chamada
+    senha_hash = hash_password(spec.password)
+
+    with engine.begin() as conn:
+        exists = conn.execute(
+            Paroquia.__table__.select().where(Paroquia.id == spec.paroquia_id)
+        ).first()
+        if exists is None:
+            conn.execute(
+                insert(Paroquia.__table__),
+                [
+                    {
+                        "id": spec.paroquia_id,
+                        "nome": "Paróquia Sintética",
+                        "email": f"{spec.paroquia_id.lower()}@synthetic.example.com",
+                        "chave_pix": f"{spec.paroquia_id.lower()}@synthetic.example.com",
+                    }
+                ],
+            )
+
+    with _deferred_indexes(engine, UsuarioComum.__table__, spec.defer_indexes):
+        _insert_batches(
+            engine,
+            UsuarioComum.__table__,
+            _FIEL_COLUMNS,
+            _fiel_rows(spec, senha_hash, now, result),
+            spec.fieis,
+            spec.batch_size,
+            started,
+            0,
+            on_progress,
+        )
+
+    games = _game_rows(spec, now, result)
+    with engine.begin() as conn:
+        conn.execute(insert(Sorteio.__table__), games)
+
+    per_game, remainder = divmod(spec.cards, spec.games)
+    inserted = 0
+    totals: list[dict] = []
+    with _deferred_indexes(engine, Cartela.__table__, spec.defer_indexes):
+        for idx, game in enumerate(games):
+            count = per_game + (1 if idx < remainder else 0)
+            if not count:
+                continue
+            paid = [0]
+            locks: list[tuple] = []
+            inserted = _insert_batches(
+                engine,
+                Cartela.__table__,
+                _CARD_COLUMNS,
+                _card_rows(game, count, rng, result.fiel_ids, now, paid, locks),
+                spec.cards,
+                spec.batch_size,
+                started,
+                inserted,
+                on_progress,
+                side_rows=(Configuracao.__table__, _LOCK_COLUMNS, locks),
+            )
+            arrecadado = paid[0] * game["valor_cartela"]
+            totals.append(
+                {
+                    "game_id": game["id"],
+                    "vendidas": paid[0],
+                    "arrecadado": arrecadado,
+                    "premio": arrecadado * game["rateio_premio"] / 100.0,
+                }
+            )
+
+    # Totais dos jogos coerentes com as cartelas pagas geradas
+    if totals:
+        with engine.begin() as conn:
+            conn.execute(
+                update(Sorteio.__table__)
+                .where(Sorteio.id == bindparam("game_id"))
+                .values(
+                    total_cartelas_vendidas=bindparam("vendidas"),
+                    total_arrecadado=bindparam("arrecadado"),
+                    total_premio=bindparam("premio"),
+                ),
+                totals,
+            )
+
+    result.elapsed_seconds = time.perf_counter() - started
+    return result
+
+
+__all__ = [
+    "SYNTHETIC_PASSWORD",
+    "DEFAULT_BATCH_SIZE",
+    "SyntheticSpec",
+    "SyntheticProgress",
+    "SyntheticDataResult",
+    "print_progress",
+    "synthetic_cpf",
+    "generate_synthetic_data",
+]
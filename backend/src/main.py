@@ -11,7 +11,7 @@ Todos os endpoints estão nos routers. Main.py apenas:
 """
 
 from fastapi import FastAPI, Request, status, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -20,10 +20,19 @@ import logging
 import os
 from typing import Dict
 
-from src.db.base import get_db, verify_connection, init_db, SessionLocal
-from src.db.seed import seed_database, registrar_auditoria_sistema
+from src.db.base import get_db, verify_connection, init_db, SessionLocal, engine, pool_telemetry
+from src.db.pool_metrics import pool_status, render_pool_prometheus
+from src.db.schema_version import mark_seed_applied, seed_pending
+from src.db.seed import SEED_VERSION, seed_database, registrar_auditoria_sistema
 from src.schemas.schemas import HealthCheckResponse
 from src.utils.time_manager import get_fortaleza_time
+from src.utils.request_metrics import (
+    RequestMetricsMiddleware,
+    install_query_counter,
+    metrics_registry,
+)
+from src.utils.response_cache import install_cache_invalidation
+from src.utils.game_scheduler import GAME_SCHEDULER_ENABLED, game_scheduler
 
 # Importar routers
 from src.routers.auth_routes import router as auth_router
@@ -66,6 +75,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    # orjson: serializa datetime/float nativamente e bem mais rápido que json
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -105,6 +116,21 @@ app.add_middleware(
 )
 
 
+# ============================================================================
+# MIDDLEWARE DE MÉTRICAS (latência por rota, status, SQL por requisição)
+# ============================================================================
+
+install_query_counter()
+app.add_middleware(RequestMetricsMiddleware, registry=metrics_registry)
+
+
+# ============================================================================
+# CACHE DE RESPOSTAS (invalidado por commits nos modelos observados)
+# ============================================================================
+
+install_cache_invalidation()
+
+
 # ============================================================================
 # TRATAMENTO GLOBAL DE ERROS (EXCEPTION HANDLERS)
 # ============================================================================
@@ -143,7 +169,9 @@ async def startup_event():
 
     Responsabilidades:
     - Verificar conexão com banco de dados
-    - Criar tabelas se não existirem (init_db)
+    - Criar tabelas se não existirem (init_db; pulado com schema atual)
+    - Rodar o seed somente quando a versão registrada estiver desatualizada
+    - Iniciar o agendador de jogos (vendas/sorteios nos horários)
     - Logs de inicialização
     """
     logger.info("=" * 70)
@@ -160,18 +188,25 @@ async def startup_event():
             logger.warning("⚠️ Falha ao conectar com banco de dados")
             return
 
-        # Inicializar banco (criar tabelas)
-        init_db()
+        # Inicializar banco (criar tabelas) - uma consulta se o schema está atual
+        schema_state = init_db()
         logger.info("✅ Schema de banco de dados inicializado")
 
-        # Executar seed bootstrap (Admin/admin123 + paróquia) se necessário
+        # Executar seed bootstrap (Admin/admin123 + paróquia) se a versão pedir
         db = SessionLocal()
         try:
-            seed_database(db)
+            if seed_pending(schema_state, SEED_VERSION):
+                seed_database(db)
+                mark_seed_applied(engine, SEED_VERSION)
             registrar_auditoria_sistema(db)
         finally:
             db.close()
 
+        # Encerramento de vendas / início de sorteios nos horários (um worker líder)
+        if GAME_SCHEDULER_ENABLED:
+            game_scheduler.start()
+            logger.info("⏱️ Agendador de jogos iniciado")
+
         logger.info("=" * 70)
         logger.info("✅ SERVIDOR INICIADO COM SUCESSO")
         logger.info("📍 Acesse a API em: http://localhost:8000")
@@ -190,6 +225,7 @@ async def shutdown_event():
     logger.info("=" * 70)
     logger.info("🛑 DESLIGANDO SERVIDOR - BINGO DA COMUNIDADE")
     logger.info("=" * 70)
+    await game_scheduler.stop()
 
 
 # ============================================================================
@@ -264,6 +300,18 @@ async def get_info_time() -> Dict[str, str]:
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Health"])
+async def metrics() -> PlainTextResponse:
+    """
+    Métricas no formato texto do Prometheus.
+
+    Latência por rota (histograma), requisições em andamento, status HTTP,
+    consultas SQL por requisição e estado do pool de conexões.
+    """
+    body = metrics_registry.render() + render_pool_prometheus(pool_status(engine, pool_telemetry))
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # ============================================================================
 # PONTO DE ENTRADA
 # ============================================================================
@@ -22,13 +22,16 @@ from sqlalchemy import (
     Enum as SQLEnum,
     JSON,
     CHAR,
+    Index,
     UniqueConstraint,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy import event
+from sqlalchemy.orm import declared_attr, relationship
 from sqlalchemy.sql import func
 import enum
 
 from src.db.base import Base
+from src.utils.normalization import normalize_cpf, normalize_email, normalize_nome, normalize_phone
 
 
 # ============================================================================
@@ -255,12 +258,58 @@ class RoleParoquia(Base):
     usuarios = relationship("UsuarioParoquia", back_populates="role")
 
 
+# ============================================================================
+# MIXIN: CONTATOS NORMALIZADOS
+# ============================================================================
+
+
+class NormalizedContactMixin:
+    """
+    Colunas de busca com nome/email/telefone/CPF normalizados e indexados.
+
+    Preenchidas automaticamente em todo INSERT/UPDATE via ORM, permitindo
+    checagens de conflito por consulta pontual e busca por prefixo em vez
+    de varrer a tabela.
+    """
+
+    nome_norm = Column(String(200), nullable=True, index=True)
+    email_norm = Column(String(200), nullable=True, index=True)
+    telefone_norm = Column(String(20), nullable=True, index=True)
+    cpf_norm = Column(String(11), nullable=True, index=True)
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        # Busca por prefixo usa LIKE 'p%' no PostgreSQL: com varchar_pattern_ops
+        # o índice compara byte a byte, independente da collation do banco
+        return tuple(
+            Index(
+                f"ix_{cls.__tablename__}_{name}_pattern",
+                name,
+                postgresql_ops={name: "varchar_pattern_ops"},
+                info={"dialect": "postgresql"},
+            ).ddl_if(dialect="postgresql")
+            for name in ("nome_norm", "email_norm", "cpf_norm")
+        )
+
+    def sync_normalized_contacts(self) -> None:
+        self.nome_norm = normalize_nome(self.nome) or None
+        self.email_norm = normalize_email(self.email) or None
+        self.telefone_norm = normalize_phone(self.telefone) or None
+        self.cpf_norm = normalize_cpf(self.cpf) or None
+
+
+@event.listens_for(NormalizedContactMixin, "before_insert", propagate=True)
+@event.listens_for(NormalizedContactMixin, "before_update", propagate=True)
+def _sync_normalized_contacts(mapper, connection, target):
+    target.sync_normalized_contacts()
+
+
 # ============================================================================
 # MODELO: ADMINISTRADOR DO SITE
 # ============================================================================
 
 
-class AdminSiteUser(Base):
+class AdminSiteUser(NormalizedContactMixin, Base):
     """Administrador do site (sem campo role)."""
 
     __tablename__ = "usuarios_admin_site"
@@ -308,7 +357,7 @@ class AdminSiteUser(Base):
 # ============================================================================
 
 
-class UsuarioParoquia(Base):
+class UsuarioParoquia(NormalizedContactMixin, Base):
     """Usuários internos da paróquia com acesso definido por role."""
 
     __tablename__ = "usuarios_paroquia"
@@ -356,7 +405,7 @@ class UsuarioParoquia(Base):
 # ============================================================================
 
 
-class UsuarioComum(Base):
+class UsuarioComum(NormalizedContactMixin, Base):
     """
     Representa um usuário comum - participante/apostador.
 
@@ -648,6 +697,14 @@ class Sorteio(Base):
     """
 
     __tablename__ = "sorteios"
+    __table_args__ = (
+        # Listagens por status ordenadas por horário (agenda, remarcação em cascata)
+        Index("ix_sorteios_status_horario_sorteio", "status", "horario_sorteio"),
+        # Listagem geral de jogos ordenada por horário (GET /games, GET /sorteios)
+        Index("ix_sorteios_horario_sorteio", "horario_sorteio"),
+        # Próximo fim de vendas dos jogos agendados (agendador de jogos)
+        Index("ix_sorteios_status_fim_vendas", "status", "fim_vendas"),
+    )
 
     # Primary Key (ID Temporal)
     id = Column(String(50), primary_key=True, index=True)
@@ -761,6 +818,12 @@ class Cartela(Base):
             "n24",
             name="uq_cartela_sorteio_n1_n24",
         ),
+        # Encerramento de vendas / contagem de pagas: sorteio_id + status
+        Index("ix_cartelas_sorteio_status", "sorteio_id", "status"),
+        # Cartelas do jogo ordenadas por compra (GET /games/{id}/cards)
+        Index("ix_cartelas_sorteio_criado_em", "sorteio_id", "criado_em"),
+        # Cartelas do fiel ordenadas por compra (GET /users/me/cards)
+        Index("ix_cartelas_usuario_criado_em", "usuario_id", "criado_em"),
     )
 
     # Primary Key (ID Temporal)
@@ -907,6 +970,13 @@ class Feedback(Base):
     """
 
     __tablename__ = "feedbacks"
+    __table_args__ = (
+        # Listagem filtrada por status/tipo ordenada por data (GET /feedbacks)
+        Index("ix_feedbacks_status_criado_em", "status", "criado_em"),
+        Index("ix_feedbacks_tipo_criado_em", "tipo", "criado_em"),
+        # Listagem geral e tendência semanal (GET /feedbacks/resumo)
+        Index("ix_feedbacks_criado_em", "criado_em"),
+    )
 
     # Primary Key (ID Temporal)
     id = Column(String(50), primary_key=True, index=True)
@@ -1027,6 +1097,30 @@ class SistemaAuditoria(Base):
         return f"<SistemaAuditoria(id={self.id}, iniciado_em={self.iniciado_em})>"
 
 
+class SchemaVersao(Base):
+    """
+    Versão do schema e do seed aplicados ao banco (registro único).
+    Permite que a inicialização pule reflexão/DDL quando nada mudou.
+    """
+
+    __tablename__ = "schema_versao"
+
+    # PK fixa (registro único)
+    id = Column(String(50), primary_key=True)
+
+    schema_hash = Column(
+        String(64), nullable=False, comment="Impressão digital dos modelos aplicados"
+    )
+    seed_versao = Column(Integer, default=0, nullable=False, comment="Versão do seed aplicada")
+    atualizado_em = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<SchemaVersao(schema_hash={self.schema_hash[:12]}, "
+            f"seed_versao={self.seed_versao})>"
+        )
+
+
 # ============================================================================
 # EXPORTAÇÕES
 # ============================================================================
@@ -1041,6 +1135,7 @@ __all__ = [
     "TipoFeedback",
     "StatusFeedback",
     "Paroquia",
+    "NormalizedContactMixin",
     "UsuarioComum",
     "UsuarioAdministrativo",
     "UsuarioParoquia",
@@ -1051,4 +1146,5 @@ __all__ = [
     "Configuracao",
     "Feedback",
     "SistemaAuditoria",
+    "SchemaVersao",
 ]
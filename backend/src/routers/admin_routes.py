@@ -5,13 +5,26 @@ Endpoints para gerenciamento de paróquias, usuários (fiéis), administradores
 Acesso restrito para SUPER_ADMIN (via UsuarioAdministrativo com nivel_acesso=ADMIN_SITE).
 """
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from datetime import datetime
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy import and_, func, literal, or_, select, text, union_all
+from sqlalchemy.orm import Session, aliased
+from datetime import datetime, timedelta
 from pydantic import BaseModel, EmailStr
 import asyncio
+import io
 
-from src.db.base import get_db
+from src.db.base import engine, get_db, pool_telemetry
+from src.db.pool_metrics import pool_status
 from src.models.models import (
     Paroquia,
     UsuarioComum,
@@ -26,8 +39,10 @@ from src.models.models import (
     TipoFeedback,
     StatusFeedback,
 )
-from src.utils.auth import hash_password, verify_password
-from src.utils.time_manager import generate_temporal_id_with_microseconds
+from src.utils.auth import get_current_user, hash_password, is_admin_payload, verify_password
+from src.utils.fiel_import import import_fieis_csv
+from src.utils.normalization import digits_only, normalize_email, normalize_nome
+from src.utils.time_manager import generate_unique_temporal_id, get_fortaleza_time
 from src.utils.email_service import email_service
 
 router = APIRouter(tags=["Admin"])
@@ -106,6 +121,15 @@ ALLOWED_ADMIN_SITE_USER_TYPES = {
 }
 
 
+def _ensure_admin_payload(user_payload: dict) -> None:
+    if is_admin_payload(user_payload):
+        return
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Apenas administradores podem acessar este recurso",
+    )
+
+
 def _get_single_paroquia_or_raise(db: Session) -> Paroquia:
     paroquias = db.query(Paroquia).all()
     if len(paroquias) == 0:
@@ -142,7 +166,7 @@ def _get_or_create_role_paroquia(db: Session, codigo: str) -> RoleParoquia:
         "paroquia_porteiro": "Porteiro",
     }
     role = RoleParoquia(
-        id=generate_temporal_id_with_microseconds("ROL"),
+        id=generate_unique_temporal_id("ROL"),
         codigo=codigo,
         nome=nomes.get(codigo, codigo.replace("paroquia_", "").title()),
         descricao=f"Role auto-criada para {codigo}",
@@ -200,7 +224,7 @@ def criar_paroquia(payload: CreateParoquiaRequest, db: Session = Depends(get_db)
             )
 
         nova_paroquia = Paroquia(
-            id=generate_temporal_id_with_microseconds("PAR"),
+            id=generate_unique_temporal_id("PAR"),
             nome=payload.nome,
             email=payload.email,
             chave_pix=payload.chave_pix,
@@ -348,49 +372,115 @@ def excluir_paroquia(paroquia_id: str, db: Session = Depends(get_db)):
 # ============================================================================
 
 
+def _select_usuarios_equipe():
+    return (
+        select(
+            UsuarioParoquia.id,
+            UsuarioParoquia.nome,
+            UsuarioParoquia.email,
+            UsuarioParoquia.cpf,
+            UsuarioParoquia.telefone,
+            UsuarioParoquia.whatsapp,
+            func.coalesce(RoleParoquia.codigo, literal("paroquia_recepcao")).label("tipo"),
+            UsuarioParoquia.paroquia_id,
+            Paroquia.nome.label("paroquia_nome"),
+            UsuarioParoquia.ativo,
+            UsuarioParoquia.criado_em,
+            UsuarioParoquia.nome_norm,
+            literal("equipe").label("grupo"),
+        )
+        .select_from(UsuarioParoquia)
+        .outerjoin(RoleParoquia, RoleParoquia.id == UsuarioParoquia.role_id)
+        .outerjoin(Paroquia, Paroquia.id == UsuarioParoquia.paroquia_id)
+    )
+
+
+def _select_usuarios_fieis():
+    return (
+        select(
+            UsuarioComum.id,
+            UsuarioComum.nome,
+            UsuarioComum.email,
+            UsuarioComum.cpf,
+            UsuarioComum.telefone,
+            UsuarioComum.whatsapp,
+            UsuarioComum.tipo,
+            UsuarioComum.paroquia_id,
+            Paroquia.nome.label("paroquia_nome"),
+            UsuarioComum.ativo,
+            UsuarioComum.criado_em,
+            UsuarioComum.nome_norm,
+            literal("fieis").label("grupo"),
+        )
+        .select_from(UsuarioComum)
+        .outerjoin(Paroquia, Paroquia.id == UsuarioComum.paroquia_id)
+    )
+
+
+def _serialize_usuario_row(row) -> dict:
+    tipo = row.tipo.value if hasattr(row.tipo, "value") else row.tipo
+    return {
+        "id": row.id,
+        "nome": row.nome,
+        "email": row.email,
+        "cpf": row.cpf,
+        "telefone": row.telefone,
+        "whatsapp": row.whatsapp,
+        "tipo": tipo,
+        "paroquia_id": row.paroquia_id,
+        "paroquia_nome": row.paroquia_nome,
+        "ativo": row.ativo,
+        "is_bootstrap": False,
+        "criado_em": row.criado_em.isoformat() if row.criado_em else None,
+    }
+
+
+def _prefix_match(db: Session, column, prefix: str):
+    if db.bind is not None and db.bind.dialect.name == "postgresql":
+        # LIKE 'p%' (índice varchar_pattern_ops): a faixa abaixo depende da
+        # collation, que ignora espaços/pontuação e não garante U+FFFF no fim
+        return column.startswith(prefix, autoescape=True)
+    # SQLite compara por bytes: faixa [prefixo, prefixo + U+FFFF) usa o índice
+    return and_(column >= prefix, column < prefix + "\uffff")
+
+
+def _filtro_busca_usuario(db: Session, model, termo: str):
+    termo = termo.strip()
+    if "@" in termo:
+        return _prefix_match(db, model.email_norm, normalize_email(termo))
+
+    digitos = digits_only(termo)
+    if digitos and not any(ch.isalpha() for ch in termo):
+        return _prefix_match(db, model.cpf_norm, digitos)
+
+    return or_(
+        _prefix_match(db, model.nome_norm, normalize_nome(termo)),
+        _prefix_match(db, model.email_norm, normalize_email(termo)),
+    )
+
+
+def _estimar_total(db: Session, model) -> int:
+    """Total aproximado sem filtro: estatística do planner no PostgreSQL, COUNT(*) no SQLite."""
+    if db.bind is not None and db.bind.dialect.name == "postgresql":
+        estimado = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :tabela"),
+            {"tabela": model.__tablename__},
+        ).scalar()
+        if estimado and estimado > 0:
+            return int(estimado)
+    return int(db.query(func.count(model.id)).scalar() or 0)
+
+
 @router.get("/usuarios", tags=["Admin - Usuários"])
 def listar_usuarios(db: Session = Depends(get_db)):
     """Lista todos os usuários do sistema"""
     try:
-        usuarios_paroquia = db.query(UsuarioParoquia).all()
-        usuarios_comuns = db.query(UsuarioComum).all()
-
         dados_paroquia = [
-            {
-                "id": u.id,
-                "nome": u.nome,
-                "email": u.email,
-                "cpf": u.cpf,
-                "telefone": u.telefone,
-                "whatsapp": u.whatsapp,
-                "tipo": (u.role.codigo if u.role else "paroquia_recepcao"),
-                "paroquia_id": u.paroquia_id,
-                "paroquia_nome": u.paroquia.nome if u.paroquia else None,
-                "ativo": u.ativo,
-                "is_bootstrap": False,
-                "criado_em": u.criado_em.isoformat() if u.criado_em else None,
-            }
-            for u in usuarios_paroquia
+            _serialize_usuario_row(row) for row in db.execute(_select_usuarios_equipe()).all()
         ]
-
         dados_comuns = [
-            {
-                "id": u.id,
-                "nome": u.nome,
-                "email": u.email,
-                "cpf": u.cpf,
-                "telefone": u.telefone,
-                "whatsapp": u.whatsapp,
-                "tipo": u.tipo.value if hasattr(u.tipo, "value") else u.tipo,
-                "paroquia_id": u.paroquia_id,
-                "paroquia_nome": u.paroquia.nome if u.paroquia else None,
-                "ativo": u.ativo,
-                "is_bootstrap": bool(getattr(u, "is_bootstrap", False)),
-                "criado_em": u.criado_em.isoformat() if u.criado_em else None,
-            }
-            for u in usuarios_comuns
+            _serialize_usuario_row(row) for row in db.execute(_select_usuarios_fieis()).all()
         ]
-
         return dados_paroquia + dados_comuns
     except Exception:
         raise HTTPException(
@@ -398,6 +488,76 @@ def listar_usuarios(db: Session = Depends(get_db)):
         )
 
 
+@router.get("/usuarios/diretorio", tags=["Admin - Usuários"])
+def diretorio_usuarios(
+    q: str | None = Query(None, max_length=100, description="Prefixo de nome, email ou CPF"),
+    grupo: str = Query("todos", pattern="^(todos|equipe|fieis)$"),
+    paroquia_id: str | None = Query(None),
+    ativo: bool | None = Query(None),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    usuario_atual: dict = Depends(get_current_user),
+):
+    """
+    Diretório paginado de usuários (equipe da paróquia + fiéis).
+
+    Uma única consulta (UNION ALL com joins só nas colunas exibidas) por
+    página. A busca é por prefixo nas colunas normalizadas e indexadas
+    (nome_norm, email_norm, cpf_norm). Sem filtros, o total vem de uma
+    estimativa barata (total_estimado=true).
+    """
+    _ensure_admin_payload(usuario_atual)
+    try:
+        partes = []
+        for nome_grupo, model, builder in (
+            ("equipe", UsuarioParoquia, _select_usuarios_equipe),
+            ("fieis", UsuarioComum, _select_usuarios_fieis),
+        ):
+            if grupo not in ("todos", nome_grupo):
+                continue
+            stmt = builder()
+            if q and q.strip():
+                stmt = stmt.where(_filtro_busca_usuario(db, model, q))
+            if paroquia_id:
+                stmt = stmt.where(model.paroquia_id == paroquia_id)
+            if ativo is not None:
+                stmt = stmt.where(model.ativo == ativo)
+            partes.append((model, stmt))
+
+        if len(partes) > 1:
+            combinado = union_all(*[stmt for _, stmt in partes]).subquery()
+        else:
+            combinado = partes[0][1].subquery()
+
+        rows = db.execute(
+            select(combinado)
+            .order_by(combinado.c.nome_norm, combinado.c.id)
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+        ).all()
+
+        sem_filtros = not (q and q.strip()) and not paroquia_id and ativo is None
+        if sem_filtros:
+            total = sum(_estimar_total(db, model) for model, _ in partes)
+        else:
+            total = int(db.execute(select(func.count()).select_from(combinado)).scalar() or 0)
+
+        return {
+            "items": [{**_serialize_usuario_row(row), "grupo": row.grupo} for row in rows],
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "total_estimado": sem_filtros,
+        }
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Erro ao listar usuários"
+        )
+
+
 @router.post("/usuarios", tags=["Admin - Usuários"])
 def criar_usuario(
     payload: CreateUsuarioRequest | None = Body(None),
@@ -485,7 +645,7 @@ def criar_usuario(
         login = payload.email.strip().lower()
 
         novo_usuario = UsuarioParoquia(
-            id=generate_temporal_id_with_microseconds("USR"),
+            id=generate_unique_temporal_id("USR"),
             nome=payload.nome,
             login=login,
             email=payload.email,
@@ -522,6 +682,45 @@ def criar_usuario(
         )
 
 
+@router.post("/admin/usuarios/importar-fieis", tags=["Admin - Usuários"])
+def importar_fieis(
+    arquivo: UploadFile = File(
+        ..., description="CSV: nome, cpf, email, telefone [, whatsapp, chave_pix, senha]"
+    ),
+    paroquia_id: str | None = Query(None),
+    db: Session = Depends(get_db),
+    usuario_atual: dict = Depends(get_current_user),
+):
+    """
+    Importa fiéis em lote a partir de um CSV (ex.: cadastro em papel da paróquia).
+
+    O arquivo é lido em streaming e processado em lotes. Linhas inválidas ou
+    duplicadas não interrompem a importação: voltam no relatório com o número
+    da linha e os motivos.
+    """
+    _ensure_admin_payload(usuario_atual)
+    try:
+        if paroquia_id and not db.query(Paroquia.id).filter(Paroquia.id == paroquia_id).first():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Paróquia não encontrada"
+            )
+
+        stream = io.TextIOWrapper(arquivo.file, encoding="utf-8-sig", newline="")
+        try:
+            return import_fieis_csv(db, stream, paroquia_id=paroquia_id)
+        finally:
+            stream.detach()
+    except HTTPException:
+        raise
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    except Exception:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Erro ao importar fiéis"
+        )
+
+
 @router.put("/usuarios/{usuario_id}", tags=["Admin - Usuários"])
 def atualizar_usuario(
     usuario_id: str,
@@ -796,6 +995,24 @@ def listar_jogos(db: Session = Depends(get_db)):
         )
 
 
+# ============================================================================
+# MÉTRICAS OPERACIONAIS
+# ============================================================================
+
+
+@router.get("/admin/metrics/db-pool", tags=["Admin - Métricas"])
+def metricas_pool_conexoes(usuario_atual: dict = Depends(get_current_user)):
+    """
+    Telemetria do pool de conexões do banco.
+
+    Inclui configuração (pool_size, max_overflow, pool_timeout), estado atual
+    (conexões em uso/livres, overflow) e métricas acumuladas desde o boot:
+    histograma de espera por conexão, pico de uso e timeouts de checkout.
+    """
+    _ensure_admin_payload(usuario_atual)
+    return pool_status(engine, pool_telemetry)
+
+
 # ============================================================================
 # CONFIGURAÇÕES - CRUD
 # ============================================================================
@@ -1128,7 +1345,7 @@ def criar_feedback(
 
         # Cria feedback
         feedback = Feedback(
-            id=generate_temporal_id_with_microseconds("FDB"),
+            id=generate_unique_temporal_id("FDB"),
             usuario_id=usuario_id,
             tipo=tipo_enum,
             assunto=assunto,
@@ -1163,62 +1380,157 @@ def criar_feedback(
         )
 
 
+FEEDBACK_PAGE_SIZE = 50
+
+
+def _semana_feedback(db: Session):
+    """Expressão SQL do início da semana (segunda-feira) de Feedback.criado_em."""
+    if db.bind is not None and db.bind.dialect.name == "postgresql":
+        return func.date(func.date_trunc("week", Feedback.criado_em))
+    # SQLite: avança até o domingo e volta 6 dias (semana ISO, segunda a domingo)
+    return func.date(Feedback.criado_em, "weekday 0", "-6 days")
+
+
 @router.get("/feedbacks", tags=["Admin - Feedbacks"])
-def listar_feedbacks(db: Session = Depends(get_db)):
-    """Lista todos os feedbacks (apenas Super Admin)"""
+def listar_feedbacks(
+    response: Response,
+    status_feedback: StatusFeedback | None = Query(None, alias="status"),
+    tipo: TipoFeedback | None = Query(None),
+    page: int | None = Query(None, ge=1),
+    page_size: int | None = Query(None, ge=1, le=200),
+    db: Session = Depends(get_db),
+):
+    """
+    Lista feedbacks, do mais recente ao mais antigo (apenas Super Admin).
+
+    Autor, paróquia do autor e quem respondeu vêm no mesmo SELECT (outer
+    joins só nas colunas exibidas). O total filtrado segue no header
+    X-Total-Count.
+
+    Sem page/page_size a lista vem completa (comportamento usado pela tela
+    FeedbackSystem); com qualquer um dos dois, pagina (padrão: página 1,
+    50 por página).
+    """
     try:
-        feedbacks = db.query(Feedback).order_by(Feedback.criado_em.desc()).all()
-
-        resultado = []
-        for f in feedbacks:
-            # Busca dados do usuário
-            usuario = db.query(UsuarioComum).filter(UsuarioComum.id == f.usuario_id).first()
-            usuario_nome = usuario.nome if usuario else "Usuário Desconhecido"
-
-            # Busca paróquia do usuário (se tiver)
-            paroquia_nome = None
-            if usuario and usuario.paroquia_id:
-                paroquia = db.query(Paroquia).filter(Paroquia.id == usuario.paroquia_id).first()
-                paroquia_nome = paroquia.nome if paroquia else None
-
-            # Busca quem respondeu (se foi respondido)
-            respondido_por_nome = None
-            if f.respondido_por_id:
-                respondido_por = (
-                    db.query(UsuarioComum).filter(UsuarioComum.id == f.respondido_por_id).first()
-                )
-                respondido_por_nome = respondido_por.nome if respondido_por else None
-
-            resultado.append(
-                {
-                    "id": f.id,
-                    "usuario_id": f.usuario_id,
-                    "usuario_nome": usuario_nome,
-                    "paroquia_nome": paroquia_nome,
-                    "tipo": f.tipo.value,
-                    "assunto": f.assunto,
-                    "mensagem": f.mensagem,
-                    "satisfacao": f.satisfacao,
-                    "status": f.status.value,
-                    "resposta": f.resposta,
-                    "respondido_por": respondido_por_nome,
-                    "respondido_em": f.respondido_em.isoformat() if f.respondido_em else None,
-                    "criado_em": f.criado_em.isoformat(),
-                    # Campos para IA (futuros)
-                    "tags": f.tags or [],
-                    "sentimento_score": f.sentimento_score,
-                    "categoria_ia": f.categoria_ia,
-                    "prioridade_ia": f.prioridade_ia,
-                }
+        Respondente = aliased(UsuarioComum)
+        filtros = []
+        if status_feedback is not None:
+            filtros.append(Feedback.status == status_feedback)
+        if tipo is not None:
+            filtros.append(Feedback.tipo == tipo)
+
+        stmt = (
+            select(
+                Feedback,
+                UsuarioComum.nome.label("usuario_nome"),
+                Paroquia.nome.label("paroquia_nome"),
+                Respondente.nome.label("respondido_por_nome"),
             )
+            .outerjoin(UsuarioComum, UsuarioComum.id == Feedback.usuario_id)
+            .outerjoin(Paroquia, Paroquia.id == UsuarioComum.paroquia_id)
+            .outerjoin(Respondente, Respondente.id == Feedback.respondido_por_id)
+            .where(*filtros)
+            .order_by(Feedback.criado_em.desc(), Feedback.id.desc())
+        )
+        if page is not None or page_size is not None:
+            page_size = page_size or FEEDBACK_PAGE_SIZE
+            stmt = stmt.limit(page_size).offset(((page or 1) - 1) * page_size)
+        rows = db.execute(stmt).all()
 
-        return resultado
+        total = db.execute(select(func.count(Feedback.id)).where(*filtros)).scalar() or 0
+        response.headers["X-Total-Count"] = str(total)
+
+        return [
+            {
+                "id": f.id,
+                "usuario_id": f.usuario_id,
+                "usuario_nome": usuario_nome or "Usuário Desconhecido",
+                "paroquia_nome": paroquia_nome,
+                "tipo": f.tipo.value,
+                "assunto": f.assunto,
+                "mensagem": f.mensagem,
+                "satisfacao": f.satisfacao,
+                "status": f.status.value,
+                "resposta": f.resposta,
+                "respondido_por": respondido_por_nome,
+                "respondido_em": f.respondido_em.isoformat() if f.respondido_em else None,
+                "criado_em": f.criado_em.isoformat(),
+                # Campos para IA (futuros)
+                "tags": f.tags or [],
+                "sentimento_score": f.sentimento_score,
+                "categoria_ia": f.categoria_ia,
+                "prioridade_ia": f.prioridade_ia,
+            }
+            for f, usuario_nome, paroquia_nome, respondido_por_nome in rows
+        ]
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Erro ao listar feedbacks"
         )
 
 
+@router.get("/feedbacks/resumo", tags=["Admin - Feedbacks"])
+def resumo_feedbacks(
+    semanas: int = Query(12, ge=1, le=104),
+    db: Session = Depends(get_db),
+    usuario_atual: dict = Depends(get_current_user),
+):
+    """
+    Indicadores agregados de feedback para o dashboard administrativo.
+
+    Contagens por status e por tipo, satisfação média e tendência semanal
+    (quantidade e satisfação média das últimas `semanas` semanas), tudo
+    calculado com GROUP BY no banco, sem carregar os feedbacks.
+    """
+    _ensure_admin_payload(usuario_atual)
+    try:
+        por_status = {s.value: 0 for s in StatusFeedback}
+        total = 0
+        soma_satisfacao = 0
+        for status_row, quantidade, soma in db.execute(
+            select(
+                Feedback.status, func.count(Feedback.id), func.sum(Feedback.satisfacao)
+            ).group_by(Feedback.status)
+        ).all():
+            por_status[status_row.value] = quantidade
+            total += quantidade
+            soma_satisfacao += soma or 0
+
+        por_tipo = {t.value: 0 for t in TipoFeedback}
+        for tipo_row, quantidade in db.execute(
+            select(Feedback.tipo, func.count(Feedback.id)).group_by(Feedback.tipo)
+        ).all():
+            por_tipo[tipo_row.value] = quantidade
+
+        semana = _semana_feedback(db).label("semana")
+        tendencia = [
+            {
+                "semana": str(semana_inicio),
+                "total": quantidade,
+                "satisfacao_media": round(float(media), 2) if media is not None else None,
+            }
+            for semana_inicio, quantidade, media in db.execute(
+                select(semana, func.count(Feedback.id), func.avg(Feedback.satisfacao))
+                .where(Feedback.criado_em >= get_fortaleza_time() - timedelta(weeks=semanas))
+                .group_by(semana)
+                .order_by(semana)
+            ).all()
+        ]
+
+        return {
+            "total": total,
+            "por_status": por_status,
+            "por_tipo": por_tipo,
+            "satisfacao_media": round(soma_satisfacao / total, 2) if total else None,
+            "tendencia_semanal": tendencia,
+        }
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro ao resumir feedbacks",
+        )
+
+
 @router.put("/feedbacks/{feedback_id}/responder", tags=["Admin - Feedbacks"])
 def responder_feedback(
     feedback_id: str, resposta: str, respondido_por_id: str, db: Session = Depends(get_db)
@@ -23,7 +23,7 @@ from src.db.base import get_db
 from src.models.models import UsuarioComum, UsuarioAdministrativo, NivelAcessoAdmin
 from src.schemas.schemas import TokenResponse
 from src.utils.auth import verify_password, create_access_token, hash_password, get_current_user
-from src.utils.time_manager import get_fortaleza_time, generate_temporal_id_with_microseconds
+from src.utils.time_manager import get_fortaleza_time, generate_unique_temporal_id
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -292,7 +292,7 @@ def signup_comum(
 
         # Criar novo usuário comum
         novo_usuario = UsuarioComum(
-            id=generate_temporal_id_with_microseconds("UC"),
+            id=generate_unique_temporal_id("UC"),
             nome=nome,
             cpf=cpf_clean,
             email=email,
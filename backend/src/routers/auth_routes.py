@@ -28,7 +28,7 @@ Rotas de Login:
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import exists, func, or_
 from sqlalchemy.exc import IntegrityError
 from datetime import timedelta
 import re
@@ -63,15 +63,21 @@ from src.schemas.schemas import SetAdminSitePasswordRequest
 from src.utils.auth import verify_password, create_access_token, hash_password, get_current_user
 from src.utils.time_manager import (
     get_fortaleza_time,
-    generate_temporal_id_with_microseconds,
+    generate_unique_temporal_id,
     FORTALEZA_TZ,
 )
 from src.utils.email_service import email_service
+from src.utils.normalization import normalize_cpf, normalize_email, normalize_phone
+from src.utils.response_cache import response_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["Autenticação"])
 
+# Status público depende só da existência de um Admin-Paróquia ativo
+PUBLIC_STATUS_CACHE_NAMESPACE = "public_status"
+response_cache.watch(PUBLIC_STATUS_CACHE_NAMESPACE, RoleParoquia, UsuarioParoquia)
+
 
 def normalize_fortaleza_datetime(value):
     if not value:
@@ -135,34 +141,15 @@ def normalize_admin_site_identity(email: str, nome: str | None = None):
     }
 
 
-def normalize_cpf(cpf: str | None) -> str:
-    return re.sub(r"\D", "", cpf or "")[:11]
-
-
-def normalize_phone(phone: str | None) -> str:
-    digits = re.sub(r"\D", "", phone or "")
-    if digits.startswith("55") and len(digits) in (12, 13):
-        digits = digits[2:]
-    return digits[:12]
-
-
 def find_admin_site_conflict(db: Session, *, email: str, telefone: str, cpf: str):
-    email_norm = (email or "").strip().lower()
-    telefone_norm = normalize_phone(telefone)
-    cpf_norm = normalize_cpf(cpf)
-
-    novos = db.query(AdminSiteUser).all()
-    for row in novos:
-        row_email = (row.email or "").strip().lower()
-        row_phone = normalize_phone(getattr(row, "telefone", None))
-        row_cpf = normalize_cpf(getattr(row, "cpf", None))
-
-        if email_norm and row_email and row_email == email_norm:
-            return "email"
-        if telefone_norm and row_phone and row_phone == telefone_norm:
-            return "telefone"
-        if cpf_norm and row_cpf and row_cpf == cpf_norm:
-            return "cpf"
+    checks = (
+        ("email", AdminSiteUser.email_norm, normalize_email(email)),
+        ("telefone", AdminSiteUser.telefone_norm, normalize_phone(telefone)),
+        ("cpf", AdminSiteUser.cpf_norm, normalize_cpf(cpf)),
+    )
+    for campo, coluna, valor in checks:
+        if valor and db.query(exists().where(coluna == valor)).scalar():
+            return campo
 
     return None
 
@@ -208,7 +195,7 @@ def enforce_signup_device_rate_limit(db: Session, device_fingerprint: str):
 def registrar_tentativa_signup(db: Session, device_fingerprint: str, sucesso: bool = False):
     db.add(
         TentativaCadastroDispositivo(
-            id=generate_temporal_id_with_microseconds("DEV"),
+            id=generate_unique_temporal_id("DEV"),
             device_fingerprint=device_fingerprint,
             sucesso=bool(sucesso),
             criado_em=get_fortaleza_time(),
@@ -231,24 +218,15 @@ def get_admin_site_by_id_any(db: Session, admin_id: str):
 
 
 def list_admin_site_any(db: Session):
-    novos = db.query(AdminSiteUser).all()
-    por_id = {a.id: ("new", a) for a in novos}
-
-    return sorted(
-        por_id.values(),
-        key=lambda item: item[1].criado_em or get_fortaleza_time(),
-        reverse=True,
-    )
+    novos = db.query(AdminSiteUser).order_by(AdminSiteUser.criado_em.desc()).all()
+    return [("new", a) for a in novos]
 
 
 def count_admin_site_ativos_any(db: Session, excluding_id: str | None = None) -> int:
-    ativos_novos = db.query(AdminSiteUser).filter(AdminSiteUser.ativo).all()
-
-    ids = {a.id for a in ativos_novos}
-
+    query = db.query(func.count(AdminSiteUser.id)).filter(AdminSiteUser.ativo)
     if excluding_id:
-        ids.discard(excluding_id)
-    return len(ids)
+        query = query.filter(AdminSiteUser.id != excluding_id)
+    return int(query.scalar() or 0)
 
 
 def get_current_admin_paroquia_actor(db: Session, user_id: str):
@@ -551,16 +529,20 @@ def bootstrap_status(db: Session = Depends(get_db)):
 @router.get(
     "/public-status", response_model=dict, summary="📊 Status Público (Manutenção/Liberação)"
 )
-def public_status(db: Session = Depends(get_db)):
-    maintenance_mode = is_public_maintenance_active(db)
-    return {
-        "maintenance_mode": maintenance_mode,
-        "message": (
-            "Acesso público bloqueado até configuração do primeiro Admin-Paróquia"
-            if maintenance_mode
-            else "Acesso público liberado"
-        ),
-    }
+def public_status(request: Request, db: Session = Depends(get_db)):
+    def load():
+        maintenance_mode = is_public_maintenance_active(db)
+        payload = {
+            "maintenance_mode": maintenance_mode,
+            "message": (
+                "Acesso público bloqueado até configuração do primeiro Admin-Paróquia"
+                if maintenance_mode
+                else "Acesso público liberado"
+            ),
+        }
+        return payload, str(maintenance_mode)
+
+    return response_cache.respond(request, PUBLIC_STATUS_CACHE_NAMESPACE, "public-status", load)
 
 
 # ============================================================================
@@ -612,7 +594,9 @@ def signup_fiel(request: SignupFielRequest, http_request: Request, db: Session =
             )
 
         # Validar unicidade de email
-        email_existe = db.query(UsuarioComum).filter(UsuarioComum.email == request.email).first()
+        email_existe = db.query(
+            exists().where(UsuarioComum.email_norm == normalize_email(request.email))
+        ).scalar()
         if email_existe:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT, detail="Email já cadastrado no sistema"
@@ -620,7 +604,7 @@ def signup_fiel(request: SignupFielRequest, http_request: Request, db: Session =
 
         # Criar novo FIEL
         novo_fiel = UsuarioComum(
-            id=generate_temporal_id_with_microseconds("USR"),
+            id=generate_unique_temporal_id("USR"),
             nome=request.nome,
             cpf=cpf_limpo,
             email=request.email,
@@ -1370,7 +1354,7 @@ def criar_admin_site(
 
         # Criar novo ADMIN_SITE
         novo_admin = AdminSiteUser(
-            id=generate_temporal_id_with_microseconds("ADM"),
+            id=generate_unique_temporal_id("ADM"),
             nome=identidade["nome"],
             login=identidade["login"],
             senha_hash=hash_password(request.senha),
@@ -1821,7 +1805,7 @@ def criar_admin_paroquia(
             )
 
         novo_admin = UsuarioParoquia(
-            id=generate_temporal_id_with_microseconds("ADM"),
+            id=generate_unique_temporal_id("ADM"),
             nome=request.nome,
             login=request.login,
             senha_hash=hash_password(request.senha),
@@ -1936,7 +1920,7 @@ def admin_paroquia_criar_subordinado(
             )
 
         novo_admin = UsuarioParoquia(
-            id=generate_temporal_id_with_microseconds("ADM"),
+            id=generate_unique_temporal_id("ADM"),
             nome=request.nome,
             login=request.login,
             senha_hash=hash_password(request.senha),
@@ -2068,7 +2052,7 @@ def bootstrap_setup(request: CreateAdminSiteRequest, db: Session = Depends(get_d
             bootstrap_admin.atualizado_em = get_fortaleza_time()
 
             primeiro_admin = AdminSiteUser(
-                id=generate_temporal_id_with_microseconds("ADM"),
+                id=generate_unique_temporal_id("ADM"),
                 nome=identidade["nome"],
                 login=identidade["login"],
                 senha_hash=hash_password(request.senha),
@@ -2088,7 +2072,7 @@ def bootstrap_setup(request: CreateAdminSiteRequest, db: Session = Depends(get_d
         else:
             # Criar primeiro ADMIN_SITE (fallback)
             primeiro_admin = AdminSiteUser(
-                id=generate_temporal_id_with_microseconds("ADM"),
+                id=generate_unique_temporal_id("ADM"),
                 nome=identidade["nome"],
                 login=identidade["login"],
                 senha_hash=hash_password(request.senha),
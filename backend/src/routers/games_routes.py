@@ -8,19 +8,43 @@ Fluxo principal:
 
 from __future__ import annotations
 
-import json
 import logging
-import os
 from datetime import datetime, timedelta
 from random import sample
 from typing import Any, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, model_validator
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    Interval,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    type_coerce,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.db.base import get_db
+from src.db.base import get_db, get_read_db, retry_on_sqlite_busy
 from src.models.models import (
     Cartela,
     CategoriaConfiguracao,
@@ -32,12 +56,25 @@ from src.models.models import (
     TipoConfiguracao,
     UsuarioComum,
 )
-from src.utils.auth import get_current_user
-from src.utils.time_manager import generate_temporal_id_with_microseconds, get_fortaleza_time
+from src.utils.auth import get_current_user, is_admin_payload
+from src.utils.game_scheduler import close_game_sales, game_scheduler
+from src.utils.game_snapshot import (
+    latest_snapshot_for_game,
+    snapshot_dir,
+    snapshot_path_for_game,
+    verify_game_snapshot,
+    write_game_snapshot,
+)
+from src.utils.response_cache import response_cache
+from src.utils.time_manager import generate_unique_temporal_id, get_fortaleza_time
 
 router = APIRouter(tags=["Jogos e Cartelas"])
 logger = logging.getLogger(__name__)
 
+# Respostas de leitura de jogos ficam em cache até o próximo commit em Sorteio
+GAMES_CACHE_NAMESPACE = "sorteios"
+response_cache.watch(GAMES_CACHE_NAMESPACE, Sorteio)
+
 
 STATUS_TO_PUBLIC = {
     StatusSorteio.AGENDADO.value: "scheduled",
@@ -139,16 +176,6 @@ def _normalize_datetime_for_compare(value: Optional[datetime]) -> Optional[datet
     return value.replace(tzinfo=None) if value.tzinfo else value
 
 
-def _is_admin_payload(user_payload: dict[str, Any]) -> bool:
-    nivel = (user_payload.get("nivel_acesso") or "").strip().lower()
-    tipo = (user_payload.get("tipo") or "").strip().lower()
-    return nivel in {"admin_site", "admin_paroquia"} or tipo in {
-        "admin_site",
-        "usuario_paroquia",
-        "usuario_administrativo",
-    }
-
-
 def _is_fiel_payload(user_payload: dict[str, Any]) -> bool:
     tipo = (user_payload.get("tipo") or "").strip().lower()
     return tipo == "usuario_comum"
@@ -197,6 +224,10 @@ def _extract_card_numbers(card: Cartela) -> list[str]:
     ]
 
 
+# n1..n24 na ordem da cartela (para selects só de colunas)
+_CARD_NUMBER_COLUMNS = tuple(getattr(Cartela, f"n{i}") for i in range(1, 25))
+
+
 def _card_columns_from_numbers(numbers_24: list[str]) -> dict[str, str]:
     return {f"n{idx}": numbers_24[idx - 1] for idx in range(1, 25)}
 
@@ -367,35 +398,113 @@ def _ensure_sales_open_for_game(game: Sorteio, now: datetime):
 
 
 def _snapshot_path_for_game(game_id: str) -> str:
-    if os.path.exists("/app/data"):
-        snapshot_dir = "/app/data/snapshots"
-    else:
-        snapshot_dir = os.path.join(os.path.dirname(__file__), "..", "..", "data", "snapshots")
-        snapshot_dir = os.path.abspath(snapshot_dir)
-
-    os.makedirs(snapshot_dir, exist_ok=True)
+    """Snapshot legado (JSON), no mesmo diretório dos snapshots NDJSON."""
+    directory = snapshot_dir()
+    directory.mkdir(parents=True, exist_ok=True)
     now = get_fortaleza_time().strftime("%Y%m%d_%H%M%S")
-    return os.path.join(snapshot_dir, f"snapshot_{game_id}_{now}.json")
+    return str(directory / f"snapshot_{game_id}_{now}.json")
 
 
-def _future_games_for_reschedule(db: Session, game: Sorteio) -> list[Sorteio]:
-    return (
-        db.query(Sorteio)
-        .filter(
-            Sorteio.horario_sorteio > game.horario_sorteio,
-            Sorteio.status.in_([StatusSorteio.AGENDADO, StatusSorteio.EM_ANDAMENTO]),
-        )
-        .order_by(Sorteio.horario_sorteio.asc())
-        .all()
-    )
+# Estados em que um jogo posterior ainda entra na remarcação em cascata
+_RESCHEDULABLE_STATUSES = (StatusSorteio.AGENDADO, StatusSorteio.EM_ANDAMENTO)
 
 
 def _to_dt_compare(value: Optional[datetime]) -> Optional[datetime]:
     return _normalize_datetime_for_compare(value)
 
 
+def _shift_datetime_sql(db: Session, column, delta: timedelta):
+    """
+    Expressão SQL `coluna + delta`, avaliada no banco (NULL continua NULL).
+
+    PostgreSQL soma um interval. No SQLite a coluna é texto no formato do
+    SQLAlchemy ("AAAA-MM-DD HH:MM:SS.ffffff"): a soma é feita em microssegundos
+    desde a época e o resultado volta ao mesmo formato, preservando a ordenação
+    textual usada nas comparações.
+    """
+    if db.bind is not None and db.bind.dialect.name == "postgresql":
+        return column + literal(delta, Interval())
+
+    delta_us = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    total_us = (
+        cast(func.strftime("%s", func.substr(column, 1, 19)), Integer) * 1_000_000
+        + func.coalesce(cast(func.substr(column, 21, 6), Integer), 0)
+        + delta_us
+    )
+    # Divisão inteira: `/` vira divisão real no SQLAlchemy 2.0 e o strftime
+    # arredonda a época fracionária (…:00.9995 iria para o segundo seguinte)
+    shifted = func.strftime("%Y-%m-%d %H:%M:%S", total_us // 1_000_000, "unixepoch").concat(
+        func.printf(".%06d", total_us % 1_000_000)
+    )
+    return type_coerce(shifted, DateTime(timezone=True))
+
+
+def _reschedule_plan(
+    db: Session, game: Sorteio, new_draw_datetime: datetime, mode: str
+) -> list[Any]:
+    """
+    Cronograma novo do jogo alvo e dos jogos posteriores, calculado em uma consulta.
+
+    Cada linha traz horários antigos/novos e a flag de conflito: um jogo que
+    não é deslocado conflita quando ocorre no mesmo horário ou antes de algum
+    jogo deslocado que o precede (MAX em janela sobre as linhas anteriores).
+    """
+    delta = new_draw_datetime - _to_dt_compare(game.horario_sorteio)
+    is_target = Sorteio.id == game.id
+    new_draw_value = literal(new_draw_datetime, DateTime(timezone=True))
+    new_sales_end_value = literal(new_draw_datetime - timedelta(minutes=1), DateTime(timezone=True))
+
+    if mode == "cascade":
+        shifted = true()
+        future_draw = _shift_datetime_sql(db, Sorteio.horario_sorteio, delta)
+        future_sales_end = _shift_datetime_sql(db, Sorteio.fim_vendas, delta)
+    else:
+        shifted = is_target
+        future_draw = Sorteio.horario_sorteio
+        future_sales_end = Sorteio.fim_vendas
+
+    new_draw = case((is_target, new_draw_value), else_=future_draw)
+    plan = (
+        select(
+            Sorteio.id.label("id"),
+            Sorteio.titulo.label("title"),
+            Sorteio.horario_sorteio.label("old_draw"),
+            new_draw.label("new_draw"),
+            Sorteio.fim_vendas.label("old_sales_end"),
+            case((is_target, new_sales_end_value), else_=future_sales_end).label("new_sales_end"),
+            shifted.label("shifted"),
+            is_target.label("is_target"),
+            func.max(case((shifted, new_draw)))
+            .over(
+                order_by=(Sorteio.horario_sorteio, Sorteio.id),
+                rows=(None, -1),
+            )
+            .label("previous_shifted_draw"),
+        )
+        .where(
+            or_(
+                is_target,
+                and_(
+                    Sorteio.horario_sorteio > game.horario_sorteio,
+                    Sorteio.status.in_(_RESCHEDULABLE_STATUSES),
+                ),
+            )
+        )
+        .subquery()
+    )
+
+    return db.execute(
+        select(
+            plan,
+            and_(~plan.c.shifted, plan.c.new_draw <= plan.c.previous_shifted_draw).label(
+                "conflict"
+            ),
+        ).order_by(plan.c.old_draw, plan.c.id)
+    ).all()
+
+
 def _build_reschedule_preview(
-    game: Sorteio, new_draw_datetime: datetime, mode: str, future_games: list[Sorteio]
+    db: Session, game: Sorteio, new_draw_datetime: datetime, mode: str
 ) -> dict[str, Any]:
     base_draw_cmp = _to_dt_compare(game.horario_sorteio)
     new_draw_cmp = _to_dt_compare(new_draw_datetime)
@@ -405,63 +514,32 @@ def _build_reschedule_preview(
         )
 
     delta = new_draw_cmp - base_draw_cmp
-    conflicts: list[dict[str, Any]] = []
-    affected_games: list[dict[str, Any]] = []
+    rows = _reschedule_plan(db, game, new_draw_cmp, mode)
 
-    target_new_sales_end = new_draw_datetime - timedelta(minutes=1)
-    affected_games.append(
+    affected_games = [
         {
-            "id": game.id,
-            "title": game.titulo,
-            "old_draw": game.horario_sorteio.isoformat() if game.horario_sorteio else None,
-            "new_draw": new_draw_datetime.isoformat(),
-            "old_sales_end": game.fim_vendas.isoformat() if game.fim_vendas else None,
-            "new_sales_end": target_new_sales_end.isoformat(),
-            "shifted": True,
-            "is_target": True,
+            "id": row.id,
+            "title": row.title,
+            "old_draw": row.old_draw,
+            "new_draw": row.new_draw,
+            "old_sales_end": row.old_sales_end,
+            "new_sales_end": row.new_sales_end,
+            "shifted": bool(row.shifted),
+            "is_target": bool(row.is_target),
         }
-    )
-
-    for future_game in future_games:
-        old_draw = future_game.horario_sorteio
-        if mode == "cascade":
-            new_draw = old_draw + delta
-            shifted = True
-        else:
-            new_draw = old_draw
-            shifted = False
-
-        affected_games.append(
-            {
-                "id": future_game.id,
-                "title": future_game.titulo,
-                "old_draw": old_draw.isoformat() if old_draw else None,
-                "new_draw": new_draw.isoformat() if new_draw else None,
-                "old_sales_end": (
-                    future_game.fim_vendas.isoformat() if future_game.fim_vendas else None
-                ),
-                "new_sales_end": (
-                    (future_game.fim_vendas + delta).isoformat()
-                    if (mode == "cascade" and future_game.fim_vendas)
-                    else (future_game.fim_vendas.isoformat() if future_game.fim_vendas else None)
-                ),
-                "shifted": shifted,
-                "is_target": False,
-            }
-        )
-
-        if mode == "single":
-            old_draw_cmp = _to_dt_compare(old_draw)
-            new_target_cmp = _to_dt_compare(new_draw_datetime)
-            if old_draw_cmp and new_target_cmp and old_draw_cmp <= new_target_cmp:
-                conflicts.append(
-                    {
-                        "id": future_game.id,
-                        "title": future_game.titulo,
-                        "draw_date": old_draw.isoformat() if old_draw else None,
-                        "reason": "Conflito de cronograma: próximo jogo ocorre no mesmo horário ou antes da nova data proposta.",  # noqa: E501
-                    }
-                )
+        for row in rows
+    ]
+    conflicts = [
+        {
+            "id": row.id,
+            "title": row.title,
+            # Vai também no detail do 409 (JSON padrão): data já em ISO 8601
+            "draw_date": row.old_draw.isoformat() if row.old_draw else None,
+            "reason": "Conflito de cronograma: próximo jogo ocorre no mesmo horário ou antes da nova data proposta.",  # noqa: E501
+        }
+        for row in rows
+        if row.conflict
+    ]
 
     return {
         "mode": mode,
@@ -472,27 +550,49 @@ def _build_reschedule_preview(
     }
 
 
-def _to_game_response(game: Sorteio) -> dict[str, Any]:
-    status_public = STATUS_TO_PUBLIC.get(
-        game.status.value if hasattr(game.status, "value") else str(game.status), "scheduled"
+def _shift_following_games(db: Session, game: Sorteio, delta: timedelta, now: datetime) -> int:
+    """Desloca, em um único UPDATE, todos os jogos posteriores ao alvo. Não faz commit."""
+    result = db.execute(
+        update(Sorteio)
+        .where(
+            Sorteio.horario_sorteio > game.horario_sorteio,
+            Sorteio.status.in_(_RESCHEDULABLE_STATUSES),
+        )
+        .values(
+            horario_sorteio=_shift_datetime_sql(db, Sorteio.horario_sorteio, delta),
+            inicio_vendas=_shift_datetime_sql(db, Sorteio.inicio_vendas, delta),
+            fim_vendas=_shift_datetime_sql(db, Sorteio.fim_vendas, delta),
+            atualizado_em=now,
+        )
+        .execution_options(synchronize_session=False)
     )
+    return int(result.rowcount or 0)
+
+
+# Serializadores devolvem tipos finais para o orjson: colunas Float/Integer já
+# chegam como float/int e datetimes são codificados em ISO 8601 pelo próprio
+# orjson (mesmo formato de isoformat()). Sem float()/isoformat() por campo.
+
+
+def _to_game_response(game: Sorteio) -> dict[str, Any]:
+    status_value = getattr(game.status, "value", game.status)
     return {
         "id": game.id,
         "title": game.titulo,
         "description": game.descricao or "",
-        "scheduled_date": game.horario_sorteio.isoformat() if game.horario_sorteio else None,
-        "data_inicio_vendas": game.inicio_vendas.isoformat() if game.inicio_vendas else None,
-        "data_sorteio": game.horario_sorteio.isoformat() if game.horario_sorteio else None,
-        "status": status_public,
-        "card_price": float(game.valor_cartela or 0),
-        "total_prize": float(game.total_premio or 0),
-        "cards_sold": int(game.total_cartelas_vendidas or 0),
-        "max_cards": int(game.max_cards) if game.max_cards else None,
-        "prize_percent": float(game.rateio_premio or 0),
-        "parish_percent": float(game.rateio_paroquia or 0),
-        "operation_percent": float(game.rateio_operacao or 0),
-        "evolution_percent": float(game.rateio_evolucao or 0),
-        "created_at": game.criado_em.isoformat() if game.criado_em else None,
+        "scheduled_date": game.horario_sorteio,
+        "data_inicio_vendas": game.inicio_vendas,
+        "data_sorteio": game.horario_sorteio,
+        "status": STATUS_TO_PUBLIC.get(status_value, "scheduled"),
+        "card_price": game.valor_cartela or 0.0,
+        "total_prize": game.total_premio or 0.0,
+        "cards_sold": game.total_cartelas_vendidas or 0,
+        "max_cards": game.max_cards or None,
+        "prize_percent": game.rateio_premio or 0.0,
+        "parish_percent": game.rateio_paroquia or 0.0,
+        "operation_percent": game.rateio_operacao or 0.0,
+        "evolution_percent": game.rateio_evolucao or 0.0,
+        "created_at": game.criado_em,
     }
 
 
@@ -502,43 +602,77 @@ def _to_sorteio_response(game: Sorteio) -> dict[str, Any]:
         "paroquia_id": game.paroquia_id,
         "titulo": game.titulo,
         "descricao": game.descricao,
-        "valor_cartela": float(game.valor_cartela or 0),
-        "rateio_premio": float(game.rateio_premio or 0),
-        "rateio_paroquia": float(game.rateio_paroquia or 0),
-        "rateio_operacao": float(game.rateio_operacao or 0),
-        "rateio_evolucao": float(game.rateio_evolucao or 0),
-        "status": game.status.value if hasattr(game.status, "value") else str(game.status),
-        "total_arrecadado": float(game.total_arrecadado or 0),
-        "total_premio": float(game.total_premio or 0),
-        "total_cartelas_vendidas": int(game.total_cartelas_vendidas or 0),
-        "max_cards": int(game.max_cards) if game.max_cards else None,
-        "inicio_vendas": game.inicio_vendas.isoformat() if game.inicio_vendas else None,
-        "fim_vendas": game.fim_vendas.isoformat() if game.fim_vendas else None,
-        "horario_sorteio": game.horario_sorteio.isoformat() if game.horario_sorteio else None,
+        "valor_cartela": game.valor_cartela or 0.0,
+        "rateio_premio": game.rateio_premio or 0.0,
+        "rateio_paroquia": game.rateio_paroquia or 0.0,
+        "rateio_operacao": game.rateio_operacao or 0.0,
+        "rateio_evolucao": game.rateio_evolucao or 0.0,
+        "status": getattr(game.status, "value", game.status),
+        "total_arrecadado": game.total_arrecadado or 0.0,
+        "total_premio": game.total_premio or 0.0,
+        "total_cartelas_vendidas": game.total_cartelas_vendidas or 0,
+        "max_cards": game.max_cards or None,
+        "inicio_vendas": game.inicio_vendas,
+        "fim_vendas": game.fim_vendas,
+        "horario_sorteio": game.horario_sorteio,
         "pedras_sorteadas": game.pedras_sorteadas or [],
         "hash_integridade": game.hash_integridade,
         "vencedores_ids": game.vencedores_ids or [],
-        "criado_em": game.criado_em.isoformat() if game.criado_em else None,
-        "atualizado_em": game.atualizado_em.isoformat() if game.atualizado_em else None,
+        "criado_em": game.criado_em,
+        "atualizado_em": game.atualizado_em,
     }
 
 
+def _games_fingerprint(games: list[Sorteio]) -> str:
+    """Impressão digital para o ETag: id + atualizado_em de cada jogo."""
+    return "|".join(
+        f"{game.id}:{game.atualizado_em.isoformat() if game.atualizado_em else ''}"
+        for game in games
+    )
+
+
+def _cached_game_list(request: Request, db: Session, key: str, serializer) -> Response:
+    def load():
+        games = db.query(Sorteio).order_by(Sorteio.horario_sorteio.desc()).all()
+        return [serializer(game) for game in games], _games_fingerprint(games)
+
+    return response_cache.respond(request, GAMES_CACHE_NAMESPACE, (key,), load)
+
+
+def _cached_game_detail(
+    request: Request, db: Session, key: str, game_id: str, serializer, not_found: str
+) -> Response:
+    def load():
+        game = db.query(Sorteio).filter(Sorteio.id == game_id).first()
+        if not game:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+        return serializer(game), _games_fingerprint([game])
+
+    return response_cache.respond(request, GAMES_CACHE_NAMESPACE, (key, game_id), load)
+
+
+# Listagens e detalhes de jogos passam pelo response_cache compartilhado e por
+# isso leem SEMPRE do primário (get_db): uma réplica atrasada gravaria dados
+# antigos sob a versão nova do cache, servidos a todos (inclusive a quem acabou
+# de escrever) até o TTL. O cache já absorve a carga das recargas.
+
+
 @router.get("/games")
 def list_games(
+    request: Request,
     db: Session = Depends(get_db),
     _: dict[str, Any] = Depends(get_current_user),
 ):
-    games = db.query(Sorteio).order_by(Sorteio.horario_sorteio.desc()).all()
-    return [_to_game_response(game) for game in games]
+    return _cached_game_list(request, db, "games", _to_game_response)
 
 
 @router.get("/sorteios")
 def list_sorteios(
+    request: Request,
     db: Session = Depends(get_db),
     _: dict[str, Any] = Depends(get_current_user),
 ):
-    jogos = db.query(Sorteio).order_by(Sorteio.horario_sorteio.desc()).all()
-    return [_to_sorteio_response(jogo) for jogo in jogos]
+    return _cached_game_list(request, db, "sorteios", _to_sorteio_response)
 
 
 @router.post("/games", status_code=status.HTTP_201_CREATED)
@@ -547,7 +681,7 @@ def create_game(
     db: Session = Depends(get_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
-    if not _is_admin_payload(user_payload):
+    if not is_admin_payload(user_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Apenas administradores podem criar jogos"
         )
@@ -566,7 +700,7 @@ def create_game(
         )
 
     novo = Sorteio(
-        id=generate_temporal_id_with_microseconds("SOR"),
+        id=generate_unique_temporal_id("SOR"),
         paroquia_id=paroquia_id,
         titulo=payload.title,
         descricao=payload.description,
@@ -592,19 +726,20 @@ def create_game(
     db.add(novo)
     db.commit()
     db.refresh(novo)
+    game_scheduler.notify()
     return _to_game_response(novo)
 
 
 @router.get("/games/{game_id}")
 def get_game(
     game_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     _: dict[str, Any] = Depends(get_current_user),
 ):
-    game = db.query(Sorteio).filter(Sorteio.id == game_id).first()
-    if not game:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Jogo não encontrado")
-    return _to_game_response(game)
+    return _cached_game_detail(
+        request, db, "games", game_id, _to_game_response, "Jogo não encontrado"
+    )
 
 
 @router.put("/games/{game_id}", status_code=status.HTTP_200_OK)
@@ -614,7 +749,7 @@ def update_game(
     db: Session = Depends(get_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
-    if not _is_admin_payload(user_payload):
+    if not is_admin_payload(user_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem editar jogos",
@@ -715,7 +850,7 @@ def reschedule_game(
     db: Session = Depends(get_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
-    if not _is_admin_payload(user_payload):
+    if not is_admin_payload(user_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem remarcar jogos",
@@ -772,8 +907,7 @@ def reschedule_game(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Nova data/hora de sorteio inválida"
         )
 
-    future_games = _future_games_for_reschedule(db, game)
-    preview = _build_reschedule_preview(game, effective_new_draw, request.mode, future_games)
+    preview = _build_reschedule_preview(db, game, effective_new_draw, request.mode)
 
     if request.preview:
         return {
@@ -799,20 +933,17 @@ def reschedule_game(
 
     delta = effective_new_draw - old_draw_cmp
 
+    # Mesma transação: o UPDATE em lote usa o horário antigo do alvo como limite
+    if request.mode == "cascade":
+        _shift_following_games(db, game, delta, now)
+
     game.horario_sorteio = effective_new_draw
     game.fim_vendas = effective_new_draw - timedelta(minutes=1)
     game.atualizado_em = now
 
-    if request.mode == "cascade":
-        for future_game in future_games:
-            future_game.horario_sorteio = future_game.horario_sorteio + delta
-            if future_game.inicio_vendas:
-                future_game.inicio_vendas = future_game.inicio_vendas + delta
-            if future_game.fim_vendas:
-                future_game.fim_vendas = future_game.fim_vendas + delta
-            future_game.atualizado_em = now
-
     db.commit()
+    # Fronteiras de venda/sorteio mudaram: o agendador recalcula o próximo despertar
+    game_scheduler.notify()
 
     return {
         "preview": False,
@@ -825,45 +956,56 @@ def reschedule_game(
 @router.get("/sorteios/{sorteio_id}")
 def get_sorteio(
     sorteio_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     _: dict[str, Any] = Depends(get_current_user),
 ):
-    jogo = db.query(Sorteio).filter(Sorteio.id == sorteio_id).first()
-    if not jogo:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sorteio não encontrado")
-    return _to_sorteio_response(jogo)
+    return _cached_game_detail(
+        request, db, "sorteios", sorteio_id, _to_sorteio_response, "Sorteio não encontrado"
+    )
 
 
 @router.get("/games/{game_id}/cards")
 def list_game_cards(
     game_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: dict[str, Any] = Depends(get_current_user),
 ):
     game = db.query(Sorteio).filter(Sorteio.id == game_id).first()
     if not game:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Jogo não encontrado")
 
-    cards = (
-        db.query(Cartela)
-        .filter(Cartela.sorteio_id == game_id)
+    # Só as colunas exibidas (sem montar objetos ORM) e JSON direto via orjson
+    rows = db.execute(
+        select(
+            Cartela.id,
+            Cartela.status,
+            Cartela.criado_em,
+            Cartela.usuario_id,
+            UsuarioComum.nome,
+            *_CARD_NUMBER_COLUMNS,
+        )
+        .outerjoin(UsuarioComum, UsuarioComum.id == Cartela.usuario_id)
+        .where(Cartela.sorteio_id == game_id)
         .order_by(Cartela.criado_em.desc())
-        .all()
+    ).all()
+    return ORJSONResponse(
+        [
+            {
+                "id": row[0],
+                "numbers": list(row[5:]),
+                "status": row[1].value,
+                "purchase_date": row[2],
+                "owner_name": row[4] or "Usuário",
+                "owner_id": row[3],
+            }
+            for row in rows
+        ]
     )
-    return [
-        {
-            "id": card.id,
-            "numbers": _extract_card_numbers(card),
-            "status": card.status.value if hasattr(card.status, "value") else str(card.status),
-            "purchase_date": card.criado_em.isoformat() if card.criado_em else None,
-            "owner_name": card.usuario.nome if card.usuario else "Usuário",
-            "owner_id": card.usuario_id,
-        }
-        for card in cards
-    ]
 
 
 @router.post("/games/{game_id}/cards", status_code=status.HTTP_201_CREATED)
+@retry_on_sqlite_busy
 def create_card(
     game_id: str,
     request: Optional[CardCreateRequest] = None,
@@ -922,7 +1064,7 @@ def create_card(
         card_columns = _card_columns_from_numbers(numbers_24)
 
         nova = Cartela(
-            id=generate_temporal_id_with_microseconds("CAR"),
+            id=generate_unique_temporal_id("CAR"),
             sorteio_id=game.id,
             usuario_id=fiel.id,
             status=StatusCartela.NO_CARRINHO,
@@ -982,7 +1124,7 @@ def create_cartela_legacy(
 
 @router.get("/users/me/cards")
 def list_my_cards(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
     if not _is_fiel_payload(user_payload):
@@ -992,26 +1134,34 @@ def list_my_cards(
         )
 
     user_id = user_payload.get("sub")
-    cards = (
-        db.query(Cartela)
-        .filter(Cartela.usuario_id == user_id)
+    rows = db.execute(
+        select(
+            Cartela.id,
+            Cartela.sorteio_id,
+            Cartela.status,
+            Cartela.criado_em,
+            *_CARD_NUMBER_COLUMNS,
+        )
+        .where(Cartela.usuario_id == user_id)
         .order_by(Cartela.criado_em.desc())
-        .all()
-    )
+    ).all()
 
-    return [
-        {
-            "id": card.id,
-            "game_id": card.sorteio_id,
-            "numbers": _extract_card_numbers(card),
-            "status": card.status.value if hasattr(card.status, "value") else str(card.status),
-            "purchase_date": card.criado_em.isoformat() if card.criado_em else None,
-        }
-        for card in cards
-    ]
+    return ORJSONResponse(
+        [
+            {
+                "id": row[0],
+                "game_id": row[1],
+                "numbers": list(row[4:]),
+                "status": row[2].value,
+                "purchase_date": row[3],
+            }
+            for row in rows
+        ]
+    )
 
 
 @router.post("/games/{game_id}/cards/{card_id}/pay", status_code=status.HTTP_200_OK)
+@retry_on_sqlite_busy
 def pay_card(
     game_id: str,
     card_id: str,
@@ -1116,13 +1266,14 @@ def pay_card(
 
 
 @router.post("/games/{game_id}/close-sales", status_code=status.HTTP_200_OK)
+@retry_on_sqlite_busy
 def close_sales_for_game(
     game_id: str,
     payload: CloseSalesRequest,
     db: Session = Depends(get_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
-    if not _is_admin_payload(user_payload):
+    if not is_admin_payload(user_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem encerrar vendas",
@@ -1141,20 +1292,7 @@ def close_sales_for_game(
             detail="Ainda não é possível encerrar: o horário de fim das vendas não foi atingido",
         )
 
-    carts_in_cart = (
-        db.query(Cartela)
-        .filter(
-            Cartela.sorteio_id == game_id,
-            Cartela.status == StatusCartela.NO_CARRINHO,
-        )
-        .all()
-    )
-
-    canceled_count = 0
-    for card in carts_in_cart:
-        card.status = StatusCartela.CANCELADA
-        card.atualizado_em = now
-        canceled_count += 1
+    canceled_count = close_game_sales(db, game, now, payload.iniciar_sorteio)
 
     paid_count = (
         db.query(Cartela)
@@ -1165,12 +1303,8 @@ def close_sales_for_game(
         .count()
     )
 
-    if payload.iniciar_sorteio and game.status == StatusSorteio.AGENDADO:
-        game.status = StatusSorteio.EM_ANDAMENTO
-        game.iniciado_em = game.iniciado_em or now
-
-    game.atualizado_em = now
     db.commit()
+    game_scheduler.notify()
 
     return {
         "message": "Vendas encerradas e carrinhos invalidados com sucesso",
@@ -1182,13 +1316,34 @@ def close_sales_for_game(
     }
 
 
+def _run_full_snapshot(bind: Any, game_id: str, target: str) -> None:
+    """Tarefa em segundo plano: sessão própria (a da requisição já foi fechada)."""
+    with Session(bind=bind) as db:
+        try:
+            result = write_game_snapshot(db, game_id, target)
+            logger.info(
+                "📸 Snapshot completo de %s: %s cartelas, sha256=%s",
+                game_id,
+                result.cards,
+                result.sha256,
+            )
+        except Exception:
+            logger.exception("❌ Falha no snapshot completo do jogo %s", game_id)
+
+
 @router.post("/games/{game_id}/snapshot", status_code=status.HTTP_201_CREATED)
 def snapshot_game_results(
     game_id: str,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    modo: Literal["vencedoras", "completo"] = Query(
+        "vencedoras",
+        description="vencedoras = JSON só com as vencedoras | completo = NDJSON.gz com todas as pagas, em segundo plano",  # noqa: E501
+    ),
     db: Session = Depends(get_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
-    if not _is_admin_payload(user_payload):
+    if not is_admin_payload(user_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem gerar snapshot",
@@ -1198,6 +1353,16 @@ def snapshot_game_results(
     if not game:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Jogo não encontrado")
 
+    if modo == "completo":
+        target = str(snapshot_path_for_game(game_id))
+        background_tasks.add_task(_run_full_snapshot, db.get_bind(), game_id, target)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {
+            "message": "Snapshot completo agendado",
+            "mode": modo,
+            "snapshot_file": target,
+        }
+
     vencedoras = (
         db.query(Cartela)
         .filter(
@@ -1222,8 +1387,8 @@ def snapshot_game_results(
     }
 
     path = _snapshot_path_for_game(game_id)
-    with open(path, "w", encoding="utf-8") as fp:
-        json.dump(payload, fp, ensure_ascii=False, indent=2)
+    with open(path, "wb") as fp:
+        fp.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     return {
         "message": "Snapshot criado com sucesso",
@@ -1232,13 +1397,44 @@ def snapshot_game_results(
     }
 
 
+@router.get("/games/{game_id}/snapshot/verify")
+def verify_game_snapshot_endpoint(
+    game_id: str,
+    db: Session = Depends(get_db),
+    user_payload: dict[str, Any] = Depends(get_current_user),
+):
+    """Confere o último snapshot completo do jogo contra o banco (uma passada em lotes)."""
+    if not is_admin_payload(user_payload):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Apenas administradores podem verificar snapshot",
+        )
+
+    if db.get(Sorteio, game_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Jogo não encontrado")
+
+    path = latest_snapshot_for_game(game_id)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Nenhum snapshot completo encontrado para este jogo",
+        )
+
+    try:
+        result = verify_game_snapshot(db, path)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+    return {"game_id": game_id, "snapshot_file": str(path), **result}
+
+
 @router.post("/maintenance/lock", status_code=status.HTTP_200_OK)
 def lock_writes_for_maintenance(
     payload: MaintenanceLockRequest,
     db: Session = Depends(get_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
-    if not _is_admin_payload(user_payload):
+    if not is_admin_payload(user_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem ativar manutenção",
@@ -1287,7 +1483,7 @@ def unlock_writes_after_maintenance(
     db: Session = Depends(get_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
-    if not _is_admin_payload(user_payload):
+    if not is_admin_payload(user_payload):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Apenas administradores podem desativar manutenção",
@@ -1321,7 +1517,7 @@ def unlock_writes_after_maintenance(
 
 @router.get("/minhas-cartelas")
 def list_my_cards_legacy(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user_payload: dict[str, Any] = Depends(get_current_user),
 ):
     return list_my_cards(db=db, user_payload=user_payload)
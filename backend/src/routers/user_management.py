@@ -17,7 +17,7 @@ from src.db.base import get_db
 from src.models.models import TipoUsuario, Paroquia
 from src.schemas.schemas import UsuarioResponse
 from src.utils.auth import hash_password
-from src.utils.time_manager import get_fortaleza_time, generate_temporal_id_with_microseconds
+from src.utils.time_manager import get_fortaleza_time, generate_unique_temporal_id
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +83,7 @@ def create_paroquia_admin(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CPF já cadastrado")
 
     novo_admin = Usuario(
-        id=generate_temporal_id_with_microseconds("USR"),
+        id=generate_unique_temporal_id("USR"),
         nome=nome,
         email=email,
         cpf=cpf,
@@ -164,7 +164,7 @@ def create_operacional(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CPF já cadastrado")
 
     novo_usuario = Usuario(
-        id=generate_temporal_id_with_microseconds("USR"),
+        id=generate_unique_temporal_id("USR"),
         nome=nome,
         email=email,
         cpf=cpf,
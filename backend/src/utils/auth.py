@@ -11,9 +11,8 @@ Responsabilidades:
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-from passlib.context import CryptContext
-from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -40,8 +39,18 @@ ALGORITHM = "HS256"
 # Bingo lida com dinheiro real, então usamos padrão conservador
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 16  # 16 horas
 
-# Contexto para hashing de senhas
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    """
+    Contexto passlib para hashing de senhas, criado no primeiro uso.
+
+    passlib (e o backend bcrypt) só são importados quando alguma senha é
+    verificada/gerada, não no import da aplicação.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 # ============================================================================
@@ -64,7 +73,7 @@ def hash_password(password: str) -> str:
     # Garantir que senha não ultrapasse 72 bytes
     if isinstance(password, str):
         password = password.encode("utf-8")[:72].decode("utf-8", errors="ignore")
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -81,7 +90,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     # Garantir que senha não ultrapasse 72 bytes
     if isinstance(plain_password, str):
         plain_password = plain_password.encode("utf-8")[:72].decode("utf-8", errors="ignore")
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 # ============================================================================
@@ -109,6 +118,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
     to_encode.update({"exp": expire, "iat": get_fortaleza_time()})  # Issued at
 
+    # python-jose carrega o backend cryptography (x509): import no primeiro uso
+    from jose import jwt
+
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -123,6 +135,8 @@ def decode_access_token(token: str) -> Optional[dict]:
     Returns:
         Payload do token se válido, None se inválido
     """
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
@@ -200,6 +214,21 @@ def get_email_verification_token_expiration() -> datetime:
 # ============================================================================
 
 
+ADMIN_NIVEIS_ACESSO = {"admin_site", "admin_paroquia"}
+ADMIN_TIPOS = {"admin_site", "usuario_paroquia", "usuario_administrativo"}
+
+
+def is_admin_payload(user_payload: dict) -> bool:
+    """
+    Indica se o payload de get_current_user é de um usuário administrativo.
+
+    Regra única usada pelos routers de jogos e de administração.
+    """
+    nivel = (user_payload.get("nivel_acesso") or "").strip().lower()
+    tipo = (user_payload.get("tipo") or "").strip().lower()
+    return nivel in ADMIN_NIVEIS_ACESSO or tipo in ADMIN_TIPOS
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security), db: Session = Depends(get_db)
 ):
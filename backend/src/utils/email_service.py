@@ -6,19 +6,21 @@ Gerencia o envio de emails para recuperação de senha e notificações.
 """
 
 import os
-import aiosmtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import logging
 import base64
 import hashlib
 
 from sqlalchemy.orm import Session
-from cryptography.fernet import Fernet
 
 from src.models.models import Configuracao
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+# aiosmtplib, email.mime e cryptography.fernet são importados no primeiro uso
+# (envio/criptografia), fora do caminho de inicialização da API
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,7 +83,9 @@ class EmailService:
             or "smtp-config-secret-change-in-production"
         )
 
-    def _get_fernet(self) -> Fernet:
+    def _get_fernet(self) -> "Fernet":
+        from cryptography.fernet import Fernet
+
         seed = self._normalize_secret_seed().encode("utf-8")
         key = base64.urlsafe_b64encode(hashlib.sha256(seed).digest())
         return Fernet(key)
@@ -235,6 +239,10 @@ class EmailService:
                 to_email,
             )
 
+            import aiosmtplib
+            from email.mime.multipart import MIMEMultipart
+            from email.mime.text import MIMEText
+
             # Criar mensagem
             message = MIMEMultipart("alternative")
             message["From"] = f"{effective_from_name} <{effective_from_email}>"
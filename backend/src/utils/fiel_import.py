@@ -0,0 +1,393 @@
+"""
+Fiel Import - Importação em Lote de Fiéis (CSV)
+===============================================
+Módulo responsável por:
+- Ler o CSV em streaming, em lotes (sem carregar o arquivo inteiro)
+- Validar CPF (Módulo 11), telefones, e-mails e chaves PIX por lote
+- Deduplicar contra o banco com UMA consulta por lote (cpf_norm/email_norm)
+- Gerar hash das senhas em paralelo (threads na API; processos no script CLI)
+- Inserir cada lote com um único INSERT multi-linha
+- Devolver um relatório com os erros por linha do arquivo
+
+Colunas aceitas (cabeçalho, separador "," ou ";"):
+nome, cpf, email, telefone [, whatsapp, chave_pix, senha]
+
+Sem coluna "senha", cada fiel recebe uma senha aleatória e deve usar a
+recuperação de senha por e-mail no primeiro acesso.
+"""
+
+import csv
+import logging
+import os
+import re
+import secrets
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from operator import mul
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Session
+
+from src.models.models import UsuarioComum
+from src.schemas.schemas import validate_nome_completo
+from src.utils.auth import hash_password
+from src.utils.normalization import digits_only, normalize_nome, normalize_phone, only_digits
+from src.utils.time_manager import generate_many, get_fortaleza_time
+
+
+logger = logging.getLogger(__name__)
+
+FIEL_IMPORT_BATCH_SIZE = int(os.getenv("FIEL_IMPORT_BATCH_SIZE", "500"))
+FIEL_IMPORT_HASH_WORKERS = int(
+    os.getenv("FIEL_IMPORT_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+REQUIRED_COLUMNS = ("nome", "cpf", "email", "telefone")
+OPTIONAL_COLUMNS = ("whatsapp", "chave_pix", "senha")
+
+
+# ============================================================================
+# VALIDAÇÃO EM LOTE
+# ============================================================================
+
+
+_CPF_WEIGHTS_1 = tuple(range(10, 1, -1))
+_CPF_WEIGHTS_2 = tuple(range(11, 1, -1))
+_CPF_REPEATED = frozenset(str(d) * 11 for d in range(10))
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_EVP_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+
+
+def _cpf_checksum_ok(cpf: str) -> bool:
+    digits = [ord(ch) - 48 for ch in cpf]
+    resto = sum(map(mul, digits[:9], _CPF_WEIGHTS_1)) % 11
+    if digits[9] != (0 if resto < 2 else 11 - resto):
+        return False
+    resto = sum(map(mul, digits[:10], _CPF_WEIGHTS_2)) % 11
+    return digits[10] == (0 if resto < 2 else 11 - resto)
+
+
+def validate_cpf_batch(values: Iterable[Optional[str]]) -> list[tuple[str, Optional[str]]]:
+    """
+    Valida um lote de CPFs (Módulo 11).
+
+    Returns:
+        list[tuple[str, Optional[str]]]: (CPF só com dígitos, mensagem de erro ou None)
+    """
+    results = []
+    for cpf in only_digits(values):
+        if len(cpf) != 11:
+            results.append((cpf, "CPF deve ter 11 dígitos"))
+        elif cpf in _CPF_REPEATED:
+            results.append((cpf, "CPF inválido (sequência de números iguais)"))
+        elif not _cpf_checksum_ok(cpf):
+            results.append((cpf, "CPF inválido (dígito verificador incorreto)"))
+        else:
+            results.append((cpf, None))
+    return results
+
+
+def normalize_phone_batch(
+    values: Iterable[Optional[str]],
+    min_digits: int = 10,
+    max_digits: int = 12,
+    label: str = "Telefone",
+) -> list[tuple[str, Optional[str]]]:
+    """
+    Normaliza um lote de telefones para DDD + número (sem DDI 55).
+
+    Returns:
+        list[tuple[str, Optional[str]]]: (telefone normalizado, mensagem de erro ou None)
+    """
+    results = []
+    for phone in only_digits(values):
+        if phone.startswith("55") and len(phone) in (12, 13):
+            phone = phone[2:]
+        if min_digits <= len(phone) <= max_digits:
+            results.append((phone, None))
+        else:
+            results.append(
+                (phone, f"{label} deve ter DDD + número ({min_digits} a {max_digits} dígitos)")
+            )
+    return results
+
+
+def validate_email_batch(values: Iterable[Optional[str]]) -> list[tuple[str, Optional[str]]]:
+    """Valida e normaliza (minúsculas) um lote de e-mails."""
+    results = []
+    for value in values:
+        email = (value or "").strip().lower()
+        results.append((email, None if _EMAIL_RE.match(email) else "Email inválido"))
+    return results
+
+
+def validate_pix_batch(
+    values: Iterable[Optional[str]],
+) -> list[tuple[Optional[str], Optional[str]]]:
+    """
+    Valida um lote de chaves PIX opcionais por tipo (CPF, email, telefone, aleatória).
+
+    Returns:
+        list[tuple[Optional[str], Optional[str]]]: (chave normalizada ou None, erro ou None)
+    """
+    results: list[tuple[Optional[str], Optional[str]]] = []
+    for value in values:
+        key = (value or "").strip()
+        if not key:
+            results.append((None, None))
+            continue
+        if "@" in key:
+            email, error = validate_email_batch([key])[0]
+            results.append((email, error and "Chave PIX (email) inválida"))
+        elif _EVP_RE.match(key):
+            results.append((key.lower(), None))
+        else:
+            digits = digits_only(key)
+            if len(digits) == 11 and not key.startswith("+") and _cpf_checksum_ok(digits):
+                results.append((digits, None))
+            else:
+                phone, error = normalize_phone_batch([key], 10, 11)[0]
+                results.append((phone, error and "Chave PIX em formato não reconhecido"))
+    return results
+
+
+# ============================================================================
+# PIPELINE DE IMPORTAÇÃO
+# ============================================================================
+
+
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _open_reader(stream: TextIO) -> csv.DictReader:
+    sample = stream.readline()
+    delimiter = ";" if sample.count(";") > sample.count(",") else ","
+    header = [name.strip().lower() for name in next(csv.reader([sample], delimiter=delimiter))]
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"Colunas obrigatórias ausentes no CSV: {', '.join(missing)}")
+    return csv.DictReader(stream, fieldnames=header, delimiter=delimiter)
+
+
+def _validate_rows(rows: list[tuple[int, dict]]) -> tuple[list[dict], list[dict]]:
+    def column(name: str) -> list[Optional[str]]:
+        return [row.get(name) for _, row in rows]
+
+    cpfs = validate_cpf_batch(column("cpf"))
+    emails = validate_email_batch(column("email"))
+    telefones = normalize_phone_batch(column("telefone"))
+    whatsapps = normalize_phone_batch(
+        [row.get("whatsapp") or row.get("telefone") for _, row in rows], 11, 12, "WhatsApp"
+    )
+    pix_keys = validate_pix_batch(column("chave_pix"))
+
+    valid, errors = [], []
+    for idx, (line_no, row) in enumerate(rows):
+        row_errors = [
+            error
+            for _, error in (cpfs[idx], emails[idx], telefones[idx], whatsapps[idx], pix_keys[idx])
+            if error
+        ]
+        try:
+            nome = validate_nome_completo(row.get("nome") or "")
+        except ValueError as exc:
+            row_errors.insert(0, str(exc))
+            nome = None
+
+        senha = row.get("senha") or ""
+        if senha and len(senha) < 6:
+            row_errors.append("Senha deve ter no mínimo 6 caracteres")
+
+        if row_errors:
+            errors.append({"linha": line_no, "erros": row_errors})
+            continue
+
+        valid.append(
+            {
+                "linha": line_no,
+                "nome": nome,
+                "cpf": cpfs[idx][0],
+                "email": emails[idx][0],
+                "telefone": telefones[idx][0],
+                "whatsapp": whatsapps[idx][0],
+                "chave_pix": pix_keys[idx][0],
+                "senha": senha or secrets.token_urlsafe(12),
+            }
+        )
+    return valid, errors
+
+
+def _dedupe(
+    db: Session, rows: list[dict], seen_cpfs: set[str], seen_emails: set[str]
+) -> tuple[list[dict], list[dict]]:
+    if not rows:
+        return [], []
+
+    existentes = (
+        db.query(UsuarioComum.cpf_norm, UsuarioComum.email_norm)
+        .filter(
+            or_(
+                UsuarioComum.cpf_norm.in_({row["cpf"] for row in rows}),
+                UsuarioComum.email_norm.in_({row["email"] for row in rows}),
+            )
+        )
+        .all()
+    )
+    cpfs_db = {cpf for cpf, _ in existentes}
+    emails_db = {email for _, email in existentes}
+
+    unique, errors = [], []
+    for row in rows:
+        row_errors = []
+        if row["cpf"] in cpfs_db:
+            row_errors.append("CPF já cadastrado no sistema")
+        elif row["cpf"] in seen_cpfs:
+            row_errors.append("CPF repetido no arquivo")
+        if row["email"] in emails_db:
+            row_errors.append("Email já cadastrado no sistema")
+        elif row["email"] in seen_emails:
+            row_errors.append("Email repetido no arquivo")
+
+        if row_errors:
+            errors.append({"linha": row["linha"], "erros": row_errors})
+            continue
+        seen_cpfs.add(row["cpf"])
+        seen_emails.add(row["email"])
+        unique.append(row)
+    return unique, errors
+
+
+def _hash_passwords(executor: Optional[Executor], passwords: list[str]) -> list[str]:
+    if executor is None or len(passwords) < 2:
+        return [hash_password(password) for password in passwords]
+    return list(executor.map(hash_password, passwords, chunksize=max(1, len(passwords) // 16)))
+
+
+def import_fieis_csv(
+    db: Session,
+    stream: TextIO,
+    paroquia_id: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    hash_workers: Optional[int] = None,
+    use_processes: bool = False,
+) -> dict[str, Any]:
+    """
+    Importa fiéis de um CSV em lotes.
+
+    Args:
+        db: Sessão do banco
+        stream: Arquivo CSV aberto em modo texto
+        paroquia_id: Paróquia associada aos fiéis importados (opcional)
+        batch_size: Linhas por lote (padrão: FIEL_IMPORT_BATCH_SIZE)
+        hash_workers: Workers para bcrypt (0 = na própria thread)
+        use_processes: Usa ProcessPoolExecutor em vez de threads. Só para o
+            script CLI: dentro do uvicorn, processos filhos herdariam locks e
+            o pool de conexões. Nas threads o bcrypt libera o GIL.
+
+    Returns:
+        dict: Relatório com total de linhas, importados e erros por linha
+
+    Raises:
+        ValueError: Se o cabeçalho não tiver as colunas obrigatórias
+    """
+    batch_size = batch_size or FIEL_IMPORT_BATCH_SIZE
+    hash_workers = FIEL_IMPORT_HASH_WORKERS if hash_workers is None else hash_workers
+    reader = _open_reader(stream)
+
+    total = 0
+    importados = 0
+    erros: list[dict] = []
+    seen_cpfs: set[str] = set()
+    seen_emails: set[str] = set()
+
+    executor: Optional[Executor] = None
+
+    def hash_executor() -> Optional[Executor]:
+        # Criado só no primeiro lote com senhas (CSV vazio não abre workers)
+        nonlocal executor
+        if executor is None and hash_workers > 0:
+            if use_processes:
+                # concurrent.futures.process (multiprocessing) só é carregado no script
+                from concurrent.futures import ProcessPoolExecutor
+
+                executor = ProcessPoolExecutor(max_workers=hash_workers)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=hash_workers, thread_name_prefix="fiel-hash"
+                )
+        return executor
+
+    try:
+        # Linha 1 (cabeçalho) já foi consumida: line_num + 1 é a linha no arquivo
+        rows = ((reader.line_num + 1, row) for row in reader)
+        for batch in _batched(rows, batch_size):
+            total += len(batch)
+            valid, batch_errors = _validate_rows(batch)
+            unique, dup_errors = _dedupe(db, valid, seen_cpfs, seen_emails)
+            erros.extend(batch_errors)
+            erros.extend(dup_errors)
+            if not unique:
+                continue
+
+            passwords = [row["senha"] for row in unique]
+            hashes = _hash_passwords(hash_executor() if len(passwords) > 1 else None, passwords)
+            ids = generate_many("USR", len(unique))
+            agora = get_fortaleza_time()
+            db.execute(
+                insert(UsuarioComum),
+                [
+                    {
+                        "id": user_id,
+                        "nome": row["nome"],
+                        "cpf": row["cpf"],
+                        "email": row["email"],
+                        "telefone": row["telefone"],
+                        "whatsapp": row["whatsapp"],
+                        "chave_pix": row["chave_pix"],
+                        "nome_norm": normalize_nome(row["nome"]) or None,
+                        "email_norm": row["email"],
+                        "telefone_norm": normalize_phone(row["telefone"]) or None,
+                        "cpf_norm": row["cpf"],
+                        "senha_hash": senha_hash,
+                        "paroquia_id": paroquia_id,
+                        "ativo": True,
+                        "banido": False,
+                        "email_verificado": False,
+                        "telefone_verificado": False,
+                        "criado_em": agora,
+                        "atualizado_em": agora,
+                    }
+                    for user_id, row, senha_hash in zip(ids, unique, hashes)
+                ],
+            )
+            db.commit()
+            importados += len(unique)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    erros.sort(key=lambda item: item["linha"])
+    logger.info(
+        f"📥 Importação de fiéis: {importados}/{total} linhas importadas, {len(erros)} com erro"
+    )
+    return {"total_linhas": total, "importados": importados, "com_erro": len(erros), "erros": erros}
+
+
+__all__ = [
+    "REQUIRED_COLUMNS",
+    "OPTIONAL_COLUMNS",
+    "validate_cpf_batch",
+    "normalize_phone_batch",
+    "validate_email_batch",
+    "validate_pix_batch",
+    "import_fieis_csv",
+]
@@ -0,0 +1,349 @@
+"""
+Game Scheduler - Encerramento Automático de Vendas e Início dos Sorteios
+========================================================================
+Módulo responsável por:
+- Encerrar as vendas no fim_vendas de cada jogo (carrinhos -> CANCELADA)
+- Passar o jogo de AGENDADO para EM_ANDAMENTO no horario_sorteio
+- Dormir exatamente até a próxima fronteira (MIN indexado no banco),
+  acordando antes quando um jogo é criado/alterado/remarcado (notify)
+- Rodar em um único worker: eleição de líder por lease na tabela
+  configuracoes (compare-and-set no valor), renovada periodicamente
+
+Variáveis de ambiente:
+- GAME_SCHEDULER_ENABLED (true)      -> liga o agendador no startup
+- GAME_SCHEDULER_MAX_SLEEP_SECONDS   -> teto do sono (capta remarcações de
+                                        outros workers); padrão 30
+- GAME_SCHEDULER_LEASE_SECONDS       -> validade da liderança; padrão 30
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.db.base import SessionLocal
+from src.models.models import (
+    Cartela,
+    CategoriaConfiguracao,
+    Configuracao,
+    Sorteio,
+    StatusCartela,
+    StatusSorteio,
+    TipoConfiguracao,
+)
+from src.utils.time_manager import get_fortaleza_time
+
+
+logger = logging.getLogger(__name__)
+
+GAME_SCHEDULER_ENABLED = os.getenv("GAME_SCHEDULER_ENABLED", "true").strip().lower() == "true"
+GAME_SCHEDULER_MAX_SLEEP_SECONDS = float(os.getenv("GAME_SCHEDULER_MAX_SLEEP_SECONDS", "30"))
+GAME_SCHEDULER_LEASE_SECONDS = float(os.getenv("GAME_SCHEDULER_LEASE_SECONDS", "30"))
+
+LEADER_KEY = "game_scheduler_leader"
+
+# Folga para não acordar um instante antes da fronteira (resolução do timer)
+_WAKE_EPSILON_SECONDS = 0.01
+
+
+def fortaleza_now_naive() -> datetime:
+    """Agora em Fortaleza sem tzinfo (como as colunas são comparadas no SQLite)."""
+    return get_fortaleza_time().replace(tzinfo=None)
+
+
+def _naive(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return value.replace(tzinfo=None) if value.tzinfo else value
+
+
+# ============================================================================
+# TRANSIÇÕES DE ESTADO DOS JOGOS
+# ============================================================================
+
+
+def close_game_sales(db: Session, game: Sorteio, now: datetime, iniciar_sorteio: bool) -> int:
+    """
+    Encerra as vendas de um jogo: cartelas no carrinho viram CANCELADA.
+
+    Não faz commit. Usado pelo endpoint manual e pelo agendador.
+
+    Returns:
+        int: Quantidade de cartelas canceladas
+    """
+    canceled = (
+        db.query(Cartela)
+        .filter(Cartela.sorteio_id == game.id, Cartela.status == StatusCartela.NO_CARRINHO)
+        .update(
+            {Cartela.status: StatusCartela.CANCELADA, Cartela.atualizado_em: now},
+            synchronize_session=False,
+        )
+    )
+
+    if iniciar_sorteio and game.status == StatusSorteio.AGENDADO:
+        game.status = StatusSorteio.EM_ANDAMENTO
+        game.iniciado_em = game.iniciado_em or now
+
+    game.atualizado_em = now
+    return int(canceled or 0)
+
+
+def run_due_transitions(db: Session, now: datetime) -> dict[str, int]:
+    """
+    Aplica, em lote, todas as transições vencidas até `now` e faz commit.
+
+    - Jogos AGENDADOS com fim_vendas <= now: carrinhos -> CANCELADA
+    - Jogos AGENDADOS com horario_sorteio <= now: -> EM_ANDAMENTO
+
+    Idempotente: rodar de novo não altera nada.
+    """
+    vendas_encerradas = select(Sorteio.id).where(
+        Sorteio.status == StatusSorteio.AGENDADO, Sorteio.fim_vendas <= now
+    )
+    canceled = (
+        db.query(Cartela)
+        .filter(
+            Cartela.sorteio_id.in_(vendas_encerradas),
+            Cartela.status == StatusCartela.NO_CARRINHO,
+        )
+        .update(
+            {Cartela.status: StatusCartela.CANCELADA, Cartela.atualizado_em: now},
+            synchronize_session=False,
+        )
+    )
+    started = (
+        db.query(Sorteio)
+        .filter(Sorteio.status == StatusSorteio.AGENDADO, Sorteio.horario_sorteio <= now)
+        .update(
+            {
+                Sorteio.status: StatusSorteio.EM_ANDAMENTO,
+                Sorteio.iniciado_em: func.coalesce(Sorteio.iniciado_em, now),
+                Sorteio.atualizado_em: now,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return {"canceled_cards": int(canceled or 0), "started_games": int(started or 0)}
+
+
+def next_boundary(db: Session, now: datetime) -> Optional[datetime]:
+    """Próximo fim_vendas ou horario_sorteio (> now) entre os jogos AGENDADOS."""
+    candidates = [
+        db.query(func.min(column))
+        .filter(Sorteio.status == StatusSorteio.AGENDADO, column > now)
+        .scalar()
+        for column in (Sorteio.fim_vendas, Sorteio.horario_sorteio)
+    ]
+    future = [_naive(value) for value in candidates if value is not None]
+    return min(future) if future else None
+
+
+# ============================================================================
+# ELEIÇÃO DE LÍDER (LEASE EM configuracoes)
+# ============================================================================
+
+
+class LeaderLease:
+    """
+    Liderança com prazo guardada em configuracoes[LEADER_KEY] = "dono|expira_epoch".
+
+    A troca de dono é um UPDATE ... WHERE valor = <valor lido> (compare-and-set),
+    então dois workers nunca assumem juntos, em SQLite ou PostgreSQL.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        ttl_seconds: float = GAME_SCHEDULER_LEASE_SECONDS,
+        owner: Optional[str] = None,
+        key: str = LEADER_KEY,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.key = key
+        self._clock = clock
+
+    @staticmethod
+    def _parse(valor: str) -> tuple[str, float]:
+        owner, _, expires = (valor or "").rpartition("|")
+        try:
+            return owner, float(expires)
+        except ValueError:
+            return owner, 0.0
+
+    def try_acquire(self) -> bool:
+        """Assume ou renova a liderança. Retorna True se este processo é o líder."""
+        now = self._clock()
+        novo_valor = f"{self.owner}|{now + self.ttl_seconds:.3f}"
+        with self.session_factory() as db:
+            row = db.get(Configuracao, self.key)
+            if row is None:
+                db.add(
+                    Configuracao(
+                        chave=self.key,
+                        valor=novo_valor,
+                        tipo=TipoConfiguracao.STRING,
+                        categoria=CategoriaConfiguracao.SEGURANCA,
+                        descricao="Worker líder do agendador de jogos (dono|expira_epoch)",
+                    )
+                )
+                try:
+                    db.commit()
+                    return True
+                except IntegrityError:
+                    db.rollback()
+                    return False
+
+            owner, expires = self._parse(row.valor)
+            if owner != self.owner and expires > now:
+                return False
+
+            updated = (
+                db.query(Configuracao)
+                .filter(Configuracao.chave == self.key, Configuracao.valor == row.valor)
+                .update({Configuracao.valor: novo_valor}, synchronize_session=False)
+            )
+            db.commit()
+            return updated == 1
+
+    def release(self) -> None:
+        """Libera a liderança (se for deste processo) para outro worker assumir já."""
+        with self.session_factory() as db:
+            row = db.get(Configuracao, self.key)
+            if row is None or self._parse(row.valor)[0] != self.owner:
+                return
+            db.query(Configuracao).filter(
+                Configuracao.chave == self.key, Configuracao.valor == row.valor
+            ).update({Configuracao.valor: f"{self.owner}|0"}, synchronize_session=False)
+            db.commit()
+
+
+# ============================================================================
+# AGENDADOR ASYNCIO
+# ============================================================================
+
+
+class GameScheduler:
+    """
+    Laço asyncio que dorme até a próxima fronteira de jogo e aplica as transições.
+
+    O trabalho de banco roda em thread (asyncio.to_thread) para não travar o
+    event loop. Só o worker com a liderança executa transições.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        lease: Optional[LeaderLease] = None,
+        max_sleep_seconds: float = GAME_SCHEDULER_MAX_SLEEP_SECONDS,
+        clock: Callable[[], datetime] = fortaleza_now_naive,
+    ):
+        self.session_factory = session_factory
+        self.lease = lease or LeaderLease(session_factory)
+        self.max_sleep_seconds = max_sleep_seconds
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.is_leader = False
+        self.next_wake_at: Optional[datetime] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Inicia o laço no event loop atual (chamar do startup da aplicação)."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = self._loop.create_task(self._run(), name="game-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self.is_leader:
+            await asyncio.to_thread(self.lease.release)
+            self.is_leader = False
+
+    def notify(self) -> None:
+        """
+        Recalcula a próxima fronteira agora (jogo criado, alterado ou remarcado).
+
+        Seguro para chamar de endpoints síncronos (threadpool).
+        """
+        if self._loop is not None and self._wake is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def run_once(self) -> tuple[dict[str, int], Optional[datetime]]:
+        """Aplica as transições vencidas e devolve (resultado, próxima fronteira)."""
+        now = self._clock()
+        with self.session_factory() as db:
+            result = run_due_transitions(db, now)
+            return result, next_boundary(db, now)
+
+    def _sleep_seconds(self, boundary: Optional[datetime]) -> float:
+        # Teto: renovar a liderança antes de expirar e captar mudanças de outros workers
+        limit = min(self.max_sleep_seconds, self.lease.ttl_seconds / 3)
+        if boundary is None:
+            return limit
+        remaining = (boundary - self._clock()).total_seconds() + _WAKE_EPSILON_SECONDS
+        return max(0.0, min(limit, remaining))
+
+    async def _run(self) -> None:
+        while True:
+            boundary = None
+            try:
+                self.is_leader = await asyncio.to_thread(self.lease.try_acquire)
+                if self.is_leader:
+                    result, boundary = await asyncio.to_thread(self.run_once)
+                    if result["canceled_cards"] or result["started_games"]:
+                        logger.info(
+                            "⏱️ Agendador: %s carrinhos cancelados, %s jogos iniciados",
+                            result["canceled_cards"],
+                            result["started_games"],
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("❌ Agendador de jogos falhou; nova tentativa em seguida")
+
+            self.next_wake_at = boundary
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._sleep_seconds(boundary))
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+
+game_scheduler = GameScheduler(SessionLocal)
+
+
+__all__ = [
+    "GAME_SCHEDULER_ENABLED",
+    "LeaderLease",
+    "GameScheduler",
+    "game_scheduler",
+    "close_game_sales",
+    "run_due_transitions",
+    "next_boundary",
+    "fortaleza_now_naive",
+]
@@ -0,0 +1,286 @@
+"""
+Game Snapshot - Snapshot Completo de Jogo em NDJSON com Hash de Integridade
+===========================================================================
+Módulo responsável por:
+- Gravar o snapshot completo de um jogo (dados do jogo + todas as cartelas
+  pagas) em NDJSON comprimido (gzip), lendo as cartelas em lotes por id
+- Calcular o SHA-256 incremental das linhas de dados e guardá-lo em
+  Sorteio.hash_integridade
+- Verificar um snapshot contra o banco em uma única passada (arquivo e banco
+  lidos em paralelo, lote a lote), sem carregar nenhum dos dois em memória
+
+Formato (uma linha JSON por registro):
+    {"type":"meta", ...}   -> data/versão (fora do hash)
+    {"type":"game", ...}   -> dados críticos do jogo (entra no hash)
+    {"type":"card", ...}   -> uma linha por cartela paga, em ordem de id (entra no hash)
+    {"type":"end", ...}    -> quantidade de cartelas e SHA-256 (fora do hash)
+"""
+
+import gzip
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.models.models import Cartela, Sorteio, StatusCartela
+from src.utils.time_manager import get_fortaleza_time
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Cartelas lidas por consulta durante o snapshot/verificação
+SNAPSHOT_CHUNK_SIZE = int(os.getenv("SNAPSHOT_CHUNK_SIZE", "1000"))
+
+# Cartelas que participaram do sorteio (pagas, inclusive já apuradas e legado)
+SNAPSHOT_CARD_STATUSES = (
+    StatusCartela.PAGA,
+    StatusCartela.ATIVA,
+    StatusCartela.VENCEDORA,
+    StatusCartela.PERDEDORA,
+)
+
+_CARD_NUMBER_COLUMNS = tuple(getattr(Cartela, f"n{i}") for i in range(1, 25))
+
+# Chaves ordenadas: a mesma linha sempre gera os mesmos bytes (hash estável)
+_DUMPS_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+@dataclass
+class SnapshotResult:
+    path: Path
+    cards: int
+    sha256: str
+    bytes_written: int
+
+
+def _line(record: dict[str, Any]) -> bytes:
+    return orjson.dumps(record, option=_DUMPS_OPTIONS) + b"\n"
+
+
+def _status_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _game_record(game: Sorteio) -> dict[str, Any]:
+    return {
+        "type": "game",
+        "id": game.id,
+        "paroquia_id": game.paroquia_id,
+        "titulo": game.titulo,
+        "status": _status_value(game.status),
+        "valor_cartela": game.valor_cartela,
+        "horario_sorteio": game.horario_sorteio,
+        "total_arrecadado": game.total_arrecadado,
+        "total_premio": game.total_premio,
+        "total_cartelas_vendidas": game.total_cartelas_vendidas,
+        "pedras_sorteadas": game.pedras_sorteadas or [],
+        "vencedores_ids": game.vencedores_ids or [],
+    }
+
+
+def iter_card_records(
+    db: Session, game_id: str, chunk_size: int = SNAPSHOT_CHUNK_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Cartelas pagas do jogo em ordem de id, lidas em lotes (keyset) sem objetos ORM."""
+    last_id = ""
+    while True:
+        rows = db.execute(
+            select(
+                Cartela.id,
+                Cartela.usuario_id,
+                Cartela.status,
+                Cartela.valor_premio,
+                *_CARD_NUMBER_COLUMNS,
+            )
+            .where(
+                Cartela.sorteio_id == game_id,
+                Cartela.status.in_(SNAPSHOT_CARD_STATUSES),
+                Cartela.id > last_id,
+            )
+            .order_by(Cartela.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            return
+        for row in rows:
+            yield {
+                "type": "card",
+                "id": row[0],
+                "usuario_id": row[1],
+                "status": _status_value(row[2]),
+                "valor_premio": row[3],
+                "numbers": list(row[4:]),
+            }
+        last_id = rows[-1][0]
+        if len(rows) < chunk_size:
+            return
+
+
+def snapshot_dir() -> Path:
+    """SNAPSHOT_DIR, ou data/snapshots (volume /app/data no Docker)."""
+    configured = os.getenv("SNAPSHOT_DIR")
+    if configured:
+        return Path(configured)
+    if os.path.exists("/app/data"):
+        return Path("/app/data/snapshots")
+    return Path(__file__).resolve().parents[2] / "data" / "snapshots"
+
+
+def snapshot_path_for_game(game_id: str, base_dir: Optional[Path] = None) -> Path:
+    base_dir = Path(base_dir) if base_dir else snapshot_dir()
+    base_dir.mkdir(parents=True, exist_ok=True)
+    stamp = get_fortaleza_time().strftime("%Y%m%d_%H%M%S")
+    return base_dir / f"snapshot_{game_id}_{stamp}_full.ndjson.gz"
+
+
+def latest_snapshot_for_game(game_id: str, base_dir: Optional[Path] = None) -> Optional[Path]:
+    directory = Path(base_dir) if base_dir else snapshot_dir()
+    candidates = sorted(directory.glob(f"snapshot_{game_id}_*_full.ndjson.gz"))
+    return candidates[-1] if candidates else None
+
+
+def write_game_snapshot(
+    db: Session,
+    game_id: str,
+    target: Optional[Path] = None,
+    chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+) -> SnapshotResult:
+    """
+    Grava o snapshot completo do jogo e atualiza Sorteio.hash_integridade.
+
+    O arquivo é escrito em um temporário e renomeado ao final: um snapshot
+    interrompido nunca fica com o nome definitivo.
+    """
+    game = db.get(Sorteio, game_id)
+    if game is None:
+        raise LookupError(f"Jogo não encontrado: {game_id}")
+
+    target = Path(target) if target else snapshot_path_for_game(game_id)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(target.name + ".tmp")
+
+    hasher = hashlib.sha256()
+    cards = 0
+    try:
+        with gzip.open(tmp_path, "wb", compresslevel=6) as fh:
+            fh.write(
+                _line(
+                    {
+                        "type": "meta",
+                        "format": SNAPSHOT_FORMAT_VERSION,
+                        "game_id": game_id,
+                        "snapshot_at": get_fortaleza_time(),
+                    }
+                )
+            )
+            line = _line(_game_record(game))
+            hasher.update(line)
+            fh.write(line)
+
+            for record in iter_card_records(db, game_id, chunk_size):
+                line = _line(record)
+                hasher.update(line)
+                fh.write(line)
+                cards += 1
+
+            digest = hasher.hexdigest()
+            fh.write(_line({"type": "end", "cards": cards, "sha256": digest}))
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    game.hash_integridade = digest
+    db.commit()
+
+    return SnapshotResult(
+        path=target, cards=cards, sha256=digest, bytes_written=target.stat().st_size
+    )
+
+
+def verify_game_snapshot(
+    db: Session, path: Path, chunk_size: int = SNAPSHOT_CHUNK_SIZE
+) -> dict[str, Any]:
+    """
+    Confere um snapshot em uma passada: integridade do arquivo (hash do rodapé)
+    e igualdade, linha a linha, com o estado atual do banco.
+
+    Returns:
+        dict: valid, file_intact, matches_database, matches_stored_hash,
+              cards, sha256 e first_mismatch (id do primeiro registro divergente)
+    """
+    file_hasher = hashlib.sha256()
+    live_hasher = hashlib.sha256()
+    footer: Optional[dict[str, Any]] = None
+    first_mismatch: Optional[str] = None
+    cards = 0
+    game: Optional[Sorteio] = None
+    live_cards: Optional[Iterator[dict[str, Any]]] = None
+
+    with gzip.open(path, "rb") as fh:
+        for raw in fh:
+            record = orjson.loads(raw)
+            kind = record.get("type")
+            if kind == "meta":
+                game = db.get(Sorteio, record["game_id"])
+                if game is None:
+                    raise LookupError(f"Jogo não encontrado: {record['game_id']}")
+                live_cards = iter_card_records(db, game.id, chunk_size)
+                continue
+            if kind == "end":
+                footer = record
+                break
+            if game is None or live_cards is None:
+                raise ValueError("Snapshot sem cabeçalho (meta)")
+
+            file_hasher.update(raw)
+            if kind == "game":
+                live_line = _line(_game_record(game))
+            else:
+                cards += 1
+                live_record = next(live_cards, None)
+                live_line = _line(live_record) if live_record is not None else b""
+            live_hasher.update(live_line)
+            if first_mismatch is None and live_line != raw:
+                first_mismatch = record.get("id")
+
+    if footer is None or game is None or live_cards is None:
+        raise ValueError("Snapshot incompleto (sem rodapé)")
+
+    # Cartelas pagas que surgiram no banco depois do snapshot
+    for live_record in live_cards:
+        live_hasher.update(_line(live_record))
+        if first_mismatch is None:
+            first_mismatch = live_record["id"]
+
+    digest = file_hasher.hexdigest()
+    file_intact = digest == footer.get("sha256") and cards == footer.get("cards")
+    matches_database = live_hasher.hexdigest() == digest and first_mismatch is None
+    matches_stored_hash = game.hash_integridade == digest
+    return {
+        "valid": file_intact and matches_database and matches_stored_hash,
+        "file_intact": file_intact,
+        "matches_database": matches_database,
+        "matches_stored_hash": matches_stored_hash,
+        "cards": cards,
+        "sha256": digest,
+        "first_mismatch": first_mismatch,
+    }
+
+
+__all__ = [
+    "SNAPSHOT_CHUNK_SIZE",
+    "SNAPSHOT_CARD_STATUSES",
+    "SnapshotResult",
+    "iter_card_records",
+    "snapshot_dir",
+    "snapshot_path_for_game",
+    "latest_snapshot_for_game",
+    "write_game_snapshot",
+    "verify_game_snapshot",
+]
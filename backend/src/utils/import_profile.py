@@ -0,0 +1,171 @@
+"""
+Import Profile - Tempo de Import na Inicialização
+=================================================
+Módulo responsável por:
+- Rodar `python -X importtime -c "import <módulo>"` em processo novo
+- Interpretar a saída (tempo próprio e acumulado por módulo, em µs)
+- Agregar por pacote de topo e apontar os imports mais caros
+- Listar módulos pesados que devem ser carregados só no primeiro uso
+
+Usado pelo CLI scripts/import_time_report.py e pelo teste de orçamento
+de import de src.main.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Dependências pesadas que não devem ser importadas por `import src.main`
+# (SMTP, Fernet, JWT/x509, passlib, pool de processos da importação de fiéis)
+LAZY_MODULES = (
+    "aiosmtplib",
+    "email.mime.multipart",
+    "cryptography.fernet",
+    "cryptography.x509",
+    "jose.jwt",
+    "passlib.context",
+    "concurrent.futures.process",
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """Linha do -X importtime (tempos em microssegundos)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".", 1)[0]
+
+
+@dataclass
+class ImportProfile:
+    """Resultado de uma medição de import."""
+
+    target: str
+    records: list[ImportRecord] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def total_us(self) -> int:
+        for record in reversed(self.records):
+            if record.module == self.target and record.depth == 0:
+                return record.cumulative_us
+        return 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+    def loaded(self, module: str) -> bool:
+        return any(record.module == module for record in self.records)
+
+    def lazy_violations(self, modules: tuple[str, ...] = LAZY_MODULES) -> list[str]:
+        return [module for module in modules if self.loaded(module)]
+
+    def top(self, limit: int = 20, key: str = "self") -> list[ImportRecord]:
+        attr = "self_us" if key == "self" else "cumulative_us"
+        return sorted(self.records, key=lambda record: getattr(record, attr), reverse=True)[:limit]
+
+    def by_package(self) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for record in self.records:
+            totals[record.package] = totals.get(record.package, 0) + record.self_us
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def to_dict(self, limit: int = 30) -> dict:
+        return {
+            "target": self.target,
+            "total_ms": round(self.total_ms, 1),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "modules": len(self.records),
+            "lazy_violations": self.lazy_violations(),
+            "by_package_ms": {
+                name: round(us / 1000, 1) for name, us in list(self.by_package().items())[:limit]
+            },
+            "top_self_ms": {
+                record.module: round(record.self_us / 1000, 1) for record in self.top(limit, "self")
+            },
+        }
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """
+    Interpreta o stderr do -X importtime.
+
+    Formato: `import time: <self us> | <cumulative us> | <2 espaços por nível><módulo>`
+    """
+    marker = "import time:"
+    records = []
+    for line in output.splitlines():
+        if not line.startswith(marker):
+            continue
+        parts = line.removeprefix(marker).split("|", 2)
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # cabeçalho "self [us] | cumulative | imported package"
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return records
+
+
+def profile_imports(
+    target: str = "src.main", python: str = sys.executable, cwd: Path = BACKEND_DIR
+) -> ImportProfile:
+    """
+    Importa `target` num interpretador novo com -X importtime.
+
+    Raises:
+        RuntimeError: Se o import falhar
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {target}"],
+        cwd=str(cwd),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall_seconds = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {target}: {completed.stderr.strip()[-2000:]}")
+    return ImportProfile(
+        target=target, records=parse_importtime(completed.stderr), wall_seconds=wall_seconds
+    )
+
+
+def best_of(runs: int, target: str = "src.main", **kwargs) -> ImportProfile:
+    """Menor tempo entre `runs` medições (reduz ruído de disco/CPU)."""
+    profiles = [profile_imports(target, **kwargs) for _ in range(max(1, runs))]
+    return min(profiles, key=lambda profile: profile.total_us)
+
+
+__all__ = [
+    "LAZY_MODULES",
+    "ImportRecord",
+    "ImportProfile",
+    "parse_importtime",
+    "profile_imports",
+    "best_of",
+]
@@ -0,0 +1,66 @@
+"""
+Normalization - Normalização de Contatos
+========================================
+Módulo responsável por:
+- Normalizar nome, email, telefone e CPF sempre da mesma forma
+- Servir de fonte única para as colunas *_norm (indexadas) dos usuários
+  e para as consultas de conflito/deduplicação que as utilizam
+"""
+
+import unicodedata
+from typing import Iterable, Optional
+
+
+class _DigitsOnly(dict):
+    """Tabela para str.translate que mantém apenas dígitos ASCII (com cache)."""
+
+    def __missing__(self, codepoint: int):
+        value = codepoint if 48 <= codepoint <= 57 else None
+        self[codepoint] = value
+        return value
+
+
+_DIGITS_ONLY = _DigitsOnly()
+
+
+def digits_only(value: Optional[str]) -> str:
+    """Remove tudo que não for dígito."""
+    return (value or "").translate(_DIGITS_ONLY)
+
+
+def only_digits(values: Iterable[Optional[str]]) -> list[str]:
+    """Remove tudo que não for dígito de cada valor do lote."""
+    table = _DIGITS_ONLY
+    return [(value or "").translate(table) for value in values]
+
+
+def normalize_nome(nome: Optional[str]) -> str:
+    """Minúsculas, sem acentos e com espaços colapsados (busca por prefixo)."""
+    decomposed = unicodedata.normalize("NFKD", nome or "")
+    sem_acento = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(sem_acento.lower().split())
+
+
+def normalize_email(email: Optional[str]) -> str:
+    return (email or "").strip().lower()
+
+
+def normalize_cpf(cpf: Optional[str]) -> str:
+    return digits_only(cpf)[:11]
+
+
+def normalize_phone(phone: Optional[str]) -> str:
+    digits = digits_only(phone)
+    if digits.startswith("55") and len(digits) in (12, 13):
+        digits = digits[2:]
+    return digits[:12]
+
+
+__all__ = [
+    "digits_only",
+    "only_digits",
+    "normalize_nome",
+    "normalize_email",
+    "normalize_cpf",
+    "normalize_phone",
+]
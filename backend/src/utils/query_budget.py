@@ -0,0 +1,161 @@
+"""
+Query Budget - Orçamento de SQL por Requisição e Detector de N+1
+================================================================
+Módulo responsável por:
+- Registrar os comandos SQL executados agrupados por "formato" (shape)
+- Detectar formatos repetidos muitas vezes na mesma requisição (N+1)
+- Logar ou abortar a requisição quando o orçamento é excedido
+- Fornecer track_queries() para os testes medirem consultas por endpoint
+
+Modo de operação (variável SQL_BUDGET_MODE):
+- off   -> apenas conta consultas (padrão, custo desprezível)
+- log   -> agrupa formatos e loga um aviso ao final da requisição
+- raise -> agrupa formatos e levanta QueryBudgetExceeded no comando que estourar
+"""
+
+import logging
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger(__name__)
+
+BUDGET_MODES = {"off", "log", "raise"}
+
+SQL_BUDGET_MODE = (os.getenv("SQL_BUDGET_MODE", "off") or "off").strip().lower()
+if SQL_BUDGET_MODE not in BUDGET_MODES:
+    SQL_BUDGET_MODE = "off"
+
+# Máximo de comandos SQL por requisição
+SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "50"))
+
+# Máximo de execuções do mesmo formato de comando por requisição (N+1)
+SQL_REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", "10"))
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Requisição excedeu o orçamento de SQL (total ou repetição de formato)."""
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+))*\s*\)")
+_POSTCOMPILE_RE = re.compile(r"__\[POSTCOMPILE_\w+\]")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduz o comando ao seu formato: espaços colapsados e listas IN (?, ?, ?) -> (?).
+
+    Args:
+        statement: SQL já parametrizado, como recebido por before_cursor_execute
+
+    Returns:
+        str: Formato do comando, usado como chave de agrupamento
+    """
+    shape = _WHITESPACE_RE.sub(" ", statement).strip()
+    shape = _POSTCOMPILE_RE.sub("?", shape)
+    return _IN_LIST_RE.sub("(?)", shape)
+
+
+class StatementLog:
+    """Contagem de comandos SQL (e, opcionalmente, de formatos) de um escopo."""
+
+    def __init__(self, track_shapes: bool = True) -> None:
+        self.queries = 0
+        self.shapes: Optional[Counter] = Counter() if track_shapes else None
+
+    def record(self, statement: str) -> Optional[str]:
+        self.queries += 1
+        if self.shapes is None:
+            return None
+        shape = normalize_statement(statement)
+        self.shapes[shape] += 1
+        return shape
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Formatos executados mais de `threshold` vezes (suspeitos de N+1)."""
+        if not self.shapes:
+            return []
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def violations(
+        self, max_queries: Optional[int], max_repeats: Optional[int] = None
+    ) -> list[str]:
+        problems = []
+        if max_queries is not None and self.queries > max_queries:
+            problems.append(f"{self.queries} comandos SQL (orçamento: {max_queries})")
+        if max_repeats is not None:
+            for shape, count in self.repeated(max_repeats):
+                problems.append(f"N+1: {count}x (limite: {max_repeats}) -> {shape[:160]}")
+        return problems
+
+    def report(self, limit: int = 5) -> str:
+        lines = [f"{self.queries} comandos SQL"]
+        for shape, count in (self.shapes or Counter()).most_common(limit):
+            lines.append(f"  {count:>4}x {shape[:160]}")
+        return "\n".join(lines)
+
+
+def check_statement(log: StatementLog, shape: Optional[str], label: str) -> None:
+    """Modo raise: aborta no primeiro comando que estourar o orçamento."""
+    if log.queries > SQL_QUERY_BUDGET:
+        raise QueryBudgetExceeded(
+            f"{label}: {log.queries} comandos SQL (orçamento: {SQL_QUERY_BUDGET})"
+        )
+    if shape is not None and log.shapes[shape] > SQL_REPEAT_THRESHOLD:
+        raise QueryBudgetExceeded(
+            f"{label}: N+1 detectado, {log.shapes[shape]}x "
+            f"(limite: {SQL_REPEAT_THRESHOLD}) -> {shape[:160]}"
+        )
+
+
+def report_budget(log: StatementLog, label: str) -> list[str]:
+    """Modo log: avisa ao final da requisição se o orçamento foi excedido."""
+    problems = log.violations(SQL_QUERY_BUDGET, SQL_REPEAT_THRESHOLD)
+    if problems:
+        logger.warning(
+            "⚠️ Orçamento de SQL excedido em %s: %s\n%s", label, "; ".join(problems), log.report()
+        )
+    return problems
+
+
+@contextmanager
+def track_queries(target=Engine) -> Iterator[StatementLog]:
+    """
+    Registra todos os comandos SQL executados dentro do bloco.
+
+    Args:
+        target: Engine específico ou a classe Engine (todos os engines)
+
+    Yields:
+        StatementLog: Contagem total e por formato dos comandos executados
+    """
+    log = StatementLog(track_shapes=True)
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        log.record(statement)
+
+    event.listen(target, "before_cursor_execute", _record)
+    try:
+        yield log
+    finally:
+        event.remove(target, "before_cursor_execute", _record)
+
+
+__all__ = [
+    "SQL_BUDGET_MODE",
+    "SQL_QUERY_BUDGET",
+    "SQL_REPEAT_THRESHOLD",
+    "QueryBudgetExceeded",
+    "normalize_statement",
+    "StatementLog",
+    "check_statement",
+    "report_budget",
+    "track_queries",
+]
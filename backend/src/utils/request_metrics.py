@@ -0,0 +1,260 @@
+"""
+Request Metrics - Métricas de Requisições HTTP
+==============================================
+Módulo responsável por:
+- Medir a latência de cada requisição por rota (histograma)
+- Contar requisições em andamento e códigos de status por rota
+- Contar as consultas SQL executadas durante cada requisição
+  (e aplicar o orçamento de SQL / detector de N+1 de query_budget)
+- Renderizar tudo no formato texto do Prometheus (endpoint /metrics)
+
+A rota é registrada pelo template (ex.: /games/{game_id}/cards), nunca pelo
+caminho concreto, para manter a cardinalidade dos rótulos sob controle.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.utils import query_budget
+from src.utils.query_budget import StatementLog
+
+
+# Limites superiores (segundos) do histograma de latência
+LATENCY_BUCKETS_S = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Limites superiores do histograma de consultas SQL por requisição
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+# ============================================================================
+# CONTEXTO POR REQUISIÇÃO
+# ============================================================================
+
+
+class RequestQueryStats(StatementLog):
+    """Contadores de SQL da requisição corrente (mutável entre threads)."""
+
+    def __init__(self, label: str = "", track_shapes: bool = False) -> None:
+        super().__init__(track_shapes=track_shapes)
+        self.label = label
+
+
+_current_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "current_request_stats", default=None
+)
+
+
+def get_request_stats() -> Optional[RequestQueryStats]:
+    """Retorna os contadores da requisição corrente (ou None fora de requisição)."""
+    return _current_request_stats.get()
+
+
+def _on_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_request_stats.get()
+    if stats is None:
+        return
+    shape = stats.record(statement)
+    if query_budget.SQL_BUDGET_MODE == "raise":
+        query_budget.check_statement(stats, shape, stats.label)
+
+
+def install_query_counter() -> None:
+    """Registra (uma única vez) o contador de SQL em todos os engines."""
+    if not event.contains(Engine, "before_cursor_execute", _on_before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _on_before_cursor_execute)
+
+
+# ============================================================================
+# REGISTRO DE MÉTRICAS
+# ============================================================================
+
+
+class _Histogram:
+    __slots__ = ("bounds", "buckets", "count", "total")
+
+    def __init__(self, bounds: tuple) -> None:
+        self.bounds = bounds
+        self.buckets = [0] * len(bounds)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        for idx, upper in enumerate(self.bounds):
+            if value <= upper:
+                self.buckets[idx] += 1
+                break
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+
+
+def _render_histogram(name: str, series: dict, label_names: tuple) -> list[str]:
+    lines = []
+    for key, hist in sorted(series.items()):
+        base = dict(zip(label_names, key))
+        cumulative = 0
+        for upper, count in zip(hist.bounds, hist.buckets):
+            cumulative += count
+            lines.append(f"{name}_bucket{{{_labels(**base, le=upper)}}} {cumulative}")
+        lines.append(f'{name}_bucket{{{_labels(**base, le="+Inf")}}} {hist.count}')
+        lines.append(f"{name}_sum{{{_labels(**base)}}} {round(hist.total, 6)!r}")
+        lines.append(f"{name}_count{{{_labels(**base)}}} {hist.count}")
+    return lines
+
+
+class MetricsRegistry:
+    """Acumulador thread-safe das métricas HTTP."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.in_flight = 0
+            self.requests: dict[tuple[str, str, str], int] = {}
+            self.latency: dict[tuple[str, str], _Histogram] = {}
+            self.db_queries: dict[tuple[str, str], _Histogram] = {}
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        elapsed_s: float,
+        query_count: int,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            status_key = (method, route, str(status_code))
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            self.latency.setdefault(key, _Histogram(LATENCY_BUCKETS_S)).observe(elapsed_s)
+            self.db_queries.setdefault(key, _Histogram(QUERY_COUNT_BUCKETS)).observe(query_count)
+
+    def render(self) -> str:
+        """Renderiza as métricas no formato texto do Prometheus (0.0.4)."""
+        with self._lock:
+            lines = [
+                "# HELP http_requests_in_flight Requisições HTTP em andamento.",
+                "# TYPE http_requests_in_flight gauge",
+                f"http_requests_in_flight {self.in_flight}",
+                "# HELP http_requests_total Requisições HTTP finalizadas por rota e status.",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, status_code), count in sorted(self.requests.items()):
+                labels = _labels(method=method, route=route, status=status_code)
+                lines.append(f"http_requests_total{{{labels}}} {count}")
+
+            lines += [
+                "# HELP http_request_duration_seconds Latência das requisições HTTP por rota.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            lines += _render_histogram(
+                "http_request_duration_seconds", self.latency, ("method", "route")
+            )
+
+            lines += [
+                "# HELP http_request_db_queries Consultas SQL executadas por requisição.",
+                "# TYPE http_request_db_queries histogram",
+            ]
+            lines += _render_histogram(
+                "http_request_db_queries", self.db_queries, ("method", "route")
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+# ============================================================================
+# MIDDLEWARE ASGI
+# ============================================================================
+
+
+def _route_template(scope: dict) -> str:
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return path_format or UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    """
+    Middleware ASGI puro que mede latência, status e SQL por requisição.
+
+    Não usa BaseHTTPMiddleware para não encapsular o corpo da resposta nem
+    quebrar a propagação do contexto para endpoints síncronos.
+    """
+
+    def __init__(
+        self, app, registry: Optional[MetricsRegistry] = None, exclude_paths: Iterable[str] = ()
+    ):
+        self.app = app
+        self.registry = registry or metrics_registry
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        mode = query_budget.SQL_BUDGET_MODE
+        stats = RequestQueryStats(
+            label=f"{scope.get('method', 'GET')} {scope.get('path', '')}",
+            track_shapes=mode != "off",
+        )
+        token = _current_request_stats.set(stats)
+        status_holder = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["code"] = message["status"]
+            await send(message)
+
+        self.registry.request_started()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _current_request_stats.reset(token)
+            if mode == "log":
+                query_budget.report_budget(stats, stats.label)
+            self.registry.request_finished(
+                scope.get("method", "GET"),
+                _route_template(scope),
+                status_holder["code"],
+                elapsed,
+                stats.queries,
+            )
+
+
+__all__ = [
+    "LATENCY_BUCKETS_S",
+    "QUERY_COUNT_BUCKETS",
+    "RequestQueryStats",
+    "get_request_stats",
+    "install_query_counter",
+    "MetricsRegistry",
+    "metrics_registry",
+    "RequestMetricsMiddleware",
+]
@@ -0,0 +1,244 @@
+"""
+Response Cache - Cache de Respostas com ETag e Invalidação por Versão
+=====================================================================
+Módulo responsável por:
+- Guardar em memória o JSON já serializado de endpoints de leitura frequente
+  (lista/detalhe de jogos, status público), chaveado por rota + parâmetros
+- Invalidar por versão: cada namespace tem um contador incrementado quando
+  um commit grava nos modelos observados (ex.: Sorteio -> "sorteios")
+- Gerar ETag forte a partir de uma impressão digital dos dados (atualizado_em)
+  e responder 304 Not Modified quando o cliente envia If-None-Match igual
+
+O cache é por processo. Escritas feitas por outros workers só são vistas
+após o TTL (RESPONSE_CACHE_TTL_SECONDS); escritas no próprio processo
+invalidam na hora. TTL 0 desliga o cache (ETag/304 continuam ativos).
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import orjson
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+# Tempo máximo (segundos) que uma entrada vale sem invalidação explícita
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+
+# Limite de entradas em memória (as mais antigas saem primeiro)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+
+# Clientes sempre revalidam (If-None-Match); respostas exigem autenticação
+CACHE_CONTROL = "private, no-cache"
+
+_SESSION_DIRTY_KEY = "_response_cache_dirty"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    version: int
+    expires_at: float
+    etag: str
+    body: bytes
+
+
+def make_etag(fingerprint: str) -> str:
+    """ETag forte (entre aspas) derivado da impressão digital dos dados."""
+    return '"' + hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compara If-None-Match com o ETag (comparação fraca, como manda o RFC 9110 para GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+def render_json(payload: Any) -> bytes:
+    """Mesma serialização do ORJSONResponse (resposta padrão da API)."""
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ResponseCache:
+    """Cache em memória de respostas JSON com versão por namespace."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], CachedResponse]" = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._watched: dict[type, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Versões / invalidação
+    # ------------------------------------------------------------------
+
+    def watch(self, namespace: str, *models: type) -> None:
+        """Associa modelos ORM ao namespace: commits que os gravam invalidam o namespace."""
+        for model in models:
+            self._watched.setdefault(model, set()).add(namespace)
+
+    def namespaces_for(self, model: type) -> set[str]:
+        found: set[str] = set()
+        for watched, namespaces in self._watched.items():
+            if issubclass(model, watched):
+                found |= namespaces
+        return found
+
+    def version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    def bump(self, *namespaces: str) -> None:
+        """Invalida os namespaces (entradas antigas deixam de valer)."""
+        with self._lock:
+            for namespace in namespaces:
+                self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Entradas
+    # ------------------------------------------------------------------
+
+    def get(self, namespace: str, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        if entry.version != self.version(namespace) or entry.expires_at <= time.monotonic():
+            self._entries.pop((namespace, key), None)
+            return None
+        return entry
+
+    def set(self, namespace: str, key: Hashable, entry: CachedResponse) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[(namespace, key)] = entry
+            self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def respond(
+        self,
+        request: Request,
+        namespace: str,
+        key: Hashable,
+        loader: Callable[[], Tuple[Any, str]],
+    ) -> Response:
+        """
+        Resposta JSON servida do cache (ou do loader), com ETag e 304.
+
+        Args:
+            request: Requisição atual (lê If-None-Match)
+            namespace: Namespace de invalidação (ex.: "sorteios")
+            key: Chave da resposta dentro do namespace (rota + parâmetros)
+            loader: Função que consulta o banco e retorna (payload, impressão digital)
+
+        Returns:
+            Response: 200 com o JSON ou 304 sem corpo
+        """
+        entry = self.get(namespace, key)
+        if entry is None:
+            self.misses += 1
+            # Versão lida antes da consulta: um commit concorrente invalida esta entrada
+            version = self.version(namespace)
+            payload, fingerprint = loader()
+            entry = CachedResponse(
+                version=version,
+                expires_at=time.monotonic() + self.ttl_seconds,
+                etag=make_etag(f"{namespace}|{key}|{fingerprint}"),
+                body=render_json(payload),
+            )
+            self.set(namespace, key, entry)
+        else:
+            self.hits += 1
+
+        headers = {"ETag": entry.etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+response_cache = ResponseCache()
+
+
+# ============================================================================
+# INVALIDAÇÃO VIA EVENTOS DA SESSÃO
+# ============================================================================
+
+
+def _mark_dirty(session: Session, namespaces: set[str]) -> None:
+    if namespaces:
+        session.info.setdefault(_SESSION_DIRTY_KEY, set()).update(namespaces)
+
+
+def install_cache_invalidation(cache: ResponseCache = response_cache) -> None:
+    """
+    Registra listeners globais de Session que invalidam o cache após commit.
+
+    Cobre gravações pela unidade de trabalho (add/alteração/delete) e
+    UPDATE/DELETE em massa via session.execute(update(Modelo)...).
+    Idempotente.
+    """
+    if getattr(cache, "_invalidation_installed", False):
+        return
+
+    @event.listens_for(Session, "after_flush")
+    def _collect_flushed(session, flush_context):
+        namespaces: set[str] = set()
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            namespaces |= cache.namespaces_for(type(obj))
+        _mark_dirty(session, namespaces)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _collect_bulk(orm_execute_state):
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _mark_dirty(orm_execute_state.session, cache.namespaces_for(mapper.class_))
+
+    @event.listens_for(Session, "after_commit")
+    def _bump_on_commit(session):
+        namespaces = session.info.pop(_SESSION_DIRTY_KEY, None)
+        if namespaces:
+            cache.bump(*namespaces)
+
+    @event.listens_for(Session, "after_soft_rollback")
+    def _discard_on_rollback(session, previous_transaction):
+        session.info.pop(_SESSION_DIRTY_KEY, None)
+
+    cache._invalidation_installed = True
+
+
+__all__ = [
+    "RESPONSE_CACHE_TTL_SECONDS",
+    "CachedResponse",
+    "ResponseCache",
+    "response_cache",
+    "make_etag",
+    "etag_matches",
+    "render_json",
+    "install_cache_invalidation",
+]
@@ -4,11 +4,16 @@ Time Manager - Gerenciador de Tempo com Fuso Horário de Fortaleza
 Módulo responsável por:
 - Garantir que TODAS as operações temporais usem o fuso de Fortaleza-CE
 - Gerar IDs temporais únicos baseados em timestamp
+  (inclusive entre vários workers, via TemporalIdGenerator)
 - Servir como Single Source of Truth para tempo no sistema
 """
 
 from datetime import datetime
 from typing import Optional
+import os
+import random
+import threading
+import time
 import pytz
 
 
@@ -83,6 +88,139 @@ def generate_temporal_id_with_microseconds(prefix: Optional[str] = None) -> str:
     return temporal_id
 
 
+class TemporalIdGenerator:
+    """
+    Gerador de IDs temporais sem colisão entre processos (estilo Snowflake).
+
+    Formato: [PREFIX_]YYYYMMDDHHMMSS_ffffff_NNNNNNNNSSSS
+    - YYYYMMDDHHMMSS_ffffff: instante (Fortaleza), mantém a ordenação temporal
+    - NNNNNNNN: nó do processo (hex), distingue workers no mesmo microssegundo
+    - SSSS: sequência (hex) dentro do mesmo microssegundo
+
+    O relógio nunca anda para trás: se o sistema recuar, o gerador continua
+    no último tick emitido. A parte YYYYMMDDHHMMSS é formatada uma vez por
+    segundo e reaproveitada nos demais IDs do mesmo segundo.
+    """
+
+    SEQUENCE_MAX = 0xFFFF
+
+    def __init__(self, node_id: Optional[int] = None) -> None:
+        self._lock = threading.Lock()
+        self.reset(node_id)
+
+    def reset(self, node_id: Optional[int] = None) -> None:
+        """Reinicia o estado com um novo nó."""
+        with self._lock:
+            self.node_id = (node_id if node_id is not None else _default_node_id()) & 0xFFFFFFFF
+            self._node_hex = f"{self.node_id:08x}"
+            self._last_tick = -1
+            self._sequence = 0
+            self._cached_second = -1
+            self._cached_second_str = ""
+
+    def _after_fork(self) -> None:
+        """
+        Processo filho: o lock herdado pode ter sido copiado travado por outra
+        thread do pai, então troca por um novo antes de reiniciar o estado.
+        """
+        self._lock = threading.Lock()
+        self.reset()
+
+    def _format_tick(self, tick: int) -> str:
+        second, micro = divmod(tick, 1_000_000)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_second_str = datetime.fromtimestamp(second, FORTALEZA_TZ).strftime(
+                "%Y%m%d%H%M%S"
+            )
+        return f"{self._cached_second_str}_{micro:06d}"
+
+    def _next_slot(self) -> tuple[int, int]:
+        tick = time.time_ns() // 1000
+        if tick <= self._last_tick:
+            tick = self._last_tick
+            self._sequence += 1
+            if self._sequence > self.SEQUENCE_MAX:
+                tick += 1
+                self._sequence = 0
+        else:
+            self._sequence = 0
+        self._last_tick = tick
+        return tick, self._sequence
+
+    def next_id(self, prefix: Optional[str] = None) -> str:
+        """Gera um único ID."""
+        with self._lock:
+            tick, sequence = self._next_slot()
+            body = f"{self._format_tick(tick)}_{self._node_hex}{sequence:04x}"
+        return f"{prefix}_{body}" if prefix else body
+
+    def generate_many(self, prefix: Optional[str], n: int) -> list[str]:
+        """Gera `n` IDs em ordem crescente com uma única aquisição do lock."""
+        ids: list[str] = []
+        head = f"{prefix}_" if prefix else ""
+        with self._lock:
+            last_tick = None
+            tick_str = ""
+            for _ in range(max(0, n)):
+                tick, sequence = self._next_slot()
+                if tick != last_tick:
+                    last_tick = tick
+                    tick_str = self._format_tick(tick)
+                ids.append(f"{head}{tick_str}_{self._node_hex}{sequence:04x}")
+        return ids
+
+
+def _default_node_id() -> int:
+    """
+    Nó do processo: 16 bits da máquina + 16 bits do PID.
+
+    A parte da máquina é ID_NODE_ID (se definido, um valor por host/container)
+    ou aleatória. O PID entra sempre: workers do mesmo host herdam o mesmo
+    ID_NODE_ID no fork e precisam de nós distintos.
+    """
+    configured = os.getenv("ID_NODE_ID", "").strip()
+    machine = int(configured, 0) if configured else random.SystemRandom().getrandbits(16)
+    return ((machine & 0xFFFF) << 16) | (os.getpid() & 0xFFFF)
+
+
+_id_generator = TemporalIdGenerator()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_generator._after_fork)
+
+
+def generate_unique_temporal_id(prefix: Optional[str] = None) -> str:
+    """
+    Gera um ID temporal único mesmo com vários workers gravando em paralelo.
+
+    Args:
+        prefix: Prefixo opcional para categorizar o ID
+
+    Returns:
+        str: ID no formato [PREFIX_]YYYYMMDDHHMMSS_ffffff_NNNNNNNNSSSS
+
+    Examples:
+        >>> generate_unique_temporal_id('CAR')
+        'CAR_20260113153045_123456_5f3a01c20000'
+    """
+    return _id_generator.next_id(prefix)
+
+
+def generate_many(prefix: Optional[str], n: int) -> list[str]:
+    """
+    Gera `n` IDs temporais únicos de uma vez (inserções em lote).
+
+    Args:
+        prefix: Prefixo opcional para categorizar os IDs
+        n: Quantidade de IDs
+
+    Returns:
+        list[str]: IDs em ordem crescente
+    """
+    return _id_generator.generate_many(prefix, n)
+
+
 def format_to_iso(dt: datetime) -> str:
     """
     Converte datetime para string ISO 8601 com timezone de Fortaleza.
@@ -153,6 +291,9 @@ __all__ = [
     "get_fortaleza_time",
     "generate_temporal_id",
     "generate_temporal_id_with_microseconds",
+    "TemporalIdGenerator",
+    "generate_unique_temporal_id",
+    "generate_many",
     "format_to_iso",
     "parse_temporal_id",
     "get_time_until_next_second",
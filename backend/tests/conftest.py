@@ -1,10 +1,22 @@
+from contextlib import contextmanager
+
 import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from src.db.base import Base, get_db
+from src.db.base import Base, get_db, get_read_db
 from src.main import app
+from src.utils.query_budget import track_queries
+from src.utils.response_cache import response_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    # Cada teste usa um banco novo; respostas em cache de outro teste seriam falsas
+    response_cache.clear()
+    yield
+    response_cache.clear()
 
 
 @pytest.fixture
@@ -34,7 +46,28 @@ def test_app(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     try:
         yield app
     finally:
         app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Afirma o número máximo de comandos SQL executados dentro do bloco.
+
+    Uso:
+        with query_budget(max_queries=3, max_repeats=1):
+            await client.get("/games/X/cards")
+    """
+
+    @contextmanager
+    def _budget(max_queries, max_repeats=None):
+        with track_queries() as log:
+            yield log
+        problems = log.violations(max_queries, max_repeats)
+        assert not problems, "\n".join(problems) + "\n" + log.report()
+
+    return _budget
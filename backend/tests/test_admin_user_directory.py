@@ -0,0 +1,142 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from src.models.models import Paroquia, RoleParoquia, UsuarioComum, UsuarioParoquia
+from src.routers.admin_routes import _filtro_busca_usuario
+from src.utils.auth import get_current_user
+
+
+@pytest.fixture
+def admin_app(test_app):
+    async def override_current_user():
+        return {"sub": "ADM-DIR", "tipo": "admin_site", "nivel_acesso": "admin_site"}
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        yield test_app
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+
+def _seed_usuarios(db_session):
+    db_session.add(
+        Paroquia(id="PAR-DIR-1", nome="Paróquia Diretório", email="dir@example.com", chave_pix="dir@example.com")
+    )
+    db_session.add(RoleParoquia(id="ROL-DIR-1", codigo="paroquia_admin", nome="Admin", ativo=True))
+    db_session.add(
+        UsuarioParoquia(
+            id="USR-EQ-1",
+            nome="Álvaro Equipe",
+            login="alvaro@example.com",
+            email="alvaro@example.com",
+            senha_hash="hash",
+            paroquia_id="PAR-DIR-1",
+            role_id="ROL-DIR-1",
+        )
+    )
+    fieis = [
+        ("USR-F-1", "Ana Souza", "ana@example.com", "11144477735", True),
+        ("USR-F-2", "Antônio Lima", "antonio@example.com", "12345678909", True),
+        ("USR-F-3", "Bruno Costa", "bruno@example.com", "52998224725", False),
+    ]
+    for user_id, nome, email, cpf, ativo in fieis:
+        db_session.add(
+            UsuarioComum(
+                id=user_id,
+                nome=nome,
+                cpf=cpf,
+                email=email,
+                telefone="85990000000",
+                whatsapp="85990000000",
+                senha_hash="hash",
+                paroquia_id="PAR-DIR-1",
+                ativo=ativo,
+            )
+        )
+    db_session.commit()
+    db_session.expire_all()
+
+
+@pytest.mark.asyncio
+async def test_listar_usuarios_has_no_per_row_queries(test_app, db_session, query_budget):
+    _seed_usuarios(db_session)
+
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        with query_budget(max_queries=2):
+            response = await client.get("/usuarios")
+
+    assert response.status_code == 200
+    by_id = {u["id"]: u for u in response.json()}
+    assert by_id["USR-EQ-1"]["tipo"] == "paroquia_admin"
+    assert by_id["USR-EQ-1"]["paroquia_nome"] == "Paróquia Diretório"
+    assert by_id["USR-F-1"]["paroquia_nome"] == "Paróquia Diretório"
+
+
+@pytest.mark.asyncio
+async def test_diretorio_paginates_across_groups_ordered_by_name(admin_app, db_session, query_budget):
+    _seed_usuarios(db_session)
+
+    async with AsyncClient(app=admin_app, base_url="http://test") as client:
+        with query_budget(max_queries=3):
+            first = await client.get("/usuarios/diretorio", params={"page_size": 2})
+        second = await client.get("/usuarios/diretorio", params={"page_size": 2, "page": 2})
+
+    assert first.status_code == 200
+    body = first.json()
+    assert body["total"] == 4 and body["total_estimado"] is True
+    assert [u["id"] for u in body["items"]] == ["USR-EQ-1", "USR-F-1"]
+    assert body["items"][0]["grupo"] == "equipe"
+    assert [u["id"] for u in second.json()["items"]] == ["USR-F-2", "USR-F-3"]
+
+
+@pytest.mark.asyncio
+async def test_diretorio_prefix_search_by_name_email_and_cpf(admin_app, db_session):
+    _seed_usuarios(db_session)
+
+    async with AsyncClient(app=admin_app, base_url="http://test") as client:
+        por_nome = await client.get("/usuarios/diretorio", params={"q": "ANT", "grupo": "fieis"})
+        por_acento = await client.get("/usuarios/diretorio", params={"q": "alv"})
+        por_cpf = await client.get("/usuarios/diretorio", params={"q": "529.982"})
+        por_email = await client.get("/usuarios/diretorio", params={"q": "ana@"})
+        inativos = await client.get("/usuarios/diretorio", params={"ativo": False})
+
+    assert [u["id"] for u in por_nome.json()["items"]] == ["USR-F-2"]
+    assert por_nome.json()["total_estimado"] is False
+    assert [u["id"] for u in por_acento.json()["items"]] == ["USR-EQ-1"]
+    assert [u["id"] for u in por_cpf.json()["items"]] == ["USR-F-3"]
+    assert [u["id"] for u in por_email.json()["items"]] == ["USR-F-1"]
+    assert inativos.json()["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_diretorio_requires_admin(test_app):
+    async def override_current_user():
+        return {"sub": "FIEL-1", "tipo": "usuario_comum"}
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        async with AsyncClient(app=test_app, base_url="http://test") as client:
+            response = await client.get("/usuarios/diretorio")
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 403
+
+
+def test_prefix_search_uses_like_and_pattern_index_on_postgresql():
+    pg_session = SimpleNamespace(bind=SimpleNamespace(dialect=SimpleNamespace(name="postgresql")))
+    filtro = _filtro_busca_usuario(pg_session, UsuarioComum, "Ana_")
+    sql = str(filtro.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+    # Collation do PostgreSQL ignora espaços na faixa >= / <: "ana maria" sumiria
+    assert "LIKE 'ana/_' || '%%' ESCAPE '/'" in sql
+    assert "\uffff" not in sql
+
+    indexes = {index.name: index for index in UsuarioComum.__table__.indexes}
+    pattern_index = indexes["ix_usuarios_comuns_nome_norm_pattern"]
+    ddl = str(CreateIndex(pattern_index).compile(dialect=postgresql.dialect()))
+    assert "nome_norm varchar_pattern_ops" in ddl
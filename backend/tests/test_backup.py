@@ -0,0 +1,159 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy.engine import make_url
+
+from src.db import backup as backup_module
+from src.db.backup import backup_postgresql, backup_sqlite, load_manifest, restore_sqlite
+
+
+def _create_database(path, rows=4000):
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE cartelas (id TEXT PRIMARY KEY, sorteio_id TEXT, numeros TEXT)")
+    conn.execute("CREATE INDEX ix_cartelas_sorteio ON cartelas (sorteio_id)")
+    conn.executemany(
+        "INSERT INTO cartelas VALUES (?, ?, ?)",
+        [(f"CAR-{idx:06d}", f"SOR-{idx % 10}", "-".join(str(n) for n in range(idx, idx + 24))) for idx in range(rows)],
+    )
+    conn.commit()
+    return conn
+
+
+def _dump(path):
+    conn = sqlite3.connect(str(path))
+    try:
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        return conn.execute("SELECT id, sorteio_id, numeros FROM cartelas ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def test_sqlite_backup_is_incremental_and_restorable(tmp_path):
+    source = tmp_path / "bingo.db"
+    store = tmp_path / "backups"
+    conn = _create_database(source)
+
+    first = backup_sqlite(source, store, store / "b1.json", chunk_pages=8)
+    second = backup_sqlite(source, store, store / "b2.json", chunk_pages=8)
+
+    assert first.objects_written > 3
+    assert first.bytes_written < first.bytes_total  # gzip
+    # Nada mudou: nenhum bloco regravado
+    assert second.objects_written == 0
+    assert second.objects_reused == second.objects_total
+
+    conn.execute("UPDATE cartelas SET numeros = 'alterada' WHERE id = 'CAR-003999'")
+    conn.commit()
+    third = backup_sqlite(source, store, store / "b3.json", chunk_pages=8)
+    assert 0 < third.objects_written < third.objects_total // 2
+
+    restored = restore_sqlite(store / "b3.json", tmp_path / "restored.db")
+    assert _dump(restored) == _dump(source)
+    assert load_manifest(store / "b1.json")["engine"] == "sqlite"
+    conn.close()
+
+
+def test_manifest_outside_store_restores_from_recorded_store(tmp_path):
+    source = tmp_path / "bingo.db"
+    store = tmp_path / "backups"
+    conn = _create_database(source, rows=500)
+    conn.close()
+
+    manifest_path = tmp_path / "elsewhere" / "close-cycle.json"
+    backup_sqlite(source, store, manifest_path, chunk_pages=8)
+
+    assert load_manifest(manifest_path)["store"] == str(store.resolve())
+    restored = restore_sqlite(manifest_path, tmp_path / "restored.db")
+    assert _dump(restored) == _dump(source)
+
+    # Repositório movido junto com o manifesto: cai para a pasta do manifesto
+    moved = tmp_path / "moved"
+    store.rename(moved)
+    (tmp_path / "elsewhere" / "close-cycle.json").rename(moved / "close-cycle.json")
+    restored_again = restore_sqlite(moved / "close-cycle.json", tmp_path / "restored-again.db")
+    assert _dump(restored_again) == _dump(source)
+
+
+def test_sqlite_backup_runs_while_app_keeps_writing(tmp_path):
+    source = tmp_path / "bingo.db"
+    _create_database(source, rows=2000).close()
+    stop = threading.Event()
+    inserted = []
+
+    def _writer():
+        conn = sqlite3.connect(str(source), timeout=5)
+        idx = 0
+        while not stop.is_set():
+            conn.execute("INSERT INTO cartelas VALUES (?, 'SOR-X', '')", (f"NEW-{idx:06d}",))
+            conn.commit()
+            inserted.append(idx)
+            idx += 1
+        conn.close()
+
+    writer = threading.Thread(target=_writer)
+    writer.start()
+    try:
+        result = backup_sqlite(
+            source, tmp_path / "backups", tmp_path / "backups" / "b.json", pages_per_step=4, step_sleep_seconds=0.001
+        )
+    finally:
+        stop.set()
+        writer.join()
+
+    assert inserted, "escritor não conseguiu gravar durante o backup"
+    rows = _dump(restore_sqlite(result.manifest_path, tmp_path / "restored.db"))
+    assert len(rows) >= 2000
+
+
+def _fake_pg(monkeypatch, snapshot_id):
+    calls = []
+    open_snapshot = {"active": False}
+
+    @contextmanager
+    def fake_snapshot(url):
+        open_snapshot["active"] = True
+        try:
+            yield snapshot_id
+        finally:
+            open_snapshot["active"] = False
+
+    def fake_dump(store, base_cmd, extra_args, env):
+        calls.append((list(extra_args), open_snapshot["active"]))
+        digest, created = store.put_bytes(" ".join(extra_args).encode())
+        return digest, len(extra_args), created
+
+    monkeypatch.setattr(backup_module, "exported_snapshot", fake_snapshot)
+    monkeypatch.setattr(backup_module, "_pg_dump_into_store", fake_dump)
+    return calls
+
+
+def test_postgresql_parts_share_one_exported_snapshot(tmp_path, monkeypatch):
+    calls = _fake_pg(monkeypatch, "00000003-0000001B-1")
+    url = make_url("postgresql://bingo:secret@db:5432/bingo")
+
+    backup_postgresql(url, ["sorteios", "cartelas"], tmp_path / "store", tmp_path / "m.json")
+
+    manifest = load_manifest(tmp_path / "m.json")
+    assert [item["name"] for item in manifest["objects"]] == [
+        "pre-data",
+        "data:cartelas",
+        "data:sorteios",
+        "post-data",
+    ]
+    assert manifest["snapshot"] is True
+    # Todas as partes com o mesmo snapshot, ainda aberto durante cada pg_dump
+    assert all("--snapshot=00000003-0000001B-1" in args and active for args, active in calls)
+
+
+def test_postgresql_falls_back_to_single_dump_without_snapshot(tmp_path, monkeypatch):
+    calls = _fake_pg(monkeypatch, None)
+    url = make_url("postgresql://bingo:secret@db:5432/bingo")
+
+    backup_postgresql(url, ["sorteios", "cartelas"], tmp_path / "store", tmp_path / "m.json")
+
+    manifest = load_manifest(tmp_path / "m.json")
+    assert [item["name"] for item in manifest["objects"]] == ["full"]
+    assert manifest["snapshot"] is False
+    assert [args for args, _ in calls] == [[]]
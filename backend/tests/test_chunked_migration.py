@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.db.chunked_migration import load_checkpoint, run_chunked_migration
+from src.utils.query_budget import track_queries
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE cartelas (id VARCHAR(20) PRIMARY KEY, status VARCHAR(20))"))
+        conn.execute(
+            text("INSERT INTO cartelas (id, status) VALUES (:id, :status)"),
+            [
+                {"id": f"CAR-{idx:04d}", "status": "ativa" if idx % 2 == 0 else "vencedora"}
+                for idx in range(100)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+def _to_paga(rows):
+    return [{"id": row.id} for row in rows]
+
+
+def _migrate(engine, **kwargs):
+    return run_chunked_migration(
+        engine,
+        name="status_teste",
+        table="cartelas",
+        columns=["status"],
+        update_sql="UPDATE cartelas SET status = 'paga' WHERE id = :id",
+        where="status = 'ativa'",
+        chunk_size=10,
+        on_progress=None,
+        **kwargs,
+    )
+
+
+def _status_counts(engine):
+    with engine.connect() as conn:
+        return dict(conn.execute(text("SELECT status, COUNT(*) FROM cartelas GROUP BY status")).all())
+
+
+def test_chunked_migration_batches_updates_per_chunk(legacy_engine):
+    progress = []
+
+    with track_queries(legacy_engine) as log:
+        result = run_chunked_migration(
+            legacy_engine,
+            name="status_teste",
+            table="cartelas",
+            columns=["status"],
+            transform=_to_paga,
+            update_sql="UPDATE cartelas SET status = 'paga' WHERE id = :id",
+            where="status = 'ativa'",
+            chunk_size=10,
+            on_progress=progress.append,
+        )
+
+    assert (result.chunks, result.scanned, result.updated) == (5, 50, 50)
+    assert _status_counts(legacy_engine) == {"paga": 50, "vencedora": 50}
+    # Um executemany por lote, nunca um UPDATE por linha
+    updates = [count for shape, count in log.shapes.items() if shape.startswith("UPDATE cartelas")]
+    assert updates == [5]
+    assert [item.scanned for item in progress] == [10, 20, 30, 40, 50]
+    assert load_checkpoint(legacy_engine, "status_teste") is None
+
+
+def test_chunked_migration_resumes_from_checkpoint(legacy_engine):
+    calls = {"chunks": 0}
+
+    def _failing(rows):
+        calls["chunks"] += 1
+        if calls["chunks"] == 3:
+            raise RuntimeError("queda no meio da migração")
+        return _to_paga(rows)
+
+    with pytest.raises(RuntimeError):
+        _migrate(legacy_engine, transform=_failing)
+
+    # Os dois lotes concluídos ficaram gravados junto com o checkpoint
+    assert _status_counts(legacy_engine)["paga"] == 20
+    checkpoint = load_checkpoint(legacy_engine, "status_teste")
+    assert checkpoint == "CAR-0038"
+
+    resumed = _migrate(legacy_engine, transform=_to_paga)
+
+    assert resumed.resumed_from == checkpoint
+    assert resumed.scanned == 30
+    assert _status_counts(legacy_engine) == {"paga": 50, "vencedora": 50}
+    assert load_checkpoint(legacy_engine, "status_teste") is None
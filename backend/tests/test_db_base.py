@@ -0,0 +1,79 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.db import base as db_base
+
+
+def test_configure_sqlite_engine_applies_pragma_profile(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    db_base.configure_sqlite_engine(engine)
+
+    with engine.connect() as conn:
+        journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+        synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+        busy_timeout = conn.execute(text("PRAGMA busy_timeout")).scalar()
+        temp_store = conn.execute(text("PRAGMA temp_store")).scalar()
+        cache_size = conn.execute(text("PRAGMA cache_size")).scalar()
+
+    engine.dispose()
+
+    assert journal_mode.lower() == "wal"
+    assert synchronous == 1  # NORMAL
+    assert busy_timeout == db_base.SQLITE_PRAGMAS["busy_timeout"]
+    assert temp_store == 2  # MEMORY
+    assert cache_size == db_base.SQLITE_PRAGMAS["cache_size"]
+
+
+def _locked_error():
+    return OperationalError("COMMIT", {}, sqlite3.OperationalError("database is locked"))
+
+
+def test_retry_on_sqlite_busy_retries_and_rolls_back(monkeypatch):
+    monkeypatch.setattr(db_base.time, "sleep", lambda _: None)
+    state = {"calls": 0, "rollbacks": 0}
+
+    class FakeSession:
+        def rollback(self):
+            state["rollbacks"] += 1
+
+    @db_base.retry_on_sqlite_busy
+    def write(db):
+        state["calls"] += 1
+        if state["calls"] < 3:
+            raise _locked_error()
+        return "ok"
+
+    assert write(db=FakeSession()) == "ok"
+    assert state["calls"] == 3
+    assert state["rollbacks"] == 2
+
+
+def test_retry_on_sqlite_busy_gives_up_after_max_attempts(monkeypatch):
+    monkeypatch.setattr(db_base.time, "sleep", lambda _: None)
+    monkeypatch.setattr(db_base, "SQLITE_WRITE_RETRY_ATTEMPTS", 2)
+    calls = {"count": 0}
+
+    @db_base.retry_on_sqlite_busy
+    def write():
+        calls["count"] += 1
+        raise _locked_error()
+
+    with pytest.raises(OperationalError):
+        write()
+    assert calls["count"] == 2
+
+
+def test_retry_on_sqlite_busy_does_not_retry_other_errors():
+    calls = {"count": 0}
+
+    @db_base.retry_on_sqlite_busy
+    def write():
+        calls["count"] += 1
+        raise OperationalError("SELECT", {}, sqlite3.OperationalError("no such table: x"))
+
+    with pytest.raises(OperationalError):
+        write()
+    assert calls["count"] == 1
@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from src.models.models import Feedback, Paroquia, StatusFeedback, TipoFeedback, UsuarioComum
+from src.utils.auth import get_current_user
+from src.utils.time_manager import get_fortaleza_time
+
+
+def _seed_feedbacks(db_session):
+    db_session.add(
+        Paroquia(id="PAR-FDB-1", nome="Paróquia Feedback", email="fdb@example.com", chave_pix="fdb@example.com")
+    )
+    for user_id, nome, cpf in (
+        ("USR-FDB-1", "Maria Autora", "11144477735"),
+        ("USR-FDB-2", "José Respondente", "12345678909"),
+    ):
+        db_session.add(
+            UsuarioComum(
+                id=user_id,
+                nome=nome,
+                cpf=cpf,
+                email=f"{user_id.lower()}@example.com",
+                telefone="85990000000",
+                whatsapp="85990000000",
+                senha_hash="hash",
+                paroquia_id="PAR-FDB-1",
+            )
+        )
+
+    agora = get_fortaleza_time()
+    feedbacks = [
+        ("FDB-1", TipoFeedback.BUG, StatusFeedback.PENDENTE, 2, agora - timedelta(days=1)),
+        ("FDB-2", TipoFeedback.ELOGIO, StatusFeedback.RESOLVIDO, 5, agora - timedelta(days=2)),
+        ("FDB-3", TipoFeedback.BUG, StatusFeedback.PENDENTE, 3, agora - timedelta(days=15)),
+        ("FDB-4", TipoFeedback.SUGESTAO, StatusFeedback.EM_ANALISE, 4, agora - timedelta(days=16)),
+    ]
+    for feedback_id, tipo, status_feedback, satisfacao, criado_em in feedbacks:
+        db_session.add(
+            Feedback(
+                id=feedback_id,
+                usuario_id="USR-FDB-1",
+                tipo=tipo,
+                assunto="Assunto",
+                mensagem="Mensagem",
+                satisfacao=satisfacao,
+                status=status_feedback,
+                respondido_por_id="USR-FDB-2" if status_feedback == StatusFeedback.RESOLVIDO else None,
+                criado_em=criado_em,
+                atualizado_em=criado_em,
+            )
+        )
+    db_session.commit()
+    db_session.expire_all()
+
+
+@pytest.mark.asyncio
+async def test_listar_feedbacks_joined_filtered_and_paginated(test_app, db_session, query_budget):
+    _seed_feedbacks(db_session)
+
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        with query_budget(max_queries=2):
+            first_page = await client.get("/feedbacks", params={"page_size": 2})
+        second_page = await client.get("/feedbacks", params={"page_size": 2, "page": 2})
+        bugs = await client.get("/feedbacks", params={"tipo": "bug", "status": "pendente"})
+        invalid = await client.get("/feedbacks", params={"status": "nao_existe"})
+
+    assert first_page.status_code == 200
+    assert first_page.headers["X-Total-Count"] == "4"
+    assert [f["id"] for f in first_page.json()] == ["FDB-1", "FDB-2"]
+    resolvido = first_page.json()[1]
+    assert resolvido["usuario_nome"] == "Maria Autora"
+    assert resolvido["paroquia_nome"] == "Paróquia Feedback"
+    assert resolvido["respondido_por"] == "José Respondente"
+    assert [f["id"] for f in second_page.json()] == ["FDB-3", "FDB-4"]
+    assert [f["id"] for f in bugs.json()] == ["FDB-1", "FDB-3"]
+    assert bugs.headers["X-Total-Count"] == "2"
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_listar_feedbacks_without_paging_params_returns_everything(test_app, db_session):
+    _seed_feedbacks(db_session)
+    for idx in range(60):
+        db_session.add(
+            Feedback(
+                id=f"FDB-X-{idx:02d}",
+                usuario_id="USR-FDB-1",
+                tipo=TipoFeedback.SUGESTAO,
+                assunto="Assunto",
+                mensagem="Mensagem",
+                satisfacao=3,
+                status=StatusFeedback.PENDENTE,
+                criado_em=get_fortaleza_time() - timedelta(days=30, minutes=idx),
+            )
+        )
+    db_session.commit()
+
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        everything = await client.get("/feedbacks")
+        default_page = await client.get("/feedbacks", params={"page": 1})
+
+    assert everything.status_code == 200
+    assert len(everything.json()) == 64
+    assert everything.headers["X-Total-Count"] == "64"
+    assert len(default_page.json()) == 50
+
+
+@pytest.mark.asyncio
+async def test_resumo_feedbacks_aggregates_in_sql(test_app, db_session, query_budget):
+    _seed_feedbacks(db_session)
+
+    async def override_current_user():
+        return {"sub": "ADM-FDB", "tipo": "admin_site", "nivel_acesso": "admin_site"}
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        async with AsyncClient(app=test_app, base_url="http://test") as client:
+            with query_budget(max_queries=3):
+                response = await client.get("/feedbacks/resumo", params={"semanas": 8})
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 4
+    assert body["por_status"] == {"pendente": 2, "em_analise": 1, "resolvido": 1, "arquivado": 0}
+    assert body["por_tipo"] == {"sugestao": 1, "elogio": 1, "reclamacao": 0, "bug": 2}
+    assert body["satisfacao_media"] == 3.5
+    semanas = body["tendencia_semanal"]
+    assert sum(s["total"] for s in semanas) == 4
+    assert [s["semana"] for s in semanas] == sorted(s["semana"] for s in semanas)
+    for semana in semanas:
+        assert datetime.strptime(semana["semana"], "%Y-%m-%d").weekday() == 0
+
+
+@pytest.mark.asyncio
+async def test_resumo_feedbacks_requires_admin(test_app):
+    async def override_current_user():
+        return {"sub": "FIEL-1", "tipo": "usuario_comum"}
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        async with AsyncClient(app=test_app, base_url="http://test") as client:
+            response = await client.get("/feedbacks/resumo")
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 403
@@ -0,0 +1,167 @@
+import io
+
+import pytest
+from httpx import AsyncClient
+
+from src.models.models import Paroquia, UsuarioComum
+from src.utils import fiel_import
+from src.utils.auth import get_current_user, verify_password
+from src.utils.fiel_import import (
+    import_fieis_csv,
+    normalize_phone_batch,
+    validate_cpf_batch,
+    validate_pix_batch,
+)
+
+
+CSV_HEADER = "nome;cpf;email;telefone;whatsapp;chave_pix;senha\n"
+
+
+def test_validate_cpf_batch_checksums():
+    results = validate_cpf_batch(["111.444.777-35", "12345678909", "12345678901", "111.111.111-11", "123"])
+
+    assert [cpf for cpf, _ in results[:2]] == ["11144477735", "12345678909"]
+    assert [error is None for _, error in results] == [True, True, False, False, False]
+
+
+def test_phone_and_pix_batches_normalize_by_type():
+    phones = normalize_phone_batch(["+55 (85) 99999-0000", "(85) 3333-0000", "999"])
+    pix = validate_pix_batch(
+        ["", "Fiel@Example.com", "111.444.777-35", "123e4567-e89b-12d3-a456-426614174000", "abc"]
+    )
+
+    assert phones[0] == ("85999990000", None)
+    assert phones[1] == ("8533330000", None)
+    assert phones[2][1] is not None
+    assert [value for value, _ in pix[:4]] == [
+        None,
+        "fiel@example.com",
+        "11144477735",
+        "123e4567-e89b-12d3-a456-426614174000",
+    ]
+    assert pix[4][1] == "Chave PIX em formato não reconhecido"
+
+
+def test_import_fieis_csv_reports_errors_per_line(db_session):
+    db_session.add(
+        UsuarioComum(
+            id="USR-EXISTENTE",
+            nome="Fiel Existente",
+            cpf="52998224725",
+            email="existente@example.com",
+            telefone="85990000000",
+            whatsapp="85990000000",
+            senha_hash="hash",
+        )
+    )
+    db_session.commit()
+
+    csv_data = CSV_HEADER + "\n".join(
+        [
+            "Maria da Silva;111.444.777-35;maria@example.com;(85) 99999-0001;;maria@example.com;segredo1",
+            "Maria Repetida;111.444.777-35;outra@example.com;85999990006;;;",
+            "João Souza;123.456.789-09;JOAO@example.com;85999990002;;;",
+            "Ana Lima;123.456.789-01;ana@example.com;85999990003;;;",
+            "Pedro Alves;529.982.247-25;pedro@example.com;85999990004;;;",
+            "Clara Nunes;987.654.321-00;Existente@Example.com;85999990005;;;",
+            "Sem Sobrenome;390.533.447-05;x;1;;;",
+        ]
+    )
+
+    report = import_fieis_csv(db_session, io.StringIO(csv_data), batch_size=3, hash_workers=0)
+
+    assert report["total_linhas"] == 7
+    assert report["importados"] == 2
+    erros = {item["linha"]: item["erros"] for item in report["erros"]}
+    assert erros[3] == ["CPF repetido no arquivo"]
+    assert erros[5] == ["CPF inválido (dígito verificador incorreto)"]
+    assert erros[6] == ["CPF já cadastrado no sistema"]
+    assert erros[7] == ["Email já cadastrado no sistema"]
+    assert "Email inválido" in erros[8]
+
+    maria = db_session.query(UsuarioComum).filter(UsuarioComum.cpf == "11144477735").one()
+    joao = db_session.query(UsuarioComum).filter(UsuarioComum.cpf == "12345678909").one()
+    assert maria.telefone == "85999990001" and maria.whatsapp == "85999990001"
+    assert verify_password("segredo1", maria.senha_hash)
+    assert joao.email == "joao@example.com"
+    assert joao.senha_hash
+
+
+def test_import_fieis_csv_requires_columns(db_session):
+    with pytest.raises(ValueError, match="telefone"):
+        import_fieis_csv(db_session, io.StringIO("nome,cpf,email\n"), hash_workers=0)
+
+
+def test_import_fieis_csv_hashes_in_thread_pool_created_on_demand(db_session, monkeypatch):
+    created = []
+
+    class RecordingExecutor(fiel_import.ThreadPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs.get("max_workers"))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(fiel_import, "ThreadPoolExecutor", RecordingExecutor)
+
+    # Só cabeçalho: nenhum worker é criado
+    empty = import_fieis_csv(db_session, io.StringIO("nome,cpf,email,telefone,senha\n"), hash_workers=2)
+    assert empty["total_linhas"] == 0
+    assert created == []
+
+    csv_data = (
+        "nome,cpf,email,telefone,senha\n"
+        "Maria da Silva,11144477735,maria@example.com,85999990001,segredo1\n"
+        "João Souza,12345678909,joao@example.com,85999990002,segredo2\n"
+    )
+    report = import_fieis_csv(db_session, io.StringIO(csv_data), hash_workers=2)
+
+    assert report["importados"] == 2
+    assert created == [2]
+    joao = db_session.query(UsuarioComum).filter(UsuarioComum.cpf == "12345678909").one()
+    assert verify_password("segredo2", joao.senha_hash)
+
+
+def test_import_fieis_csv_process_pool_for_cli(db_session):
+    csv_data = (
+        "nome,cpf,email,telefone,senha\n"
+        "Maria da Silva,11144477735,maria@example.com,85999990001,segredo1\n"
+        "João Souza,12345678909,joao@example.com,85999990002,segredo2\n"
+    )
+
+    report = import_fieis_csv(db_session, io.StringIO(csv_data), hash_workers=2, use_processes=True)
+
+    assert report["importados"] == 2
+    maria = db_session.query(UsuarioComum).filter(UsuarioComum.cpf == "11144477735").one()
+    assert verify_password("segredo1", maria.senha_hash)
+
+
+@pytest.mark.asyncio
+async def test_importar_fieis_endpoint(test_app, db_session):
+    db_session.add(
+        Paroquia(id="PAR-IMP-1", nome="Paróquia Import", email="imp@example.com", chave_pix="imp@example.com")
+    )
+    db_session.commit()
+
+    async def override_current_user():
+        return {"sub": "ADM-1", "tipo": "admin_site", "nivel_acesso": "admin_site"}
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    csv_bytes = (CSV_HEADER + "Maria da Silva;11144477735;maria@example.com;85999990001;;;segredo1\n").encode()
+    try:
+        async with AsyncClient(app=test_app, base_url="http://test") as client:
+            response = await client.post(
+                "/admin/usuarios/importar-fieis",
+                params={"paroquia_id": "PAR-IMP-1"},
+                files={"arquivo": ("fieis.csv", csv_bytes, "text/csv")},
+            )
+            invalid = await client.post(
+                "/admin/usuarios/importar-fieis",
+                files={"arquivo": ("fieis.csv", b"nome,cpf\n", "text/csv")},
+            )
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 200
+    assert response.json()["importados"] == 1
+    assert invalid.status_code == 400
+    maria = db_session.query(UsuarioComum).filter(UsuarioComum.cpf == "11144477735").one()
+    assert maria.paroquia_id == "PAR-IMP-1"
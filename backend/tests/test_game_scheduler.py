@@ -0,0 +1,163 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.db.base import Base
+from src.models.models import Cartela, Paroquia, Sorteio, StatusCartela, StatusSorteio, UsuarioComum
+from src.utils.game_scheduler import (
+    GameScheduler,
+    LeaderLease,
+    fortaleza_now_naive,
+    next_boundary,
+    run_due_transitions,
+)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    with factory() as db:
+        db.add(Paroquia(id="PAR-SCH", nome="Paróquia", email="sch@example.com", chave_pix="sch@example.com"))
+        db.add(
+            UsuarioComum(
+                id="FIEL-SCH",
+                nome="Fiel",
+                cpf="11144477735",
+                email="fiel-sch@example.com",
+                telefone="85990000000",
+                whatsapp="85990000000",
+                senha_hash="hash",
+            )
+        )
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+def _add_game(db, game_id, fim_vendas, horario_sorteio, card_statuses=()):
+    db.add(
+        Sorteio(
+            id=game_id,
+            paroquia_id="PAR-SCH",
+            titulo=game_id,
+            valor_cartela=10.0,
+            rateio_premio=50.0,
+            rateio_paroquia=30.0,
+            rateio_operacao=15.0,
+            rateio_evolucao=5.0,
+            inicio_vendas=fim_vendas - timedelta(hours=1),
+            fim_vendas=fim_vendas,
+            horario_sorteio=horario_sorteio,
+            status=StatusSorteio.AGENDADO,
+        )
+    )
+    for idx, card_status in enumerate(card_statuses):
+        db.add(
+            Cartela(
+                id=f"{game_id}-CAR-{idx}",
+                sorteio_id=game_id,
+                usuario_id="FIEL-SCH",
+                status=card_status,
+                **{f"n{i}": f"{i + idx:02d}" for i in range(1, 25)},
+            )
+        )
+    db.commit()
+
+
+def test_due_transitions_close_sales_and_start_draws(session_factory):
+    now = fortaleza_now_naive()
+    with session_factory() as db:
+        _add_game(
+            db,
+            "SOR-FECHANDO",
+            now - timedelta(seconds=1),
+            now + timedelta(minutes=1),
+            (StatusCartela.NO_CARRINHO, StatusCartela.PAGA),
+        )
+        _add_game(db, "SOR-COMECANDO", now - timedelta(minutes=2), now - timedelta(seconds=1))
+        _add_game(db, "SOR-FUTURO", now + timedelta(minutes=5), now + timedelta(minutes=6))
+
+        assert run_due_transitions(db, now) == {"canceled_cards": 1, "started_games": 1}
+        assert run_due_transitions(db, now) == {"canceled_cards": 0, "started_games": 0}
+
+        statuses = {game.id: game.status for game in db.query(Sorteio).all()}
+        cards = {card.id: card.status for card in db.query(Cartela).all()}
+        boundary = next_boundary(db, now)
+
+    assert statuses == {
+        "SOR-FECHANDO": StatusSorteio.AGENDADO,
+        "SOR-COMECANDO": StatusSorteio.EM_ANDAMENTO,
+        "SOR-FUTURO": StatusSorteio.AGENDADO,
+    }
+    assert cards == {
+        "SOR-FECHANDO-CAR-0": StatusCartela.CANCELADA,
+        "SOR-FECHANDO-CAR-1": StatusCartela.PAGA,
+    }
+    # Próxima fronteira: horário do sorteio do jogo com vendas já encerradas
+    assert boundary == now + timedelta(minutes=1)
+
+
+def test_leader_lease_is_exclusive_until_expiry(session_factory):
+    clock = [1000.0]
+    first = LeaderLease(session_factory, ttl_seconds=30, owner="worker-a", clock=lambda: clock[0])
+    second = LeaderLease(session_factory, ttl_seconds=30, owner="worker-b", clock=lambda: clock[0])
+
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+    clock[0] += 20
+    assert first.try_acquire() is True  # renovação
+    clock[0] += 25
+    assert second.try_acquire() is False
+    clock[0] += 10
+    assert second.try_acquire() is True  # lease de A expirou
+    assert first.try_acquire() is False
+
+    second.release()
+    assert first.try_acquire() is True
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wakes_at_boundary_and_on_notify(session_factory):
+    now = fortaleza_now_naive()
+    with session_factory() as db:
+        _add_game(
+            db,
+            "SOR-LIVE",
+            now + timedelta(seconds=0.3),
+            now + timedelta(hours=1),
+            (StatusCartela.NO_CARRINHO,),
+        )
+        _add_game(db, "SOR-REMARCADO", now + timedelta(hours=2), now + timedelta(hours=3))
+
+    scheduler = GameScheduler(
+        session_factory,
+        LeaderLease(session_factory, ttl_seconds=300, owner="worker-test"),
+        max_sleep_seconds=60,
+    )
+    scheduler.start()
+    try:
+        await asyncio.sleep(0.8)
+        with session_factory() as db:
+            assert db.get(Cartela, "SOR-LIVE-CAR-0").status == StatusCartela.CANCELADA
+        assert scheduler.is_leader is True
+
+        # Remarcação para quase agora: notify recalcula a fronteira sem esperar o teto
+        with session_factory() as db:
+            game = db.get(Sorteio, "SOR-REMARCADO")
+            game.fim_vendas = fortaleza_now_naive() - timedelta(seconds=1)
+            game.horario_sorteio = fortaleza_now_naive() + timedelta(seconds=0.2)
+            db.commit()
+        scheduler.notify()
+        await asyncio.sleep(0.6)
+        with session_factory() as db:
+            assert db.get(Sorteio, "SOR-REMARCADO").status == StatusSorteio.EM_ANDAMENTO
+    finally:
+        await scheduler.stop()
@@ -0,0 +1,139 @@
+import gzip
+from datetime import timedelta
+from pathlib import Path
+
+import orjson
+import pytest
+from httpx import AsyncClient
+
+from src.models.models import Cartela, Paroquia, Sorteio, StatusCartela, StatusSorteio, UsuarioComum
+from src.utils.auth import get_current_user
+from src.routers.games_routes import _snapshot_path_for_game
+from src.utils.game_snapshot import snapshot_path_for_game, verify_game_snapshot, write_game_snapshot
+from src.utils.time_manager import get_fortaleza_time
+
+
+ADMIN_PAYLOAD = {"sub": "ADMIN-1", "tipo": "usuario_administrativo", "nivel_acesso": "admin_paroquia"}
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _seed_finished_game(db_session, cards=30):
+    now = get_fortaleza_time()
+    db_session.add(Paroquia(id="PAR-SNAP", nome="Paróquia", email="snap@example.com", chave_pix="snap@example.com"))
+    db_session.add(
+        UsuarioComum(
+            id="FIEL-SNAP",
+            nome="Fiel",
+            cpf="52998224725",
+            email="fiel-snap@example.com",
+            telefone="85990000001",
+            whatsapp="85990000001",
+            senha_hash="hash",
+        )
+    )
+    db_session.add(
+        Sorteio(
+            id="SOR-SNAP",
+            paroquia_id="PAR-SNAP",
+            titulo="Bingo Snapshot",
+            valor_cartela=10.0,
+            rateio_premio=50.0,
+            rateio_paroquia=30.0,
+            rateio_operacao=15.0,
+            rateio_evolucao=5.0,
+            total_arrecadado=10.0 * cards,
+            inicio_vendas=now - timedelta(hours=3),
+            fim_vendas=now - timedelta(hours=2),
+            horario_sorteio=now - timedelta(hours=1),
+            status=StatusSorteio.FINALIZADO,
+            pedras_sorteadas=[1, 2, 3],
+            vencedores_ids=["CAR-SNAP-000"],
+        )
+    )
+    for idx in range(cards):
+        card_status = StatusCartela.VENCEDORA if idx == 0 else StatusCartela.PERDEDORA
+        db_session.add(
+            Cartela(
+                id=f"CAR-SNAP-{idx:03d}",
+                sorteio_id="SOR-SNAP",
+                usuario_id="FIEL-SNAP",
+                status=card_status,
+                valor_premio=150.0 if idx == 0 else None,
+                **{f"n{i}": f"{i + idx:02d}" for i in range(1, 25)},
+            )
+        )
+    # Carrinho cancelado não entra no snapshot
+    db_session.add(
+        Cartela(
+            id="CAR-SNAP-XXX",
+            sorteio_id="SOR-SNAP",
+            usuario_id="FIEL-SNAP",
+            status=StatusCartela.CANCELADA,
+            **{f"n{i}": f"{i + 50:02d}" for i in range(1, 25)},
+        )
+    )
+    db_session.commit()
+
+
+def test_full_snapshot_streams_paid_cards_and_verifies(db_session, snapshot_dir):
+    _seed_finished_game(db_session, cards=30)
+
+    result = write_game_snapshot(db_session, "SOR-SNAP", snapshot_dir / "s.ndjson.gz", chunk_size=7)
+
+    with gzip.open(result.path, "rb") as fh:
+        lines = [orjson.loads(line) for line in fh]
+    assert [line["type"] for line in lines[:2]] == ["meta", "game"]
+    assert lines[-1] == {"type": "end", "cards": 30, "sha256": result.sha256}
+    assert [line["id"] for line in lines[2:-1]] == [f"CAR-SNAP-{idx:03d}" for idx in range(30)]
+    assert db_session.get(Sorteio, "SOR-SNAP").hash_integridade == result.sha256
+
+    check = verify_game_snapshot(db_session, result.path, chunk_size=4)
+    assert check["valid"] is True
+    assert check["cards"] == 30
+
+    card = db_session.get(Cartela, "CAR-SNAP-017")
+    card.valor_premio = 99.0
+    db_session.commit()
+
+    check = verify_game_snapshot(db_session, result.path, chunk_size=4)
+    assert check["file_intact"] is True
+    assert check["matches_database"] is False
+    assert check["first_mismatch"] == "CAR-SNAP-017"
+
+
+@pytest.mark.asyncio
+async def test_full_snapshot_endpoint_runs_in_background(test_app, db_session, snapshot_dir):
+    _seed_finished_game(db_session, cards=5)
+
+    async def override_current_user():
+        return ADMIN_PAYLOAD
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        async with AsyncClient(app=test_app, base_url="http://test") as client:
+            created = await client.post("/games/SOR-SNAP/snapshot", params={"modo": "completo"})
+            verified = await client.get("/games/SOR-SNAP/snapshot/verify")
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+    assert created.status_code == 202
+    assert created.json()["snapshot_file"].startswith(str(snapshot_dir))
+    assert verified.status_code == 200
+    body = verified.json()
+    assert body["valid"] is True
+    assert body["cards"] == 5
+    db_session.expire_all()
+    assert db_session.get(Sorteio, "SOR-SNAP").hash_integridade == body["sha256"]
+
+
+def test_legacy_snapshot_path_uses_same_directory_as_full_snapshots(snapshot_dir):
+    legacy = Path(_snapshot_path_for_game("SOR-SNAP-1"))
+    full = snapshot_path_for_game("SOR-SNAP-1")
+
+    assert legacy.parent == full.parent == snapshot_dir
+    assert legacy.name.endswith(".json")
@@ -1,9 +1,11 @@
-from datetime import timedelta, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
 
 from src.models.models import Cartela, Paroquia, Sorteio, StatusCartela, StatusSorteio, UsuarioComum
+from src.routers.games_routes import _shift_datetime_sql
 from src.utils.auth import get_current_user
 from src.utils.time_manager import get_fortaleza_time
 
@@ -284,6 +286,105 @@ async def test_reschedule_cascade_shifts_next_games(test_app, db_session, auth_p
     assert jogo_futuro.fim_vendas == old_future_end + timedelta(hours=1)
 
 
+@pytest.mark.asyncio
+async def test_reschedule_cascade_shifts_a_year_of_games_in_one_update(
+    test_app, db_session, auth_payload_state, query_budget
+):
+    paroquia, _, jogo = _seed_game_base(db_session)
+    weekly = [
+        _seed_future_game(
+            db_session,
+            paroquia.id,
+            f"SOR-WEEK-{week:02d}",
+            f"Bingo Semana {week}",
+            jogo.horario_sorteio + timedelta(weeks=week),
+        )
+        for week in range(1, 53)
+    ]
+    finished = _seed_future_game(
+        db_session, paroquia.id, "SOR-FINISHED", "Bingo Encerrado", jogo.horario_sorteio + timedelta(days=2)
+    )
+    finished.status = StatusSorteio.FINALIZADO
+    db_session.commit()
+    old_schedule = {
+        game.id: (game.horario_sorteio, game.inicio_vendas, game.fim_vendas) for game in weekly + [finished]
+    }
+
+    auth_payload_state["payload"] = {"sub": "ADMIN-1", "tipo": "usuario_administrativo", "nivel_acesso": "admin_paroquia"}
+    delta = timedelta(days=1, minutes=30, microseconds=250)
+    new_draw = jogo.horario_sorteio + delta
+
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        preview = await client.post(
+            f"/games/{jogo.id}/reschedule",
+            json={"novo_horario_sorteio": new_draw.isoformat(), "mode": "cascade", "preview": True},
+        )
+        with query_budget(max_queries=8) as log:
+            response = await client.post(
+                f"/games/{jogo.id}/reschedule",
+                json={"novo_horario_sorteio": new_draw.isoformat(), "mode": "cascade", "preview": False},
+            )
+
+    assert preview.status_code == 200
+    preview_payload = preview.json()
+    assert preview_payload["conflict_count"] == 0
+    assert [item["id"] for item in preview_payload["affected_games"]] == [jogo.id] + [g.id for g in weekly]
+    assert all(item["shifted"] for item in preview_payload["affected_games"])
+
+    assert response.status_code == 200
+    assert response.json()["affected_games"] == preview_payload["affected_games"]
+    # Um UPDATE em lote para os 52 jogos seguintes + o do jogo alvo
+    assert sum(count for shape, count in log.shapes.items() if shape.startswith("UPDATE sorteios")) == 2
+
+    db_session.expire_all()
+    for game_id, (draw, start, end) in old_schedule.items():
+        stored = db_session.get(Sorteio, game_id)
+        expected_delta = timedelta(0) if game_id == finished.id else delta
+        assert stored.horario_sorteio == draw + expected_delta
+        assert stored.inicio_vendas == start + expected_delta
+        assert stored.fim_vendas == end + expected_delta
+
+
+@pytest.mark.parametrize("microsecond", [0, 1, 499_999, 999_499, 999_500, 999_999])
+def test_shift_datetime_sql_keeps_sub_second_precision(db_session, microsecond):
+    paroquia, _, _ = _seed_game_base(db_session)
+    draw = datetime(2030, 1, 15, 10, 0, 0, microsecond)
+    game = _seed_future_game(db_session, paroquia.id, "SOR-SHIFT", "Bingo Deslocado", draw)
+
+    shifted = db_session.execute(
+        select(_shift_datetime_sql(db_session, Sorteio.horario_sorteio, timedelta(hours=1))).where(
+            Sorteio.id == game.id
+        )
+    ).scalar_one()
+
+    # 10:00:00.999999 + 1h = 11:00:00.999999 (sem arredondar para o segundo seguinte)
+    assert shifted.replace(tzinfo=None) == datetime(2030, 1, 15, 11, 0, 0, microsecond)
+
+
+@pytest.mark.asyncio
+async def test_reschedule_single_flags_only_overtaken_active_games(test_app, db_session, auth_payload_state):
+    paroquia, _, jogo = _seed_game_base(db_session)
+    for suffix, hours in (("A", 1), ("B", 2), ("C", 4)):
+        _seed_future_game(
+            db_session, paroquia.id, f"SOR-NEXT-{suffix}", f"Bingo {suffix}", jogo.horario_sorteio + timedelta(hours=hours)
+        )
+    canceled = db_session.get(Sorteio, "SOR-NEXT-B")
+    canceled.status = StatusSorteio.CANCELADO
+    db_session.commit()
+
+    auth_payload_state["payload"] = {"sub": "ADMIN-1", "tipo": "usuario_administrativo", "nivel_acesso": "admin_paroquia"}
+    new_draw = jogo.horario_sorteio + timedelta(hours=3)
+
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        response = await client.post(
+            f"/games/{jogo.id}/reschedule",
+            json={"novo_horario_sorteio": new_draw.isoformat(), "mode": "single", "preview": False},
+        )
+
+    assert response.status_code == 409
+    assert [item["id"] for item in response.json()["detail"]["conflicts"]] == ["SOR-NEXT-A"]
+
+
 @pytest.mark.asyncio
 async def test_reschedule_accepts_utc_datetime_payload_without_500(test_app, db_session, auth_payload_state):
     _, _, jogo = _seed_game_base(db_session)
@@ -308,3 +409,27 @@ async def test_reschedule_accepts_utc_datetime_payload_without_500(test_app, db_
 
     assert response.status_code == 200
     assert response.json()["applied"] is True
+
+
+@pytest.mark.asyncio
+async def test_card_and_game_listings_keep_json_shape(test_app, db_session, auth_payload_state):
+    _, fiel, jogo = _seed_game_base(db_session)
+    auth_payload_state["payload"] = {"sub": fiel.id, "tipo": "usuario_comum"}
+
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        created = await client.post(f"/games/{jogo.id}/cards", json={"modo": "aleatoria"})
+        my_cards = await client.get("/users/me/cards")
+        game = await client.get(f"/games/{jogo.id}")
+
+    assert created.status_code == 201
+    card = my_cards.json()[0]
+    assert card["game_id"] == jogo.id
+    assert len(card["numbers"]) == 24 and all(isinstance(n, str) for n in card["numbers"])
+    assert card["status"] == StatusCartela.NO_CARRINHO.value
+    assert isinstance(card["purchase_date"], str)
+
+    body = game.json()
+    assert body["scheduled_date"] == jogo.horario_sorteio.isoformat()
+    assert body["card_price"] == 10.0
+    assert body["cards_sold"] == 0
+    assert body["max_cards"] is None
@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+from src.utils.import_profile import best_of, parse_importtime
+
+
+# Orçamento do `import src.main` em processo novo (ms); CI lento pode subir via env.
+# Medida de relógio: só roda com RUN_IMPORT_BUDGET=1, como os benchmarks
+RUN_IMPORT_BUDGET = os.getenv("RUN_IMPORT_BUDGET", "").lower() in {"1", "true", "yes"}
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "3000"))
+
+
+def test_parse_importtime_reads_self_cumulative_and_depth():
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     jose.jwk",
+            "import time:       300 |        420 |   jose",
+            "aviso qualquer do processo",
+            "import time:      1000 |       1420 | src.main",
+        ]
+    )
+
+    records = parse_importtime(output)
+
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ("jose.jwk", 120, 120, 2),
+        ("jose", 300, 420, 1),
+        ("src.main", 1000, 1420, 0),
+    ]
+
+
+def test_src_main_import_stays_lazy():
+    profile = best_of(1, "src.main")
+
+    assert profile.total_us > 0
+    assert profile.lazy_violations() == []
+
+
+@pytest.mark.skipif(not RUN_IMPORT_BUDGET, reason="orçamento de import desativado (defina RUN_IMPORT_BUDGET=1)")
+def test_src_main_import_stays_within_budget():
+    profile = best_of(2, "src.main")
+
+    assert profile.total_ms <= IMPORT_TIME_BUDGET_MS, profile.to_dict(limit=10)
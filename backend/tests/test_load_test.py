@@ -0,0 +1,120 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+
+def _load_script():
+    path = Path(__file__).resolve().parents[1] / "scripts" / "load_test.py"
+    spec = importlib.util.spec_from_file_location("load_test_script", path)
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses com `from __future__ import annotations` resolvem tipos via sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+load_test = _load_script()
+
+
+def _histogram(values_ms):
+    histogram = load_test.LatencyHistogram()
+    for value in values_ms:
+        histogram.record(value / 1000)
+    return histogram
+
+
+def test_bucket_rounds_down_to_significant_digits():
+    histogram = load_test.LatencyHistogram(significant_digits=2)
+
+    assert histogram._bucket(0) == 0
+    assert histogram._bucket(99) == 99
+    assert histogram._bucket(100) == 100
+    assert histogram._bucket(1_234) == 1_200
+    assert histogram._bucket(98_765) == 98_000
+    assert histogram._bucket(1_999_999) == 1_900_000
+    assert load_test.LatencyHistogram(significant_digits=3)._bucket(1_234) == 1_230
+
+
+def test_percentile_uses_nearest_rank_on_bucket_lower_bound():
+    # 10.5 ms .. 99.5 ms: cada valor cai no balde de (10 + i) ms
+    histogram = _histogram([10 + i + 0.5 for i in range(90)])
+
+    assert histogram.total == 90
+    assert histogram.percentile(50) == 54.0
+    assert histogram.percentile(90) == 90.0
+    assert histogram.percentile(100) == 99.0
+    assert histogram.percentile(0) == 10.0
+    assert load_test.LatencyHistogram().percentile(99) == 0.0
+
+
+def test_percentile_never_exceeds_recorded_max():
+    histogram = _histogram([5.0, 5.0, 5.0])
+
+    assert histogram.percentile(99.9) == 5.0
+    assert histogram.summary()["max_ms"] == 5.0
+
+
+def test_merge_equals_histogram_of_all_values():
+    first, second = [12.5, 30.0, 75.5], [3.0, 99.0, 30.0]
+    merged = _histogram(first)
+    merged.merge(_histogram(second))
+    expected = _histogram(first + second)
+
+    assert merged.counts == expected.counts
+    assert (merged.total, merged.sum_us, merged.min_us, merged.max_us) == (
+        expected.total,
+        expected.sum_us,
+        expected.min_us,
+        expected.max_us,
+    )
+
+    empty = load_test.LatencyHistogram()
+    empty.merge(load_test.LatencyHistogram())
+    assert empty.min_us is None and empty.total == 0
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error", "expected"),
+    [
+        (200, None, "ok"),
+        (201, None, "ok"),
+        (409, None, "409_conflito"),
+        (423, None, "423_manutencao"),
+        (500, None, "5xx"),
+        (503, None, "5xx"),
+        (404, None, "404"),
+        (None, None, "excecao"),
+        (None, httpx.ReadTimeout("lento"), "timeout"),
+        (None, httpx.ConnectError("recusada"), "conexao"),
+        (None, ValueError("json"), "excecao"),
+    ],
+)
+def test_classify_statuses_and_exceptions(status_code, error, expected):
+    assert load_test.classify(status_code, error) == expected
+
+
+def _report(p50, p99, error_rate, scenarios=("cards",)):
+    item = {"latency": {"p50_ms": p50, "p99_ms": p99}, "error_rate": error_rate}
+    return {"scenarios": {name: item for name in scenarios}, "total": item}
+
+
+def test_compare_reports_prints_change_per_scenario_and_total():
+    baseline = _report(10.0, 40.0, 0.01)
+    current = _report(15.0, 30.0, 0.0, scenarios=("cards", "listing"))
+
+    lines = load_test.compare_reports(baseline, current)
+
+    # "listing" não existe no baseline e fica de fora
+    assert [line.split()[0] for line in lines] == ["cards", "total"]
+    assert "p50 10.0→15.0ms (+50%)" in lines[0]
+    assert "p99 40.0→30.0ms (-25%)" in lines[0]
+    assert "erro 1.00%→0.00%" in lines[0]
+
+
+def test_compare_reports_handles_zero_baseline_latency():
+    lines = load_test.compare_reports(_report(0.0, 0.0, 0.0), _report(5.0, 8.0, 0.0))
+
+    assert "p50 0.0→5.0ms (+0%)" in lines[0]
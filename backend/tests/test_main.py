@@ -5,6 +5,7 @@ from httpx import AsyncClient
 from starlette.requests import Request
 
 from src import main
+from src.db.schema_version import SchemaState
 
 
 @pytest.mark.asyncio
@@ -84,24 +85,56 @@ async def test_startup_event_executes_bootstrap_flow(monkeypatch):
         "seed": False,
         "audit": False,
         "closed": False,
+        "scheduler": False,
     }
 
     class FakeDB:
         def close(self):
             calls["closed"] = True
 
+    class FakeScheduler:
+        def start(self):
+            calls["scheduler"] = True
+
     monkeypatch.setattr(main, "verify_connection", lambda: True)
     monkeypatch.setattr(main, "init_db", lambda: calls.__setitem__("init", True))
     monkeypatch.setattr(main, "seed_database", lambda db: calls.__setitem__("seed", db is not None))
     monkeypatch.setattr(main, "registrar_auditoria_sistema", lambda db: calls.__setitem__("audit", db is not None))
+    monkeypatch.setattr(main, "mark_seed_applied", lambda engine, version: calls.__setitem__("seed_version", version))
     monkeypatch.setattr(main, "SessionLocal", lambda: FakeDB())
+    monkeypatch.setattr(main, "GAME_SCHEDULER_ENABLED", True)
+    monkeypatch.setattr(main, "game_scheduler", FakeScheduler())
 
     await main.startup_event()
 
     assert calls["init"] is True
     assert calls["seed"] is True
+    assert calls["seed_version"] == main.SEED_VERSION
     assert calls["audit"] is True
     assert calls["closed"] is True
+    assert calls["scheduler"] is True
+
+
+@pytest.mark.asyncio
+async def test_startup_event_skips_seed_when_version_is_current(monkeypatch):
+    calls = {"seed": False, "audit": False}
+
+    class FakeDB:
+        def close(self):
+            pass
+
+    current = SchemaState(schema_hash="abc", seed_versao=main.SEED_VERSION)
+    monkeypatch.delenv("SCHEMA_SYNC_FORCE", raising=False)
+    monkeypatch.setattr(main, "verify_connection", lambda: True)
+    monkeypatch.setattr(main, "init_db", lambda: current)
+    monkeypatch.setattr(main, "seed_database", lambda db: calls.__setitem__("seed", True))
+    monkeypatch.setattr(main, "registrar_auditoria_sistema", lambda db: calls.__setitem__("audit", True))
+    monkeypatch.setattr(main, "SessionLocal", lambda: FakeDB())
+    monkeypatch.setattr(main, "GAME_SCHEDULER_ENABLED", False)
+
+    await main.startup_event()
+
+    assert calls == {"seed": False, "audit": True}
 
 
 @pytest.mark.asyncio
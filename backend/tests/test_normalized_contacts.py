@@ -0,0 +1,101 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.db.normalized_contacts import ensure_normalized_contact_columns
+from src.models.models import AdminSiteUser, UsuarioComum
+from src.routers.auth_routes import count_admin_site_ativos_any, find_admin_site_conflict, list_admin_site_any
+from src.utils.time_manager import get_fortaleza_time
+
+
+def _admin(idx: int, **overrides):
+    data = {
+        "id": f"ADM-NORM-{idx}",
+        "nome": f"Admin Site {idx}",
+        "login": f"admin{idx}@example.com",
+        "senha_hash": "hash",
+        "email": f"Admin{idx}@Example.com",
+        "telefone": f"+55 (85) 99999-000{idx}",
+        "cpf": f"111.222.333-4{idx}",
+        "ativo": True,
+    }
+    data.update(overrides)
+    return AdminSiteUser(**data)
+
+
+def test_normalized_columns_are_filled_on_insert_and_update(db_session):
+    admin = _admin(1)
+    db_session.add(admin)
+    db_session.commit()
+
+    assert admin.email_norm == "admin1@example.com"
+    assert admin.telefone_norm == "85999990001"
+    assert admin.cpf_norm == "11122233341"
+
+    admin.email = "  NOVO@Example.com "
+    admin.cpf = None
+    db_session.commit()
+
+    assert admin.email_norm == "novo@example.com"
+    assert admin.cpf_norm is None
+
+
+def test_admin_site_helpers_use_point_queries_and_count(db_session, query_budget):
+    agora = get_fortaleza_time()
+    db_session.add_all(
+        [
+            _admin(1, criado_em=agora),
+            _admin(2, ativo=False, criado_em=agora.replace(year=agora.year - 1)),
+            _admin(3, criado_em=agora.replace(year=agora.year + 1)),
+        ]
+    )
+    db_session.commit()
+
+    with query_budget(max_queries=1):
+        assert find_admin_site_conflict(db_session, email="ADMIN2@example.COM", telefone="", cpf="") == "email"
+    with query_budget(max_queries=2):
+        assert find_admin_site_conflict(db_session, email="x@y.z", telefone="85 99999-0003", cpf="") == "telefone"
+    assert find_admin_site_conflict(db_session, email="", telefone="", cpf="11122233341") == "cpf"
+    assert find_admin_site_conflict(db_session, email="nada@example.com", telefone="", cpf="") is None
+
+    with query_budget(max_queries=1):
+        assert count_admin_site_ativos_any(db_session) == 2
+    assert count_admin_site_ativos_any(db_session, excluding_id="ADM-NORM-1") == 1
+    assert [admin.id for _, admin in list_admin_site_any(db_session)] == [
+        "ADM-NORM-3",
+        "ADM-NORM-1",
+        "ADM-NORM-2",
+    ]
+
+
+def test_ensure_normalized_contact_columns_migrates_and_backfills_legacy_table():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE usuarios_comuns (id VARCHAR(50) PRIMARY KEY, nome VARCHAR(200), "
+                "email VARCHAR(200), telefone VARCHAR(20), cpf VARCHAR(11))"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO usuarios_comuns VALUES "
+                "('U1', 'José  Araújo', 'Fiel@Example.com', '+55 85 99999-0001', '111.444.777-35'), "
+                "('U2', 'Sem Contato', NULL, '', NULL), "
+                "('U3', 'Outro Fiel', 'outro@example.com', '8533330000', '12345678909')"
+            )
+        )
+
+    result = ensure_normalized_contact_columns(engine, chunk_size=2)
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id, nome_norm, email_norm, telefone_norm, cpf_norm FROM usuarios_comuns ORDER BY id")
+        ).all()
+        indexes = {row[1] for row in conn.execute(text("PRAGMA index_list('usuarios_comuns')"))}
+
+    assert result == {UsuarioComum.__tablename__: 3}
+    assert rows[0] == ("U1", "jose araujo", "fiel@example.com", "85999990001", "11144477735")
+    assert rows[1] == ("U2", "sem contato", None, None, None)
+    assert rows[2] == ("U3", "outro fiel", "outro@example.com", "8533330000", "12345678909")
+    assert "ix_usuarios_comuns_email_norm" in indexes
+    assert ensure_normalized_contact_columns(engine) == {}
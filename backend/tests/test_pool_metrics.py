@@ -0,0 +1,87 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.db.pool_metrics import (
+    InstrumentedQueuePool,
+    PoolTelemetry,
+    attach_pool_telemetry,
+    pool_status,
+)
+from src.utils.auth import get_current_user
+
+
+def _instrumented_engine(tmp_path, **pool_kwargs):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=InstrumentedQueuePool,
+        **pool_kwargs,
+    )
+    telemetry = attach_pool_telemetry(engine, PoolTelemetry())
+    return engine, telemetry
+
+
+def test_pool_telemetry_counts_checkouts_and_wait_histogram(tmp_path):
+    engine, telemetry = _instrumented_engine(tmp_path, pool_size=2, max_overflow=1)
+
+    first = engine.connect()
+    second = engine.connect()
+    third = engine.connect()
+    third.execute(text("SELECT 1"))
+
+    status = pool_status(engine, telemetry)
+    assert status["config"]["pool_size"] == 2
+    assert status["config"]["max_overflow"] == 1
+    assert status["current"]["checked_out"] == 3
+    assert status["metrics"]["checked_out_peak"] == 3
+    assert status["metrics"]["overflow_peak"] == 1
+
+    for conn in (first, second, third):
+        conn.close()
+
+    metrics = pool_status(engine, telemetry)["metrics"]
+    engine.dispose()
+
+    assert metrics["connects_total"] == 3
+    assert metrics["checkouts_total"] == 3
+    assert metrics["checkins_total"] == 3
+    assert metrics["checked_out"] == 0
+    assert metrics["wait"]["count"] == 3
+    assert metrics["wait"]["buckets"][-1] == {"le_ms": "+Inf", "count": 3}
+
+
+def test_pool_telemetry_counts_checkout_timeouts(tmp_path):
+    engine, telemetry = _instrumented_engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.01)
+
+    held = engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    held.close()
+    engine.dispose()
+
+    assert telemetry.snapshot()["checkout_timeouts_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_db_pool_metrics_endpoint_requires_admin(test_app):
+    state = {"payload": {"sub": "USR-1", "tipo": "usuario_comum"}}
+
+    async def override_current_user():
+        return state["payload"]
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        async with AsyncClient(app=test_app, base_url="http://test") as client:
+            forbidden = await client.get("/admin/metrics/db-pool")
+            state["payload"] = {"sub": "ADM-1", "tipo": "admin_site", "nivel_acesso": "admin_site"}
+            allowed = await client.get("/admin/metrics/db-pool")
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+    assert forbidden.status_code == 403
+    assert allowed.status_code == 200
+    body = allowed.json()
+    assert body["config"]["pool_class"] == "InstrumentedQueuePool"
+    assert {"checkouts_total", "wait", "checkout_timeouts_total"} <= set(body["metrics"])
@@ -0,0 +1,165 @@
+import logging
+from datetime import timedelta
+
+import pytest
+from fastapi import Depends
+from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+from src.db.base import get_db
+from src.models.models import Cartela, Paroquia, Sorteio, StatusCartela, StatusSorteio, UsuarioComum
+from src.utils import query_budget as budget
+from src.utils.auth import get_current_user
+from src.utils.query_budget import QueryBudgetExceeded, StatementLog, normalize_statement
+from src.utils.time_manager import get_fortaleza_time
+
+
+GAME_ID = "SOR-QB-1"
+
+
+@pytest.fixture
+def admin_client_app(test_app):
+    async def override_current_user():
+        return {"sub": "ADM-QB", "tipo": "admin_site", "nivel_acesso": "admin_site"}
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        yield test_app
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+
+def _seed_cards(db_session, owners: int):
+    now = get_fortaleza_time()
+    db_session.add(
+        Paroquia(id="PAR-QB-1", nome="Paróquia QB", email="qb@example.com", chave_pix="qb@example.com")
+    )
+    db_session.add(
+        Sorteio(
+            id=GAME_ID,
+            paroquia_id="PAR-QB-1",
+            titulo="Bingo QB",
+            valor_cartela=10.0,
+            inicio_vendas=now - timedelta(hours=1),
+            fim_vendas=now + timedelta(hours=1),
+            horario_sorteio=now + timedelta(hours=2),
+            status=StatusSorteio.AGENDADO,
+        )
+    )
+    for idx in range(owners):
+        db_session.add(
+            UsuarioComum(
+                id=f"FIEL-QB-{idx}",
+                nome=f"Fiel {idx}",
+                cpf=f"{idx:011d}",
+                email=f"fiel-qb-{idx}@example.com",
+                telefone="85990000000",
+                whatsapp="85990000000",
+                senha_hash="hash",
+            )
+        )
+        db_session.add(
+            Cartela(
+                id=f"CAR-QB-{idx}",
+                sorteio_id=GAME_ID,
+                usuario_id=f"FIEL-QB-{idx}",
+                status=StatusCartela.ATIVA,
+                numeros_marcados=[],
+                criado_em=now + timedelta(seconds=idx),
+                atualizado_em=now,
+                **{f"n{pos}": f"{(idx + pos) % 75 + 1:02d}" for pos in range(1, 25)},
+            )
+        )
+    db_session.commit()
+    db_session.expire_all()
+
+
+def test_normalize_statement_groups_in_lists_and_whitespace():
+    a = normalize_statement("SELECT *  FROM x\n WHERE id IN (?, ?, ?)")
+    b = normalize_statement("SELECT * FROM x WHERE id IN (?)")
+
+    assert a == b == "SELECT * FROM x WHERE id IN (?)"
+
+
+def test_statement_log_flags_repeated_shapes():
+    log = StatementLog()
+    for _ in range(4):
+        log.record("SELECT nome FROM usuarios_comuns WHERE id = ?")
+    log.record("SELECT * FROM cartelas")
+
+    problems = log.violations(max_queries=10, max_repeats=3)
+
+    assert log.queries == 5
+    assert len(problems) == 1 and problems[0].startswith("N+1: 4x")
+
+
+@pytest.mark.asyncio
+async def test_list_game_cards_query_count_is_constant(admin_client_app, db_session, query_budget):
+    _seed_cards(db_session, owners=6)
+
+    async with AsyncClient(app=admin_client_app, base_url="http://test") as client:
+        with query_budget(max_queries=2, max_repeats=1):
+            response = await client.get(f"/games/{GAME_ID}/cards")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 6
+    assert {card["owner_name"] for card in response.json()} == {f"Fiel {idx}" for idx in range(6)}
+
+
+@pytest.mark.asyncio
+async def test_raise_mode_aborts_request_over_budget(admin_client_app, db_session, monkeypatch):
+    _seed_cards(db_session, owners=2)
+    monkeypatch.setattr(budget, "SQL_BUDGET_MODE", "raise")
+    monkeypatch.setattr(budget, "SQL_QUERY_BUDGET", 1)
+
+    async with AsyncClient(app=admin_client_app, base_url="http://test") as client:
+        with pytest.raises(QueryBudgetExceeded):
+            await client.get(f"/games/{GAME_ID}/cards")
+
+
+@pytest.mark.asyncio
+async def test_log_mode_warns_when_total_budget_exceeded(admin_client_app, db_session, monkeypatch, caplog):
+    _seed_cards(db_session, owners=1)
+    monkeypatch.setattr(budget, "SQL_BUDGET_MODE", "log")
+    monkeypatch.setattr(budget, "SQL_QUERY_BUDGET", 1)
+
+    with caplog.at_level(logging.WARNING, logger=budget.__name__):
+        async with AsyncClient(app=admin_client_app, base_url="http://test") as client:
+            response = await client.get(f"/games/{GAME_ID}/cards")
+
+    assert response.status_code == 200
+    messages = [record.message for record in caplog.records]
+    assert any("Orçamento de SQL excedido" in message and "orçamento: 1" in message for message in messages)
+    assert not any("N+1" in message for message in messages)
+
+
+@pytest.mark.asyncio
+async def test_log_mode_warns_on_repeated_statement(admin_client_app, db_session, monkeypatch, caplog):
+    _seed_cards(db_session, owners=4)
+    monkeypatch.setattr(budget, "SQL_BUDGET_MODE", "log")
+    monkeypatch.setattr(budget, "SQL_QUERY_BUDGET", 100)
+    monkeypatch.setattr(budget, "SQL_REPEAT_THRESHOLD", 2)
+
+    # Rota com N+1 clássico: uma consulta de nome por cartela
+    def owner_names_n_plus_one(db: Session = Depends(get_db)):
+        cards = db.query(Cartela).filter(Cartela.sorteio_id == GAME_ID).all()
+        return [
+            db.query(UsuarioComum.nome).filter(UsuarioComum.id == card.usuario_id).scalar() for card in cards
+        ]
+
+    admin_client_app.add_api_route("/__test__/n-plus-one", owner_names_n_plus_one)
+    route = admin_client_app.router.routes[-1]
+    try:
+        with caplog.at_level(logging.WARNING, logger=budget.__name__):
+            async with AsyncClient(app=admin_client_app, base_url="http://test") as client:
+                response = await client.get("/__test__/n-plus-one")
+    finally:
+        admin_client_app.router.routes.remove(route)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 4
+    warnings = [record.message for record in caplog.records if "Orçamento de SQL excedido" in record.message]
+    assert len(warnings) == 1
+    assert "N+1: 4x (limite: 2)" in warnings[0]
+    assert "usuarios_comuns" in warnings[0]
+    assert "orçamento: 100" not in warnings[0]
@@ -0,0 +1,45 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.db.base import Base
+from src.db.query_plan import HOT_QUERIES, check_hot_query_indexes, plan_uses_index
+
+
+def _sqlite_engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def test_all_hot_queries_use_index_on_sqlite():
+    engine = _sqlite_engine()
+
+    results = check_hot_query_indexes(engine)
+
+    assert len(results) == len(HOT_QUERIES)
+    sem_indice = [item["endpoint"] for item in results if not item["uses_index"]]
+    assert sem_indice == []
+
+
+def test_missing_composite_index_is_reported_as_scan():
+    engine = _sqlite_engine()
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_cartelas_usuario_criado_em"))
+        conn.execute(text("DROP INDEX ix_cartelas_usuario_id"))
+
+    results = {item["endpoint"]: item for item in check_hot_query_indexes(engine)}
+
+    assert results["GET /users/me/cards"]["uses_index"] is False
+    assert results["GET /games/{game_id}/cards"]["uses_index"] is True
+
+
+def test_plan_uses_index_postgres_plan_lines():
+    seq_scan = ["Sort  (cost=1.02..1.03 rows=1 width=32)", "  ->  Seq Scan on cartelas"]
+    index_scan = ["Index Scan using ix_cartelas_sorteio_status on cartelas"]
+
+    assert plan_uses_index("postgresql", "cartelas", seq_scan) is False
+    assert plan_uses_index("postgresql", "cartelas", index_scan) is True
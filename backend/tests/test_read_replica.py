@@ -0,0 +1,155 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import Request
+from httpx import AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.db.base import Base, create_read_engine, get_db, get_read_db
+from src.db.replica import ReadWriteSessions, ReplicaStickiness
+from src.main import app
+from src.models.models import Paroquia, Sorteio, StatusSorteio, UsuarioComum
+from src.utils.auth import get_current_user
+from src.utils.time_manager import get_fortaleza_time
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """Primário e réplica em dois arquivos SQLite; a réplica nunca recebe os dados (atraso total)."""
+    primary_engine = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=primary_engine)
+    Base.metadata.create_all(bind=replica_engine)
+
+    primary_factory = sessionmaker(bind=primary_engine, autoflush=False, expire_on_commit=False)
+    replica_factory = sessionmaker(bind=replica_engine, autoflush=False, expire_on_commit=False)
+    routing = ReadWriteSessions(primary_factory, replica_factory, ReplicaStickiness(ttl_seconds=60))
+
+    now = get_fortaleza_time()
+    with primary_factory() as db:
+        db.add(Paroquia(id="PAR-REP-1", nome="Paróquia Réplica", email="rep@example.com", chave_pix="rep@example.com"))
+        db.add(
+            UsuarioComum(
+                id="FIEL-REP-1",
+                nome="Fiel Réplica",
+                cpf="11144477735",
+                email="fiel-rep@example.com",
+                telefone="85990000000",
+                whatsapp="85990000000",
+                senha_hash="hash",
+                paroquia_id="PAR-REP-1",
+            )
+        )
+        db.add(
+            Sorteio(
+                id="SOR-REP-1",
+                paroquia_id="PAR-REP-1",
+                titulo="Bingo Réplica",
+                valor_cartela=10.0,
+                rateio_premio=50.0,
+                rateio_paroquia=30.0,
+                rateio_operacao=15.0,
+                rateio_evolucao=5.0,
+                inicio_vendas=now - timedelta(minutes=30),
+                fim_vendas=now + timedelta(minutes=30),
+                horario_sorteio=now + timedelta(hours=1),
+                status=StatusSorteio.AGENDADO,
+                criado_em=now,
+                atualizado_em=now,
+            )
+        )
+        db.commit()
+
+    def override_get_db(request: Request):
+        yield from routing.session(request)
+
+    def override_get_read_db(request: Request):
+        yield from routing.read_session(request)
+
+    async def override_current_user():
+        return {"sub": "FIEL-REP-1", "tipo": "usuario_comum"}
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    app.dependency_overrides[get_current_user] = override_current_user
+    try:
+        yield app
+    finally:
+        app.dependency_overrides.clear()
+        primary_engine.dispose()
+        replica_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_until_client_writes(replica_app):
+    token_a = {"Authorization": "Bearer token-a"}
+    token_b = {"Authorization": "Bearer token-b"}
+
+    async with AsyncClient(app=replica_app, base_url="http://test") as client:
+        before = await client.get("/users/me/cards", headers=token_a)
+        created = await client.post("/games/SOR-REP-1/cards", json={"modo": "aleatoria"}, headers=token_a)
+        writer_reads = await client.get("/users/me/cards", headers=token_a)
+        other_client_reads = await client.get("/users/me/cards", headers=token_b)
+
+    assert before.json() == []
+    assert created.status_code == 201
+    # Quem escreveu lê do primário (read-your-writes)...
+    assert [card["id"] for card in writer_reads.json()] == [created.json()["id"]]
+    # ...os demais continuam na réplica (atrasada)
+    assert other_client_reads.json() == []
+
+
+@pytest.mark.asyncio
+async def test_cached_game_endpoints_never_read_the_replica(replica_app):
+    token_b = {"Authorization": "Bearer token-b"}
+
+    async with AsyncClient(app=replica_app, base_url="http://test") as client:
+        games = await client.get("/games", headers=token_b)
+        sorteios = await client.get("/sorteios", headers=token_b)
+        game = await client.get("/games/SOR-REP-1", headers=token_b)
+        sorteio = await client.get("/sorteios/SOR-REP-1", headers=token_b)
+
+    # Réplica vazia (atraso total): o cache compartilhado só é preenchido pelo primário
+    assert [item["id"] for item in games.json()] == ["SOR-REP-1"]
+    assert [item["id"] for item in sorteios.json()] == ["SOR-REP-1"]
+    assert game.status_code == 200
+    assert sorteio.status_code == 200
+
+
+def test_stickiness_expires_after_ttl():
+    now = [100.0]
+    stickiness = ReplicaStickiness(ttl_seconds=5, clock=lambda: now[0])
+
+    stickiness.mark("tok:a")
+    assert stickiness.is_sticky("tok:a")
+    assert not stickiness.is_sticky("tok:b")
+    assert not stickiness.is_sticky(None)
+
+    now[0] += 5.1
+    assert not stickiness.is_sticky("tok:a")
+
+
+def test_read_sessions_fall_back_to_primary_without_replica():
+    factory = sessionmaker(bind=create_engine("sqlite://"))
+    routing = ReadWriteSessions(factory)
+
+    session = next(routing.read_session(None))
+    assert session.info["db_role"] == "primary"
+    session.close()
+
+
+def test_sqlite_read_engine_is_query_only(tmp_path):
+    url = f"sqlite:///{tmp_path / 'replica.db'}"
+    with create_engine(url).begin() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER)"))
+
+    read_engine = create_read_engine(url)
+    try:
+        with read_engine.connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 0
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO t VALUES (1)"))
+    finally:
+        read_engine.dispose()
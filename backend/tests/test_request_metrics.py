@@ -0,0 +1,44 @@
+import pytest
+from httpx import AsyncClient
+
+from src.utils.request_metrics import MetricsRegistry, metrics_registry
+
+
+def test_metrics_registry_renders_prometheus_histogram():
+    registry = MetricsRegistry()
+    registry.request_started()
+    registry.request_finished("GET", "/games/{game_id}", 200, 0.02, 3)
+    registry.request_started()
+    registry.request_finished("GET", "/games/{game_id}", 404, 0.3, 1)
+
+    body = registry.render()
+
+    assert "http_requests_in_flight 0" in body
+    assert 'http_requests_total{method="GET",route="/games/{game_id}",status="200"} 1' in body
+    assert 'http_requests_total{method="GET",route="/games/{game_id}",status="404"} 1' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/games/{game_id}",le="0.025"} 1' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/games/{game_id}",le="+Inf"} 2' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/games/{game_id}"} 2' in body
+    assert 'http_request_db_queries_sum{method="GET",route="/games/{game_id}"} 4' in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_template_and_db_queries(test_app):
+    metrics_registry.reset()
+
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        health = await client.get("/health")
+        missing = await client.get("/rota/inexistente")
+        response = await client.get("/metrics")
+
+    assert health.status_code == 200
+    assert missing.status_code == 404
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/health",status="200"} 1' in body
+    assert 'http_requests_total{method="GET",route="__unmatched__",status="404"} 1' in body
+    assert 'http_request_db_queries_bucket{method="GET",route="/health",le="0"} 0' in body
+    assert 'http_request_db_queries_count{method="GET",route="/health"} 1' in body
+    assert "db_pool_checkouts_total" in body
@@ -0,0 +1,126 @@
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from src.models.models import Paroquia, Sorteio, StatusSorteio
+from src.utils.auth import get_current_user
+from src.utils.response_cache import etag_matches, response_cache
+from src.utils.time_manager import get_fortaleza_time
+
+
+@pytest.fixture
+def games_app(test_app, db_session):
+    async def override_current_user():
+        return {"sub": "FIEL-CACHE", "tipo": "usuario_comum"}
+
+    test_app.dependency_overrides[get_current_user] = override_current_user
+
+    now = get_fortaleza_time()
+    db_session.add(
+        Paroquia(id="PAR-CACHE-1", nome="Paróquia Cache", email="cache@example.com", chave_pix="cache@example.com")
+    )
+    db_session.add(
+        Sorteio(
+            id="SOR-CACHE-1",
+            paroquia_id="PAR-CACHE-1",
+            titulo="Bingo Cache",
+            valor_cartela=10.0,
+            rateio_premio=50.0,
+            rateio_paroquia=30.0,
+            rateio_operacao=15.0,
+            rateio_evolucao=5.0,
+            inicio_vendas=now - timedelta(hours=1),
+            fim_vendas=now + timedelta(hours=1),
+            horario_sorteio=now + timedelta(hours=2),
+            status=StatusSorteio.AGENDADO,
+            criado_em=now,
+            atualizado_em=now,
+        )
+    )
+    db_session.commit()
+    try:
+        yield test_app
+    finally:
+        test_app.dependency_overrides.pop(get_current_user, None)
+
+
+def test_etag_matches_handles_lists_weak_and_wildcard():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"x"')
+    assert not etag_matches(None, '"x"')
+    assert not etag_matches('"a"', '"b"')
+
+
+@pytest.mark.asyncio
+async def test_games_list_served_from_cache_with_etag_and_304(games_app, query_budget):
+    async with AsyncClient(app=games_app, base_url="http://test") as client:
+        first = await client.get("/games")
+        with query_budget(max_queries=0):
+            cached = await client.get("/games")
+            not_modified = await client.get("/games", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert first.json()[0]["title"] == "Bingo Cache"
+    assert cached.content == first.content
+    assert cached.headers["ETag"] == first.headers["ETag"]
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert response_cache.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_commit_on_sorteio_invalidates_cached_responses(games_app, db_session):
+    async with AsyncClient(app=games_app, base_url="http://test") as client:
+        before = await client.get("/games/SOR-CACHE-1")
+
+        game = db_session.get(Sorteio, "SOR-CACHE-1")
+        game.titulo = "Bingo Atualizado"
+        game.atualizado_em = get_fortaleza_time() + timedelta(seconds=1)
+        db_session.commit()
+        after_orm = await client.get(
+            "/games/SOR-CACHE-1", headers={"If-None-Match": before.headers["ETag"]}
+        )
+
+        db_session.execute(
+            update(Sorteio)
+            .where(Sorteio.id == "SOR-CACHE-1")
+            .values(titulo="Bingo em Massa", atualizado_em=get_fortaleza_time() + timedelta(seconds=2))
+        )
+        db_session.commit()
+        after_bulk = await client.get("/sorteios/SOR-CACHE-1")
+        missing = await client.get("/games/SOR-404")
+
+    assert after_orm.status_code == 200
+    assert after_orm.json()["title"] == "Bingo Atualizado"
+    assert after_orm.headers["ETag"] != before.headers["ETag"]
+    assert after_bulk.json()["titulo"] == "Bingo em Massa"
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_rollback_does_not_invalidate(games_app, db_session):
+    async with AsyncClient(app=games_app, base_url="http://test") as client:
+        await client.get("/games")
+        version = response_cache.version("sorteios")
+
+        game = db_session.get(Sorteio, "SOR-CACHE-1")
+        game.titulo = "Descartado"
+        db_session.flush()
+        db_session.rollback()
+        await client.get("/games")
+
+    assert response_cache.version("sorteios") == version
+    assert response_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_public_status_supports_conditional_requests(test_app):
+    async with AsyncClient(app=test_app, base_url="http://test") as client:
+        first = await client.get("/auth/public-status")
+        second = await client.get("/auth/public-status", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert first.json()["maintenance_mode"] is True
+    assert second.status_code == 304
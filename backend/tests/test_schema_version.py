@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from src.db import base
+from src.db.schema_version import read_schema_state, seed_pending, write_schema_state
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.delenv("SCHEMA_SYNC_FORCE", raising=False)
+    return create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+
+def test_init_db_records_schema_and_skips_reflection_when_current(engine, monkeypatch):
+    assert read_schema_state(engine) is None
+
+    first = base.init_db(engine)
+    assert "cartelas" in inspect(engine).get_table_names()
+    assert read_schema_state(engine) == first
+    assert first.seed_versao == 0
+
+    def _no_reflection(*args, **kwargs):
+        raise AssertionError("reflexão não deveria rodar com schema atual")
+
+    monkeypatch.setattr(base, "inspect", _no_reflection)
+    monkeypatch.setattr(base.Base.metadata, "create_all", _no_reflection)
+    assert base.init_db(engine) == first
+
+
+def test_init_db_resyncs_when_hash_differs_and_keeps_seed_version(engine):
+    base.init_db(engine)
+    write_schema_state(engine, schema_hash="desatualizado", seed_versao=3)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_cartelas_sorteio_status"))
+
+    state = base.init_db(engine)
+
+    assert state.schema_hash != "desatualizado"
+    assert state.seed_versao == 3
+    assert "ix_cartelas_sorteio_status" in {index["name"] for index in inspect(engine).get_indexes("cartelas")}
+
+
+def test_seed_pending_follows_recorded_version_and_force_env(engine, monkeypatch):
+    base.init_db(engine)
+    current = write_schema_state(engine, seed_versao=1)
+
+    assert seed_pending(None, 1) is True
+    assert seed_pending(current, 1) is False
+    assert seed_pending(current, 2) is True
+
+    monkeypatch.setenv("SCHEMA_SYNC_FORCE", "true")
+    assert seed_pending(current, 1) is True
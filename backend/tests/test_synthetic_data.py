@@ -0,0 +1,127 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.db.base import Base
+from src.db.synthetic_data import SyntheticSpec, _deferred_indexes, generate_synthetic_data
+from src.models.models import Cartela, Configuracao, Sorteio, StatusCartela, StatusSorteio, UsuarioComum
+from src.routers.games_routes import _build_paid_card_lock_key
+from src.schemas.schemas import validate_cpf
+from src.utils.auth import verify_password
+from src.utils.time_manager import FORTALEZA_TZ
+
+
+REFERENCE = FORTALEZA_TZ.localize(datetime(2026, 3, 1, 19, 0, 0))
+
+
+def _engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _spec(**overrides):
+    values = dict(
+        fieis=120, games=4, cards=2003, seed=7, open_games=1, closing_games=1, batch_size=500, reference_time=REFERENCE
+    )
+    values.update(overrides)
+    return SyntheticSpec(**values)
+
+
+def _card_dump(engine):
+    with engine.connect() as conn:
+        columns = [Cartela.id, Cartela.sorteio_id, Cartela.usuario_id, Cartela.status, Cartela.criado_em]
+        columns += [getattr(Cartela, f"n{i}") for i in range(1, 25)]
+        return conn.execute(select(*columns).order_by(Cartela.id)).all()
+
+
+def test_same_seed_generates_identical_valid_data():
+    first, second = _engine(), _engine()
+    result = generate_synthetic_data(first, _spec(), on_progress=None)
+    generate_synthetic_data(second, _spec(), on_progress=None)
+
+    cards = _card_dump(first)
+    assert cards == _card_dump(second)
+    assert _card_dump(_engine()) == []
+    assert len(cards) == 2003
+
+    # Assinatura única por jogo (conjunto dos 24 números) e 24 números distintos
+    signatures = {(row[1], frozenset(row[5:])) for row in cards}
+    assert len(signatures) == len(cards)
+    assert all(len(set(row[5:])) == 24 for row in cards)
+
+    with Session(first) as db:
+        fieis = db.scalars(select(UsuarioComum)).all()
+        assert len(fieis) == 120
+        assert all(validate_cpf(fiel.cpf) == fiel.cpf == fiel.cpf_norm for fiel in fieis)
+        assert verify_password(_spec().password, fieis[0].senha_hash)
+
+        open_game = db.get(Sorteio, result.open_game_ids[0])
+        paid = db.query(Cartela).filter(Cartela.sorteio_id == open_game.id, Cartela.status == StatusCartela.PAGA).count()
+        assert open_game.status == StatusSorteio.AGENDADO
+        assert open_game.total_cartelas_vendidas == paid
+        assert open_game.total_arrecadado == paid * open_game.valor_cartela
+        closing = db.get(Sorteio, result.closing_game_ids[0])
+        assert closing.status == StatusSorteio.AGENDADO
+        assert closing.fim_vendas.replace(tzinfo=None) < REFERENCE.replace(tzinfo=None)
+
+
+def test_paid_cards_get_the_checkout_lock_rows():
+    engine = _engine()
+    generate_synthetic_data(engine, _spec(cards=1200, batch_size=250), on_progress=None)
+
+    with Session(engine) as db:
+        locks = {
+            row.chave: row.valor
+            for row in db.scalars(select(Configuracao).where(Configuracao.chave.like("paid_card_unique::%")))
+        }
+        paid_cards = db.scalars(
+            select(Cartela).where(Cartela.status.in_([StatusCartela.PAGA, StatusCartela.PERDEDORA]))
+        ).all()
+
+    assert paid_cards
+    expected = {
+        _build_paid_card_lock_key(card.sorteio_id, [getattr(card, f"n{i}") for i in range(1, 25)]): card.id
+        for card in paid_cards
+    }
+    # Uma trava por cartela paga, com a chave que o checkout usaria
+    assert locks == expected
+
+
+def test_indexes_are_rebuilt_after_deferred_load():
+    engine = _engine()
+    expected = {index["name"] for index in inspect(engine).get_indexes("cartelas")}
+
+    generate_synthetic_data(engine, _spec(cards=300), on_progress=None)
+
+    assert {index["name"] for index in inspect(engine).get_indexes("cartelas")} == expected
+
+
+def test_deferred_load_keeps_unique_indexes():
+    engine = _engine()
+
+    with _deferred_indexes(engine, UsuarioComum.__table__, enabled=True):
+        indexes = inspect(engine).get_indexes("usuarios_comuns")
+    during = {index["name"]: index["unique"] for index in indexes}
+
+    unique = {index.name for index in UsuarioComum.__table__.indexes if index.unique}
+    assert unique and all(during.get(name) for name in unique)
+    assert not any(name.endswith("_norm") for name in during)
+
+
+def test_second_load_with_other_seed_keeps_existing_rows():
+    engine = _engine()
+    generate_synthetic_data(engine, _spec(cards=200), on_progress=None)
+    generate_synthetic_data(engine, _spec(cards=200, seed=8), on_progress=None)
+
+    with engine.connect() as conn:
+        assert len(conn.execute(select(Cartela.id)).all()) == 400
+        assert len(conn.execute(select(UsuarioComum.id)).all()) == 240
+
+
+def test_invalid_spec_is_rejected():
+    with pytest.raises(ValueError):
+        generate_synthetic_data(_engine(), _spec(games=0), on_progress=None)
@@ -0,0 +1,94 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.utils import time_manager
+
+
+def _ids_from_worker(count: int) -> list[str]:
+    half = count // 2
+    ids = [time_manager.generate_unique_temporal_id("CAR") for _ in range(half)]
+    return ids + time_manager.generate_many("CAR", count - half)
+
+
+def test_unique_temporal_id_keeps_sortable_prefix_and_parses():
+    value = time_manager.generate_unique_temporal_id("CAR")
+    prefix, dt_part, micro_part, node_seq = value.split("_")
+
+    assert prefix == "CAR"
+    assert len(dt_part) == 14 and len(micro_part) == 6
+    assert len(node_seq) == 12
+    assert time_manager.parse_temporal_id(value).year >= 2026
+
+
+def test_generate_many_is_unique_and_ordered():
+    ids = time_manager.generate_many("CAR", 5000)
+
+    assert len(set(ids)) == 5000
+    assert ids == sorted(ids)
+
+
+def test_generator_does_not_go_backwards_when_clock_regresses(monkeypatch):
+    generator = time_manager.TemporalIdGenerator(node_id=0xABCD)
+    clock = iter([2_000_000_000_000_000_000, 1_999_999_999_000_000_000, 1_999_999_999_000_000_000])
+    monkeypatch.setattr(time_manager.time, "time_ns", lambda: next(clock))
+
+    ids = [generator.next_id("X") for _ in range(3)]
+
+    assert len(set(ids)) == 3
+    assert ids == sorted(ids)
+    assert ids[2].endswith("0000abcd0002")
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requer start method fork"
+)
+def test_unique_temporal_ids_across_processes():
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=4, mp_context=context) as pool:
+        batches = list(pool.map(_ids_from_worker, [4000] * 4))
+
+    all_ids = [value for batch in batches for value in batch]
+
+    assert len(all_ids) == 16000
+    assert len(set(all_ids)) == len(all_ids)
+
+
+def _node_after_fork(_):
+    return time_manager._id_generator.node_id
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requer start method fork"
+)
+def test_configured_node_id_still_differs_per_forked_worker(monkeypatch):
+    monkeypatch.setenv("ID_NODE_ID", "0x0001")
+    time_manager._id_generator.reset()
+    try:
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=3, mp_context=context) as pool:
+            nodes = set(pool.map(_node_after_fork, range(3)))
+    finally:
+        monkeypatch.delenv("ID_NODE_ID")
+        time_manager._id_generator.reset()
+
+    assert nodes and all(node >> 16 == 0x0001 for node in nodes)
+    assert time_manager._id_generator.node_id not in nodes
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requer start method fork"
+)
+def test_child_does_not_deadlock_on_lock_held_at_fork():
+    generator = time_manager._id_generator
+    context = multiprocessing.get_context("fork")
+    # Lock travado no instante do fork, como se outra thread do pai gerasse um ID
+    with generator._lock:
+        child = context.Process(target=generator.next_id, args=("CAR",))
+        child.start()
+    child.join(timeout=10)
+    if child.is_alive():
+        child.kill()
+
+    assert child.exitcode == 0
@@ -36,6 +36,15 @@ def test_aliases_get_password_hash_and_verify_password_hash():
     assert auth_utils.verify_password_hash("Senha@123", hashed) is True
 
 
+def test_is_admin_payload_accepts_admin_levels_and_types_only():
+    assert auth_utils.is_admin_payload({"nivel_acesso": "admin_site"})
+    assert auth_utils.is_admin_payload({"nivel_acesso": " Admin_Paroquia "})
+    assert auth_utils.is_admin_payload({"tipo": "usuario_paroquia"})
+    assert auth_utils.is_admin_payload({"tipo": "usuario_administrativo", "nivel_acesso": None})
+    assert not auth_utils.is_admin_payload({"tipo": "usuario_comum"})
+    assert not auth_utils.is_admin_payload({})
+
+
 def test_generate_tokens_and_expirations_have_expected_shape():
     recovery_1 = auth_utils.generate_recovery_token()
     recovery_2 = auth_utils.generate_recovery_token()
@@ -10,7 +10,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext
-from groq_vision import GroqVisionAnalyzer
+from vision_cache import create_vision_analyzer
 from utils import Logger, take_screenshot, wait_for_service
 import config
 import json
@@ -73,20 +73,46 @@ class PlaywrightBrowser:
     Gerenciador de browser Playwright com integração Groq Vision
     """
     
-    def __init__(self, headless: bool = False):
+    def __init__(
+        self,
+        headless: bool = False,
+        pool=None,
+        session_key: Optional[str] = None,
+        reuse_session: bool = False,
+        save_session: bool = False
+    ):
+        """
+        Args:
+            headless: Browser sem janela (ignorado com pool)
+            pool: BrowserPool compartilhado; sem pool, inicia um browser próprio
+            session_key: Chave da sessão autenticada no cache do pool
+            reuse_session: Começa com a sessão em cache (já logado)
+            save_session: Salva a sessão no cache ao fechar
+        """
         self.headless = headless
+        self.pool = pool
+        self.session_key = session_key
+        self.reuse_session = reuse_session
+        self.save_session = save_session
+        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.vision_analyzer = GroqVisionAnalyzer()
+        self.vision_analyzer = create_vision_analyzer()
         self.test_flow = VisionTestFlow()
     
     async def launch(self):
-        """Inicia o browser"""
+        """Inicia o browser (ou pega um contexto isolado do pool)"""
         try:
+            if self.pool:
+                self.context = await self.pool.open_context(self.session_key, self.reuse_session)
+                self.page = await self.context.new_page()
+                logger.success("Contexto do pool pronto")
+                return True
+            
             logger.info("Iniciando Playwright...")
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(headless=self.headless)
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(headless=self.headless)
             self.context = await self.browser.new_context(
                 viewport=config.CONTEXT_CONFIG.get("viewport"),
                 ignore_https_errors=True
@@ -99,14 +125,22 @@ class PlaywrightBrowser:
             return False
     
     async def close(self):
-        """Fecha o browser"""
+        """Fecha o browser (com pool, devolve o contexto e salva a sessão)"""
         try:
             if self.page:
                 await self.page.close()
+            if self.pool:
+                if self.context:
+                    await self.pool.release_context(self.context, self.session_key, self.save_session)
+                    self.context = None
+                logger.success("Contexto devolvido ao pool")
+                return
             if self.context:
                 await self.context.close()
             if self.browser:
                 await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
             logger.success("Playwright fechado")
         except Exception as e:
             logger.error(f"Erro ao fechar Playwright: {e}")
@@ -157,7 +191,10 @@ class PlaywrightBrowser:
             
             # Analisar com Claude
             logger.info("Analisando com Claude Haiku 4.5...")
-            analysis = self.vision_analyzer.analyze_screenshot(
+            # Cliente de visão é síncrono: roda em thread para não travar
+            # os outros fluxos que executam em paralelo
+            analysis = await asyncio.to_thread(
+                self.vision_analyzer.analyze_screenshot,
                 screenshot_path,
                 context=context,
                 last_action=step_name,
@@ -334,9 +371,22 @@ class SmartTestAgent:
     Simula comportamento de um usuário real fazendo testes.
     """
     
-    def __init__(self, headless: bool = False):
-        self.browser_manager = PlaywrightBrowser(headless=headless)
-        self.vision_analyzer = ClaudeVisionAnalyzer()
+    def __init__(
+        self,
+        headless: bool = False,
+        pool=None,
+        session_key: Optional[str] = None,
+        reuse_session: bool = False,
+        save_session: bool = False
+    ):
+        self.browser_manager = PlaywrightBrowser(
+            headless=headless,
+            pool=pool,
+            session_key=session_key,
+            reuse_session=reuse_session,
+            save_session=save_session
+        )
+        self.vision_analyzer = self.browser_manager.vision_analyzer
     
     async def execute_intelligent_flow(
         self,
@@ -0,0 +1,160 @@
+"""
+===========================================================================
+TPIC - Pool de Browser e Cache de Sessões
+===========================================================================
+Um único Chromium é iniciado por execução; cada fluxo recebe um
+BrowserContext próprio (cookies/localStorage isolados) a partir de um
+número limitado de vagas (TPIC_WORKERS).
+
+Sessões autenticadas (storage_state do Playwright) ficam em cache por
+chave ("admin_site", "admin_paroquia", "usuario_comum") e podem ser
+reaproveitadas pelos fluxos seguintes, evitando repetir o login.
+===========================================================================
+"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import config
+from utils import Logger
+
+logger = Logger("browser_pool")
+
+
+class SessionCache:
+    """
+    Cache de storage_state por chave, persistido em config.SESSIONS_DIR.
+
+    Entradas mais velhas que `ttl_seconds` são descartadas (token expirado
+    ou banco recriado pelo setup).
+    """
+
+    def __init__(self, directory: Path = None, ttl_seconds: int = None):
+        self.directory = directory or config.SESSIONS_DIR
+        self.ttl_seconds = config.SESSION_CACHE_TTL if ttl_seconds is None else ttl_seconds
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._memory: Dict[str, Dict[str, Any]] = {}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retorna o storage_state em cache (ou None se ausente/expirado)"""
+        entry = self._memory.get(key)
+        if entry is None:
+            path = self._path(key)
+            if not path.exists():
+                return None
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            self._memory[key] = entry
+
+        if time.time() - entry.get("saved_at", 0) > self.ttl_seconds:
+            self.invalidate(key)
+            return None
+        return entry.get("state")
+
+    def put(self, key: str, state: Dict[str, Any]):
+        entry = {"saved_at": time.time(), "state": state}
+        self._memory[key] = entry
+        self._path(key).write_text(json.dumps(entry), encoding="utf-8")
+        logger.debug(f"Sessão '{key}' salva em cache")
+
+    def invalidate(self, key: str = None):
+        """Remove uma sessão (ou todas, se key=None)"""
+        keys = [key] if key else [path.stem for path in self.directory.glob("*.json")]
+        for item in keys:
+            self._memory.pop(item, None)
+            self._path(item).unlink(missing_ok=True)
+
+
+class BrowserPool:
+    """
+    Browser compartilhado com até `size` contextos simultâneos.
+
+    Uso:
+        async with BrowserPool(size=3) as pool:
+            async with pool.context(session_key="admin_site") as context:
+                page = await context.new_page()
+    """
+
+    def __init__(self, size: int = None, headless: bool = None, sessions: SessionCache = None):
+        self.size = max(1, size or config.TPIC_WORKERS)
+        self.headless = config.BROWSER_CONFIG.get("headless", False) if headless is None else headless
+        self.sessions = sessions or SessionCache()
+        self._slots = asyncio.Semaphore(self.size)
+        self._playwright = None
+        self._browser = None
+        self.contexts_opened = 0
+
+    async def start(self) -> "BrowserPool":
+        from playwright.async_api import async_playwright
+
+        logger.info(f"Iniciando browser compartilhado ({self.size} contextos simultâneos)...")
+        self._playwright = await async_playwright().start()
+        launch_config = {**config.BROWSER_CONFIG, "headless": self.headless}
+        self._browser = await self._playwright.chromium.launch(**launch_config)
+        logger.success("Browser compartilhado pronto")
+        return self
+
+    async def stop(self):
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.success(f"Browser compartilhado fechado ({self.contexts_opened} contextos usados)")
+
+    async def __aenter__(self) -> "BrowserPool":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def open_context(self, session_key: str = None, reuse_session: bool = False):
+        """
+        Ocupa uma vaga e cria um contexto isolado.
+
+        Com reuse_session=True e sessão em cache, o contexto já nasce autenticado.
+        Devolver com release_context().
+        """
+        await self._slots.acquire()
+        try:
+            options = dict(config.CONTEXT_CONFIG)
+            state = self.sessions.get(session_key) if (session_key and reuse_session) else None
+            if state:
+                options["storage_state"] = state
+                logger.info(f"Reutilizando sessão autenticada '{session_key}'")
+            context = await self._browser.new_context(**options)
+            self.contexts_opened += 1
+            return context
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release_context(self, context, session_key: str = None, save_session: bool = False):
+        """Salva a sessão (opcional), fecha o contexto e libera a vaga"""
+        try:
+            if session_key and save_session:
+                try:
+                    self.sessions.put(session_key, await context.storage_state())
+                except Exception as e:
+                    logger.warning(f"Não foi possível salvar a sessão '{session_key}': {e}")
+            await context.close()
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def context(self, session_key: str = None, reuse_session: bool = False, save_session: bool = False):
+        context = await self.open_context(session_key, reuse_session)
+        try:
+            yield context
+        finally:
+            await self.release_context(context, session_key, save_session)
@@ -20,6 +20,9 @@ class ClaudeVisionAnalyzer:
     Toma decisões inteligentes sobre as próximas ações no teste.
     """
     
+    # Incrementar ao alterar os prompts (invalida o cache de análises)
+    PROMPT_VERSION = 1
+    
     def __init__(self):
         api_key = os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
@@ -17,6 +17,8 @@ PROJECT_ROOT = TPIC_DIR.parent
 REPORTS_DIR = TPIC_DIR / "reports"
 SCREENSHOTS_DIR = REPORTS_DIR / "screenshots"
 LOGS_DIR = TPIC_DIR / "logs"
+SESSIONS_DIR = REPORTS_DIR / "sessions"
+VISION_CACHE_DIR = REPORTS_DIR / "vision_cache"
 
 # Criar diretórios se não existirem
 REPORTS_DIR.mkdir(exist_ok=True)
@@ -137,6 +139,24 @@ DEFAULT_TIMEOUT = 30000  # 30 segundos
 NAVIGATION_TIMEOUT = 60000  # 60 segundos
 LOAD_PAGE_TIMEOUT = 45000  # 45 segundos
 
+# ===========================================================================
+# EXECUÇÃO PARALELA
+# ===========================================================================
+TPIC_WORKERS = int(os.getenv("TPIC_WORKERS", "3"))  # Contextos de browser simultâneos
+SESSION_CACHE_TTL = int(os.getenv("TPIC_SESSION_TTL", "3600"))  # Segundos (token JWT dura 16h)
+
+# ===========================================================================
+# ANÁLISE VISUAL
+# ===========================================================================
+VISION_BACKEND = os.getenv("TPIC_VISION_BACKEND", "groq")  # groq | claude | gemini | offline
+VISION_CACHE_ENABLED = os.getenv("TPIC_VISION_CACHE", "true").lower() == "true"
+VISION_CACHE_TTL = int(os.getenv("TPIC_VISION_CACHE_TTL", str(7 * 24 * 3600)))  # Segundos (0 = sem expiração)
+# Chave padrão = sha256 do arquivo (só telas idênticas). dHash é opt-in: 16x16
+# não distingue toasts/mensagens de validação e pode reaproveitar análise errada
+VISION_CACHE_PERCEPTUAL = os.getenv("TPIC_VISION_PERCEPTUAL", "false").lower() == "true"
+VISION_CACHE_MAX_DISTANCE = int(os.getenv("TPIC_VISION_CACHE_DISTANCE", "0"))  # Bits de tolerância no dHash
+VISION_HASH_SIZE = 16  # dHash de 16x16 = 256 bits
+
 # ===========================================================================
 # LOGS E RELATÓRIOS
 # ===========================================================================
@@ -21,6 +21,9 @@ class GeminiVisionAnalyzer:
     Funciona exatamente como ClaudeVisionAnalyzer, mas sem custos!
     """
     
+    # Incrementar ao alterar os prompts (invalida o cache de análises)
+    PROMPT_VERSION = 1
+    
     def __init__(self):
         api_key = os.getenv("GOOGLE_GEMINI_API_KEY")
         if not api_key:
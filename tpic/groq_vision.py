@@ -21,6 +21,9 @@ class GroqVisionAnalyzer:
     Usa modelos de código aberto (Llama, Mixtral).
     """
     
+    # Incrementar ao alterar os prompts (invalida o cache de análises)
+    PROMPT_VERSION = 1
+    
     def __init__(self):
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
@@ -10,31 +10,85 @@ Executa todos os fluxos de teste:
 3. Admin Paróquia (Bootstrap)
 4. Usuário Comum (Cadastro, Login, Jogar)
 
+Os fluxos rodam em paralelo quando independentes (grafo de dependências em
+FLOW_STEPS), compartilhando um único browser com contextos isolados
+(browser_pool.BrowserPool) e reaproveitando sessões autenticadas entre fluxos.
+O relatório inclui o tempo de cada fluxo e de cada fase.
+
+Uso:
+    python run_tpic.py                  # Setup + fluxos em paralelo (TPIC_WORKERS)
+    python run_tpic.py --workers 1      # Um fluxo por vez
+    python run_tpic.py --skip-setup     # Aplicação já no ar; reaproveita sessões em cache
+    TPIC_VISION_BACKEND=offline python run_tpic.py --skip-setup   # Sem API de visão (stub)
+
+Análises de screenshots ficam em cache por hash perceptual (vision_cache.py):
+telas iguais em execuções seguintes não chamam a API de novo.
+
 Gera relatórios consolidados com análise visual do Claude.
 """
 
+import argparse
 import asyncio
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Tuple
 from colorama import Fore, Style
 
 import config
+from browser_pool import BrowserPool
 from utils import Logger, run_script
+from vision_cache import vision_cache_stats
 from test_admin_site import test_admin_site_bootstrap, test_admin_site_login
 from test_admin_paroquia import test_admin_paroquia_bootstrap, test_admin_paroquia_login, test_admin_paroquia_game_creation
 from test_usuario_comum import test_usuario_cadastro, test_usuario_login, test_usuario_jogar_bingo, test_usuario_perfil
 
 logger = Logger("run_tpic")
 
+
+@dataclass(frozen=True)
+class FlowStep:
+    """Fluxo de teste e os fluxos que precisam terminar antes dele"""
+    key: str
+    name: str
+    func: Callable
+    depends_on: Tuple[str, ...] = ()
+
+    @property
+    def category(self) -> str:
+        return self.name.split(" - ")[0]
+
+
+# Dependências reais entre os fluxos (o restante roda em paralelo):
+# - paróquia só existe depois do bootstrap do Admin Site
+# - cadastro público exige Admin-Paróquia ativo
+# - jogar exige jogo criado pelo Admin-Paróquia e fiel logado
+FLOW_STEPS = [
+    FlowStep("admin_site_bootstrap", "Admin Site - Bootstrap", test_admin_site_bootstrap),
+    FlowStep("admin_site_login", "Admin Site - Login", test_admin_site_login, ("admin_site_bootstrap",)),
+    FlowStep("admin_paroquia_bootstrap", "Admin Paróquia - Bootstrap", test_admin_paroquia_bootstrap, ("admin_site_bootstrap",)),
+    FlowStep("admin_paroquia_login", "Admin Paróquia - Login", test_admin_paroquia_login, ("admin_paroquia_bootstrap",)),
+    FlowStep("admin_paroquia_game", "Admin Paróquia - Criar Jogo", test_admin_paroquia_game_creation, ("admin_paroquia_login",)),
+    FlowStep("usuario_cadastro", "Usuário Comum - Cadastro", test_usuario_cadastro, ("admin_paroquia_bootstrap",)),
+    FlowStep("usuario_login", "Usuário Comum - Login", test_usuario_login, ("usuario_cadastro",)),
+    FlowStep("usuario_jogar", "Usuário Comum - Jogar Bingo", test_usuario_jogar_bingo, ("usuario_login", "admin_paroquia_game")),
+    FlowStep("usuario_perfil", "Usuário Comum - Perfil", test_usuario_perfil, ("usuario_login",)),
+]
+
+
 class TPICOrchestrator:
     """Orquestra a execução completa do TPIC"""
     
-    def __init__(self):
+    def __init__(self, workers: int = None, skip_setup: bool = False):
         self.results = []
         self.start_time = datetime.now()
         self.execution_log = []
+        self.workers = workers or config.TPIC_WORKERS
+        self.skip_setup = skip_setup
+        self.setup_duration = 0.0
+        self._clock_start = time.perf_counter()
     
     async def setup_environment(self) -> bool:
         """
@@ -105,128 +159,82 @@ class TPICOrchestrator:
             self.execution_log.append(f"✗ Setup: {str(e)}")
             return False
     
-    async def run_admin_site_tests(self) -> List[Dict[str, Any]]:
-        """Executa testes do Admin Site"""
-        logger.info("\n" + "=" * 70)
-        logger.info("ETAPA 2: Testes Admin Site")
-        logger.info("=" * 70)
-        
-        results = []
-        
-        try:
-            # Teste 1: Bootstrap
-            result1 = await test_admin_site_bootstrap()
-            results.append({
-                "name": "Admin Site - Bootstrap",
-                "result": result1,
-                "icon": "✓" if result1.get("success") else "✗"
-            })
-            
-            # Teste 2: Login apenas
-            result2 = await test_admin_site_login()
-            results.append({
-                "name": "Admin Site - Login",
-                "result": result2,
-                "icon": "✓" if result2.get("success") else "✗"
-            })
-            
-            self.execution_log.append(f"Admin Site Tests: {sum(1 for r in results if r['result'].get('success'))}/{len(results)}")
+    async def run_flow_steps(self, steps: List[FlowStep], pool: BrowserPool) -> List[Dict[str, Any]]:
+        """
+        Executa os fluxos respeitando as dependências.
         
-        except Exception as e:
-            logger.error(f"Erro nos testes Admin Site: {e}")
-            self.execution_log.append(f"✗ Admin Site Tests: {str(e)}")
+        Cada fluxo espera apenas os fluxos de que depende (mesmo que falhem,
+        como na execução sequencial); a concorrência é limitada pelas vagas
+        do pool de browser.
         
-        return results
-    
-    async def run_admin_paroquia_tests(self) -> List[Dict[str, Any]]:
-        """Executa testes do Admin Paróquia"""
+        Returns:
+            Resultados na ordem de `steps`, com tempo de cada fluxo
+        """
         logger.info("\n" + "=" * 70)
-        logger.info("ETAPA 3: Testes Admin Paróquia")
+        logger.info(f"ETAPA 2: Fluxos de teste ({pool.size} em paralelo)")
         logger.info("=" * 70)
         
-        results = []
+        tasks: Dict[str, asyncio.Task] = {}
+        results: Dict[str, Dict[str, Any]] = {}
         
-        try:
-            # Teste 1: Bootstrap
-            result1 = await test_admin_paroquia_bootstrap()
-            results.append({
-                "name": "Admin Paróquia - Bootstrap",
-                "result": result1,
-                "icon": "✓" if result1.get("success") else "✗"
-            })
+        async def _run(step: FlowStep):
+            for dependency in step.depends_on:
+                await asyncio.shield(tasks[dependency])
             
-            # Teste 2: Login
-            result2 = await test_admin_paroquia_login()
-            results.append({
-                "name": "Admin Paróquia - Login",
-                "result": result2,
-                "icon": "✓" if result2.get("success") else "✗"
-            })
+            started = time.perf_counter()
+            logger.info(f"▶ {step.name}")
+            try:
+                result = await step.func(pool=pool)
+            except Exception as e:
+                logger.error(f"Erro em {step.name}: {e}")
+                result = {"success": False, "error": str(e)}
+            finished = time.perf_counter()
             
-            # Teste 3: Criação de jogo
-            result3 = await test_admin_paroquia_game_creation()
-            results.append({
-                "name": "Admin Paróquia - Criar Jogo",
-                "result": result3,
-                "icon": "✓" if result3.get("success") else "✗"
-            })
-            
-            self.execution_log.append(f"Admin Paroquia Tests: {sum(1 for r in results if r['result'].get('success'))}/{len(results)}")
+            results[step.key] = {
+                "name": step.name,
+                "result": result,
+                "icon": "✓" if result.get("success") else "✗",
+                "started_at": started - self._clock_start,
+                "finished_at": finished - self._clock_start,
+                "duration": finished - started,
+            }
+            logger.info(f"■ {step.name}: {finished - started:.1f}s")
         
-        except Exception as e:
-            logger.error(f"Erro nos testes Admin Paróquia: {e}")
-            self.execution_log.append(f"✗ Admin Paroquia Tests: {str(e)}")
+        for step in steps:
+            tasks[step.key] = asyncio.create_task(_run(step))
+        await asyncio.gather(*tasks.values())
         
-        return results
-    
-    async def run_usuario_comum_tests(self) -> List[Dict[str, Any]]:
-        """Executa testes do Usuário Comum"""
-        logger.info("\n" + "=" * 70)
-        logger.info("ETAPA 4: Testes Usuário Comum")
-        logger.info("=" * 70)
+        ordered = [results[step.key] for step in steps]
+        for category in dict.fromkeys(step.category for step in steps):
+            category_results = [r for r in ordered if r["name"].startswith(f"{category} - ")]
+            successes = sum(1 for r in category_results if r["result"].get("success"))
+            self.execution_log.append(f"{category} Tests: {successes}/{len(category_results)}")
         
-        results = []
+        return ordered
+    
+    def phase_timings(self, all_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Tempo por fase (categoria): janela real (início do 1º fluxo ao fim do
+        último) e soma dos fluxos, que seria o tempo numa execução sequencial.
+        """
+        phases: Dict[str, Dict[str, Any]] = {}
+        if self.setup_duration:
+            phases["Setup"] = {"phase": "Setup", "wall": self.setup_duration, "sum": self.setup_duration, "flows": 1}
         
-        try:
-            # Teste 1: Cadastro
-            result1 = await test_usuario_cadastro()
-            results.append({
-                "name": "Usuário Comum - Cadastro",
-                "result": result1,
-                "icon": "✓" if result1.get("success") else "✗"
-            })
-            
-            # Teste 2: Login
-            result2 = await test_usuario_login()
-            results.append({
-                "name": "Usuário Comum - Login",
-                "result": result2,
-                "icon": "✓" if result2.get("success") else "✗"
-            })
-            
-            # Teste 3: Jogar
-            result3 = await test_usuario_jogar_bingo()
-            results.append({
-                "name": "Usuário Comum - Jogar Bingo",
-                "result": result3,
-                "icon": "✓" if result3.get("success") else "✗"
-            })
-            
-            # Teste 4: Perfil
-            result4 = await test_usuario_perfil()
-            results.append({
-                "name": "Usuário Comum - Perfil",
-                "result": result4,
-                "icon": "✓" if result4.get("success") else "✗"
+        for result in all_results:
+            if "duration" not in result:
+                continue
+            category = result["name"].split(" - ")[0]
+            phase = phases.setdefault(category, {
+                "phase": category, "start": result["started_at"], "end": result["finished_at"], "sum": 0.0, "flows": 0
             })
-            
-            self.execution_log.append(f"Usuário Comum Tests: {sum(1 for r in results if r['result'].get('success'))}/{len(results)}")
+            phase["start"] = min(phase.get("start", result["started_at"]), result["started_at"])
+            phase["end"] = max(phase.get("end", result["finished_at"]), result["finished_at"])
+            phase["sum"] += result["duration"]
+            phase["flows"] += 1
+            phase["wall"] = phase["end"] - phase["start"]
         
-        except Exception as e:
-            logger.error(f"Erro nos testes Usuário Comum: {e}")
-            self.execution_log.append(f"✗ Usuário Comum Tests: {str(e)}")
-        
-        return results
+        return list(phases.values())
     
     def generate_summary_report(self, all_results: List[Dict[str, Any]]) -> str:
         """
@@ -370,6 +378,13 @@ class TPICOrchestrator:
                     overflow-y: auto;
                 }}
                 .log-item {{ margin: 5px 0; }}
+                .timing-table {{ width: 100%; border-collapse: collapse; }}
+                .timing-table th, .timing-table td {{
+                    text-align: left;
+                    padding: 8px 12px;
+                    border-bottom: 1px solid #e0e0e0;
+                }}
+                .timing-table th {{ background: #f8f9fa; color: #666; }}
                 @media (max-width: 768px) {{
                     .stats {{ grid-template-columns: repeat(2, 1fr); }}
                     .test-result {{ flex-direction: column; align-items: flex-start; }}
@@ -420,9 +435,11 @@ class TPICOrchestrator:
             status = "success" if result["result"].get("success") else "fail"
             status_text = "✓ Sucesso" if result["result"].get("success") else "✗ Falha"
             
+            duration_text = f" ({result['duration']:.1f}s)" if "duration" in result else ""
+            
             html += f"""
                     <div class="test-result {status}">
-                        <span class="test-name">{result['name']}</span>
+                        <span class="test-name">{result['name']}{duration_text}</span>
                         <span class="test-status {status}">{status_text}</span>
                     </div>
             """
@@ -430,6 +447,29 @@ class TPICOrchestrator:
         if current_category:
             html += "</div>"
         
+        # Tempo por fase
+        phase_rows = "".join(
+            f"<tr><td>{p['phase']}</td><td>{p['flows']}</td><td>{p['wall']:.1f}s</td><td>{p['sum']:.1f}s</td></tr>"
+            for p in self.phase_timings(all_results)
+        )
+        flows_sum = sum(r.get("duration", 0.0) for r in all_results)
+        cache_info = "".join(
+            f" · cache de análises ({c['backend']}): {c['hits']} reaproveitadas, {c['misses']} novas"
+            for c in vision_cache_stats()
+        )
+        html += f"""
+                    <div class="test-category">
+                        <h2>Tempo por Fase</h2>
+                        <table class="timing-table">
+                            <tr><th>Fase</th><th>Fluxos</th><th>Duração (real)</th><th>Soma dos fluxos</th></tr>
+                            {phase_rows}
+                        </table>
+                        <p style="margin-top: 10px; color: #666;">
+                            {self.workers} fluxo(s) em paralelo · soma de todos os fluxos: {flows_sum:.0f}s{cache_info}
+                        </p>
+                    </div>
+        """
+        
         # Log de execução
         html += """
                     <div class="log-section">
@@ -468,21 +508,21 @@ class TPICOrchestrator:
         
         try:
             # Etapa 1: Setup
-            setup_ok = await self.setup_environment()
-            if not setup_ok:
-                logger.warning("Setup incompleto, mas continuando com testes...")
-            
-            # Etapa 2-4: Testes
-            all_results = []
-            
-            admin_site_results = await self.run_admin_site_tests()
-            all_results.extend(admin_site_results)
-            
-            admin_paroquia_results = await self.run_admin_paroquia_tests()
-            all_results.extend(admin_paroquia_results)
+            if self.skip_setup:
+                logger.info("Setup ignorado (--skip-setup)")
+            else:
+                setup_started = time.perf_counter()
+                setup_ok = await self.setup_environment()
+                self.setup_duration = time.perf_counter() - setup_started
+                if not setup_ok:
+                    logger.warning("Setup incompleto, mas continuando com testes...")
             
-            usuario_comum_results = await self.run_usuario_comum_tests()
-            all_results.extend(usuario_comum_results)
+            # Etapa 2: Fluxos (paralelos conforme FLOW_STEPS)
+            async with BrowserPool(size=self.workers) as pool:
+                if not self.skip_setup:
+                    # Banco recriado pelo setup: sessões antigas não valem mais
+                    pool.sessions.invalidate()
+                all_results = await self.run_flow_steps(FLOW_STEPS, pool)
             
             # Gerar relatório consolidado
             logger.info("\n" + "=" * 70)
@@ -502,6 +542,10 @@ class TPICOrchestrator:
             print(f"{Fore.CYAN}  Total: {len(all_results)} testes")
             print(f"{Fore.GREEN}  Sucesso: {successful}")
             print(f"{Fore.RED}  Falhas: {len(all_results) - successful}{Style.RESET_ALL}")
+            for phase in self.phase_timings(all_results):
+                print(f"{Fore.CYAN}  ⏱ {phase['phase']}: {phase['wall']:.1f}s (soma dos fluxos {phase['sum']:.1f}s){Style.RESET_ALL}")
+            for cache in vision_cache_stats():
+                print(f"{Fore.CYAN}  ♻️  Cache de análises ({cache['backend']}): {cache['hits']} reaproveitadas, {cache['misses']} novas{Style.RESET_ALL}")
             print(f"{Fore.BLUE}  Relatório: {report_file}{Style.RESET_ALL}")
             print(f"{Fore.GREEN}{'=' * 70}{Style.RESET_ALL}\n")
             
@@ -516,7 +560,12 @@ class TPICOrchestrator:
 
 async def main():
     """Função principal"""
-    orchestrator = TPICOrchestrator()
+    parser = argparse.ArgumentParser(description="TPIC - execução completa")
+    parser.add_argument("--workers", type=int, default=config.TPIC_WORKERS, help="Fluxos simultâneos (padrão: TPIC_WORKERS)")
+    parser.add_argument("--skip-setup", action="store_true", help="Não roda limpa/install/start e reaproveita sessões em cache")
+    args = parser.parse_args()
+    
+    orchestrator = TPICOrchestrator(workers=args.workers, skip_setup=args.skip_setup)
     success = await orchestrator.run()
     sys.exit(0 if success else 1)
 
@@ -0,0 +1,135 @@
+"""
+===========================================================================
+TPIC - Analisador Visual Offline (stub)
+===========================================================================
+Mesma interface dos analisadores Groq/Claude/Gemini, sem rede e sem chave
+de API. A resposta é determinística (depende só da imagem e do prompt),
+então serve para exercitar o pipeline de screenshots e o cache de
+análises: TPIC_VISION_BACKEND=offline
+===========================================================================
+"""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any
+from utils import Logger
+
+logger = Logger("stub_vision")
+
+class OfflineVisionAnalyzer:
+    """
+    Analisador falso: não olha o conteúdo da tela, só calcula uma
+    assinatura do arquivo e devolve uma análise válida que encerra o fluxo
+    ("complete"). `calls` conta as análises realmente executadas.
+    """
+
+    # Incrementar ao alterar as respostas (invalida o cache de análises)
+    PROMPT_VERSION = 1
+
+    def __init__(self, delay: float = None):
+        """
+        Args:
+            delay: Segundos de espera por análise, simulando a latência da API
+                   (padrão: TPIC_OFFLINE_VISION_DELAY ou 0)
+        """
+        self.model = "offline-stub"
+        self.delay = float(os.getenv("TPIC_OFFLINE_VISION_DELAY", "0")) if delay is None else delay
+        self.conversation_history = []
+        self.calls = 0
+        self._lock = threading.Lock()
+        logger.success("Offline Vision Analyzer inicializado (sem rede)")
+
+    def _respond(self, screenshot_path: str | Path, *prompt_parts: Optional[str]) -> str:
+        """Conta a chamada, simula a latência e devolve a assinatura da tela"""
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        digest = hashlib.sha256(Path(screenshot_path).read_bytes())
+        for part in prompt_parts:
+            digest.update((part or "").encode("utf-8"))
+        return digest.hexdigest()[:12]
+
+    def analyze_screenshot(
+        self,
+        screenshot_path: str | Path,
+        context: str = "Teste de aplicação web",
+        last_action: str = "Página carregada",
+        custom_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Análise determinística de um screenshot.
+
+        Args:
+            screenshot_path: Caminho da imagem
+            context: Contexto do teste
+            last_action: Última ação executada
+            custom_prompt: Prompt customizado (opcional)
+
+        Returns:
+            Dict com a mesma estrutura dos analisadores reais
+        """
+        signature = self._respond(screenshot_path, context, last_action, custom_prompt)
+        logger.info(f"Screenshot analisado offline: {Path(screenshot_path).name}")
+        return {
+            "page_loaded": True,
+            "current_page": Path(screenshot_path).stem,
+            "page_title": "",
+            "errors": [],
+            "warnings": [],
+            "info_messages": [],
+            "visible_elements": {"buttons": [], "input_fields": [], "links": [], "modals": []},
+            "form_fields": {},
+            "next_recommended_action": {
+                "type": "complete",
+                "target": "body",
+                "reasoning": "Analisador offline não decide ações"
+            },
+            "issues_detected": [],
+            "success_indicators": [],
+            "observations": f"Análise offline ({signature}) - {context} / {last_action}"
+        }
+
+    def analyze_page_state(
+        self,
+        screenshot_path: str | Path,
+        expected_page: str,
+        validation_rules: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Considera sempre a página esperada"""
+        signature = self._respond(screenshot_path, expected_page, str(validation_rules))
+        return {
+            "is_correct_page": True,
+            "current_page": expected_page,
+            "matches_expected": True,
+            "validation_passed": True,
+            "issues": [],
+            "evidence": f"Análise offline ({signature})",
+            "recommendation": "Nenhuma"
+        }
+
+    def detect_errors(self, screenshot_path: str | Path) -> Dict[str, Any]:
+        """Nunca encontra erros"""
+        self._respond(screenshot_path, "detect_errors")
+        return {
+            "has_errors": False,
+            "error_types": [],
+            "error_details": [],
+            "critical": False,
+            "affected_functionality": "",
+            "suggested_fix": ""
+        }
+
+    def extract_form_data(self, screenshot_path: str | Path) -> Dict[str, Any]:
+        """Não identifica formulários"""
+        self._respond(screenshot_path, "extract_form_data")
+        return {
+            "has_form": False,
+            "form_type": "",
+            "fields": {},
+            "submit_button": {"text": "", "visible": False, "enabled": False},
+            "validation_messages": ""
+        }
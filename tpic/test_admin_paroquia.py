@@ -20,7 +20,7 @@ import config
 
 logger = Logger("test_admin_paroquia")
 
-async def test_admin_paroquia_bootstrap() -> Dict[str, Any]:
+async def test_admin_paroquia_bootstrap(pool=None) -> Dict[str, Any]:
     """
     Testa o bootstrap do primeiro admin da paróquia
     
@@ -31,7 +31,7 @@ async def test_admin_paroquia_bootstrap() -> Dict[str, Any]:
     logger.info("INICIANDO: Fluxo 2 - Admin da Paróquia (Bootstrap)")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="admin_paroquia", save_session=True)
     
     custom_instructions = """
     Você está testando o processo de bootstrap do administrativo de paróquia.
@@ -80,7 +80,7 @@ async def test_admin_paroquia_bootstrap() -> Dict[str, Any]:
     return result
 
 
-async def test_admin_paroquia_login() -> Dict[str, Any]:
+async def test_admin_paroquia_login(pool=None) -> Dict[str, Any]:
     """
     Testa apenas o login no painel Admin da Paróquia
     """
@@ -88,7 +88,7 @@ async def test_admin_paroquia_login() -> Dict[str, Any]:
     logger.info("INICIANDO: Test Login - Admin Paróquia")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="admin_paroquia", save_session=True)
     
     custom_instructions = """
     Teste simples de login no painel admin-paroquia.
@@ -121,7 +121,7 @@ async def test_admin_paroquia_login() -> Dict[str, Any]:
     return result
 
 
-async def test_admin_paroquia_game_creation() -> Dict[str, Any]:
+async def test_admin_paroquia_game_creation(pool=None) -> Dict[str, Any]:
     """
     Testa a criação de um novo jogo/partida no painel da paróquia
     """
@@ -129,7 +129,7 @@ async def test_admin_paroquia_game_creation() -> Dict[str, Any]:
     logger.info("INICIANDO: Test Game Creation - Admin Paróquia")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="admin_paroquia", reuse_session=True)
     
     custom_instructions = """
     Teste de criação de novo jogo/partida no painel admin-paroquia.
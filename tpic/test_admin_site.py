@@ -21,7 +21,7 @@ import config
 
 logger = Logger("test_admin_site")
 
-async def test_admin_site_bootstrap() -> Dict[str, Any]:
+async def test_admin_site_bootstrap(pool=None) -> Dict[str, Any]:
     """
     Testa o bootstrap do primeiro admin do site
     
@@ -32,7 +32,7 @@ async def test_admin_site_bootstrap() -> Dict[str, Any]:
     logger.info("INICIANDO: Fluxo 1 - Admin do Site (Bootstrap)")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="admin_site", save_session=True)
     
     custom_instructions = """
     Você está testando o processo de bootstrap do administrativo do site (super admin).
@@ -80,7 +80,7 @@ async def test_admin_site_bootstrap() -> Dict[str, Any]:
     return result
 
 
-async def test_admin_site_login() -> Dict[str, Any]:
+async def test_admin_site_login(pool=None) -> Dict[str, Any]:
     """
     Testa apenas o login no Admin Site
     """
@@ -88,7 +88,7 @@ async def test_admin_site_login() -> Dict[str, Any]:
     logger.info("INICIANDO: Test Login - Admin Site")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="admin_site", save_session=True)
     
     custom_instructions = """
     Teste simples de login no painel admin-site.
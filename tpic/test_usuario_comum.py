@@ -20,7 +20,7 @@ import config
 
 logger = Logger("test_usuario_comum")
 
-async def test_usuario_cadastro() -> Dict[str, Any]:
+async def test_usuario_cadastro(pool=None) -> Dict[str, Any]:
     """
     Testa o cadastro de um novo usuário comum
     
@@ -31,7 +31,7 @@ async def test_usuario_cadastro() -> Dict[str, Any]:
     logger.info("INICIANDO: Fluxo 3 - Cadastro Usuário Comum")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool)
     
     custom_instructions = """
     Você está testando o processo de cadastro de um usuário comum (fiel).
@@ -83,7 +83,7 @@ async def test_usuario_cadastro() -> Dict[str, Any]:
     return result
 
 
-async def test_usuario_login() -> Dict[str, Any]:
+async def test_usuario_login(pool=None) -> Dict[str, Any]:
     """
     Testa o login de um usuário comum
     """
@@ -91,7 +91,7 @@ async def test_usuario_login() -> Dict[str, Any]:
     logger.info("INICIANDO: Test Login - Usuário Comum")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="usuario_comum", save_session=True)
     
     custom_instructions = """
     Teste simples de login para usuário comum.
@@ -126,7 +126,7 @@ async def test_usuario_login() -> Dict[str, Any]:
     return result
 
 
-async def test_usuario_jogar_bingo() -> Dict[str, Any]:
+async def test_usuario_jogar_bingo(pool=None) -> Dict[str, Any]:
     """
     Testa o fluxo de jogar bingo como usuário comum
     """
@@ -134,7 +134,7 @@ async def test_usuario_jogar_bingo() -> Dict[str, Any]:
     logger.info("INICIANDO: Test Jogar Bingo - Usuário Comum")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="usuario_comum", reuse_session=True)
     
     custom_instructions = """
     Teste de jogo de bingo como usuário comum.
@@ -176,7 +176,7 @@ async def test_usuario_jogar_bingo() -> Dict[str, Any]:
     return result
 
 
-async def test_usuario_perfil() -> Dict[str, Any]:
+async def test_usuario_perfil(pool=None) -> Dict[str, Any]:
     """
     Testa a página de perfil do usuário comum
     """
@@ -184,7 +184,7 @@ async def test_usuario_perfil() -> Dict[str, Any]:
     logger.info("INICIANDO: Test Perfil - Usuário Comum")
     logger.info("=" * 70)
     
-    agent = SmartTestAgent(headless=False)
+    agent = SmartTestAgent(headless=False, pool=pool, session_key="usuario_comum", reuse_session=True)
     
     custom_instructions = """
     Teste da página de perfil do usuário comum.
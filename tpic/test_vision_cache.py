@@ -0,0 +1,67 @@
+"""
+Teste do cache de análises visuais com o analisador offline (sem rede).
+
+    cd tpic && python -m pytest -q test_vision_cache.py
+"""
+
+from stub_vision import OfflineVisionAnalyzer
+from vision_cache import CachedVisionAnalyzer, VisionCache
+
+
+def _screen(directory, name, content):
+    path = directory / name
+    path.write_bytes(content)
+    return path
+
+
+def _analyzer(tmp_path):
+    offline = OfflineVisionAnalyzer(delay=0)
+    cache = VisionCache(directory=tmp_path / "cache", ttl_seconds=0, perceptual=False)
+    return offline, CachedVisionAnalyzer(offline, cache)
+
+
+def test_identical_screens_hit_and_changed_screens_miss(tmp_path):
+    offline, cached = _analyzer(tmp_path)
+    home = _screen(tmp_path, "home.png", b"tela inicial")
+    home_again = _screen(tmp_path, "home_2.png", b"tela inicial")
+    # Mesma tela com um toast de erro: um byte diferente já é outra análise
+    home_error = _screen(tmp_path, "home_erro.png", b"tela inicia!")
+
+    first = cached.analyze_screenshot(home, context="Home", last_action="Login")
+    assert cached.analyze_screenshot(home_again, context="Home", last_action="Login") == first
+    cached.analyze_screenshot(home_error, context="Home", last_action="Login")
+    # Outro prompt para a mesma tela também é outra análise
+    cached.analyze_screenshot(home, context="Home", last_action="Logout")
+
+    assert offline.calls == 3
+    assert cached.stats()["hits"] == 1
+    assert cached.stats()["misses"] == 3
+
+
+def test_analyze_many_groups_duplicates_and_reuses_cache(tmp_path):
+    offline, cached = _analyzer(tmp_path)
+    screens = [_screen(tmp_path, f"tela_{i}.png", f"tela {i % 3}".encode()) for i in range(6)]
+    requests = [{"screenshot_path": path, "context": "Lote"} for path in screens]
+
+    results = cached.analyze_many(requests, max_workers=3)
+
+    # 6 screenshots, 3 telas distintas: 3 análises, duplicadas recebem o mesmo resultado
+    assert offline.calls == 3
+    assert results[0] == results[3] and results[1] == results[4] and results[2] == results[5]
+    assert results[0] != results[1]
+    assert (cached.stats()["hits"], cached.stats()["misses"]) == (0, 3)
+
+    # Nova instância sobre o mesmo diretório: tudo vem do disco
+    offline_again, cached_again = _analyzer(tmp_path)
+    assert cached_again.analyze_many(requests, max_workers=3) == results
+    assert offline_again.calls == 0
+    assert (cached_again.stats()["hits"], cached_again.stats()["misses"]) == (3, 0)
+
+
+def test_hamming_distance_only_applies_in_perceptual_mode(tmp_path):
+    exact = VisionCache(directory=tmp_path / "cache", max_distance=8, ttl_seconds=0, perceptual=False)
+    perceptual = VisionCache(directory=tmp_path / "cache", max_distance=8, ttl_seconds=0, perceptual=True)
+
+    assert exact.max_distance == 0
+    assert perceptual.max_distance == 8
+    assert exact.image_hash(_screen(tmp_path, "a.png", b"a")).startswith("sha256:")
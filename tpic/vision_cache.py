@@ -0,0 +1,393 @@
+"""
+===========================================================================
+TPIC - Cache de Análises Visuais
+===========================================================================
+Cada screenshot é identificado pelo sha256 do arquivo. A análise fica em
+cache sob a chave
+
+    backend + modelo + PROMPT_VERSION + (contexto, última ação, prompt) + hash
+
+de modo que reexecutar os mesmos fluxos não chama a API de novo para
+telas já vistas. Alterou um prompt? Incremente PROMPT_VERSION no
+analisador correspondente e as entradas antigas deixam de valer.
+
+Hash perceptual (dHash) é opt-in (TPIC_VISION_PERCEPTUAL=true): reaproveita
+telas visualmente iguais mesmo que o PNG mude byte a byte, mas 16x16 não
+resolve texto de toast ou de validação - uma tela de erro pode receber a
+análise de sucesso guardada.
+
+Backends (TPIC_VISION_BACKEND): groq (padrão), claude, gemini e offline
+(stub determinístico, sem rede - para testar pipeline e cache).
+===========================================================================
+"""
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import config
+from utils import Logger
+
+logger = Logger("vision_cache")
+
+# Versão do formato das entradas em disco (não do prompt)
+CACHE_FORMAT = 1
+
+BACKENDS = {
+    "groq": ("groq_vision", "GroqVisionAnalyzer"),
+    "claude": ("claude_vision", "ClaudeVisionAnalyzer"),
+    "gemini": ("gemini_vision", "GeminiVisionAnalyzer"),
+    "offline": ("stub_vision", "OfflineVisionAnalyzer"),
+}
+
+
+# ===========================================================================
+# HASH DA TELA
+# ===========================================================================
+
+_pillow_warned = False
+
+
+def file_hash(image_path: str | Path) -> str:
+    """sha256 do arquivo: só telas idênticas byte a byte se reaproveitam"""
+    return "sha256:" + hashlib.sha256(Path(image_path).read_bytes()).hexdigest()
+
+
+def perceptual_hash(image_path: str | Path, hash_size: int = None) -> str:
+    """
+    dHash da imagem: escala de cinza, reduz para (hash_size + 1) x hash_size
+    e compara cada pixel com o vizinho da direita (1 bit por comparação).
+
+    Sem Pillow instalado, cai para o sha256 do arquivo (só telas idênticas
+    byte a byte se reaproveitam).
+
+    Returns:
+        Hash em hexadecimal (hash_size² bits)
+    """
+    global _pillow_warned
+    hash_size = hash_size or config.VISION_HASH_SIZE
+    try:
+        from PIL import Image
+    except ImportError:
+        if not _pillow_warned:
+            _pillow_warned = True
+            logger.warning("Pillow não instalado - usando sha256 do arquivo no cache de análises")
+        return file_hash(image_path)
+
+    with Image.open(image_path) as image:
+        small = image.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+        pixels = list(small.getdata())
+
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def hamming_distance(first: str, second: str) -> float:
+    """Bits diferentes entre dois hashes (infinito se não forem comparáveis)"""
+    if len(first) != len(second) or first.startswith("sha256:") or second.startswith("sha256:"):
+        return 0 if first == second else float("inf")
+    return bin(int(first, 16) ^ int(second, 16)).count("1")
+
+
+def _is_failed_analysis(analysis: Dict[str, Any]) -> bool:
+    """Resultado de _default_analysis (erro de API/JSON) nunca entra no cache"""
+    return not analysis or str(analysis.get("observations", "")).startswith("Erro na análise")
+
+
+# ===========================================================================
+# CACHE EM DISCO
+# ===========================================================================
+
+class VisionCache:
+    """
+    Análises endereçadas por conteúdo, em config.VISION_CACHE_DIR/<namespace>/.
+
+    O namespace agrupa backend, modelo, versão do prompt e entradas do
+    prompt; dentro dele cada arquivo é uma tela (sha256 do arquivo). Com
+    perceptual=True a tela é identificada pelo dHash e, com max_distance > 0,
+    telas a até N bits de distância também contam como iguais (ex.: cursor
+    piscando, relógio na tela).
+    """
+
+    def __init__(
+        self,
+        directory: Path = None,
+        max_distance: int = None,
+        ttl_seconds: int = None,
+        perceptual: bool = None
+    ):
+        self.directory = directory or config.VISION_CACHE_DIR
+        self.perceptual = config.VISION_CACHE_PERCEPTUAL if perceptual is None else perceptual
+        max_distance = config.VISION_CACHE_MAX_DISTANCE if max_distance is None else max_distance
+        # Distância só faz sentido entre dHashes
+        self.max_distance = max_distance if self.perceptual else 0
+        self.ttl_seconds = config.VISION_CACHE_TTL if ttl_seconds is None else ttl_seconds
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def namespace(backend: str, model: str, prompt_version: int, *prompt_parts: Optional[str]) -> str:
+        digest = hashlib.sha256(f"format={CACHE_FORMAT}|{backend}|{model}|prompt=v{prompt_version}".encode())
+        for part in prompt_parts:
+            digest.update(b"\x00" + (part or "").encode("utf-8"))
+        return digest.hexdigest()[:24]
+
+    def image_hash(self, image_path: str | Path) -> str:
+        """Identidade da tela no cache: sha256 do arquivo ou dHash (opt-in)"""
+        return perceptual_hash(image_path) if self.perceptual else file_hash(image_path)
+
+    def _path(self, namespace: str, image_hash: str) -> Path:
+        return self.directory / namespace / f"{hashlib.sha256(image_hash.encode()).hexdigest()[:32]}.json"
+
+    def _load(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if self.ttl_seconds and time.time() - entry.get("saved_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def get(self, namespace: str, image_hash: str) -> Optional[Dict[str, Any]]:
+        """Análise em cache para a tela (ou None)"""
+        entry = self._load(self._path(namespace, image_hash))
+        if entry is None and self.max_distance > 0:
+            entry = self._nearest(namespace, image_hash)
+        return entry["analysis"] if entry else None
+
+    def _nearest(self, namespace: str, image_hash: str) -> Optional[Dict[str, Any]]:
+        best, best_distance = None, self.max_distance + 1
+        for path in (self.directory / namespace).glob("*.json"):
+            entry = self._load(path)
+            if entry is None:
+                continue
+            distance = hamming_distance(image_hash, entry.get("image_hash", ""))
+            if distance < best_distance:
+                best, best_distance = entry, distance
+        return best
+
+    def put(self, namespace: str, image_hash: str, analysis: Dict[str, Any], screenshot: str = ""):
+        path = self._path(namespace, image_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"saved_at": time.time(), "image_hash": image_hash, "screenshot": screenshot, "analysis": analysis}
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def clear(self):
+        """Remove todas as entradas"""
+        for path in self.directory.glob("*/*.json"):
+            path.unlink(missing_ok=True)
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+# ===========================================================================
+# ANALISADOR COM CACHE
+# ===========================================================================
+
+class CachedVisionAnalyzer:
+    """
+    Envolve qualquer analisador (Groq, Claude, Gemini, offline) com o cache.
+
+    Tem a mesma interface (analyze_screenshot, analyze_page_state,
+    detect_errors, extract_form_data). Chamadas simultâneas para a mesma
+    tela e o mesmo prompt - fluxos paralelos passando pela mesma página -
+    esperam uma única análise em vez de repetir a chamada.
+    """
+
+    def __init__(self, analyzer, cache: VisionCache = None):
+        self.analyzer = analyzer
+        self.cache = cache or VisionCache()
+        self.backend_name = type(analyzer).__name__
+        model = getattr(analyzer, "model", "")
+        self.model_name = str(getattr(model, "model_name", model))
+        self.prompt_version = getattr(analyzer, "PROMPT_VERSION", 0)
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # conversation_history, client, model... continuam acessíveis
+        return getattr(self.analyzer, name)
+
+    def _namespace(self, *prompt_parts: Optional[str]) -> str:
+        return VisionCache.namespace(self.backend_name, self.model_name, self.prompt_version, *prompt_parts)
+
+    def _cached(self, screenshot_path: str | Path, prompt_parts: Tuple, analyze) -> Dict[str, Any]:
+        image_hash = self.cache.image_hash(screenshot_path)
+        namespace = self._namespace(*prompt_parts)
+        analysis = self.cache.get(namespace, image_hash)
+        if analysis is not None:
+            self.cache.record(hit=True)
+            logger.info(f"♻️  Análise reaproveitada do cache: {Path(screenshot_path).name}")
+            return analysis
+
+        key = (namespace, image_hash)
+        with self._lock:
+            pending = self._inflight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[key] = Future()
+        self.cache.record(hit=not owner)
+        if not owner:
+            logger.info(f"⏳ Mesma tela em análise por outro fluxo: {Path(screenshot_path).name}")
+            return pending.result()
+
+        try:
+            analysis = analyze()
+            if not _is_failed_analysis(analysis):
+                self.cache.put(namespace, image_hash, analysis, screenshot=Path(screenshot_path).name)
+            pending.set_result(analysis)
+            return analysis
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def analyze_screenshot(
+        self,
+        screenshot_path: str | Path,
+        context: str = "Teste de aplicação web",
+        last_action: str = "Página carregada",
+        custom_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Igual ao analisador original, mas consulta o cache antes"""
+        return self._cached(
+            screenshot_path,
+            ("analyze_screenshot", context, last_action, custom_prompt),
+            lambda: self.analyzer.analyze_screenshot(
+                screenshot_path, context=context, last_action=last_action, custom_prompt=custom_prompt
+            ),
+        )
+
+    def analyze_page_state(
+        self,
+        screenshot_path: str | Path,
+        expected_page: str,
+        validation_rules: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        rules = json.dumps(validation_rules, sort_keys=True, default=str) if validation_rules else None
+        return self._cached(
+            screenshot_path,
+            ("analyze_page_state", expected_page, rules),
+            lambda: self.analyzer.analyze_page_state(screenshot_path, expected_page, validation_rules),
+        )
+
+    def detect_errors(self, screenshot_path: str | Path) -> Dict[str, Any]:
+        return self._cached(
+            screenshot_path, ("detect_errors",), lambda: self.analyzer.detect_errors(screenshot_path)
+        )
+
+    def extract_form_data(self, screenshot_path: str | Path) -> Dict[str, Any]:
+        return self._cached(
+            screenshot_path, ("extract_form_data",), lambda: self.analyzer.extract_form_data(screenshot_path)
+        )
+
+    def analyze_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        max_workers: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analisa um lote de screenshots de uma vez.
+
+        Cada item tem os argumentos de analyze_screenshot (screenshot_path,
+        context, last_action, custom_prompt). Itens com a mesma tela e o
+        mesmo prompt viram uma única análise; o restante roda em paralelo.
+
+        Returns:
+            Análises na mesma ordem dos itens
+        """
+        requests = list(requests)
+        groups: Dict[Tuple, List[int]] = {}
+        for index, request in enumerate(requests):
+            key = (
+                self.cache.image_hash(request["screenshot_path"]),
+                request.get("context", "Teste de aplicação web"),
+                request.get("last_action", "Página carregada"),
+                request.get("custom_prompt"),
+            )
+            groups.setdefault(key, []).append(index)
+
+        if len(groups) < len(requests):
+            logger.info(f"Lote de {len(requests)} screenshots → {len(groups)} análises distintas")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        workers = max(1, min(max_workers or config.TPIC_WORKERS, len(groups) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.analyze_screenshot, **requests[indexes[0]]): indexes
+                for indexes in groups.values()
+            }
+            for future, indexes in futures.items():
+                analysis = future.result()
+                for index in indexes:
+                    results[index] = analysis
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend_name, "model": self.model_name, **self.cache.stats()}
+
+
+# ===========================================================================
+# FÁBRICA
+# ===========================================================================
+
+_shared_analyzers: Dict[Tuple[str, bool], Any] = {}
+_factory_lock = threading.Lock()
+
+
+def create_vision_analyzer(backend: str = None, use_cache: bool = None):
+    """
+    Analisador configurado por TPIC_VISION_BACKEND / TPIC_VISION_CACHE.
+
+    A instância é compartilhada entre os fluxos da mesma execução (mesmo
+    cache em memória, estatísticas somadas).
+
+    Raises:
+        ValueError: Backend desconhecido ou chave de API ausente
+    """
+    backend = (backend or config.VISION_BACKEND).lower()
+    use_cache = config.VISION_CACHE_ENABLED if use_cache is None else use_cache
+    if backend not in BACKENDS:
+        raise ValueError(f"TPIC_VISION_BACKEND inválido: {backend} (opções: {', '.join(BACKENDS)})")
+
+    with _factory_lock:
+        key = (backend, use_cache)
+        if key not in _shared_analyzers:
+            module_name, class_name = BACKENDS[backend]
+            module = __import__(module_name)
+            analyzer = getattr(module, class_name)()
+            _shared_analyzers[key] = CachedVisionAnalyzer(analyzer) if use_cache else analyzer
+        return _shared_analyzers[key]
+
+
+def vision_cache_stats() -> List[Dict[str, Any]]:
+    """Estatísticas de cache dos analisadores criados nesta execução"""
+    return [analyzer.stats() for analyzer in _shared_analyzers.values() if isinstance(analyzer, CachedVisionAnalyzer)]